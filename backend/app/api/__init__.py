@@ -1,12 +1,14 @@
 from fastapi import APIRouter
 
 from app.api import (
+    alerts,
     data_sources,
     folder_mapping,
     folders,
     hands,
     progress,
     scan,
+    search,
     stats,
     sync,
     work_status,
@@ -47,3 +49,5 @@ api_router.include_router(progress.router, prefix="/progress", tags=["Progress"]
 api_router.include_router(
     folder_mapping.router, prefix="/folder-mapping", tags=["Folder Mapping"]
 )
+api_router.include_router(alerts.router, prefix="/alerts", tags=["Alerts"])
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
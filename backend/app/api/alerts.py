@@ -0,0 +1,97 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db, get_read_db
+from app.models.alert import AlertEvent, AlertRule
+from app.schemas.alert import (
+    AlertEventListResponse,
+    AlertRuleCreate,
+    AlertRuleResponse,
+    AlertRuleUpdate,
+)
+from app.services.email_notifier import email_notifier
+
+router = APIRouter()
+
+
+# ===== Rule Endpoints =====
+
+
+@router.get("/rules", response_model=List[AlertRuleResponse])
+async def get_alert_rules(db: AsyncSession = Depends(get_read_db)):
+    """Get all alert rules"""
+    result = await db.execute(select(AlertRule).order_by(AlertRule.id))
+    return result.scalars().all()
+
+
+@router.post("/rules", response_model=AlertRuleResponse)
+async def create_alert_rule(
+    rule: AlertRuleCreate,
+    db: AsyncSession = Depends(get_db),
+):
+    """Create an alert rule"""
+    if rule.rule_type == "missing_duration" and rule.threshold > 1:
+        raise HTTPException(
+            status_code=422, detail="missing_duration threshold is a ratio (0-1)"
+        )
+    db_rule = AlertRule(**rule.model_dump())
+    db.add(db_rule)
+    await db.commit()
+    await db.refresh(db_rule)
+    return db_rule
+
+
+@router.patch("/rules/{rule_id}", response_model=AlertRuleResponse)
+async def update_alert_rule(
+    rule_id: int,
+    update: AlertRuleUpdate,
+    db: AsyncSession = Depends(get_db),
+):
+    """Update an alert rule"""
+    db_rule = await db.get(AlertRule, rule_id)
+    if not db_rule:
+        raise HTTPException(status_code=404, detail="Alert rule not found")
+
+    for key, value in update.model_dump(exclude_unset=True).items():
+        setattr(db_rule, key, value)
+    if db_rule.rule_type == "missing_duration" and db_rule.threshold > 1:
+        raise HTTPException(
+            status_code=422, detail="missing_duration threshold is a ratio (0-1)"
+        )
+    await db.commit()
+    await db.refresh(db_rule)
+    return db_rule
+
+
+@router.delete("/rules/{rule_id}")
+async def delete_alert_rule(rule_id: int, db: AsyncSession = Depends(get_db)):
+    """Delete an alert rule"""
+    db_rule = await db.get(AlertRule, rule_id)
+    if not db_rule:
+        raise HTTPException(status_code=404, detail="Alert rule not found")
+    await db.delete(db_rule)
+    await db.commit()
+    return {"message": "Alert rule deleted"}
+
+
+# ===== Event Endpoints =====
+
+
+@router.get("/events", response_model=AlertEventListResponse)
+async def get_alert_events(
+    rule_id: Optional[int] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Recently fired alerts (newest first)"""
+    query = select(AlertEvent).order_by(AlertEvent.triggered_at.desc()).limit(limit)
+    if rule_id is not None:
+        query = query.where(AlertEvent.rule_id == rule_id)
+    result = await db.execute(query)
+    return AlertEventListResponse(
+        items=result.scalars().all(),
+        pending_emails=sum(email_notifier.pending.values()),
+    )
@@ -17,7 +17,7 @@ from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.models.hand_analysis import HandAnalysis
 from app.models.work_status import WorkStatus
 from app.services.hand_analysis_sync import hand_analysis_sync_service
@@ -82,28 +82,23 @@ async def get_all_data_sources():
     - metadata_db: Hand Analysis 시트 (핸드 분석 데이터)
     - iconik_db: iconik MAM 메타데이터 (미구현)
     """
+    # 동기화는 leader 워커만 수행하므로 상태는 공유 상태 기준
     # archive_db (Work Status)
-    sheets_result = sheets_sync_service.last_sync_result
+    sheets_status = await sheets_sync_service.get_shared_status()
+    sheets_result = sheets_status["last_result"]
     archive_db = DataSourceStatus(
         name="archive db",
         type="Work Status",
-        enabled=sheets_sync_service.is_enabled,
-        status=sheets_sync_service.status,
-        last_sync=(
-            sheets_sync_service.last_sync_time.isoformat()
-            if sheets_sync_service.last_sync_time
-            else None
-        ),
-        next_sync=(
-            sheets_sync_service.next_sync_time.isoformat()
-            if sheets_sync_service.next_sync_time
-            else None
-        ),
-        record_count=sheets_result.synced_count if sheets_result else 0,
+        enabled=sheets_status["enabled"],
+        status=sheets_status["status"],
+        last_sync=sheets_status["last_sync"],
+        next_sync=sheets_status["next_sync"],
+        record_count=sheets_result["synced_count"] if sheets_result else 0,
         details=(
             {
-                "created": sheets_result.created_count if sheets_result else 0,
-                "updated": sheets_result.updated_count if sheets_result else 0,
+                "created": sheets_result["created_count"],
+                "updated": sheets_result["updated_count"],
+                "deleted": sheets_result["deleted_count"],
             }
             if sheets_result
             else None
@@ -111,28 +106,22 @@ async def get_all_data_sources():
     )
 
     # metadata_db (Hand Analysis)
-    hand_result = hand_analysis_sync_service.last_sync_result
+    hand_status = await hand_analysis_sync_service.get_shared_status()
+    hand_result = hand_status["last_result"]
     metadata_db = DataSourceStatus(
         name="metadata db",
         type="Hand Analysis",
-        enabled=hand_analysis_sync_service.is_enabled,
-        status=hand_analysis_sync_service.status,
-        last_sync=(
-            hand_analysis_sync_service.last_sync_time.isoformat()
-            if hand_analysis_sync_service.last_sync_time
-            else None
-        ),
-        next_sync=(
-            hand_analysis_sync_service.next_sync_time.isoformat()
-            if hand_analysis_sync_service.next_sync_time
-            else None
-        ),
-        record_count=hand_result.synced_count if hand_result else 0,
+        enabled=hand_status["enabled"],
+        status=hand_status["status"],
+        last_sync=hand_status["last_sync"],
+        next_sync=hand_status["next_sync"],
+        record_count=hand_result["synced_count"] if hand_result else 0,
         details=(
             {
-                "created": hand_result.created_count if hand_result else 0,
-                "updated": hand_result.updated_count if hand_result else 0,
-                "worksheets": hand_result.worksheets_processed if hand_result else 0,
+                "created": hand_result["created_count"],
+                "updated": hand_result["updated_count"],
+                "deleted": hand_result["deleted_count"],
+                "worksheets": hand_result["worksheets_processed"],
             }
             if hand_result
             else None
@@ -160,7 +149,7 @@ async def get_all_data_sources():
 
 @router.get("/work-status/summary", response_model=WorkStatusSummary)
 async def get_work_status_summary(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Work Status 요약 (Dashboard용)
@@ -205,7 +194,7 @@ async def get_work_status_summary(
 
 @router.get("/hand-analysis/summary", response_model=HandAnalysisSummary)
 async def get_hand_analysis_summary(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Hand Analysis 요약 (Dashboard용)
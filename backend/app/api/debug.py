@@ -0,0 +1,94 @@
+"""
+Debug API - 요청별 SQL 계측, single-flight 지표, 작업 프로파일링
+
+API_PREFIX 없이 등록 (/debug/..., /metrics/coalescing).
+요청 계측과 프로파일링은 X-Profile-Token 필요 (PROFILING_TOKEN 미설정 시 404).
+
+Block: api.debug
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from app.api.scan import run_scan
+from app.core.config import settings
+from app.core.profiling import authorized, find_task, job_profiles
+from app.core.query_stats import request_log
+from app.core.single_flight import single_flight
+from app.services.hand_analysis_sync import HandAnalysisSyncService
+from app.services.scanner import ArchiveScanner
+from app.services.sheets_sync import SheetsSyncService
+
+router = APIRouter()
+
+# job → (entry coroutine, blocking functions run in the thread pool)
+PROFILE_JOBS = {
+    "scan": (run_scan, [ArchiveScanner._get_media_info]),
+    "sheets_sync": (SheetsSyncService.sync, [SheetsSyncService._fetch_values]),
+    "hand_sync": (HandAnalysisSyncService.sync, [HandAnalysisSyncService._open_sheet]),
+}
+
+
+def require_profiling(x_profile_token: Optional[str] = Header(None)):
+    """프로파일링 활성 + X-Profile-Token 일치"""
+    if not settings.PROFILING_TOKEN:
+        raise HTTPException(status_code=404, detail="Profiling disabled")
+    if not authorized(x_profile_token):
+        raise HTTPException(status_code=403, detail="Invalid profile token")
+
+
+@router.get("/metrics/coalescing")
+async def coalescing_metrics():
+    """Single-flight 요청 병합 지표 (이 워커 기준)"""
+    return single_flight.stats()
+
+
+@router.get("/debug/requests", dependencies=[Depends(require_profiling)])
+async def debug_requests(limit: int = Query(50, ge=1, le=1000)):
+    """요청별 SQL 계측 (최근 요청 + DB 시간 기준 라우트 순위, 이 워커 기준)"""
+    return request_log.snapshot(limit)
+
+
+@router.post("/debug/profile/{job}", dependencies=[Depends(require_profiling)])
+async def profile_job(
+    job: str,
+    seconds: int = Query(60, ge=1, description="샘플링 시간 (작업이 먼저 끝나면 종료)"),
+):
+    """실행 중인 스캔/동기화 작업에 샘플러 부착 → PROFILING_DIR에 collapsed stack 저장"""
+    if job not in PROFILE_JOBS:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job}")
+    entry, blocking = PROFILE_JOBS[job]
+    task = find_task(entry.__code__)
+    if task is None:
+        # 작업은 시작한 워커에서만 실행됨
+        raise HTTPException(
+            status_code=409, detail=f"{job} is not running in this worker"
+        )
+    seconds = min(seconds, settings.PROFILING_MAX_SECONDS)
+    try:
+        report = job_profiles.attach(
+            job, task, entry.__code__, [fn.__code__ for fn in blocking], seconds
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"job": job, "seconds": seconds, "report": report}
+
+
+@router.get("/debug/profile", dependencies=[Depends(require_profiling)])
+async def profile_reports():
+    """저장된 작업 프로파일 목록 + 진행 중인 작업"""
+    return {
+        "active": {job: s.summary() for job, s in job_profiles.active.items()},
+        "reports": job_profiles.reports(),
+    }
+
+
+@router.get("/debug/profile/{name}", dependencies=[Depends(require_profiling)])
+async def profile_report(name: str):
+    """저장된 작업 프로파일 (flamegraph.pl / speedscope 입력)"""
+    path = job_profiles.report_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return FileResponse(path, media_type="text/plain; charset=utf-8")
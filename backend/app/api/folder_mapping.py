@@ -11,9 +11,10 @@ from pydantic import BaseModel
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.file_stats import FolderStats
 from app.models.work_status import WorkStatus
+from app.services.data_generation import data_generation
 
 router = APIRouter()
 
@@ -73,7 +74,7 @@ async def get_unmapped_folders(
     max_depth: int = Query(default=3, ge=0, le=10),
     min_files: int = Query(default=1, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     WorkStatus에 연결되지 않은 폴더 목록 조회
@@ -111,7 +112,7 @@ async def get_unmapped_folders(
 async def get_mapped_folders(
     work_status_id: Optional[int] = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     WorkStatus에 연결된 폴더 목록 조회
@@ -144,7 +145,7 @@ async def get_mapped_folders(
 
 @router.get("/work-status-options", response_model=List[WorkStatusOption])
 async def get_work_status_options(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     연결 가능한 WorkStatus 목록
@@ -208,6 +209,7 @@ async def connect_folder_to_work_status(
     # 연결
     folder.work_status_id = mapping.work_status_id
     await db.commit()
+    await data_generation.bump("work_status")
     await db.refresh(folder)
 
     return FolderMappingResponse(
@@ -247,6 +249,8 @@ async def connect_folders_bulk(
 
     await db.commit()
 
+    await data_generation.bump("work_status")
+
     return {
         "success_count": success_count,
         "error_count": len(errors),
@@ -274,6 +278,7 @@ async def disconnect_folder(
 
     folder.work_status_id = None
     await db.commit()
+    await data_generation.bump("work_status")
 
     return {"message": "연결 해제됨", "folder_id": folder_id}
 
@@ -333,6 +338,7 @@ async def auto_match_folders(
 
     if not dry_run:
         await db.commit()
+        await data_generation.bump("work_status")
 
     return {
         "dry_run": dry_run,
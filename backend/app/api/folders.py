@@ -1,12 +1,20 @@
+from datetime import datetime, timedelta
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.models.file_stats import FileStats, FolderStats
-from app.schemas.stats import FileTypeStats, FolderDetails, FolderTreeNode
+from app.core.database import get_read_db
+from app.models.file_stats import FileStats, FolderStats, FolderStatsDelta
+from app.schemas.stats import (
+    FileTypeStats,
+    FolderDetails,
+    FolderGrowth,
+    FolderGrowthPoint,
+    FolderGrowthSeries,
+    FolderTreeNode,
+)
 from app.services.utils import format_duration, format_size
 
 
@@ -29,7 +37,7 @@ async def get_folder_tree(
     extensions: Optional[str] = Query(
         default=None, description="Comma-separated extensions filter"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get folder tree structure with optional extension filter"""
 
@@ -121,7 +129,7 @@ async def get_folder_tree(
 @router.get("/details", response_model=FolderDetails)
 async def get_folder_details(
     path: str = Query(..., description="Folder path"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get detailed information for a specific folder"""
 
@@ -177,7 +185,7 @@ async def get_folder_details(
 @router.get("/top", response_model=List[FolderTreeNode])
 async def get_top_folders(
     limit: int = Query(default=10, ge=1, le=50),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get top folders by size"""
 
@@ -201,3 +209,88 @@ async def get_top_folders(
         )
         for folder in folders
     ]
+
+
+@router.get("/growth", response_model=List[FolderGrowth])
+async def get_top_growing_folders(
+    days: int = Query(default=30, ge=1, le=3650),
+    depth: Optional[int] = Query(
+        default=None, ge=0, le=20, description="Only folders at this depth"
+    ),
+    limit: int = Query(default=20, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Top growing folders over the last N days (sums scan deltas in the window)"""
+
+    since = datetime.utcnow() - timedelta(days=days)
+    size_delta = func.sum(FolderStatsDelta.size_delta).label("size_delta")
+    query = (
+        select(
+            FolderStatsDelta.folder_path,
+            func.min(FolderStatsDelta.depth).label("depth"),
+            size_delta,
+            func.sum(FolderStatsDelta.file_count_delta).label("file_count_delta"),
+            func.count(FolderStatsDelta.id).label("changes"),
+        )
+        .where(FolderStatsDelta.scanned_at >= since)
+        .group_by(FolderStatsDelta.folder_path)
+        .having(size_delta > 0)
+        .order_by(size_delta.desc())
+        .limit(limit)
+    )
+    if depth is not None:
+        query = query.where(FolderStatsDelta.depth == depth)
+    rows = (await db.execute(query)).all()
+
+    current = {}
+    if rows:
+        result = await db.execute(
+            select(FolderStats.path, FolderStats.total_size).where(
+                FolderStats.path.in_([row.folder_path for row in rows])
+            )
+        )
+        current = dict(result.all())
+
+    return [
+        FolderGrowth(
+            path=row.folder_path,
+            name=row.folder_path.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1],
+            depth=row.depth,
+            size_delta=row.size_delta,
+            size_delta_formatted=format_size(row.size_delta),
+            file_count_delta=row.file_count_delta,
+            changes=row.changes,
+            current_size=current.get(row.folder_path),
+        )
+        for row in rows
+    ]
+
+
+@router.get("/growth/series", response_model=FolderGrowthSeries)
+async def get_folder_growth_series(
+    path: str = Query(..., description="Folder path"),
+    days: int = Query(default=365, ge=1, le=3650),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Totals of one folder after every scan that changed it"""
+
+    since = datetime.utcnow() - timedelta(days=days)
+    result = await db.execute(
+        select(FolderStatsDelta)
+        .where(FolderStatsDelta.folder_path == path)
+        .where(FolderStatsDelta.scanned_at >= since)
+        .order_by(FolderStatsDelta.scanned_at.asc(), FolderStatsDelta.id.asc())
+    )
+    return FolderGrowthSeries(
+        path=path,
+        points=[
+            FolderGrowthPoint(
+                scanned_at=delta.scanned_at,
+                total_size=delta.total_size,
+                file_count=delta.file_count,
+                size_delta=delta.size_delta,
+                file_count_delta=delta.file_count_delta,
+            )
+            for delta in result.scalars().all()
+        ],
+    )
@@ -4,20 +4,63 @@ Hands API - 핸드 분석 데이터 조회 및 동기화
 Block: api.hands
 """
 
+import base64
+import json
 from datetime import datetime
-from typing import List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_read_db
+from app.core.fast_json import FastJSONResponse
 from app.models.hand_analysis import HandAnalysis
 from app.services.hand_analysis_sync import hand_analysis_sync_service
+from app.services.hand_facets import hand_facets
+from app.services.hand_tags import hand_tag_service, parse_tag_filter
+from app.services.search_service import search_service
 
 router = APIRouter()
 
+# keyset 정렬 키 (idx_hand_keyset / idx_hand_grade_keyset 순서)
+HAND_SORT_KEY = (
+    HandAnalysis.source_worksheet,
+    HandAnalysis.file_name,
+    HandAnalysis.timecode_in_sec,
+    HandAnalysis.id,
+)
+
+
+def _encode_cursor(row: Any) -> str:
+    """마지막 행의 정렬 키 → cursor 문자열"""
+    key = [
+        row.source_worksheet or "",
+        row.file_name,
+        row.timecode_in_sec or 0.0,
+        row.id,
+    ]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> List[Any]:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        worksheet, file_name, timecode, hand_id = key
+        if not (
+            isinstance(worksheet, str)
+            and isinstance(file_name, str)
+            and isinstance(timecode, (int, float))
+            and isinstance(hand_id, int)
+        ):
+            raise ValueError(key)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return [worksheet, file_name, float(timecode), hand_id]
+
 
 # ==================== Schemas ====================
 
@@ -44,12 +87,37 @@ class HandAnalysisResponse(BaseModel):
         from_attributes = True
 
 
+class HandFacetsResponse(BaseModel):
+    """워크시트/등급별 핸드 수 (필터와 무관한 전체 기준)"""
+
+    worksheets: Dict[str, int]
+    grades: Dict[str, int]
+
+
 class HandListResponse(BaseModel):
     """핸드 목록 응답"""
 
     items: List[HandAnalysisResponse]
-    total_count: int
+    total_count: Optional[int]  # file_name/태그 검색 + count=false면 null
     worksheets: List[str]
+    facets: HandFacetsResponse
+    next_cursor: Optional[str] = None  # 다음 페이지 cursor (마지막 페이지면 null)
+
+
+class HandTagCount(BaseModel):
+    """태그별 핸드 수"""
+
+    kind: str  # player / play
+    name: str  # 정규화 이름 (필터 값)
+    label: str  # 원본 표기
+    count: int
+
+
+class HandTagFacetsResponse(BaseModel):
+    """태그 facet 응답"""
+
+    total_hands: int  # 범위 + 태그 필터에 맞는 핸드 수
+    tags: List[HandTagCount]
 
 
 class FileProgressResponse(BaseModel):
@@ -69,6 +137,7 @@ class HandSyncStatusResponse(BaseModel):
     status: str
     last_sync: Optional[str]
     next_sync: Optional[str]
+    last_success: Optional[str] = None
     error: Optional[str]
     interval_minutes: int
     last_result: Optional[dict]
@@ -83,7 +152,11 @@ class HandSyncTriggerResponse(BaseModel):
     synced_count: int
     created_count: int
     updated_count: int
+    deleted_count: int = 0
+    unchanged_count: int = 0
     worksheets_processed: int
+    worksheets_skipped: int = 0
+    worksheet_diffs: Dict[str, Dict[str, int]] = {}
     error: Optional[str]
     message: str
 
@@ -98,9 +171,24 @@ async def get_hands(
         None, description="Filter by file name (partial match)"
     ),
     grade: Optional[str] = Query(None, description="Filter by hand grade (★, ★★, ★★★)"),
+    player_tags: Optional[str] = Query(
+        None, description="Comma-separated player tags (e.g. ivey,baby shark)"
+    ),
+    play_tags: Optional[str] = Query(
+        None, description="Comma-separated poker play tags (e.g. bluff,fold)"
+    ),
+    tag_match: str = Query(
+        "all", pattern="^(all|any)$", description="all: every tag, any: at least one"
+    ),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor of the previous page (keyset, ignores offset)"
+    ),
+    count: bool = Query(
+        False, description="Exact total_count for file_name searches (slower)"
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     핸드 분석 목록 조회
@@ -108,50 +196,128 @@ async def get_hands(
     - worksheet: 워크시트명 필터 (예: "2024 WSOPC LA")
     - file_name: 파일명 부분 검색
     - grade: 핸드 등급 필터
+    - player_tags / play_tags: 태그 필터 (tag_match=all 교집합, any 합집합)
+    - cursor: 이전 페이지의 next_cursor → 정렬 키 다음 행부터 (깊은 페이지도 일정 비용)
+    - total_count: 워크시트/등급 필터는 facet 집계에서 계산,
+      file_name/태그 검색은 count=true일 때만 (아니면 null)
     """
+    facets = await hand_facets.get(db)
     query = select(HandAnalysis)
 
     if worksheet:
-        query = query.where(HandAnalysis.source_worksheet == worksheet)
+        query = query.where(HAND_SORT_KEY[0] == worksheet)
     if file_name:
-        query = query.where(HandAnalysis.file_name.ilike(f"%{file_name}%"))
+        query = query.where(search_service.contains(db, "hand", file_name))
     if grade:
         query = query.where(HandAnalysis.hand_grade == grade)
+    tags = parse_tag_filter(player_tags, play_tags)
+    if tags:
+        query = query.where(
+            HandAnalysis.id.in_(
+                hand_tag_service.matching_hands(tags, tag_match, worksheet or None)
+            )
+        )
 
     # 총 개수
-    count_query = select(func.count()).select_from(query.subquery())
-    total_count = await db.scalar(count_query)
-
-    # 워크시트 목록
-    ws_query = select(HandAnalysis.source_worksheet).distinct()
-    ws_result = await db.execute(ws_query)
-    worksheets = [row[0] for row in ws_result.fetchall() if row[0]]
+    if not file_name and not tags:
+        total_count = hand_facets.count(facets, worksheet, grade)
+    elif count:
+        count_query = select(func.count()).select_from(query.subquery())
+        total_count = await db.scalar(count_query) or 0
+    else:
+        total_count = None
+
+    # 데이터 조회 (limit + 1 → 다음 페이지 여부)
+    if cursor:
+        # 워크시트 고정이면 나머지 키만 비교 (인덱스 범위 검색 유지)
+        skip = 1 if worksheet else 0
+        query = query.where(
+            tuple_(*HAND_SORT_KEY[skip:]) > tuple_(*_decode_cursor(cursor)[skip:])
+        )
+    elif offset:
+        query = query.offset(offset)
+    query = query.order_by(*HAND_SORT_KEY).limit(limit + 1)
+
+    page = {
+        "total_count": total_count,
+        "worksheets": list(facets["worksheets"]),
+        "facets": {
+            "worksheets": facets["worksheets"],
+            "grades": facets["grades"],
+        },
+    }
 
-    # 데이터 조회
-    query = (
-        query.order_by(
-            HandAnalysis.source_worksheet,
-            HandAnalysis.file_name,
-            HandAnalysis.timecode_in_sec,
+    if settings.FAST_JSON_ENABLED:
+        # 필요한 컬럼만 조회해 스키마와 같은 dict로 바로 직렬화 (ORM 객체/검증 생략)
+        fields = list(HandAnalysisResponse.model_fields)
+        rows = await db.execute(
+            query.with_only_columns(*(getattr(HandAnalysis, f) for f in fields))
+        )
+        items = [dict(zip(fields, row)) for row in rows]
+        next_cursor = (
+            _encode_cursor(SimpleNamespace(**items[limit - 1]))
+            if len(items) > limit
+            else None
+        )
+        return FastJSONResponse(
+            {**page, "items": items[:limit], "next_cursor": next_cursor}
         )
-        .offset(offset)
-        .limit(limit)
-    )
 
     result = await db.execute(query)
     items = result.scalars().all()
+    next_cursor = _encode_cursor(items[limit - 1]) if len(items) > limit else None
 
     return HandListResponse(
-        items=[HandAnalysisResponse.model_validate(item) for item in items],
-        total_count=total_count or 0,
-        worksheets=worksheets,
+        items=[HandAnalysisResponse.model_validate(item) for item in items[:limit]],
+        next_cursor=next_cursor,
+        **page,
     )
 
 
+@router.get("/tags", response_model=HandTagFacetsResponse)
+async def get_hand_tags(
+    kind: Optional[str] = Query(
+        None, pattern="^(player|play)$", description="Tag kind (default: both)"
+    ),
+    worksheet: Optional[str] = Query(None, description="Filter by worksheet name"),
+    folder: Optional[str] = Query(
+        None, description="Only hands of files under this folder path"
+    ),
+    player_tags: Optional[str] = Query(
+        None, description="Comma-separated player tags the hands must match"
+    ),
+    play_tags: Optional[str] = Query(
+        None, description="Comma-separated poker play tags the hands must match"
+    ),
+    tag_match: str = Query(
+        "all", pattern="^(all|any)$", description="all: every tag, any: at least one"
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    태그 facet - 범위 안 핸드의 태그별 핸드 수 (많은 순)
+
+    - worksheet / folder: 핸드 범위
+    - player_tags / play_tags + tag_match: 이 태그 조합을 가진 핸드의 다른 태그 분포
+      (예: ivey + bluff 핸드에 함께 붙은 태그)
+    """
+    facets = await hand_tag_service.facets(
+        db,
+        kind=kind,
+        worksheet=worksheet,
+        folder=folder,
+        tags=parse_tag_filter(player_tags, play_tags),
+        match=tag_match,
+        limit=limit,
+    )
+    return HandTagFacetsResponse(**facets)
+
+
 @router.get("/by-file/{file_name:path}", response_model=FileProgressResponse)
 async def get_hands_by_file(
     file_name: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     특정 파일의 핸드 목록 및 진행률 조회
@@ -161,7 +327,7 @@ async def get_hands_by_file(
     """
     query = (
         select(HandAnalysis)
-        .where(HandAnalysis.file_name.ilike(f"%{file_name}%"))
+        .where(search_service.contains(db, "hand", file_name))
         .order_by(HandAnalysis.timecode_out_sec.desc())
     )
 
@@ -192,7 +358,7 @@ async def get_hands_by_file(
 
 @router.get("/summary")
 async def get_hands_summary(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     핸드 분석 요약 통계
@@ -245,16 +411,21 @@ async def get_hands_summary(
 @router.get("/sync/status", response_model=HandSyncStatusResponse)
 async def get_hand_sync_status():
     """핸드 분석 동기화 상태 조회"""
-    status = hand_analysis_sync_service.get_status_dict()
+    status = await hand_analysis_sync_service.get_shared_status()
     return HandSyncStatusResponse(**status)
 
 
 @router.post("/sync/trigger", response_model=HandSyncTriggerResponse)
-async def trigger_hand_sync():
+async def trigger_hand_sync(
+    force: bool = Query(
+        False, description="Re-sync worksheets even if their content is unchanged"
+    ),
+):
     """
     핸드 분석 수동 동기화 트리거
 
     Google Sheets의 8개 워크시트에서 핸드 데이터를 동기화합니다.
+    내용이 바뀌지 않은 워크시트는 건너뜁니다 (force=true로 전체 재동기화).
     """
     if not hand_analysis_sync_service.is_enabled:
         raise HTTPException(
@@ -262,7 +433,7 @@ async def trigger_hand_sync():
             detail="Hand analysis sync is not enabled. Set HAND_ANALYSIS_SYNC_ENABLED=true",
         )
 
-    result = await hand_analysis_sync_service.sync()
+    result = await hand_analysis_sync_service.sync(force=force)
 
     return HandSyncTriggerResponse(
         success=result.success,
@@ -271,7 +442,11 @@ async def trigger_hand_sync():
         synced_count=result.synced_count,
         created_count=result.created_count,
         updated_count=result.updated_count,
+        deleted_count=result.deleted_count,
+        unchanged_count=result.unchanged_count,
         worksheets_processed=result.worksheets_processed,
+        worksheets_skipped=result.worksheets_skipped,
+        worksheet_diffs=result.worksheet_diffs,
         error=result.error,
         message=(
             f"Successfully synced {result.synced_count} hands from {result.worksheets_processed} worksheets"
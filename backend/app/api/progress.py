@@ -7,14 +7,19 @@ metadata db(핸드 분석)와 archive db(작업 현황)를 NAS 폴더 구조와
 Block: api.progress
 """
 
-from typing import List, Optional
+import json
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_read_db, read_session_maker
+from app.core.fast_json import model_json_response
 from app.services.progress_service import progress_service
+from app.services.search_service import search_service
 
 router = APIRouter()
 
@@ -133,8 +138,8 @@ class FolderRootStats(BaseModel):
     size_ratio: float = 0.0  # 현재 폴더 용량 / 전체 용량 * 100
 
 
-class FolderWithProgress(BaseModel):
-    """폴더 + 진행률 (재귀 구조)"""
+class _FolderProgressBase(BaseModel):
+    """폴더 + 진행률 공통 필드 (full/compact 스키마 공용)"""
 
     id: int
     name: str
@@ -157,12 +162,6 @@ class FolderWithProgress(BaseModel):
     # 코덱 정보 (Codec Explorer용)
     codec_summary: Optional[FolderCodecSummary] = None
 
-    # Issue #29: 루트 전체 대비 비율 (NAS/Sheets 데이터 분리 표시용)
-    root_stats: Optional[FolderRootStats] = None  # deprecated: archive_stats 사용 권장
-
-    # Issue #49: 전체 아카이브 통계 (항상 일관된 값)
-    archive_stats: Optional["ArchiveStats"] = None
-
     # extensions 필터 적용 시 필터링된 파일 수/용량 (v1.35.0)
     filtered_file_count: Optional[int] = None
     filtered_size: Optional[int] = None
@@ -173,13 +172,44 @@ class FolderWithProgress(BaseModel):
     # 하위 호환성
     work_status: Optional[WorkStatusInfo] = None  # deprecated
 
-    children: List["FolderWithProgress"] = []
     files: Optional[List[FileWithProgress]] = None
 
     class Config:
         from_attributes = True
 
 
+class FolderWithProgress(_FolderProgressBase):
+    """폴더 + 진행률 (재귀 구조)"""
+
+    # Issue #29: 루트 전체 대비 비율 (NAS/Sheets 데이터 분리 표시용)
+    root_stats: Optional[FolderRootStats] = None  # deprecated: archive_stats 사용 권장
+
+    # Issue #49: 전체 아카이브 통계 (항상 일관된 값)
+    archive_stats: Optional["ArchiveStats"] = None
+
+    children: List["FolderWithProgress"] = []
+
+
+class FolderRatios(BaseModel):
+    """Compact 스키마 노드별 비율 (전역 통계는 응답 최상위에 1회)"""
+
+    file_ratio: float = 0.0  # archive_stats 기준 (Issue #49)
+    size_ratio: float = 0.0
+    root_file_ratio: float = 0.0  # root_stats 기준 (Issue #29)
+    root_size_ratio: float = 0.0
+
+
+class CompactFolderWithProgress(_FolderProgressBase):
+    """폴더 + 진행률 Compact 스키마
+
+    노드마다 반복되던 root_stats/archive_stats 복사본 대신 비율만 포함.
+    """
+
+    ratios: Optional[FolderRatios] = None
+
+    children: List["CompactFolderWithProgress"] = []
+
+
 class RootStats(BaseModel):
     """전체 아카이브 통계 (Issue #29)"""
 
@@ -221,14 +251,27 @@ class TreeWithRootStats(BaseModel):
     archive_stats: Optional[ArchiveStats] = None  # Issue #49: 항상 일관된 통계
 
 
+class CompactTreeWithRootStats(BaseModel):
+    """폴더 트리 + 루트 통계 Compact 스키마
+
+    root_stats/archive_stats는 여기에만 1회 포함되고, 각 노드는 ratios만 보유.
+    """
+
+    schema_version: str = "compact"
+    tree: List[CompactFolderWithProgress] = []
+    root_stats: RootStats
+    archive_stats: Optional[ArchiveStats] = None
+
+
 # Forward reference 해결
 FolderWithProgress.model_rebuild()
+CompactFolderWithProgress.model_rebuild()
 
 
 # ==================== Endpoints ====================
 
 
-@router.get("/tree", response_model=TreeWithRootStats)
+@router.get("/tree", response_model=Union[TreeWithRootStats, CompactTreeWithRootStats])
 async def get_folder_tree_with_progress(
     path: Optional[str] = Query(None, description="시작 경로 (None=루트)"),
     depth: int = Query(2, ge=1, le=10, description="탐색 깊이 (1-10)"),
@@ -240,7 +283,20 @@ async def get_folder_tree_with_progress(
         None, description="쉼표로 구분된 확장자 필터 (예: mp4,mkv)"
     ),
     include_hidden: bool = Query(False, description="숨김 파일/폴더 포함 (v1.29.0)"),
-    db: AsyncSession = Depends(get_db),
+    format: str = Query(
+        "json",
+        regex="^(json|ndjson)$",
+        description="응답 형식 (json: 전체 트리, ndjson: 노드 단위 스트리밍)",
+    ),
+    stats_schema: Optional[str] = Query(
+        None,
+        regex="^(full|compact)$",
+        description="통계 스키마 (full: 노드별 전체 통계, compact: 최상위 1회 + 노드별 비율)",
+    ),
+    x_response_schema: Optional[str] = Header(
+        None, description="stats_schema 쿼리 대신 헤더로 협상 (full|compact)"
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     폴더 트리 + 진행률 통합 조회 (간트차트용)
@@ -252,6 +308,11 @@ async def get_folder_tree_with_progress(
     - extensions 필터로 특정 확장자만 포함
     - include_hidden=true 시 숨김 파일/폴더 포함 (v1.29.0)
     - Issue #29: root_stats로 전체 통계 반환 (NAS/Sheets 데이터 분리 표시용)
+    - format=ndjson 시 노드가 완성되는 즉시 한 줄씩 스트리밍
+      (node 레코드: parent_id + 노드 필드, 마지막 줄: summary 레코드)
+    - stats_schema=compact (또는 X-Response-Schema: compact 헤더) 시
+      root_stats/archive_stats를 최상위에 1회만 두고 노드에는 ratios만 포함.
+      기본값(full)은 기존 스키마 그대로 유지 (기존 클라이언트 호환)
 
     Returns:
         {tree: 폴더 트리, root_stats: 전체 통계}
@@ -261,17 +322,98 @@ async def get_folder_tree_with_progress(
     if extensions:
         ext_list = [f".{e.strip().lower().lstrip('.')}" for e in extensions.split(",")]
 
+    # 쿼리 파라미터 우선, 없으면 헤더로 협상
+    compact = (stats_schema or (x_response_schema or "").strip().lower()) == "compact"
+    # 헤더가 스키마 선택에 관여하면 캐시가 헤더별로 구분하도록 Vary 지정
+    headers = {"Vary": "X-Response-Schema"} if stats_schema is None else None
+
+    if format == "ndjson":
+        return StreamingResponse(
+            _stream_tree_ndjson(
+                path,
+                depth,
+                include_files,
+                ext_list,
+                include_codecs,
+                include_hidden,
+                compact,
+            ),
+            media_type="application/x-ndjson",
+            headers=headers,
+        )
+
     result = await progress_service.get_folder_with_progress(
-        db, path, depth, include_files, ext_list, include_codecs, include_hidden
+        db,
+        path,
+        depth,
+        include_files,
+        ext_list,
+        include_codecs,
+        include_hidden,
+        compact_stats=compact,
     )
-    return result
+
+    # 스키마별로 직접 직렬화 (Union response_model은 OpenAPI 문서화용)
+    response_model = CompactTreeWithRootStats if compact else TreeWithRootStats
+    if settings.FAST_JSON_ENABLED:
+        return model_json_response(response_model, result, headers=headers)
+    return JSONResponse(
+        response_model.model_validate(result).model_dump(mode="json"),
+        headers=headers,
+    )
+
+
+async def _stream_tree_ndjson(
+    path: Optional[str],
+    depth: int,
+    include_files: bool,
+    ext_list: Optional[List[str]],
+    include_codecs: bool,
+    include_hidden: bool,
+    compact: bool = False,
+):
+    """/tree NDJSON 스트림 생성기
+
+    get_read_db 세션은 응답 전송 전에 닫히므로 스트림 전용 읽기 세션을 직접 연다.
+    각 노드는 JSON 모드와 동일한 스키마(FolderWithProgress, compact 시
+    CompactFolderWithProgress)로 직렬화한다.
+    """
+    node_model = CompactFolderWithProgress if compact else FolderWithProgress
+    async with read_session_maker() as db:
+        records = progress_service.iter_folder_progress(
+            db,
+            path,
+            depth,
+            include_files,
+            ext_list,
+            include_codecs,
+            include_hidden,
+            compact_stats=compact,
+        )
+        try:
+            async for record in records:
+                if record["type"] == "node":
+                    record["node"] = node_model.model_validate(
+                        record["node"]
+                    ).model_dump(mode="json")
+                else:
+                    record["root_stats"] = RootStats.model_validate(
+                        record["root_stats"]
+                    ).model_dump(mode="json")
+                    record["archive_stats"] = ArchiveStats.model_validate(
+                        record["archive_stats"]
+                    ).model_dump(mode="json")
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+        finally:
+            # 연결 종료 시 세션이 닫히기 전에 생산자 정리
+            await records.aclose()
 
 
 @router.get("/folder/{folder_path:path}")
 async def get_folder_progress_detail(
     folder_path: str,
     include_files: bool = Query(True, description="파일 목록 포함"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     특정 폴더의 상세 진행률
@@ -293,7 +435,7 @@ async def get_folder_progress_detail(
 @router.get("/file/{file_path:path}")
 async def get_file_progress_detail(
     file_path: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     특정 파일의 상세 진행률
@@ -318,7 +460,7 @@ async def get_progress_summary(
     extensions: Optional[str] = Query(
         None, description="쉼표로 구분된 확장자 필터 (예: mp4,mkv)"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     전체 진행률 요약 (폴더 필터 지원)
@@ -365,14 +507,13 @@ async def get_progress_summary(
         folder_name = path.split("/")[-1] if path else None
         if folder_name:
             # 카테고리에 폴더명이 포함된 Work Status 검색
-            ws_query = select(func.count(WorkStatus.id)).where(
-                WorkStatus.category.ilike(f"%{folder_name}%")
-            )
+            matches = search_service.contains(db, "category", folder_name)
+            ws_query = select(func.count(WorkStatus.id)).where(matches)
             ws_total = await db.scalar(ws_query) or 0
             ws_completed = (
                 await db.scalar(
                     select(func.count(WorkStatus.id)).where(
-                        WorkStatus.category.ilike(f"%{folder_name}%"),
+                        matches,
                         WorkStatus.status == "completed",
                     )
                 )
@@ -1,11 +1,18 @@
-from datetime import datetime, timedelta
-from typing import List, Optional
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import db_writer, get_db, get_read_db, read_session_maker
 from app.models.file_stats import ScanHistory
 from app.schemas.scan import (
     ScanHistoryResponse,
@@ -13,11 +20,32 @@ from app.schemas.scan import (
     ScanStartResponse,
     ScanStatus,
 )
+from app.services.alert_service import alert_service
+from app.services.data_generation import data_generation
+from app.services.progress_service import progress_service
+from app.services.scan_events import VIEWER_TTL_SECONDS, ScanEventBroadcaster
+from app.services.scan_staging import StagingDatabase, staging_supported
 from app.services.scanner import ArchiveScanner
+from app.services.shared_state import WORKER_ID, shared_state
+from app.services.snapshot_service import snapshot_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Global scan state (shared across all clients)
+# Shared state keys (visible to every worker process)
+SCAN_LOCK = "scan"
+SCAN_STATE_KEY = "scan:state"
+SCAN_STOP_KEY = "scan:stop"
+VIEWER_PREFIX = "viewer:"
+
+# client_id -> last heartbeat write on this worker (monotonic). Repeat polls
+# within a third of the TTL keep the existing key instead of rewriting it.
+_viewer_touched: Dict[str, float] = {}
+
+# Local scan state of the worker running the scan.
+# The scanner mutates this dict directly; a publisher task copies it to the
+# shared state backend every SCAN_STATE_FLUSH_SECONDS.
 _scan_state = {
     "is_scanning": False,
     "scan_id": None,
@@ -27,52 +55,142 @@ _scan_state = {
     "total_files_estimated": 0,
     "started_at": None,
     "logs": [],
+    "log_seq": 0,
     "media_files_processed": 0,
     "total_duration_found": 0.0,
 }
 
-# Track active viewers (simple heartbeat-based tracking)
-_active_viewers = {}  # {client_id: last_seen_timestamp}
+
+def _idle_state() -> Dict[str, Any]:
+    return {**_scan_state, "is_scanning": False, "scan_id": None, "logs": []}
+
+
+async def _publish_scan_state():
+    """Copy the local scan state to the shared backend"""
+    # Full log ring buffer so stream consumers can pick up every new line
+    state = {**_scan_state, "logs": list(_scan_state.get("logs", []))}
+    if state["started_at"]:
+        state["started_at"] = state["started_at"].isoformat()
+    await shared_state.set(SCAN_STATE_KEY, state)
+
+
+async def _load_scan_state() -> Dict[str, Any]:
+    """Scan state as seen by all workers"""
+    shared = await shared_state.get(SCAN_STATE_KEY)
+    if not shared:
+        return _idle_state()
+    state = {**_idle_state(), **shared}
+    if isinstance(state["started_at"], str):
+        state["started_at"] = datetime.fromisoformat(state["started_at"])
+    # The worker that owned the scan died without cleaning up
+    if state["is_scanning"] and await shared_state.lock_owner(SCAN_LOCK) is None:
+        state["is_scanning"] = False
+        state["scan_id"] = None
+    return state
 
 
 @router.get("/status", response_model=ScanStatus)
 async def get_scan_status(client_id: Optional[str] = None):
-    """Get current scan status (shared across all clients)"""
-    # Update viewer tracking
+    """Get current scan status (shared across all clients and workers)"""
+    # Update viewer tracking (heartbeat expires after VIEWER_TTL_SECONDS)
     if client_id:
-        _active_viewers[client_id] = datetime.utcnow()
+        await _touch_viewer(client_id)
+    active_viewers = await shared_state.count_prefix(VIEWER_PREFIX)
+
+    return _build_status(await _load_scan_state(), active_viewers)
+
+
+async def _touch_viewer(client_id: str):
+    """Refresh the viewer heartbeat at most every VIEWER_TTL_SECONDS / 3"""
+    now = time.monotonic()
+    if now - _viewer_touched.get(client_id, float("-inf")) < VIEWER_TTL_SECONDS / 3:
+        return
+    for key, touched in list(_viewer_touched.items()):
+        if now - touched > VIEWER_TTL_SECONDS:
+            del _viewer_touched[key]
+    await shared_state.set(VIEWER_PREFIX + client_id, 1, ttl=VIEWER_TTL_SECONDS)
+    _viewer_touched[client_id] = now
 
-    # Clean up stale viewers (not seen in 30 seconds)
-    stale_threshold = datetime.utcnow() - timedelta(seconds=30)
-    stale_clients = [k for k, v in _active_viewers.items() if v < stale_threshold]
-    for client in stale_clients:
-        del _active_viewers[client]
 
+def _build_status(state: Dict[str, Any], active_viewers: int) -> ScanStatus:
     elapsed = None
     estimated_remaining = None
 
-    if _scan_state["started_at"]:
-        elapsed = (datetime.utcnow() - _scan_state["started_at"]).total_seconds()
+    if state["started_at"]:
+        elapsed = (datetime.utcnow() - state["started_at"]).total_seconds()
 
         # Estimate remaining time based on progress
-        if _scan_state["progress"] > 0:
-            total_estimated = elapsed / (_scan_state["progress"] / 100)
+        if state["progress"] > 0:
+            total_estimated = elapsed / (state["progress"] / 100)
             estimated_remaining = max(0, total_estimated - elapsed)
 
     return ScanStatus(
-        is_scanning=_scan_state["is_scanning"],
-        scan_id=_scan_state["scan_id"],
-        progress=_scan_state["progress"],
-        current_folder=_scan_state["current_folder"],
-        files_scanned=_scan_state["files_scanned"],
-        total_files_estimated=_scan_state["total_files_estimated"],
-        started_at=_scan_state["started_at"],
+        is_scanning=state["is_scanning"],
+        scan_id=state["scan_id"],
+        progress=state["progress"],
+        current_folder=state["current_folder"],
+        files_scanned=state["files_scanned"],
+        total_files_estimated=state["total_files_estimated"],
+        started_at=state["started_at"],
         elapsed_seconds=elapsed,
         estimated_remaining_seconds=estimated_remaining,
-        logs=_scan_state.get("logs", [])[-20:],  # Last 20 logs
-        media_files_processed=_scan_state.get("media_files_processed", 0),
-        total_duration_found=_scan_state.get("total_duration_found", 0.0),
-        active_viewers=len(_active_viewers),
+        logs=state.get("logs", [])[-20:],  # Last 20 logs
+        log_seq=state.get("log_seq", 0),
+        media_files_processed=state.get("media_files_processed", 0),
+        total_duration_found=state.get("total_duration_found", 0.0),
+        active_viewers=active_viewers,
+    )
+
+
+async def _stream_state() -> Dict[str, Any]:
+    """Status payload for the event stream (full log buffer for deltas)"""
+    state = await _load_scan_state()
+    payload = _build_status(state, 0).model_dump(mode="json")
+    payload["logs"] = state.get("logs", [])
+    if not payload["is_scanning"]:
+        # Idle: don't emit a delta every tick just because elapsed grows
+        payload["elapsed_seconds"] = None
+        payload["estimated_remaining_seconds"] = None
+    return payload
+
+
+# One broadcaster per worker: polls the shared state once per interval and
+# fans out coalesced deltas to every open stream
+scan_events = ScanEventBroadcaster(_stream_state)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/events")
+async def stream_scan_events(request: Request):
+    """Scan progress as Server-Sent Events
+
+    - snapshot: full status once on connect
+    - progress: changed fields + new log lines (log_seq = last line's number),
+      at most one per SCAN_STREAM_INTERVAL_SECONDS
+    - comment lines as keepalive
+
+    Open connections count as active viewers (no polling heartbeat needed).
+    """
+
+    async def events():
+        async with scan_events.subscribe() as subscriber:
+            yield _sse("snapshot", await scan_events.snapshot())
+            while not await request.is_disconnected():
+                delta = await subscriber.next(
+                    timeout=settings.SCAN_STREAM_KEEPALIVE_SECONDS
+                )
+                if delta is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield _sse("progress", delta)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -83,18 +201,35 @@ async def start_scan(
     db: AsyncSession = Depends(get_db),
 ):
     """Start a new archive scan"""
-    if _scan_state["is_scanning"]:
+    staged = request.staged if request.staged is not None else settings.SCAN_STAGED
+    if staged and not staging_supported():
+        if request.staged:
+            raise HTTPException(
+                status_code=400,
+                detail="Staged scans require a file-based SQLite database",
+            )
+        staged = False
+
+    # Only one scan across all workers
+    if not await shared_state.acquire_lock(
+        SCAN_LOCK, WORKER_ID, settings.SCAN_LOCK_TTL_SECONDS
+    ):
         raise HTTPException(status_code=409, detail="A scan is already in progress")
+    await shared_state.delete(SCAN_STOP_KEY)
 
     # Create scan history record
-    scan_history = ScanHistory(
-        scan_type=request.scan_type,
-        status="running",
-        started_at=datetime.utcnow(),
-    )
-    db.add(scan_history)
-    await db.commit()
-    await db.refresh(scan_history)
+    try:
+        scan_history = ScanHistory(
+            scan_type=request.scan_type,
+            status="running",
+            started_at=datetime.utcnow(),
+        )
+        db.add(scan_history)
+        await db.commit()
+        await db.refresh(scan_history)
+    except Exception:
+        await shared_state.release_lock(SCAN_LOCK, WORKER_ID)
+        raise
 
     # Update global state
     _scan_state["is_scanning"] = True
@@ -106,8 +241,12 @@ async def start_scan(
     _scan_state["logs"] = [
         f"[{datetime.utcnow().strftime('%H:%M:%S')}] 🚀 Scan started"
     ]
+    _scan_state["log_seq"] = 1
     _scan_state["media_files_processed"] = 0
     _scan_state["total_duration_found"] = 0.0
+    await _publish_scan_state()
+    # New "running" scan history row
+    await data_generation.bump("scan")
 
     # Start background scan
     background_tasks.add_task(
@@ -115,6 +254,7 @@ async def start_scan(
         scan_history.id,
         request.path,
         request.scan_type,
+        staged,
     )
 
     return ScanStartResponse(
@@ -124,53 +264,139 @@ async def start_scan(
     )
 
 
-async def run_scan(scan_id: int, path: Optional[str] = None, scan_type: str = "full"):
+async def run_scan(
+    scan_id: int,
+    path: Optional[str] = None,
+    scan_type: str = "full",
+    staged: bool = False,
+):
     """Background scan task"""
-    from app.core.database import async_session_maker
+    # In-place scans change live data as they go; staged scans only on swap
+    publisher = asyncio.create_task(_publish_scan_state_loop(bump_data=not staged))
+    staging = StagingDatabase() if staged else None
+    started = time.perf_counter()
+    status = "failed"
+    try:
+        # Scanner reads through the read-only pool; its writes go through the
+        # single writer. Staged scans use the staging snapshot for both.
+        session_maker, writer = read_session_maker, None
+        if staging:
+            await staging.create()
+            session_maker, writer = staging.read_session_maker, staging.writer
 
-    async with async_session_maker() as db:
-        try:
-            scanner = ArchiveScanner(db, _scan_state, scan_type=scan_type)
+        async with session_maker() as db:
+            scanner = ArchiveScanner(
+                db, _scan_state, scan_type=scan_type, writer=writer, scan_id=scan_id
+            )
             await scanner.scan(path)
 
-            # Update scan history
-            scan_history = await db.get(ScanHistory, scan_id)
-            if scan_history:
-                scan_history.status = "completed"
-                scan_history.completed_at = datetime.utcnow()
-                scan_history.total_files = _scan_state["files_scanned"]
-                await db.commit()
+        status = "completed"
+        if staging:
+            if _scan_state["is_scanning"]:
+                scanner._add_log("🔁 Swapping staged snapshot into the live database")
+                await staging.swap()
+                progress_service.invalidate_archive_stats_cache()
+            else:
+                # Stopped: the live database keeps the previous snapshot
+                await staging.discard()
+                status = "cancelled"
 
-        except Exception as e:
-            # Update scan history with error
-            scan_history = await db.get(ScanHistory, scan_id)
-            if scan_history:
-                scan_history.status = "failed"
-                scan_history.completed_at = datetime.utcnow()
-                scan_history.error_message = str(e)
-                await db.commit()
+        # Update scan history
+        await _finish_scan_history(
+            scan_id, status, total_files=_scan_state["files_scanned"]
+        )
 
-        finally:
-            # Reset global state
-            _scan_state["is_scanning"] = False
-            _scan_state["scan_id"] = None
+        if status == "completed" and settings.SNAPSHOT_ENABLED:
+            # Only a scan that walked the whole tree has a full per-type breakdown
+            complete = path is None and _scan_state["is_scanning"]
+            try:
+                await snapshot_service.take_snapshot(
+                    scanner.type_stats if complete else None
+                )
+            except Exception as e:
+                logger.exception(f"Snapshot after scan failed: {e}")
+
+        if status == "completed":
+            # Only the folders this scan changed are evaluated
+            try:
+                await alert_service.evaluate_scan(scanner.started_at)
+            except Exception as e:
+                logger.exception(f"Alert evaluation after scan failed: {e}")
+
+    except Exception as e:
+        status = "failed"
+        if staging:
+            await staging.discard()
+        # Update scan history with error
+        await _finish_scan_history(scan_id, "failed", error_message=str(e))
+
+    finally:
+        metrics.scan_runs.inc(labels=(status,))
+        metrics.scan_duration.observe(time.perf_counter() - started, (scan_type,))
+        # Reset state and hand the scan lock back
+        _scan_state["is_scanning"] = False
+        _scan_state["scan_id"] = None
+        publisher.cancel()
+        try:
+            await publisher
+        except asyncio.CancelledError:
+            pass
+        await _publish_scan_state()
+        await data_generation.bump("scan")
+        await shared_state.delete(SCAN_STOP_KEY)
+        await shared_state.release_lock(SCAN_LOCK, WORKER_ID)
+
+
+async def _finish_scan_history(scan_id: int, status: str, **fields):
+    async def write(db: AsyncSession):
+        scan_history = await db.get(ScanHistory, scan_id)
+        if scan_history:
+            scan_history.status = status
+            scan_history.completed_at = datetime.utcnow()
+            for key, value in fields.items():
+                setattr(scan_history, key, value)
+
+    await db_writer.run(write)
+
+
+async def _publish_scan_state_loop(bump_data: bool = True):
+    """Publish scan progress, renew the scan lock and watch for stop requests"""
+    files_published = _scan_state["files_scanned"]
+    while True:
+        await asyncio.sleep(settings.SCAN_STATE_FLUSH_SECONDS)
+        try:
+            # Stop may have been requested through another worker
+            if await shared_state.get(SCAN_STOP_KEY):
+                _scan_state["is_scanning"] = False
+            await _publish_scan_state()
+            if bump_data and _scan_state["files_scanned"] != files_published:
+                files_published = _scan_state["files_scanned"]
+                await data_generation.bump("scan")
+            await shared_state.acquire_lock(
+                SCAN_LOCK, WORKER_ID, settings.SCAN_LOCK_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish scan state: {e}")
 
 
 @router.post("/stop")
 async def stop_scan():
     """Stop current scan"""
-    if not _scan_state["is_scanning"]:
+    state = await _load_scan_state()
+    if not state["is_scanning"]:
         raise HTTPException(status_code=400, detail="No scan is currently running")
 
-    # Set flag to stop scan (scanner should check this)
+    # Set flag to stop scan (scanner should check this).
+    # The owning worker picks up the shared stop flag on its next publish.
     _scan_state["is_scanning"] = False
+    await shared_state.set(SCAN_STOP_KEY, True, ttl=settings.SCAN_LOCK_TTL_SECONDS)
     return {"message": "Scan stop requested"}
 
 
 @router.get("/history", response_model=List[ScanHistoryResponse])
 async def get_scan_history(
     limit: int = 10,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get scan history"""
     result = await db.execute(
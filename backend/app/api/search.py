@@ -0,0 +1,31 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_read_db
+from app.schemas.search import SearchKind, SearchResponse
+from app.services.search_service import search_service
+
+router = APIRouter()
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Name substring"),
+    kind: Optional[List[SearchKind]] = Query(
+        default=None, description="file, folder, hand, category (default: all)"
+    ),
+    limit: int = Query(default=20, ge=1, le=200),
+    offset: int = Query(default=0, ge=0, le=10000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    파일/폴더/핸드/카테고리 이름 검색 (부분 문자열, 순위순)
+
+    - 3자 이상은 검색 색인 사용 (SQLite FTS5 trigram / PostgreSQL pg_trgm)
+    - has_more로 다음 페이지 여부 (전체 개수는 세지 않음)
+    """
+    return await search_service.search(
+        db, q.strip() or q, kinds=kind, limit=limit, offset=offset
+    )
@@ -5,8 +5,16 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.models.file_stats import DailySnapshot, FileStats, FolderStats, ScanHistory
+from app.core.config import settings
+from app.core.database import get_read_db
+from app.core.fast_json import model_json_response
+from app.models.file_stats import (
+    DailySnapshot,
+    FileStats,
+    FolderStats,
+    HistoryRollup,
+    ScanHistory,
+)
 from app.schemas.stats import (
     CodecCount,
     CodecsByExtensionResponse,
@@ -21,6 +29,7 @@ from app.schemas.stats import (
     HistoryResponse,
     StatsSummary,
 )
+from app.services.snapshot_service import PERIOD_DAYS, period_start
 from app.services.utils import format_duration, format_size
 
 router = APIRouter()
@@ -31,7 +40,7 @@ async def get_stats_summary(
     extensions: Optional[str] = Query(
         None, description="Comma-separated extensions filter (e.g., mp4,mkv,avi)"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get overall archive statistics summary with optional extension filter"""
 
@@ -124,7 +133,7 @@ async def get_file_type_stats(
     extensions: Optional[str] = Query(
         None, description="Comma-separated extensions filter"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get file statistics by extension/type with optional filter"""
 
@@ -171,7 +180,7 @@ async def get_file_type_stats(
 
 
 @router.get("/available-extensions", response_model=List[str])
-async def get_available_extensions(db: AsyncSession = Depends(get_db)):
+async def get_available_extensions(db: AsyncSession = Depends(get_read_db)):
     """Get list of all available file extensions in the archive"""
 
     result = await db.execute(
@@ -189,21 +198,58 @@ async def get_available_extensions(db: AsyncSession = Depends(get_db)):
 @router.get("/history", response_model=HistoryResponse)
 async def get_history(
     period: str = Query(default="daily", regex="^(daily|weekly|monthly)$"),
-    days: int = Query(default=30, ge=1, le=365),
-    db: AsyncSession = Depends(get_db),
+    days: int = Query(default=30, ge=1, le=3650),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get historical statistics data"""
+    """Get historical statistics data
+
+    Weekly/monthly points come from the rollup table. If the requested
+    resolution would exceed HISTORY_MAX_POINTS, the next coarser one is used
+    (the response's period says which).
+    """
 
     end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=days)
 
-    result = await db.execute(
-        select(DailySnapshot)
-        .where(DailySnapshot.date >= start_date)
-        .where(DailySnapshot.date <= end_date)
-        .order_by(DailySnapshot.date.asc())
-    )
-    snapshots = result.scalars().all()
+    periods = list(PERIOD_DAYS)
+    index = periods.index(period)
+    while (
+        index < len(periods) - 1
+        and days / PERIOD_DAYS[periods[index]] > settings.HISTORY_MAX_POINTS
+    ):
+        index += 1
+    period = periods[index]
+
+    if period == "daily":
+        result = await db.execute(
+            select(
+                DailySnapshot.date,
+                DailySnapshot.total_size,
+                DailySnapshot.total_files,
+                DailySnapshot.total_folders,
+                DailySnapshot.total_duration,
+            )
+            .where(DailySnapshot.date >= start_date)
+            .where(DailySnapshot.date <= end_date)
+            .order_by(DailySnapshot.date.asc())
+        )
+    else:
+        result = await db.execute(
+            select(
+                HistoryRollup.period_start.label("date"),
+                HistoryRollup.total_size,
+                HistoryRollup.total_files,
+                HistoryRollup.total_folders,
+                HistoryRollup.total_duration,
+            )
+            .where(HistoryRollup.period == period)
+            .where(
+                HistoryRollup.period_start >= period_start(period, start_date.date())
+            )
+            .where(HistoryRollup.period_start <= end_date)
+            .order_by(HistoryRollup.period_start.asc())
+        )
+    snapshots = result.all()
 
     data = []
     prev_size = None
@@ -238,7 +284,7 @@ async def get_codec_stats(
     extensions: Optional[str] = Query(
         None, description="Comma-separated extensions filter"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get codec statistics for video and audio files"""
 
@@ -357,7 +403,7 @@ async def get_codecs_by_extension(
     codec_limit: int = Query(
         default=5, ge=1, le=20, description="Max codecs per extension"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get codec distribution grouped by file extension.
 
@@ -461,7 +507,7 @@ async def get_codec_tree(
     path: Optional[str] = Query(None, description="Starting folder path"),
     depth: int = Query(default=2, ge=1, le=5, description="Tree depth"),
     include_files: bool = Query(default=False, description="Include file list"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get codec information in folder tree structure.
 
@@ -640,6 +686,8 @@ async def get_codec_tree(
         folder_data = await build_codec_tree(folder, 0, depth, include_files)
         tree.append(folder_data)
 
+    if settings.FAST_JSON_ENABLED:
+        return model_json_response(List[CodecTreeNode], tree)
     return tree
 
 
@@ -647,7 +695,7 @@ async def get_codec_tree(
 async def get_codec_folder_detail(
     folder_path: str,
     include_files: bool = Query(default=True, description="Include file list"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get codec information for a specific folder.
 
@@ -7,7 +7,7 @@ Block: sync.sheets
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from app.core.config import settings
@@ -23,6 +23,7 @@ class SyncStatusResponse(BaseModel):
     status: str
     last_sync: Optional[str]
     next_sync: Optional[str]
+    last_success: Optional[str] = None
     error: Optional[str]
     interval_minutes: int
     last_result: Optional[Dict[str, Any]] = None
@@ -37,6 +38,9 @@ class SyncTriggerResponse(BaseModel):
     synced_count: int
     created_count: int
     updated_count: int
+    deleted_count: int = 0
+    unchanged_count: int = 0
+    skipped_unchanged: bool = False
     error: Optional[str] = None
     message: str
 
@@ -51,17 +55,20 @@ async def get_sync_status():
         - status: 현재 상태 (idle, syncing, error)
         - last_sync: 마지막 동기화 시간
         - next_sync: 다음 예정 동기화 시간
+        - last_success: 마지막 성공 동기화 시간
         - error: 마지막 에러 메시지
         - interval_minutes: 동기화 간격 (분)
         - last_result: 마지막 동기화 결과 상세
     """
-    status_dict = sheets_sync_service.get_status_dict()
+    # 모든 워커가 같은 상태를 보도록 공유 상태 기준
+    status_dict = await sheets_sync_service.get_shared_status()
 
     return SyncStatusResponse(
         enabled=status_dict["enabled"],
         status=status_dict["status"],
         last_sync=status_dict["last_sync"],
         next_sync=status_dict["next_sync"],
+        last_success=status_dict.get("last_success"),
         error=status_dict["error"],
         interval_minutes=status_dict["interval_minutes"],
         last_result=status_dict["last_result"],
@@ -69,11 +76,16 @@ async def get_sync_status():
 
 
 @router.post("/trigger", response_model=SyncTriggerResponse)
-async def trigger_sync():
+async def trigger_sync(
+    force: bool = Query(
+        False, description="Re-sync even if the sheet content is unchanged"
+    ),
+):
     """
     수동으로 동기화 트리거
 
     Google Sheets에서 데이터를 즉시 가져와 DB에 동기화합니다.
+    시트 내용이 이전과 같으면 DB 반영을 건너뜁니다 (force=true로 강제).
 
     Returns:
         - success: 성공 여부
@@ -82,6 +94,9 @@ async def trigger_sync():
         - synced_count: 동기화된 레코드 수
         - created_count: 신규 생성된 레코드 수
         - updated_count: 업데이트된 레코드 수
+        - deleted_count: 시트에서 삭제되어 제거된 레코드 수
+        - unchanged_count: 변경 없어 건너뛴 레코드 수
+        - skipped_unchanged: 시트 fingerprint 동일로 전체 skip 여부
         - error: 에러 메시지 (실패 시)
         - message: 결과 메시지
     """
@@ -91,18 +106,22 @@ async def trigger_sync():
             detail="Sheets sync is not enabled. Check SHEETS_SYNC_ENABLED and WORK_STATUS_SHEET_URL settings.",
         )
 
-    if sheets_sync_service.status == "syncing":
+    shared_status = await sheets_sync_service.get_shared_status()
+    if shared_status["status"] == "syncing":
         raise HTTPException(
             status_code=409,
             detail="Sync is already in progress. Please wait.",
         )
 
-    result = await sheets_sync_service.sync()
+    result = await sheets_sync_service.sync(force=force)
 
-    if result.success:
+    if result.success and result.skipped_unchanged:
+        message = f"Sheet unchanged - skipped ({result.synced_count} records)"
+    elif result.success:
         message = (
             f"Successfully synced {result.synced_count} records "
-            f"({result.created_count} created, {result.updated_count} updated)"
+            f"({result.created_count} created, {result.updated_count} updated, "
+            f"{result.deleted_count} deleted, {result.unchanged_count} unchanged)"
         )
     else:
         message = f"Sync failed: {result.error}"
@@ -114,6 +133,9 @@ async def trigger_sync():
         synced_count=result.synced_count,
         created_count=result.created_count,
         updated_count=result.updated_count,
+        deleted_count=result.deleted_count,
+        unchanged_count=result.unchanged_count,
+        skipped_unchanged=result.skipped_unchanged,
         error=result.error,
         message=message,
     )
@@ -8,7 +8,7 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.work_status import Archive, WorkStatus
 from app.schemas.work_status import (
     ArchiveCreate,
@@ -19,6 +19,7 @@ from app.schemas.work_status import (
     WorkStatusResponse,
     WorkStatusUpdate,
 )
+from app.services.data_generation import data_generation
 
 router = APIRouter()
 
@@ -27,7 +28,7 @@ router = APIRouter()
 
 
 @router.get("/archives", response_model=List[ArchiveResponse])
-async def get_archives(db: AsyncSession = Depends(get_db)):
+async def get_archives(db: AsyncSession = Depends(get_read_db)):
     """Get all archives"""
     result = await db.execute(select(Archive).order_by(Archive.name))
     return result.scalars().all()
@@ -42,6 +43,7 @@ async def create_archive(
     db_archive = Archive(**archive.model_dump())
     db.add(db_archive)
     await db.commit()
+    await data_generation.bump("work_status")
     await db.refresh(db_archive)
     return db_archive
 
@@ -54,7 +56,7 @@ async def get_work_statuses(
     archive_id: Optional[int] = None,
     status: Optional[str] = None,
     pic: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get all work statuses with optional filters"""
 
@@ -113,7 +115,7 @@ async def get_work_statuses(
 @router.get("/{work_status_id}", response_model=WorkStatusResponse)
 async def get_work_status(
     work_status_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get a specific work status"""
     result = await db.execute(
@@ -156,6 +158,7 @@ async def create_work_status(
     db_ws.calculate_progress()
     db.add(db_ws)
     await db.commit()
+    await data_generation.bump("work_status")
     await db.refresh(db_ws)
 
     # Get archive name
@@ -195,6 +198,7 @@ async def update_work_status(
 
     db_ws.calculate_progress()
     await db.commit()
+    await data_generation.bump("work_status")
     await db.refresh(db_ws)
 
     archive = await db.get(Archive, db_ws.archive_id)
@@ -228,6 +232,7 @@ async def delete_work_status(
 
     await db.delete(db_ws)
     await db.commit()
+    await data_generation.bump("work_status")
     return {"message": "Work status deleted successfully"}
 
 
@@ -310,6 +315,8 @@ async def import_csv(
 
     await db.commit()
 
+    await data_generation.bump("work_status")
+
     return WorkStatusImportResult(
         success=len(errors) == 0,
         total_rows=imported + skipped,
@@ -320,7 +327,7 @@ async def import_csv(
 
 
 @router.get("/export/csv")
-async def export_csv(db: AsyncSession = Depends(get_db)):
+async def export_csv(db: AsyncSession = Depends(get_read_db)):
     """Export work statuses to CSV"""
     result = await db.execute(
         select(WorkStatus, Archive.name.label("archive_name"))
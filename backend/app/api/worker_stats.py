@@ -10,7 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.work_status import Archive, WorkStatus
 from app.schemas.worker_stats import (
     WorkerDetailResponse,
@@ -113,7 +113,7 @@ async def get_worker_stats(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/summary", response_model=WorkerStatsSummary)
-async def get_worker_stats_summary(db: AsyncSession = Depends(get_db)):
+async def get_worker_stats_summary(db: AsyncSession = Depends(get_read_db)):
     """
     Get overall summary statistics only
 
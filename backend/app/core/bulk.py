@@ -0,0 +1,105 @@
+"""
+엔진별 bulk 쓰기 경로
+
+스캐너/동기화의 대량 쓰기를 DB 엔진에 맞는 가장 빠른 방식으로 실행한다.
+
+- bulk_insert: PostgreSQL(asyncpg)은 COPY, 그 외는 executemany INSERT
+- upsert: INSERT ... ON CONFLICT (SQLite 3.24+ / PostgreSQL 공통 구문)
+
+모두 호출 측 트랜잭션 안에서 실행 (commit은 호출 측에서).
+
+Block: core.bulk
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(dialect: str, model):
+    """ON CONFLICT를 지원하는 dialect별 INSERT 구문"""
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert(model)
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    return sqlite_insert(model)
+
+
+def _uses_copy(db: AsyncSession) -> bool:
+    dialect = db.bind.dialect
+    return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+
+def _copy_columns(model, rows: List[Dict[str, Any]]) -> list:
+    """COPY 대상 컬럼: 행에 있는 컬럼 + Python 기본값이 있는 컬럼
+
+    COPY는 ORM 기본값(created_at=datetime.utcnow 등)을 적용하지 않으므로
+    여기서 채운다. 나머지(자동 증가 PK 등)는 DB 기본값 사용.
+    """
+    keys = set().union(*rows)
+    return [
+        column
+        for column in model.__table__.columns
+        if column.key in keys or (column.default is not None and not column.primary_key)
+    ]
+
+
+def _default_value(column):
+    default = column.default
+    return default.arg(None) if default.is_callable else default.arg
+
+
+async def bulk_insert(db: AsyncSession, model, rows: List[Dict[str, Any]]) -> None:
+    """대량 INSERT (PostgreSQL+asyncpg는 COPY FROM STDIN)"""
+    if not rows:
+        return
+    if not _uses_copy(db):
+        await db.execute(insert(model), rows)
+        return
+
+    columns = _copy_columns(model, rows)
+    defaults = {
+        column.key: _default_value(column)
+        for column in columns
+        if column.default is not None
+    }
+    records = [
+        tuple(row.get(column.key, defaults.get(column.key)) for column in columns)
+        for row in rows
+    ]
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        model.__table__.name,
+        records=records,
+        columns=[column.name for column in columns],
+    )
+
+
+async def upsert(
+    db: AsyncSession,
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+) -> None:
+    """INSERT ... ON CONFLICT
+
+    Args:
+        conflict_columns: 유니크 제약 컬럼
+        update_columns: 충돌 시 갱신할 컬럼 (없으면 DO NOTHING)
+    """
+    if not rows:
+        return
+    stmt = dialect_insert(db.bind.dialect.name, model)
+    if update_columns:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={col: stmt.excluded[col] for col in update_columns},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+    await db.execute(stmt, rows)
@@ -17,6 +17,21 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./archive_stats.db"
+    # SQLite production profile (파일 DB일 때 연결마다 적용)
+    SQLITE_WAL: bool = True
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456  # 256MB
+    SQLITE_CACHE_SIZE: int = -65536  # 음수 = KiB 단위 (64MB)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_READ_POOL_SIZE: int = 5
+    # PostgreSQL 연결 풀 (postgresql+asyncpg)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # 풀 고갈 시 대기 (초)
+    DB_POOL_RECYCLE: int = 1800  # 유휴 연결 재생성 주기 (초)
+    DB_POOL_PRE_PING: bool = True
+    # 기동 시 Alembic upgrade head 실행 (False면 수동: cd backend && alembic upgrade head)
+    DATABASE_AUTO_MIGRATE: bool = True
 
     # NAS Connection
     NAS_HOST: str = "10.10.100.122"
@@ -31,6 +46,90 @@ class Settings(BaseSettings):
     # Redis (for background tasks)
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # 워커 간 공유 상태 / leader lock 백엔드 ("database" | "redis" | "memory")
+    # database: 앱 DB shared_state 테이블, redis: REDIS_URL, memory: 단일 워커 전용
+    SHARED_STATE_BACKEND: str = "database"
+    # 만료된 공유 상태 항목(뷰어 heartbeat, 잠금) 정리 주기 (초)
+    SHARED_STATE_PURGE_SECONDS: float = 60.0
+    # 스캔 진행 상태를 공유 상태에 게시하는 주기 / 스캔 lock TTL (초)
+    SCAN_STATE_FLUSH_SECONDS: float = 1.0
+    SCAN_LOCK_TTL_SECONDS: int = 60
+    # 스캔 로그 ring buffer 크기 / SSE delta 최소 간격 / keepalive 간격 (초)
+    SCAN_LOG_BUFFER_SIZE: int = 100
+    SCAN_STREAM_INTERVAL_SECONDS: float = 1.0
+    SCAN_STREAM_KEEPALIVE_SECONDS: float = 15.0
+    # staged 스캔: staging DB 복사본에 기록 후 완료 시 라이브 DB에 교체 반영
+    # (파일 SQLite 전용, 요청의 staged 값이 우선)
+    SCAN_STAGED: bool = False
+
+    # HTTP 캐시: 데이터 generation 기반 ETag / 304 / 응답 memo
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_PATHS: list = [
+        "/api/stats",
+        "/api/folders",
+        "/api/progress",
+        "/api/hands",
+        "/api/metadata",
+        "/api/worker-stats",
+    ]
+    HTTP_CACHE_EXCLUDE: list = ["/sync/"]  # 동기화 상태는 generation과 무관
+    # 응답이 달라지는 요청 헤더 (ETag에 포함)
+    HTTP_CACHE_VARY_HEADERS: list = ["Accept", "Accept-Encoding", "X-Response-Schema"]
+    HTTP_CACHE_CONTROL: str = "private, no-cache"  # 매번 재검증 (304)
+    HTTP_CACHE_MEMO_ENTRIES: int = 128  # 워커별 응답 memo 개수 (0 = 끔)
+    HTTP_CACHE_MEMO_MAX_BYTES: int = 2 * 1024 * 1024  # 응답 1건 최대 크기
+    # 동일 요청(같은 ETag) 동시 처리 병합 - HTTP_CACHE_ENABLED일 때만 동작
+    SINGLE_FLIGHT_ENABLED: bool = True
+    SINGLE_FLIGHT_PATHS: list = [
+        "/api/progress/tree",
+        "/api/stats/codecs",
+        "/api/stats/summary",
+    ]
+    SINGLE_FLIGHT_MAX_BYTES: int = 32 * 1024 * 1024  # 공유할 응답 최대 크기
+    # 다른 워커의 generation 변경 반영 주기 (초)
+    DATA_GENERATION_REFRESH_SECONDS: float = 1.0
+
+    # 요청별 SQL 계측 (Server-Timing 헤더, /debug/requests - X-Profile-Token 필요)
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_BUFFER_SIZE: int = 200  # 최근 요청 보관 수
+    QUERY_STATS_SLOWEST: int = 5  # 요청/라우트별 가장 느린 문장 보관 수
+    QUERY_STATS_STATEMENT_CHARS: int = 300
+    # 이 기준 이상인 요청은 INFO 로그 (나머지는 DEBUG)
+    QUERY_STATS_LOG_MIN_QUERIES: int = 50
+    QUERY_STATS_LOG_MIN_DB_MS: float = 500.0
+
+    # Prometheus 지표 (GET /metrics, 워커 단위)
+    METRICS_ENABLED: bool = True
+
+    # 온디맨드 프로파일링 (?__profile=1, /debug/profile) - 비어 있으면 비활성
+    PROFILING_TOKEN: str = ""  # X-Profile-Token 헤더 값
+    PROFILING_DIR: str = "./profiles"  # 작업 프로파일 보고서 저장 위치
+    PROFILING_INTERVAL_MS: float = 10.0  # 샘플 간격
+    PROFILING_MAX_SECONDS: int = 600  # 작업 프로파일 최대 시간
+    PROFILING_PSTATS_LINES: int = 80
+
+    # 대용량 응답 직렬화 fast path (/progress/tree, /stats/codecs/tree, /hands)
+    FAST_JSON_ENABLED: bool = False
+    # 큰 비스트리밍 응답 gzip (Accept-Encoding: gzip 요청만)
+    RESPONSE_COMPRESSION_ENABLED: bool = False
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 64 * 1024
+    RESPONSE_COMPRESSION_LEVEL: int = 6
+
+    # 용량 히스토리 snapshot (스캔 완료 후 + 매일, 주/월 rollup)
+    SNAPSHOT_ENABLED: bool = True
+    SNAPSHOT_DAILY_HOUR: int = 0  # 매일 snapshot 시각 (서버 로컬 시간)
+    # /stats/history 최대 점 개수 - 넘으면 주/월 rollup으로 전환
+    HISTORY_MAX_POINTS: int = 400
+
+    # 용량 알림 (스캔 후 변경된 폴더만 평가, 동기화 지연은 주기 점검)
+    ALERTS_ENABLED: bool = True
+    ALERT_EMAIL_TO: str = ""  # 쉼표 구분 기본 수신자
+    ALERT_COOLDOWN_MINUTES: int = 720  # 같은 규칙 재발송 최소 간격
+    ALERT_SYNC_CHECK_MINUTES: int = 15  # sync_stale 규칙 점검 주기
+    ALERT_BATCH_SECONDS: float = 60.0  # 알림을 모아 보내는 대기 시간
+    ALERT_EMAIL_MAX_PER_HOUR: int = 10  # 초과분은 다음 묶음으로 이월
+    ALERT_EMAIL_MAX_LINES: int = 200  # 메일 1통 최대 알림 수
+
     # Email
     SMTP_HOST: Optional[str] = None
     SMTP_PORT: int = 587
@@ -42,6 +141,12 @@ class Settings(BaseSettings):
     GOOGLE_SERVICE_ACCOUNT_FILE: str = "service_account_key.json"
     SHEETS_SYNC_ENABLED: bool = True
     SHEETS_SYNC_INTERVAL_MINUTES: int = 30
+    # values_batch_get 1회당 워크시트 수 / 동시 batch 요청 수
+    SHEETS_FETCH_BATCH_SIZE: int = 20
+    SHEETS_FETCH_CONCURRENCY: int = 2
+    # 첫 동기화는 기동 후 지연 + 랜덤 jitter 뒤 백그라운드로 실행 (초)
+    SYNC_STARTUP_DELAY_SECONDS: int = 5
+    SYNC_JITTER_SECONDS: int = 30
 
     # Archiving Status Sheet (아카이빙 작업 현황)
     # Note: WORK_STATUS_SHEET_URL is deprecated (Issue #37)
@@ -1,5 +1,12 @@
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
@@ -8,10 +15,98 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-)
+def _is_sqlite_file(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _set_sqlite_pragmas(dbapi_connection, readonly: bool = False):
+    """SQLite production profile (connect 이벤트마다 적용)
+
+    - WAL: 읽기와 쓰기가 서로 막지 않음 (writer 연결에서만 설정, DB 파일에 유지됨)
+    - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 손상 없음
+    - mmap_size / cache_size: 읽기 I/O를 페이지 캐시/메모리 맵으로
+    - busy_timeout: 잠금 충돌 시 즉시 "database is locked" 대신 대기
+    """
+    cursor = dbapi_connection.cursor()
+    if not readonly and settings.SQLITE_WAL:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    if readonly:
+        cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def _read_only_url(url: str) -> str:
+    """같은 SQLite 파일을 읽기 전용 URI로 여는 URL"""
+    parsed = make_url(url)
+    return parsed.set(
+        database=f"file:{parsed.database}",
+        query={**parsed.query, "mode": "ro", "uri": "true"},
+    ).render_as_string(hide_password=False)
+
+
+def _pool_kwargs(url: str) -> dict:
+    """엔진별 연결 풀 설정"""
+    backend = make_url(url).get_backend_name()
+    if backend == "postgresql":
+        return {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
+    if _is_sqlite_file(url):
+        # aiosqlite 파일 DB 기본값은 NullPool(요청마다 새 연결 + pragma 재설정)이므로
+        # 연결을 재사용하도록 큐 풀 지정
+        return {"poolclass": AsyncAdaptedQueuePool}
+    return {}
+
+
+def create_sqlite_engine(url: str, readonly: bool = False, **kwargs):
+    """파일 SQLite 엔진 (연결마다 production pragma 적용)
+
+    readonly=True면 같은 파일을 읽기 전용 URI로 연다.
+    """
+    sqlite_engine = create_async_engine(
+        _read_only_url(url) if readonly else url,
+        echo=settings.DEBUG,
+        **_pool_kwargs(url),
+        **kwargs,
+    )
+    event.listen(
+        sqlite_engine.sync_engine,
+        "connect",
+        lambda conn, _: _set_sqlite_pragmas(conn, readonly=readonly),
+    )
+    return sqlite_engine
+
+
+_SQLITE_FILE = _is_sqlite_file(settings.DATABASE_URL)
+
+if _SQLITE_FILE:
+    engine = create_sqlite_engine(settings.DATABASE_URL)
+    # 읽기 전용 풀: 대시보드 조회는 writer 연결/잠금과 분리
+    read_engine = create_sqlite_engine(
+        settings.DATABASE_URL,
+        readonly=True,
+        pool_size=settings.SQLITE_READ_POOL_SIZE,
+    )
+else:
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        **_pool_kwargs(settings.DATABASE_URL),
+    )
+    read_engine = engine
 
 async_session_maker = async_sessionmaker(
     engine,
@@ -19,6 +114,12 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def get_db() -> AsyncSession:
     async with async_session_maker() as session:
@@ -28,6 +129,85 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
-async def create_tables():
+async def get_read_db() -> AsyncSession:
+    """조회 전용 세션 (SQLite에서는 읽기 전용 연결 풀)"""
+    async with read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+class DatabaseWriter:
+    """단일 writer
+
+    스캐너/동기화 쓰기를 프로세스 내에서 한 번에 하나씩 FIFO로 실행한다.
+    SQLite는 writer가 하나뿐이므로, 여러 작업이 동시에 쓰기 트랜잭션을 열어
+    busy_timeout까지 대기하거나 "database is locked"로 실패하는 대신
+    여기서 순서대로 대기한다. 각 작업은 짧은 트랜잭션으로 유지할 것.
+    """
+
+    def __init__(self, session_maker=None):
+        self._session_maker = session_maker or async_session_maker
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def session(self):
+        """writer 슬롯을 잡은 세션 (호출자가 commit)"""
+        async with self._lock:
+            async with self._session_maker() as db:
+                yield db
+
+    @asynccontextmanager
+    async def connection(self):
+        """writer 슬롯을 잡은 연결 (ATTACH 등 연결 단위 작업, 호출자가 commit)"""
+        async with self._lock:
+            async with self._session_maker.kw["bind"].connect() as conn:
+                yield conn
+
+    async def run(self, fn):
+        """fn(session)을 writer 슬롯에서 실행하고 commit"""
+        async with self.session() as db:
+            result = await fn(db)
+            await db.commit()
+            return result
+
+
+db_writer = DatabaseWriter()
+
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+BASELINE_REVISION = "0001"
+
+
+def _upgrade(connection):
+    """Alembic upgrade head (동기 연결에서 실행)"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    config.attributes["connection"] = connection
+
+    tables = set(inspect(connection).get_table_names())
+    if "alembic_version" not in tables and "folder_stats" in tables:
+        # Alembic 도입 전 create_all()로 만든 DB → baseline으로 간주
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
+
+async def dispose_engines():
+    """풀 연결 정리 (앱 종료 시)
+
+    파일 SQLite는 큐 풀 → 남은 aiosqlite 연결 스레드(non-daemon)가 프로세스
+    종료를 막으므로 명시적으로 닫는다.
+    """
+    if read_engine is not engine:
+        await read_engine.dispose()
+    await engine.dispose()
+
+
+async def run_migrations():
+    """스키마를 최신 리비전으로 (create_all 대신 Alembic 마이그레이션)"""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade)
@@ -0,0 +1,118 @@
+"""
+대용량 응답 직렬화 / 압축
+
+FAST_JSON_ENABLED (opt-in) 시 큰 트리/목록 응답의 직렬화 경로:
+- model_json_response: 응답 스키마(pydantic)로 1회 검증 후 pydantic-core에서 바로
+  JSON bytes 생성 (모델 → dict → jsonable_encoder → json.dumps 단계를 생략)
+- FastJSONResponse: 스키마와 정확히 일치하는 내부 dict는 검증 없이 orjson으로 인코딩
+  (orjson 미설치 시 표준 json)
+
+CompressionMiddleware: 완성된(비스트리밍) 큰 응답만 gzip.
+SSE / NDJSON 같은 스트리밍 응답은 청크 단위 전달을 위해 그대로 통과.
+
+Block: core.fast_json
+"""
+
+import gzip
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSONResponse (내용은 이미 JSON 호환 dict/list)"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def model_json_response(
+    schema, content: Any, headers: Optional[dict] = None
+) -> Response:
+    """content를 schema로 검증하고 pydantic-core에서 바로 JSON으로 직렬화"""
+    adapter = _adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(content))
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _header(headers, name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key == name:
+            return value
+    return None
+
+
+class CompressionMiddleware:
+    """큰 비스트리밍 응답 gzip 압축 (Accept-Encoding 협상)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        accept = (
+            _header(scope.get("headers", []), b"accept-encoding") or b""
+            if scope["type"] == "http"
+            else b""
+        )
+        if not settings.RESPONSE_COMPRESSION_ENABLED or b"gzip" not in accept:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[dict] = None
+
+        async def send_wrapper(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                # 첫 body를 보고 압축 여부를 정할 때까지 보류
+                start = message
+                return
+            if start is None:
+                await send(message)
+                return
+
+            pending, start = start, None
+            body = message.get("body", b"")
+            headers = list(pending.get("headers", []))
+            if (
+                message.get("more_body", False)
+                or len(body) < settings.RESPONSE_COMPRESSION_MIN_BYTES
+                or _header(headers, b"content-encoding") is not None
+            ):
+                await send(pending)
+                await send(message)
+                return
+
+            body = gzip.compress(
+                body, compresslevel=settings.RESPONSE_COMPRESSION_LEVEL, mtime=0
+            )
+            vary = _header(headers, b"vary")
+            if vary and b"accept-encoding" not in vary.lower():
+                vary += b", Accept-Encoding"
+            headers = [
+                (k, v) for k, v in headers if k not in (b"content-length", b"vary")
+            ]
+            headers += [
+                (b"content-encoding", b"gzip"),
+                (b"content-length", str(len(body)).encode()),
+                (b"vary", vary or b"Accept-Encoding"),
+            ]
+            await send({**pending, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,206 @@
+"""
+generation 기반 HTTP 캐시 미들웨어
+
+HTTP_CACHE_PATHS 아래 GET 응답에 ETag / Cache-Control을 붙인다.
+ETag = hash(generation vector, 경로, 정렬된 쿼리, HTTP_CACHE_VARY_HEADERS 값) 이므로
+요청 처리 전에 계산 가능 → If-None-Match가 일치하면 라우트/DB를 거치지 않고 304.
+
+generation이 같으면 응답도 같으므로, 크기가 작은 200 응답은 워커별 LRU에
+ETag 키로 보관했다가 그대로 재전송 (generation이 바뀌면 키가 달라져 자연 만료).
+SINGLE_FLIGHT_PATHS의 동시 동일 요청(같은 ETag)은 single-flight로 1회만 처리.
+
+Block: core.http_cache
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.single_flight import single_flight
+from app.services.data_generation import data_generation
+
+CachedResponse = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _vary_headers() -> List[str]:
+    return [name.lower() for name in settings.HTTP_CACHE_VARY_HEADERS]
+
+
+def _varies_only_on_known(headers) -> bool:
+    """응답 Vary가 ETag에 반영된 요청 헤더로만 이뤄졌는지 (아니면 memo 안 함)"""
+    known = set(_vary_headers())
+    for key, value in headers:
+        if key == b"vary":
+            names = {v.strip().lower() for v in value.decode("latin-1").split(",")}
+            if not names <= known:
+                return False
+    return True
+
+
+def compute_etag(vector, scope) -> str:
+    payload = json.dumps(
+        [
+            vector,
+            scope["path"],
+            sorted(parse_qsl(scope.get("query_string", b"").decode("latin-1"))),
+            [_header(scope, name.encode()) for name in _vary_headers()],
+        ],
+        sort_keys=True,
+    )
+    return 'W/"' + hashlib.sha1(payload.encode()).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # 약한 비교 (W/ 접두사 무시)
+    bare = etag.removeprefix("W/")
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == bare for tag in candidates
+    )
+
+
+class GenerationCacheMiddleware:
+    """ETag / 304 / 응답 memo (순수 ASGI - 스트리밍 응답은 그대로 통과)"""
+
+    def __init__(self, app):
+        self.app = app
+        self._memo: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    def _applies(self, scope) -> bool:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            return False
+        if scope.get("profiling"):
+            # 프로파일링 요청은 항상 라우트까지 실행
+            return False
+        path = scope["path"]
+        if any(part in path for part in settings.HTTP_CACHE_EXCLUDE):
+            return False
+        return any(
+            path == prefix or path.startswith(prefix + "/")
+            for prefix in settings.HTTP_CACHE_PATHS
+        )
+
+    def _coalesces(self, scope) -> bool:
+        return (
+            settings.SINGLE_FLIGHT_ENABLED
+            and scope["method"] == "GET"
+            and scope["path"] in settings.SINGLE_FLIGHT_PATHS
+        )
+
+    async def __call__(self, scope, receive, send):
+        if not settings.HTTP_CACHE_ENABLED or not self._applies(scope):
+            await self.app(scope, receive, send)
+            return
+
+        etag = compute_etag(await data_generation.current(), scope)
+        cache_headers = [
+            (b"etag", etag.encode()),
+            (b"cache-control", settings.HTTP_CACHE_CONTROL.encode()),
+        ]
+
+        if etag_matches(_header(scope, b"if-none-match"), etag):
+            metrics.http_cache_results.inc(labels=("not_modified",))
+            await send(
+                {"type": "http.response.start", "status": 304, "headers": cache_headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        cached = self._memo.get(etag) if scope["method"] == "GET" else None
+        if cached is not None:
+            self._memo.move_to_end(etag)
+            metrics.http_cache_results.inc(labels=("memo_hit",))
+            await _replay(send, cached)
+            return
+
+        if self._coalesces(scope):
+            # 같은 ETag = 같은 응답 → 처리 중인 동일 요청의 결과를 공유
+            result, shared = await single_flight.do(
+                etag,
+                lambda: self._respond(scope, receive, send, etag, cache_headers),
+                label=scope["path"],
+            )
+            if not shared:
+                return
+            if result is not None:
+                metrics.http_cache_results.inc(labels=("coalesced",))
+                await _replay(send, result)
+                return
+            # leader가 완성된 응답을 내지 못함 → 직접 처리
+
+        await self._respond(scope, receive, send, etag, cache_headers)
+
+    async def _respond(
+        self, scope, receive, send, etag: str, cache_headers
+    ) -> Optional[CachedResponse]:
+        """라우트 실행 + 헤더 부착. 완성된 200 응답이면 (memo 가능하면 memo 후) 반환"""
+        metrics.http_cache_results.inc(labels=("miss",))
+        limit = 0
+        if scope["method"] == "GET":
+            limit = settings.HTTP_CACHE_MEMO_MAX_BYTES
+            if self._coalesces(scope):
+                limit = max(limit, settings.SINGLE_FLIGHT_MAX_BYTES)
+
+        start = {}
+        chunks: Optional[List[bytes]] = [] if limit else None
+        size = 0
+        result: Optional[CachedResponse] = None
+
+        async def send_wrapper(message):
+            nonlocal chunks, size, result
+            if message["type"] == "http.response.start":
+                start.update(message)
+                if message["status"] == 200:
+                    headers = [
+                        (k, v)
+                        for k, v in message.get("headers", [])
+                        if k not in (b"etag", b"cache-control")
+                    ]
+                    message = {**message, "headers": headers + cache_headers}
+                    start["headers"] = message["headers"]
+                    if not _varies_only_on_known(headers):
+                        chunks = None
+                else:
+                    chunks = None
+            elif message["type"] == "http.response.body" and chunks is not None:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > limit:
+                    chunks = None
+                else:
+                    chunks.append(body)
+                    if not message.get("more_body", False):
+                        result = (start["status"], start["headers"], b"".join(chunks))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if result is not None and len(result[2]) <= settings.HTTP_CACHE_MEMO_MAX_BYTES:
+            self._remember(etag, result)
+        return result
+
+    def _remember(self, etag: str, response: CachedResponse):
+        if settings.HTTP_CACHE_MEMO_ENTRIES <= 0:
+            return
+        self._memo[etag] = response
+        while len(self._memo) > settings.HTTP_CACHE_MEMO_ENTRIES:
+            self._memo.popitem(last=False)
+
+
+async def _replay(send, response: CachedResponse):
+    status, headers, body = response
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,345 @@
+"""
+Prometheus 지표 (text exposition format 0.0.4)
+
+외부 의존성 없는 최소 구현: Counter / Histogram / 콜백 Gauge.
+스캐너 파일 루프처럼 자주 호출되는 곳에서도 쓰도록 기록은 dict 갱신 1회
+(+ Histogram은 bisect 1회)만 한다. 지표는 워커(프로세스) 단위.
+
+- HTTP: 라우트별 요청 수 / 지연 히스토그램, HTTP 캐시 결과
+- 스캐너: 파일/바이트/스킵/오류 카운터, ffprobe 호출 결과 + 지연 히스토그램, 스캔 소요 시간
+- 동기화: 서비스/단계별 소요 시간 히스토그램, 실행 결과
+- DB 풀 / single-flight: 수집 시점 콜백 Gauge
+
+Block: core.metrics
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from app.core.config import settings
+
+Labels = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        # 스레드 풀(ffprobe)에서도 기록하므로 갱신은 잠금 안에서
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, labels: Labels = ()):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_label_text(self.label_names, labels)} {_number(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (버킷별 count는 내부적으로 비누적 저장)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # labels → [버킷별 count..., +Inf count, sum]
+        self._values: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, labels: Labels = ()):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(labels)
+            if row is None:
+                row = self._values[labels] = [0] * (len(self.buckets) + 2)
+            row[index] += 1
+            row[-1] += value
+
+    def time(self, labels: Labels = ()) -> "_Timer":
+        """with metric.time(labels): ... 블록 소요 시간 기록"""
+        return _Timer(self, labels)
+
+    def count(self, labels: Labels = ()) -> int:
+        row = self._values.get(labels)
+        return int(sum(row[:-1])) if row else 0
+
+    def samples(self) -> List[str]:
+        lines = []
+        for labels, row in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), row[:-1]):
+                cumulative += count
+                label_text = _label_text(
+                    (*self.label_names, "le"), (*labels, _number(bound))
+                )
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = _label_text(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_number(row[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, self.labels)
+
+
+class CallbackGauge(_Metric):
+    """수집 시점에 callback()이 돌려주는 (labels, value) 목록"""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[Tuple[Labels, float]]],
+        labels: Sequence[str] = (),
+    ):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_label_text(self.label_names, labels)} {_number(value)}"
+            for labels, value in self.callback()
+        ]
+
+
+class MetricsRegistry:
+    """지표 모음 → text exposition"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels=()) -> Counter:
+        return self.register(Counter(name, documentation, labels))
+
+    def histogram(
+        self, name: str, documentation: str, labels=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labels, buckets))
+
+    def gauge(self, name: str, documentation: str, callback, labels=()):
+        return self.register(CallbackGauge(name, documentation, callback, labels))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            try:
+                samples = metric.samples()
+            except Exception:
+                # 콜백 실패가 전체 수집을 막지 않도록
+                continue
+            lines.extend(metric.header())
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+# Singleton instance
+registry = MetricsRegistry()
+
+PREFIX = "archive_"
+
+# ==================== HTTP ====================
+
+http_requests = registry.counter(
+    PREFIX + "http_requests_total", "HTTP requests", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    PREFIX + "http_request_duration_seconds",
+    "HTTP request latency",
+    ("method", "route"),
+)
+http_cache_results = registry.counter(
+    PREFIX + "http_cache_total",
+    "Generation cache outcomes (not_modified, memo_hit, coalesced, miss)",
+    ("result",),
+)
+
+# ==================== Scanner ====================
+
+scan_files = registry.counter(PREFIX + "scan_files_total", "Files processed by scans")
+scan_bytes = registry.counter(PREFIX + "scan_bytes_total", "Bytes of files processed")
+scan_files_skipped = registry.counter(
+    PREFIX + "scan_files_skipped_total", "Unchanged files skipped by incremental scans"
+)
+scan_errors = registry.counter(
+    PREFIX + "scan_errors_total", "Scanner errors", ("stage",)
+)
+scan_probes = registry.counter(
+    PREFIX + "scan_probes_total", "ffprobe invocations", ("result",)
+)
+scan_probe_duration = registry.histogram(
+    PREFIX + "scan_probe_duration_seconds",
+    "ffprobe latency",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+)
+scan_runs = registry.counter(PREFIX + "scan_runs_total", "Finished scans", ("status",))
+scan_duration = registry.histogram(
+    PREFIX + "scan_duration_seconds",
+    "Scan wall time",
+    ("scan_type",),
+    buckets=(1, 10, 60, 300, 900, 1800, 3600, 7200, 14400, 43200),
+)
+
+# ==================== Sync ====================
+
+sync_runs = registry.counter(
+    PREFIX + "sync_runs_total", "Sheet sync runs", ("service", "result")
+)
+sync_phase_duration = registry.histogram(
+    PREFIX + "sync_phase_duration_seconds",
+    "Sheet sync phase duration (fetch, apply, total)",
+    ("service", "phase"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+
+
+def record_sync(service: str, result: Any, seconds: float):
+    """sync() 1회 결과 기록 (result=None이면 예외로 종료)"""
+    if result is None:
+        outcome = "error"
+    elif not result.success:
+        outcome = "failed"
+    elif getattr(result, "skipped_unchanged", False):
+        outcome = "unchanged"
+    else:
+        outcome = "ok"
+    sync_runs.inc(labels=(service, outcome))
+    sync_phase_duration.observe(seconds, (service, "total"))
+
+
+# ==================== Collect-time gauges ====================
+
+
+def _pool_stats() -> Iterable[Tuple[Labels, float]]:
+    from app.core.database import engine, read_engine
+
+    pools = {"write": engine.pool}
+    if read_engine is not engine:
+        pools["read"] = read_engine.pool
+    for name, pool in pools.items():
+        # StaticPool / NullPool 등 통계가 없는 풀은 건너뜀
+        for stat in ("size", "checkedout", "overflow", "checkedin"):
+            getter = getattr(pool, stat, None)
+            if getter is not None:
+                yield (name, stat), getter()
+
+
+def _single_flight_stats() -> Iterable[Tuple[Labels, float]]:
+    from app.core.single_flight import single_flight
+
+    stats = single_flight.stats()
+    for name in ("leaders", "followers", "fallbacks", "inflight"):
+        yield (name,), stats[name]
+
+
+registry.gauge(
+    PREFIX + "db_pool_connections",
+    "DB connection pool state",
+    _pool_stats,
+    ("pool", "state"),
+)
+registry.gauge(
+    PREFIX + "single_flight_requests",
+    "Single-flight coalescing counters",
+    _single_flight_stats,
+    ("kind",),
+)
+
+
+class MetricsMiddleware:
+    """라우트별 요청 수 / 지연 기록 (라우트 템플릿 기준이라 라벨 수가 제한됨)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "(not routed)"
+            method = scope["method"]
+            http_request_duration.observe(time.perf_counter() - start, (method, route))
+            http_requests.inc(labels=(method, route, str(status["code"])))
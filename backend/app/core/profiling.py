@@ -0,0 +1,387 @@
+"""
+온디맨드 프로파일링
+
+PROFILING_TOKEN이 설정된 경우에만 동작 (비어 있으면 미들웨어는 바로 통과,
+샘플러 스레드도 프로파일링 중에만 존재 → 비활성 시 오버헤드 없음).
+요청에는 X-Profile-Token 헤더가 일치해야 한다 (운영자 전용).
+
+- 요청 플래그 ?__profile=1 → 그 요청의 wall-clock 샘플 (collapsed stack, flamegraph 입력)
+  ?__profile=pstats → cProfile 결과 (cumulative 순). 이벤트 루프 단위 계측이라
+  동시에 처리 중인 다른 요청도 함께 잡힌다.
+- 실행 중인 스캔/동기화 작업에 시간 제한 샘플러 부착 → PROFILING_DIR에 저장
+
+샘플러는 대상 asyncio Task의 코루틴 체인(cr_await)을 따라가므로 DB/스레드 풀을
+기다리는 시간도 await 지점별로 잡힌다 (<waiting>). 루프에서 실행 중이면 그 아래
+동기 호출까지, thread_codes가 주어지면 해당 코드를 실행 중인 스레드 풀 작업도 포함.
+
+Block: core.profiling
+"""
+
+import asyncio
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from app.core.config import settings
+
+PROFILE_PARAM = "__profile"
+TOKEN_HEADER = b"x-profile-token"
+
+
+def authorized(token: Optional[str]) -> bool:
+    """프로파일링 활성 + 토큰 일치"""
+    expected = settings.PROFILING_TOKEN
+    if not expected or not token:
+        return False
+    return hmac.compare_digest(token.encode(), expected.encode())
+
+
+# ==================== Sampler ====================
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def _inner_frame(obj):
+    for attr in ("cr_frame", "gi_frame", "ag_frame"):
+        frame = getattr(obj, attr, None)
+        if frame is not None:
+            return frame
+    return None
+
+
+def _is_running(obj) -> bool:
+    return bool(
+        getattr(obj, "cr_running", False)
+        or getattr(obj, "gi_running", False)
+        or getattr(obj, "ag_running", False)
+    )
+
+
+def _awaiting(obj):
+    for attr in ("cr_await", "gi_yieldfrom", "ag_await"):
+        value = getattr(obj, attr, None)
+        if value is not None:
+            return value
+    return None
+
+
+def _coroutine_frames(task: asyncio.Task) -> Tuple[List[Any], bool]:
+    """Task의 코루틴 체인 frame 목록 (바깥 → 안), 가장 안쪽이 실행 중인지"""
+    frames = []
+    running = False
+    obj = task.get_coro()
+    while obj is not None:
+        frame = _inner_frame(obj)
+        if frame is None:
+            break
+        frames.append(frame)
+        running = _is_running(obj)
+        obj = _awaiting(obj)
+    return frames, running
+
+
+def find_task(code) -> Optional[asyncio.Task]:
+    """코루틴 체인에 code를 실행 중인 frame이 있는 Task"""
+    for task in asyncio.all_tasks():
+        frames, _ = _coroutine_frames(task)
+        if any(frame.f_code is code for frame in frames):
+            return task
+    return None
+
+
+class Sampler:
+    """대상 Task(+선택한 스레드 풀 작업)의 stack을 주기적으로 수집"""
+
+    def __init__(
+        self,
+        task: asyncio.Task,
+        root_code=None,
+        thread_codes: Iterable = (),
+        interval: Optional[float] = None,
+    ):
+        self.task = task
+        self.root_code = root_code
+        self.thread_codes = frozenset(thread_codes)
+        self.interval = interval or settings.PROFILING_INTERVAL_MS / 1000
+        # 루프 스레드에서 생성해야 함 (실행 중인 코루틴 아래 동기 호출 추적용)
+        self.loop_thread = threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started = 0.0
+        self.ended = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, seconds: Optional[float] = None, on_done=None) -> "Sampler":
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, args=(seconds, on_done), name="profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self, seconds: Optional[float], on_done):
+        deadline = self.started + seconds if seconds else None
+        while not self._stop.wait(self.interval):
+            if self.task.done() or (deadline and time.perf_counter() >= deadline):
+                break
+            try:
+                self.sample()
+            except Exception:
+                # 루프 스레드가 체인을 바꾸는 중에 읽은 경우 - 해당 샘플만 버림
+                pass
+        self.ended = time.perf_counter()
+        if on_done is not None:
+            on_done(self)
+
+    def sample(self):
+        current = sys._current_frames()
+        stack = self._task_stack(current.get(self.loop_thread))
+        if stack:
+            self.stacks[";".join(stack)] += 1
+        if self.thread_codes:
+            for ident, frame in current.items():
+                if ident in (self.loop_thread, threading.get_ident()):
+                    continue
+                stack = self._thread_stack(frame)
+                if stack:
+                    self.stacks[";".join(stack)] += 1
+        self.samples += 1
+
+    def _task_stack(self, loop_frame) -> List[str]:
+        frames, running = _coroutine_frames(self.task)
+        if not frames:
+            return []
+        leaf = ["<waiting>"]
+        if running:
+            # 실행 중이면 cr_await 체인이 끊기므로 loop 스레드 stack에서 나머지를 채움
+            below = []
+            frame = loop_frame
+            while frame is not None and frame is not frames[-1]:
+                below.append(frame)
+                frame = frame.f_back
+            if frame is not None:
+                frames.extend(reversed(below))
+            leaf = []
+        if self.root_code is not None:
+            for index, frame in enumerate(frames):
+                if frame.f_code is self.root_code:
+                    frames = frames[index:]
+                    break
+        return [_frame_name(frame) for frame in frames] + leaf
+
+    def _thread_stack(self, frame) -> List[str]:
+        frames = []
+        matched = False
+        while frame is not None:
+            frames.append(frame)
+            matched = matched or frame.f_code in self.thread_codes
+            frame = frame.f_back
+        if not matched:
+            return []
+        return ["<thread pool>"] + [_frame_name(f) for f in reversed(frames)]
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope 입력 형식 (stack count)"""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "interval_ms": round(self.interval * 1000, 2),
+            "duration_ms": round(
+                ((self.ended or time.perf_counter()) - self.started) * 1000, 1
+            ),
+            "stacks": len(self.stacks),
+        }
+
+
+# ==================== Background jobs ====================
+
+
+class JobProfiles:
+    """실행 중인 작업에 부착한 샘플러 + 디스크 보고서"""
+
+    def __init__(self):
+        self.active: Dict[str, Sampler] = {}
+        self._lock = threading.Lock()
+
+    def attach(
+        self, job: str, task: asyncio.Task, root_code, thread_codes, seconds: float
+    ) -> str:
+        """샘플러 시작, 보고서 파일 이름 반환 (작업 종료 / seconds 경과 시 저장)"""
+        with self._lock:
+            if job in self.active:
+                raise RuntimeError(f"Already profiling {job}")
+            os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+            name = f"{job}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.folded"
+            path = os.path.join(settings.PROFILING_DIR, name)
+            sampler = Sampler(task, root_code, thread_codes)
+            self.active[job] = sampler
+
+        def done(sampler: Sampler):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(sampler.collapsed())
+            with self._lock:
+                self.active.pop(job, None)
+
+        sampler.start(seconds, on_done=done)
+        return name
+
+    def reports(self) -> List[Dict[str, Any]]:
+        if not os.path.isdir(settings.PROFILING_DIR):
+            return []
+        reports = []
+        for entry in os.scandir(settings.PROFILING_DIR):
+            if entry.is_file() and entry.name.endswith(".folded"):
+                stat = entry.stat()
+                reports.append(
+                    {
+                        "name": entry.name,
+                        "size": stat.st_size,
+                        "created_at": datetime.fromtimestamp(stat.st_mtime),
+                    }
+                )
+        return sorted(reports, key=lambda r: r["created_at"], reverse=True)
+
+    def report_path(self, name: str) -> Optional[str]:
+        # 디렉터리 밖 경로 차단
+        if os.path.basename(name) != name:
+            return None
+        path = os.path.join(settings.PROFILING_DIR, name)
+        return path if os.path.isfile(path) else None
+
+
+# Singleton instance
+job_profiles = JobProfiles()
+
+
+# ==================== Request flag ====================
+
+# cProfile은 스레드당 하나만 활성화 가능
+_pstats_lock = threading.Lock()
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class ProfilingMiddleware:
+    """?__profile=1|pstats 요청을 프로파일링하고 응답 대신 결과 반환"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            not settings.PROFILING_TOKEN
+            or scope["type"] != "http"
+            or PROFILE_PARAM.encode() not in scope["query_string"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        params = parse_qsl(
+            scope["query_string"].decode("latin-1"), keep_blank_values=True
+        )
+        mode = dict(params).get(PROFILE_PARAM)
+        if mode is None or not authorized(_header(scope, TOKEN_HEADER)):
+            await self.app(scope, receive, send)
+            return
+
+        # 라우트에는 플래그 없이 전달, HTTP 캐시(304/memo)는 건너뜀
+        inner_scope = {
+            **scope,
+            "query_string": urlencode(
+                [(k, v) for k, v in params if k != PROFILE_PARAM]
+            ).encode(),
+            "headers": [
+                (k, v)
+                for k, v in scope["headers"]
+                if k not in (b"if-none-match", b"accept-encoding", TOKEN_HEADER)
+            ],
+            "profiling": True,
+        }
+        await self._profiled(inner_scope, receive, send, mode)
+
+    async def _profiled(self, scope, receive, send, mode: str):
+        status = {"code": 500}
+
+        async def discard(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+
+        if mode == "pstats":
+            if not _pstats_lock.acquire(blocking=False):
+                await _send_text(send, 409, "Another pstats profile is running\n", [])
+                return
+            profile = cProfile.Profile()
+            started = time.perf_counter()
+            try:
+                profile.enable()
+                try:
+                    await self.app(scope, receive, discard)
+                finally:
+                    profile.disable()
+            finally:
+                _pstats_lock.release()
+            out = io.StringIO()
+            stats = pstats.Stats(profile, stream=out)
+            stats.sort_stats("cumulative").print_stats(settings.PROFILING_PSTATS_LINES)
+            body = out.getvalue()
+            meta = {"duration_ms": round((time.perf_counter() - started) * 1000, 1)}
+        else:
+            sampler = Sampler(
+                asyncio.current_task(), root_code=ProfilingMiddleware._profiled.__code__
+            ).start()
+            try:
+                await self.app(scope, receive, discard)
+            finally:
+                sampler.stop()
+            body = sampler.collapsed()
+            meta = sampler.summary()
+
+        headers = [(b"x-profile-status", str(status["code"]).encode())] + [
+            (f"x-profile-{k.replace('_', '-')}".encode(), str(v).encode())
+            for k, v in meta.items()
+        ]
+        await _send_text(send, 200, body, headers)
+
+
+async def _send_text(send, status: int, body: str, headers: List[Tuple[bytes, bytes]]):
+    data = body.encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(data)).encode()),
+                (b"cache-control", b"no-store"),
+                *headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": data})
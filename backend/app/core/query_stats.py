@@ -0,0 +1,222 @@
+"""
+요청별 SQL 계측
+
+요청마다 실행된 쿼리 수 / DB 시간 / 반환 행 수 / 가장 느린 문장을 모은다.
+N+1 쿼리(트리 빌더의 폴더별 조회 등)가 어느 라우트에서 얼마나 나오는지 확인용.
+
+- SQLAlchemy before/after_cursor_execute 훅 (모든 엔진) → 현재 요청의 RequestQueryStats
+  (contextvar, 요청 밖의 스캔/동기화 쿼리는 집계하지 않음)
+- QueryStatsMiddleware: 응답 헤더 Server-Timing (db / app), 구조화 로그,
+  최근 요청 ring buffer + 라우트별 누적 (GET /debug/requests)
+
+Block: core.query_stats
+"""
+
+import heapq
+import json
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.requests")
+
+_current: ContextVar[Optional["RequestQueryStats"]] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def _statement_text(statement: str) -> str:
+    text = " ".join(statement.split())
+    limit = settings.QUERY_STATS_STATEMENT_CHARS
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _row_count(cursor) -> int:
+    """SELECT는 adapter가 미리 읽어 둔 행 수, 그 외는 DBAPI rowcount"""
+    rows = getattr(cursor, "_rows", None)
+    if rows is not None and cursor.description:
+        return len(rows)
+    return max(cursor.rowcount, 0)
+
+
+class RequestQueryStats:
+    """요청 1건의 SQL 집계"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.ended: Optional[float] = None
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+        # 응답 전송 완료 후 (BackgroundTasks 등) 쿼리는 집계하지 않음
+        self.finished = False
+        # (duration, seq, statement) min-heap - 가장 느린 N개만 유지
+        self._slowest: List[Tuple[float, int, str]] = []
+
+    def record(self, statement: str, duration: float, rows: int):
+        self.queries += 1
+        self.db_seconds += duration
+        self.rows += rows
+        entry = (duration, self.queries, statement)
+        if len(self._slowest) < settings.QUERY_STATS_SLOWEST:
+            heapq.heappush(self._slowest, entry)
+        elif duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def slowest(self) -> List[Dict[str, Any]]:
+        return [
+            {"ms": round(duration * 1000, 2), "statement": _statement_text(stmt)}
+            for duration, _, stmt in sorted(self._slowest, reverse=True)
+        ]
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current.get() is not None:
+        context._query_stats_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    start = getattr(context, "_query_stats_start", None)
+    if stats is None or start is None or stats.finished:
+        return
+    stats.record(statement, time.perf_counter() - start, _row_count(cursor))
+
+
+class RequestLog:
+    """최근 요청 ring buffer + 라우트별 누적 (워커 단위)"""
+
+    def __init__(self):
+        self.recent: Deque[Dict[str, Any]] = deque(
+            maxlen=settings.QUERY_STATS_BUFFER_SIZE
+        )
+        self.routes: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, entry: Dict[str, Any]):
+        self.recent.append(entry)
+        key = f"{entry['method']} {entry['route']}"
+        route = self.routes.get(key)
+        if route is None:
+            route = self.routes[key] = {
+                "route": key,
+                "requests": 0,
+                "queries": 0,
+                "db_ms": 0.0,
+                "rows": 0,
+                "max_queries": 0,
+                "max_db_ms": 0.0,
+                "slowest": [],
+            }
+        route["requests"] += 1
+        route["queries"] += entry["queries"]
+        route["db_ms"] = round(route["db_ms"] + entry["db_ms"], 2)
+        route["rows"] += entry["rows"]
+        route["max_queries"] = max(route["max_queries"], entry["queries"])
+        route["max_db_ms"] = max(route["max_db_ms"], entry["db_ms"])
+        slowest = route["slowest"] + entry["slowest"]
+        slowest.sort(key=lambda s: s["ms"], reverse=True)
+        route["slowest"] = slowest[: settings.QUERY_STATS_SLOWEST]
+
+    def snapshot(self, limit: int = 50) -> Dict[str, Any]:
+        routes = sorted(self.routes.values(), key=lambda r: r["db_ms"], reverse=True)
+        return {
+            "recent": list(self.recent)[-limit:][::-1],
+            "routes": [
+                {
+                    **route,
+                    "avg_queries": round(route["queries"] / route["requests"], 1),
+                    "avg_db_ms": round(route["db_ms"] / route["requests"], 2),
+                }
+                for route in routes
+            ],
+        }
+
+
+# Singleton instance
+request_log = RequestLog()
+
+
+class QueryStatsMiddleware:
+    """요청별 SQL 집계 → Server-Timing 헤더 / 로그 / request_log"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.QUERY_STATS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current.set(stats)
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                app_ms = (time.perf_counter() - stats.started) * 1000
+                db_ms = stats.db_seconds * 1000
+                timing = (
+                    f'db;dur={db_ms:.1f};desc="{stats.queries} queries", '
+                    f"app;dur={app_ms:.1f}"
+                )
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"server-timing", timing.encode()),
+                    ],
+                }
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                stats.finished = True
+                stats.ended = time.perf_counter()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stats.finished = True
+            _current.reset(token)
+            self._finish(scope, stats, status["code"])
+
+    def _finish(self, scope, stats: RequestQueryStats, status: int):
+        route = scope.get("route")
+        entry = {
+            "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "method": scope["method"],
+            "path": scope["path"],
+            # 라우터까지 가지 않은 응답(304/memo, 404)은 한 키로 묶음 (키 수 제한)
+            "route": getattr(route, "path", None) or "(not routed)",
+            "status": status,
+            "duration_ms": round(
+                ((stats.ended or time.perf_counter()) - stats.started) * 1000, 2
+            ),
+            "queries": stats.queries,
+            "db_ms": round(stats.db_seconds * 1000, 2),
+            "rows": stats.rows,
+            "slowest": stats.slowest,
+        }
+        request_log.add(entry)
+
+        slow = (
+            stats.queries >= settings.QUERY_STATS_LOG_MIN_QUERIES
+            or entry["db_ms"] >= settings.QUERY_STATS_LOG_MIN_DB_MS
+        )
+        logger.log(
+            logging.INFO if slow else logging.DEBUG,
+            json.dumps(
+                {k: v for k, v in entry.items() if k != "slowest"}, ensure_ascii=False
+            ),
+        )
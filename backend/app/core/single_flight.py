@@ -0,0 +1,86 @@
+"""
+Single-flight 요청 병합
+
+같은 키(엔드포인트 + 정규화된 파라미터 + 데이터 generation)의 요청이 처리 중이면
+뒤따르는 요청(follower)은 다시 계산하지 않고 먼저 온 요청(leader)의 결과를 기다린다.
+스캔 직후처럼 여러 탭/사용자가 같은 무거운 조회를 동시에 보낼 때 DB 부하를 1회로.
+
+- leader가 결과를 내지 못하면(None, 예외, 연결 끊김으로 취소) follower는 직접 실행
+- 워커(프로세스) 단위 병합, 지표는 경로별 leader/follower/fallback 수
+
+Block: core.single_flight
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class SingleFlight:
+    """키별 in-flight 작업 공유"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"leaders": 0, "followers": 0, "fallbacks": 0}
+        )
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Optional[Any]]],
+        label: str = "default",
+    ) -> Tuple[Optional[Any], bool]:
+        """key로 fn 실행 (동시 요청은 1회만)
+
+        Returns:
+            (결과, shared) - shared=True면 다른 요청(leader)의 결과.
+            follower인데 leader 결과가 None이면 (None, True) → 호출자가 직접 실행
+        """
+        stats = self._stats[label]
+        future = self._inflight.get(key)
+        if future is not None:
+            stats["followers"] += 1
+            result = await asyncio.shield(future)
+            if result is None:
+                stats["fallbacks"] += 1
+            return result, True
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        stats["leaders"] += 1
+        result = None
+        try:
+            result = await fn()
+            return result, False
+        finally:
+            self._inflight.pop(key, None)
+            future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """경로별 병합 지표 (collapse_ratio = follower / 전체 요청)"""
+        paths = {}
+        totals = {"leaders": 0, "followers": 0, "fallbacks": 0}
+        for label, counts in self._stats.items():
+            paths[label] = {**counts, "collapse_ratio": _ratio(counts)}
+            for name, value in counts.items():
+                totals[name] += value
+        return {
+            **totals,
+            "collapse_ratio": _ratio(totals),
+            "inflight": self.inflight,
+            "paths": paths,
+        }
+
+
+def _ratio(counts: Dict[str, int]) -> float:
+    total = counts["leaders"] + counts["followers"]
+    return round(counts["followers"] / total, 4) if total else 0.0
+
+
+# Singleton instance
+single_flight = SingleFlight()
@@ -1,24 +1,38 @@
 """Archive Statistics Dashboard - FastAPI Application"""
 
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from app.api import api_router
+from app.api import api_router, debug
 from app.core.config import settings
-from app.core.database import create_tables
+from app.core.database import dispose_engines, run_migrations
+from app.core.fast_json import CompressionMiddleware
+from app.core.http_cache import GenerationCacheMiddleware
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.services.alert_service import alert_service
 from app.services.hand_analysis_sync import hand_analysis_sync_service
 from app.services.sheets_sync import sheets_sync_service
+from app.services.shared_state import purge_loop
+from app.services.snapshot_service import snapshot_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
-    await create_tables()
+    if settings.DATABASE_AUTO_MIGRATE:
+        await run_migrations()
     print(f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} started")
 
+    # Sync 서비스는 스케줄러만 등록하고 첫 동기화는 지연 + jitter 후 백그라운드 실행
+    # (기동이 Sheets 응답을 기다리지 않음 - 데이터 준비 상태는 /ready 참조)
+
     # Start Google Sheets sync service (Work Status)
     if settings.SHEETS_SYNC_ENABLED:
         print("📊 Starting Google Sheets sync service...")
@@ -29,15 +43,30 @@ async def lifespan(app: FastAPI):
         print("🃏 Starting Hand Analysis sync service...")
         await hand_analysis_sync_service.start()
 
+    # Daily capacity snapshot (scans also write one when they complete)
+    await snapshot_service.start()
+    # Capacity alerts (scan rules run after each scan, sync staleness on a timer)
+    await alert_service.start()
+    # Expired viewer heartbeats / locks (reads never delete)
+    purge_task = asyncio.create_task(purge_loop())
+
     yield
 
     # Shutdown
+    purge_task.cancel()
+    try:
+        await purge_task
+    except asyncio.CancelledError:
+        pass
+    await alert_service.stop()
+    await snapshot_service.stop()
     if settings.SHEETS_SYNC_ENABLED:
         await sheets_sync_service.stop()
         print("📊 Google Sheets sync service stopped")
     if settings.HAND_ANALYSIS_SYNC_ENABLED:
         await hand_analysis_sync_service.stop()
         print("🃏 Hand Analysis sync service stopped")
+    await dispose_engines()
     print("👋 Application shutting down")
 
 
@@ -48,6 +77,12 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# gzip for large non-streaming responses (inside the cache so memo keeps compressed bodies)
+app.add_middleware(CompressionMiddleware)
+
+# ETag / 304 for dashboard reads (inside CORS so 304s carry CORS headers)
+app.add_middleware(GenerationCacheMiddleware)
+
 # CORS - Allow LAN access
 app.add_middleware(
     CORSMiddleware,
@@ -57,8 +92,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL count / DB time (outermost so cached responses are recorded too)
+app.add_middleware(QueryStatsMiddleware)
+
+# Prometheus request counters / latency per route template
+app.add_middleware(MetricsMiddleware)
+
+# ?__profile=1|pstats with X-Profile-Token (outermost: bypasses the HTTP cache)
+app.add_middleware(ProfilingMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_PREFIX)
+# Debug / profiling endpoints stay at the root (/debug/..., /metrics/coalescing)
+app.include_router(debug.router, tags=["Debug"])
 
 
 @app.get("/")
@@ -77,6 +123,47 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 지표 (text exposition format, 이 워커 기준)"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics disabled")
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/ready")
+async def ready(
+    require_warm: bool = Query(
+        False, description="True면 데이터가 warm 상태가 아닐 때 503 반환"
+    ),
+):
+    """Readiness endpoint
+
+    - serving: 요청 처리 가능 (이 응답이 나오면 항상 True)
+    - data_warm: 활성화된 동기화 서비스가 모두 1회 이상 성공했는지
+    """
+    checks = {}
+    for name, service in (
+        ("sheets_sync", sheets_sync_service),
+        ("hand_analysis_sync", hand_analysis_sync_service),
+    ):
+        # 동기화는 leader 워커만 수행 → 공유 상태 기준으로 판단
+        status = await service.get_shared_status()
+        checks[name] = {
+            "enabled": status["enabled"],
+            "status": status["status"],
+            "warm": bool(status.get("last_success")) or not status["enabled"],
+            "last_success": status.get("last_success"),
+            "next_sync": status["next_sync"],
+        }
+    data_warm = all(check["warm"] for check in checks.values())
+    body = {"serving": True, "data_warm": data_warm, "checks": checks}
+    status_code = 503 if require_warm and not data_warm else 200
+    return JSONResponse(body, status_code=status_code)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,12 +1,34 @@
-from app.models.file_stats import FileStats, FolderStats, ScanHistory
-from app.models.hand_analysis import HandAnalysis
+from app.models.alert import AlertEvent, AlertRule
+from app.models.file_stats import (
+    DailySnapshot,
+    FileStats,
+    FolderStats,
+    FolderStatsDelta,
+    HistoryRollup,
+    ScanHistory,
+)
+from app.models.hand_analysis import HandAnalysis, HandTag, HandTagLink
+from app.models.search import SEARCH_SOURCES, SEARCH_TABLES
+from app.models.shared_state import SharedStateEntry
+from app.models.sync_state import SyncFingerprint
 from app.models.work_status import Archive, WorkStatus
 
 __all__ = [
     "FileStats",
     "FolderStats",
+    "FolderStatsDelta",
     "ScanHistory",
+    "DailySnapshot",
+    "HistoryRollup",
     "WorkStatus",
     "Archive",
     "HandAnalysis",
+    "HandTag",
+    "HandTagLink",
+    "SyncFingerprint",
+    "SharedStateEntry",
+    "AlertRule",
+    "AlertEvent",
+    "SEARCH_SOURCES",
+    "SEARCH_TABLES",
 ]
@@ -0,0 +1,67 @@
+"""
+Alert Models
+
+용량 임계값 알림 규칙 및 발생 기록
+
+Block: alerts.rules
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String, Text
+
+from app.core.database import Base
+
+
+class AlertRule(Base):
+    """
+    알림 규칙 테이블
+
+    rule_type:
+        size: 폴더/전체 용량이 threshold(bytes)를 넘어서는 순간
+        growth: window_days 동안 증가량이 threshold(bytes) 이상
+        missing_duration: 미디어 파일 중 재생시간 없는 비율이 threshold(0~1) 이상
+        sync_stale: 마지막 동기화 성공 후 threshold(시간) 경과
+    target: 폴더 경로 또는 동기화 서비스 ("sheets", "hands") - 비어 있으면 전체
+    """
+
+    __tablename__ = "alert_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    rule_type = Column(String, nullable=False)
+    target = Column(String, nullable=True)
+    threshold = Column(Float, nullable=False)
+    window_days = Column(Integer, default=1)  # growth 전용
+
+    # 쉼표 구분 수신자 (비어 있으면 ALERT_EMAIL_TO)
+    recipients = Column(Text, nullable=True)
+    # 같은 규칙 재발송 최소 간격 (비어 있으면 ALERT_COOLDOWN_MINUTES)
+    cooldown_minutes = Column(Integer, nullable=True)
+    enabled = Column(Boolean, default=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<AlertRule {self.name} {self.rule_type} {self.target or '*'}>"
+
+
+class AlertEvent(Base):
+    """알림 발생 기록 (cooldown 판단 + 이력 조회)"""
+
+    __tablename__ = "alert_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    rule_id = Column(Integer, nullable=False)
+    rule_type = Column(String, nullable=False)
+    target = Column(String, nullable=True)
+    value = Column(Float, nullable=False)
+    threshold = Column(Float, nullable=False)
+    message = Column(Text, nullable=False)
+    triggered_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # 규칙별 최근 발생 (cooldown)
+        Index("ix_alert_events_rule_time", "rule_id", "triggered_at"),
+    )
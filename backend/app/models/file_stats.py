@@ -1,6 +1,16 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -22,6 +32,9 @@ class FolderStats(Base):
     file_count = Column(Integer, default=0)
     folder_count = Column(Integer, default=0)
     total_duration = Column(Float, default=0.0)  # seconds
+    # 미디어 파일 수 / 그중 재생시간 없는 파일 수 (누적 - missing_duration 알림용)
+    media_count = Column(Integer, default=0)
+    missing_duration_count = Column(Integer, default=0)
 
     # Work Status 연결 (명시적 FK - fuzzy matching 대체)
     work_status_id = Column(
@@ -36,6 +49,20 @@ class FolderStats(Base):
     # Relationships
     work_status = relationship("WorkStatus", back_populates="folders")
 
+    __table_args__ = (
+        # PostgreSQL: LIKE 'prefix%' 하위 경로 조회용 (비 C locale에서도 인덱스 사용)
+        Index(
+            "ix_folder_stats_path_prefix",
+            "path",
+            postgresql_ops={"path": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_folder_stats_parent_path_prefix",
+            "parent_path",
+            postgresql_ops={"parent_path": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class FileStats(Base):
     """File statistics model"""
@@ -63,6 +90,43 @@ class FileStats(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index(
+            "ix_file_stats_folder_path_prefix",
+            "folder_path",
+            postgresql_ops={"folder_path": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+class FolderStatsDelta(Base):
+    """Per-folder change recorded by a scan (only folders whose totals changed)"""
+
+    __tablename__ = "folder_stats_deltas"
+
+    id = Column(Integer, primary_key=True, index=True)
+    scan_id = Column(Integer, nullable=True)
+    folder_path = Column(String, nullable=False)
+    depth = Column(Integer, default=0)
+    # 스캔 시작 시각 - 같은 스캔의 변경은 같은 시점으로 묶임
+    scanned_at = Column(DateTime, nullable=False)
+
+    # Changes since the previous scan
+    size_delta = Column(BigInteger, default=0)
+    file_count_delta = Column(Integer, default=0)
+    duration_delta = Column(Float, default=0.0)
+
+    # Totals after the change (series는 누적 재계산 없이 그대로 사용)
+    total_size = Column(BigInteger, default=0)
+    file_count = Column(Integer, default=0)
+
+    __table_args__ = (
+        # 폴더별 시계열
+        Index("ix_folder_stats_deltas_path_time", "folder_path", "scanned_at"),
+        # 기간별 top growing
+        Index("ix_folder_stats_deltas_time_depth", "scanned_at", "depth"),
+    )
+
 
 class ScanHistory(Base):
     """Scan history model"""
@@ -108,3 +172,28 @@ class DailySnapshot(Base):
     file_type_stats = Column(String, nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class HistoryRollup(Base):
+    """Weekly / monthly history rollup (last daily snapshot of each period)"""
+
+    __tablename__ = "history_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    period = Column(String, nullable=False)  # weekly, monthly
+    period_start = Column(DateTime, nullable=False)
+    # 마지막으로 반영된 daily snapshot 날짜
+    snapshot_date = Column(DateTime, nullable=False)
+
+    # Statistics (period-end values)
+    total_size = Column(BigInteger, default=0)
+    total_files = Column(Integer, default=0)
+    total_folders = Column(Integer, default=0)
+    total_duration = Column(Float, default=0.0)
+    file_type_stats = Column(String, nullable=True)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("period", "period_start", name="uq_history_rollup_period"),
+    )
@@ -4,12 +4,25 @@ Hand Analysis Model
 Google Sheets (WSOP Circuit LA)에서 동기화된 핸드 분석 데이터
 타임코드 기반 영상 진행률 추적에 사용
 
+태그는 JSON 문자열 컬럼(원본 유지) + 정규화 테이블 (hand_tags 사전,
+hand_tag_links 핸드↔태그) → 태그 교집합/합집합/facet을 인덱스 집합 연산으로 조회
+
 Block: sync.hands
 """
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 
 from app.core.database import Base
 
@@ -58,9 +71,75 @@ class HandAnalysis(Base):
     __table_args__ = (
         Index("idx_hand_file_worksheet", "file_name", "source_worksheet"),
         Index("idx_hand_timecode_out", "timecode_out_sec"),
+        # /hands keyset 페이지 정렬 키 (행 값 비교 범위 검색)
+        # 동기화는 source_worksheet / timecode_in_sec을 항상 채움 (NULL은 비교 불가)
+        Index(
+            "idx_hand_keyset",
+            "source_worksheet",
+            "file_name",
+            "timecode_in_sec",
+            "id",
+        ),
+        Index(
+            "idx_hand_grade_keyset",
+            "hand_grade",
+            "source_worksheet",
+            "file_name",
+            "timecode_in_sec",
+            "id",
+        ),
     )
 
     def __repr__(self):
         return (
             f"<HandAnalysis {self.file_name} [{self.timecode_in}-{self.timecode_out}]>"
         )
+
+
+class HandTag(Base):
+    """
+    핸드 태그 사전
+
+    종류(player: player_tags, play: poker_play_tags)별 정규화 이름 1행.
+    name은 공백 정리 + casefold (조회 키), label은 처음 본 원본 표기.
+    """
+
+    __tablename__ = "hand_tags"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)  # "player" / "play"
+    name = Column(String, nullable=False)  # "ivey"
+    label = Column(String, nullable=False)  # "Ivey"
+
+    __table_args__ = (UniqueConstraint("kind", "name", name="uq_hand_tag_kind_name"),)
+
+    def __repr__(self):
+        return f"<HandTag {self.kind}:{self.name}>"
+
+
+class HandTagLink(Base):
+    """
+    핸드 ↔ 태그 연결
+
+    source_worksheet는 hand_analyses 값 복사 - 워크시트 단위 동기화/조회가
+    hand_analyses를 거치지 않고 인덱스만으로 끝나도록.
+    """
+
+    __tablename__ = "hand_tag_links"
+
+    hand_id = Column(
+        Integer,
+        ForeignKey("hand_analyses.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tag_id = Column(
+        Integer, ForeignKey("hand_tags.id", ondelete="CASCADE"), primary_key=True
+    )
+    source_worksheet = Column(String, nullable=False, default="")
+
+    __table_args__ = (
+        # 태그 → 핸드 (교집합/합집합 필터, 워크시트 범위)
+        Index("idx_hand_tag_link_tag", "tag_id", "source_worksheet", "hand_id"),
+        # 워크시트 → 태그 (워크시트 facet, 동기화 diff)
+        Index("idx_hand_tag_link_worksheet", "source_worksheet", "tag_id"),
+    )
@@ -0,0 +1,134 @@
+"""
+Search Index
+
+이름 부분 문자열 검색 색인 (파일, 폴더, 핸드 파일명, 작업 카테고리)
+
+- SQLite: FTS5 trigram 가상 테이블 (external content = 원본 테이블)
+  원본 테이블 trigger로 유지 → 스캐너/동기화/수동 입력 모두 같은 트랜잭션에서 반영
+- PostgreSQL: pg_trgm GIN 인덱스 (ILIKE '%...%'가 인덱스 사용)
+
+가상 테이블은 Base.metadata 밖 (create_all 후 after_create 이벤트로 생성,
+Alembic은 0006 마이그레이션에서 생성).
+
+Block: search.index
+"""
+
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, event, text
+
+from app.core.database import Base
+
+# 검색 종류 → (원본 테이블, 색인 컬럼)
+SEARCH_SOURCES: Dict[str, Tuple[str, str]] = {
+    "file": ("file_stats", "name"),
+    "folder": ("folder_stats", "name"),
+    "hand": ("hand_analyses", "file_name"),
+    "category": ("work_statuses", "category"),
+}
+
+SEARCH_SUFFIX = "_search"
+
+# 쿼리 작성용 FTS5 테이블 정의 (create_all 대상 아님)
+search_metadata = MetaData()
+SEARCH_TABLES: Dict[str, Table] = {
+    kind: Table(
+        table + SEARCH_SUFFIX,
+        search_metadata,
+        Column("rowid", Integer, primary_key=True),
+        Column(column, String),
+    )
+    for kind, (table, column) in SEARCH_SOURCES.items()
+}
+
+
+def is_search_table(name: str) -> bool:
+    """FTS5 가상 테이블 / shadow 테이블 여부 (Alembic 비교 제외용)"""
+    return any(
+        name.startswith(table + SEARCH_SUFFIX) for table, _ in SEARCH_SOURCES.values()
+    )
+
+
+def sqlite_trigger_ddl(kind: str, schema: str = "") -> List[str]:
+    """원본 테이블 → FTS5 색인 동기화 trigger (schema: ATTACH 상태에서 "main")"""
+    table, column = SEARCH_SOURCES[kind]
+    fts = table + SEARCH_SUFFIX
+    prefix = f"{schema}." if schema else ""
+    delete = (
+        f"INSERT INTO {fts}({fts}, rowid, {column}) "
+        f"VALUES ('delete', old.id, old.{column});"
+    )
+    insert = f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column});"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {prefix}{fts}_ai AFTER INSERT ON {table} "
+        f"BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {prefix}{fts}_ad AFTER DELETE ON {table} "
+        f"BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {prefix}{fts}_au "
+        f"AFTER UPDATE OF {column} ON {table} BEGIN {delete} {insert} END",
+    ]
+
+
+def sqlite_drop_trigger_ddl(kind: str, schema: str = "") -> List[str]:
+    fts = SEARCH_SOURCES[kind][0] + SEARCH_SUFFIX
+    prefix = f"{schema}." if schema else ""
+    return [
+        f"DROP TRIGGER IF EXISTS {prefix}{fts}_{suffix}"
+        for suffix in ("ai", "ad", "au")
+    ]
+
+
+def sqlite_rebuild_ddl(kind: str, schema: str = "") -> str:
+    """원본 테이블 전체로 색인 재구성 (대량 교체 후)"""
+    fts = SEARCH_SOURCES[kind][0] + SEARCH_SUFFIX
+    prefix = f"{schema}." if schema else ""
+    return f"INSERT INTO {prefix}{fts}({fts}) VALUES ('rebuild')"
+
+
+def create_search_index(connection):
+    """검색 색인 생성 + 기존 행 색인 (동기 연결, 여러 번 실행해도 안전)"""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for table, column in SEARCH_SOURCES.values():
+            connection.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                )
+            )
+        return
+    if dialect != "sqlite":
+        return
+
+    for kind, (table, column) in SEARCH_SOURCES.items():
+        fts = table + SEARCH_SUFFIX
+        connection.execute(
+            text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                f"{column}, content='{table}', content_rowid='id', "
+                f"tokenize='trigram')"
+            )
+        )
+        for statement in sqlite_trigger_ddl(kind):
+            connection.execute(text(statement))
+        connection.execute(text(sqlite_rebuild_ddl(kind)))
+
+
+def drop_search_index(connection):
+    dialect = connection.dialect.name
+    for kind, (table, column) in SEARCH_SOURCES.items():
+        if dialect == "postgresql":
+            connection.execute(text(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm"))
+        elif dialect == "sqlite":
+            for statement in sqlite_drop_trigger_ddl(kind):
+                connection.execute(text(statement))
+            connection.execute(text(f"DROP TABLE IF EXISTS {table}{SEARCH_SUFFIX}"))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_after_metadata(target, connection, tables=None, **kw):
+    # create_all()로 만든 DB (테스트, 마이그레이션 이전 DB)도 같은 색인
+    created = {table.name for table in tables} if tables is not None else None
+    if created is None or created >= {t for t, _ in SEARCH_SOURCES.values()}:
+        create_search_index(connection)
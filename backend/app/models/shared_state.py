@@ -0,0 +1,34 @@
+"""
+Shared State Model
+
+여러 워커 프로세스(uvicorn --workers N)가 공유하는 키-값 상태 / 잠금 저장소
+스캔 진행 상태, 활성 뷰어 heartbeat, 동기화 상태, 스케줄러 leader lock에 사용
+
+Block: core.shared_state
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, String, Text
+
+from app.core.database import Base
+
+
+class SharedStateEntry(Base):
+    """
+    공유 상태 테이블
+
+    key: "scan:state", "viewer:<client_id>", "lock:<name>" 등
+    value: JSON 문자열 (잠금은 소유자 ID)
+    expires_at: 만료 시각 (None이면 만료 없음)
+    """
+
+    __tablename__ = "shared_state"
+
+    key = Column(String, primary_key=True)
+    value = Column(Text, nullable=True)
+    expires_at = Column(DateTime, nullable=True, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SharedStateEntry {self.key}>"
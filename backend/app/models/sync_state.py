@@ -0,0 +1,52 @@
+"""
+Sync State Model
+
+Google Sheets 워크시트별 콘텐츠 fingerprint 저장
+변경 없는 워크시트는 파싱/DB diff/캐시 무효화를 건너뛰는 데 사용
+
+Block: sync.fingerprint
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint
+
+from app.core.database import Base
+
+
+class SyncFingerprint(Base):
+    """
+    워크시트 fingerprint 테이블
+
+    source: 동기화 출처 ("work_status", "hand_analysis")
+    worksheet: 워크시트 제목
+    fingerprint: get_all_values() 결과의 SHA-256
+    """
+
+    __tablename__ = "sync_fingerprints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String, nullable=False)
+    worksheet = Column(String, nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+
+    # 마지막 반영 시점의 행 수 (skip 시 결과 보고용)
+    row_count = Column(Integer, default=0)  # 데이터 행 수
+    record_count = Column(Integer, default=0)  # 동기화된 레코드 수
+
+    # 이 시트가 마지막 동기화에서 소유한 행 ID 목록 (JSON)
+    # 삭제 전파는 이 목록 안에서만 수행 → 수동 입력/CSV import 행 보호
+    synced_ids = Column(Text, nullable=True)
+
+    # 메타
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("source", "worksheet", name="uq_sync_fingerprint_ws"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<SyncFingerprint {self.source}/{self.worksheet} {self.fingerprint[:8]}>"
+        )
@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+RuleType = Literal["size", "growth", "missing_duration", "sync_stale"]
+
+
+class AlertRuleBase(BaseModel):
+    """Alert rule base schema"""
+
+    name: str
+    rule_type: RuleType
+    # Folder path or sync service ("sheets", "hands"); empty = whole archive / all
+    target: Optional[str] = None
+    # bytes (size, growth), ratio 0-1 (missing_duration), hours (sync_stale)
+    threshold: float = Field(gt=0)
+    window_days: int = Field(default=1, ge=1, le=365)
+    recipients: Optional[str] = None  # comma separated
+    cooldown_minutes: Optional[int] = Field(default=None, ge=0)
+    enabled: bool = True
+
+    @field_validator("target", "recipients")
+    @classmethod
+    def empty_to_none(cls, value: Optional[str]) -> Optional[str]:
+        return value.strip() or None if value is not None else None
+
+
+class AlertRuleCreate(AlertRuleBase):
+    pass
+
+
+class AlertRuleUpdate(BaseModel):
+    """Update alert rule"""
+
+    name: Optional[str] = None
+    threshold: Optional[float] = Field(default=None, gt=0)
+    window_days: Optional[int] = Field(default=None, ge=1, le=365)
+    recipients: Optional[str] = None
+    cooldown_minutes: Optional[int] = Field(default=None, ge=0)
+    enabled: Optional[bool] = None
+
+
+class AlertRuleResponse(AlertRuleBase):
+    id: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AlertEventResponse(BaseModel):
+    """Fired alert"""
+
+    id: int
+    rule_id: int
+    rule_type: str
+    target: Optional[str] = None
+    value: float
+    threshold: float
+    message: str
+    triggered_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AlertEventListResponse(BaseModel):
+    items: List[AlertEventResponse]
+    pending_emails: int = 0  # alerts waiting for the next batched email
@@ -17,6 +17,7 @@ class ScanStatus(BaseModel):
     elapsed_seconds: Optional[float] = None
     estimated_remaining_seconds: Optional[float] = None
     logs: List[str] = []  # Recent log messages
+    log_seq: int = 0  # Total log lines written (sequence number of the last line)
     media_files_processed: int = 0
     total_duration_found: float = 0.0
     active_viewers: int = 0  # Number of active clients viewing the dashboard
@@ -48,6 +49,9 @@ class ScanStartRequest(BaseModel):
 
     scan_type: str = "manual"
     path: Optional[str] = None  # Optional subfolder path
+    # Write into a staging snapshot and swap it in on completion
+    # (None = settings.SCAN_STAGED)
+    staged: Optional[bool] = None
 
 
 class ScanStartResponse(BaseModel):
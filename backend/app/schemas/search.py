@@ -0,0 +1,27 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+SearchKind = Literal["file", "folder", "hand", "category"]
+
+
+class SearchHit(BaseModel):
+    """One ranked search result"""
+
+    kind: SearchKind
+    id: int
+    name: Optional[str] = None
+    path: Optional[str] = None
+    score: float  # higher = more relevant (comparable within one kind)
+
+
+class SearchResponse(BaseModel):
+    """One page of search results"""
+
+    query: str
+    kinds: List[SearchKind]
+    items: List[SearchHit]
+    offset: int
+    limit: int
+    has_more: bool
+    took_ms: float
@@ -65,6 +65,36 @@ class FolderDetails(BaseModel):
     last_scanned_at: Optional[datetime] = None
 
 
+class FolderGrowth(BaseModel):
+    """Folder growth over a period (sum of per-scan deltas)"""
+
+    path: str
+    name: str
+    depth: int
+    size_delta: int
+    size_delta_formatted: str
+    file_count_delta: int
+    changes: int  # number of scans that changed this folder
+    current_size: Optional[int] = None
+
+
+class FolderGrowthPoint(BaseModel):
+    """Folder totals after one scan that changed it"""
+
+    scanned_at: datetime
+    total_size: int
+    file_count: int
+    size_delta: int
+    file_count_delta: int
+
+
+class FolderGrowthSeries(BaseModel):
+    """Per-folder growth time series"""
+
+    path: str
+    points: List[FolderGrowthPoint]
+
+
 class HistoryData(BaseModel):
     """Historical data point"""
 
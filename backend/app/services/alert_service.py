@@ -0,0 +1,380 @@
+"""
+용량 임계값 알림 서비스
+
+규칙 종류는 AlertRule 참고 (size / growth / missing_duration / sync_stale).
+
+- 스캔 규칙: 스캔 완료 후 그 스캔 세대(scanned_at)의 folder_stats_deltas 중
+  규칙 대상 행만 읽고 평가 → 비용은 아카이브 크기가 아니라 변경량에 비례
+  (합계가 바뀌지 않은 대상은 평가하지 않음)
+- sync_stale: ALERT_SYNC_CHECK_MINUTES마다 점검 (leader 워커만)
+- 발생 기록은 alert_events, 같은 규칙·대상은 cooldown 동안 다시 보내지 않음
+- 메일은 email_notifier가 수신자별로 묶어 속도 제한 발송
+
+Block: alerts.engine
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bulk import bulk_insert
+from app.core.config import settings
+from app.core.database import DatabaseWriter, db_writer, read_session_maker
+from app.models.alert import AlertEvent, AlertRule
+from app.models.file_stats import FolderStats, FolderStatsDelta
+from app.services.email_notifier import EmailNotifier, email_notifier
+from app.services.shared_state import WORKER_ID, shared_state
+from app.services.utils import format_size
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+logger = logging.getLogger(__name__)
+
+RULE_TYPES = ("size", "growth", "missing_duration", "sync_stale")
+# 스캔 완료 후 평가하는 규칙
+SCAN_RULE_TYPES = ("size", "growth", "missing_duration")
+
+# (규칙, 대상, 측정값)
+Candidate = Tuple[AlertRule, Optional[str], float]
+
+
+class AlertService:
+    """알림 규칙 평가 (스캔 완료 후 + 동기화 지연 주기 점검)"""
+
+    # 스케줄러 job ID = leader lock 이름
+    JOB_ID = "alert_sync_check"
+
+    def __init__(
+        self,
+        session_maker=None,
+        writer: Optional[DatabaseWriter] = None,
+        notifier: Optional[EmailNotifier] = None,
+    ):
+        self._session_maker = session_maker or read_session_maker
+        self.writer = writer or db_writer
+        self.notifier = notifier or email_notifier
+        # apscheduler는 start() 시 lazy import
+        self.scheduler: Optional["AsyncIOScheduler"] = None
+        self._is_started: bool = False
+        # 한 번도 성공하지 않은 동기화의 지연 기준
+        self.started_at = datetime.utcnow()
+
+    async def start(self):
+        """동기화 지연 점검 스케줄 등록"""
+        if self._is_started or not settings.ALERTS_ENABLED:
+            return
+        try:
+            from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+            self.scheduler = AsyncIOScheduler()
+            self.scheduler.add_job(
+                self._check_wrapper,
+                "interval",
+                minutes=settings.ALERT_SYNC_CHECK_MINUTES,
+                id=self.JOB_ID,
+                replace_existing=True,
+            )
+            self.scheduler.start()
+            self._is_started = True
+            logger.info(
+                f"Alert sync check started "
+                f"(interval: {settings.ALERT_SYNC_CHECK_MINUTES} min)"
+            )
+        except Exception as e:
+            logger.exception(f"Failed to start alert scheduler: {e}")
+
+    async def stop(self):
+        """스케줄 중지 + 대기 중인 메일 취소"""
+        if self.scheduler is not None and self.scheduler.running:
+            self.scheduler.shutdown()
+            self._is_started = False
+        await self.notifier.stop()
+        try:
+            await shared_state.release_lock(self.JOB_ID, WORKER_ID)
+        except Exception as e:
+            logger.warning(f"Failed to release alert lock: {e}")
+
+    async def _check_wrapper(self):
+        """스케줄 실행 - 워커 1개만"""
+        ttl = settings.ALERT_SYNC_CHECK_MINUTES * 60 * 1.5
+        try:
+            leader = await shared_state.acquire_lock(self.JOB_ID, WORKER_ID, ttl)
+        except Exception as e:
+            logger.warning(f"Alert lock unavailable, running locally: {e}")
+            leader = True
+        if not leader:
+            return
+        try:
+            await self.check_sync_staleness()
+        except Exception as e:
+            logger.exception(f"Sync staleness check failed: {e}")
+
+    # ==================== 스캔 규칙 ====================
+
+    async def evaluate_scan(self, generation: datetime) -> List[Dict[str, Any]]:
+        """스캔 1회(generation = 스캔 시작 시각)에서 바뀐 폴더로 규칙 평가
+
+        Returns:
+            새로 발생한 알림 목록
+        """
+        if not settings.ALERTS_ENABLED:
+            return []
+        now = datetime.utcnow()
+        async with self._session_maker() as db:
+            rules = await self._rules(db, SCAN_RULE_TYPES)
+            if not rules:
+                return []
+
+            paths = {rule.target for rule in rules if rule.target}
+            roots = any(not rule.target for rule in rules)
+            condition = FolderStatsDelta.folder_path.in_(sorted(paths))
+            if roots:
+                condition = or_(condition, FolderStatsDelta.depth == 0)
+            result = await db.execute(
+                select(FolderStatsDelta).where(
+                    FolderStatsDelta.scanned_at == generation, condition
+                )
+            )
+
+            # 대상 → 이번 스캔의 변경 (None = 전체, 최상위 폴더 합)
+            changed: Dict[Optional[str], List[FolderStatsDelta]] = {}
+            for delta in result.scalars().all():
+                if delta.folder_path in paths:
+                    changed.setdefault(delta.folder_path, []).append(delta)
+                if roots and delta.depth == 0:
+                    changed.setdefault(None, []).append(delta)
+
+            candidates: List[Candidate] = []
+            for rule in rules:
+                target = rule.target or None
+                changes = changed.get(target)
+                if not changes:
+                    continue
+                value = await self._measure(db, rule, target, changes, now)
+                if value is not None:
+                    candidates.append((rule, target, value))
+
+            return await self._fire(db, candidates, now)
+
+    async def _measure(
+        self,
+        db: AsyncSession,
+        rule: AlertRule,
+        target: Optional[str],
+        changes: List[FolderStatsDelta],
+        now: datetime,
+    ) -> Optional[float]:
+        """규칙 측정값 (조건을 만족하지 않으면 None)"""
+        if rule.rule_type == "size":
+            if target:
+                current = changes[-1].total_size
+            else:
+                current = await db.scalar(
+                    select(func.sum(FolderStats.total_size)).where(
+                        FolderStats.depth == 0
+                    )
+                )
+                current = current or 0
+            before = current - sum(delta.size_delta for delta in changes)
+            # 넘어서는 순간만 (임계값 위에 머무는 동안은 다시 울리지 않음)
+            if before < rule.threshold <= current:
+                return float(current)
+            return None
+
+        if rule.rule_type == "growth":
+            since = now - timedelta(days=rule.window_days or 1)
+            grown = await db.scalar(
+                select(func.sum(FolderStatsDelta.size_delta)).where(
+                    FolderStatsDelta.scanned_at >= since,
+                    self._delta_target(target),
+                )
+            )
+            if grown is not None and grown >= rule.threshold:
+                return float(grown)
+            return None
+
+        if rule.rule_type == "missing_duration":
+            condition = FolderStats.path == target if target else FolderStats.depth == 0
+            media, missing = (
+                await db.execute(
+                    select(
+                        func.sum(FolderStats.media_count),
+                        func.sum(FolderStats.missing_duration_count),
+                    ).where(condition)
+                )
+            ).one()
+            if not media:
+                return None
+            ratio = (missing or 0) / media
+            return ratio if ratio >= rule.threshold else None
+
+        return None
+
+    @staticmethod
+    def _delta_target(target: Optional[str]):
+        if target:
+            return FolderStatsDelta.folder_path == target
+        return FolderStatsDelta.depth == 0
+
+    # ==================== 동기화 지연 ====================
+
+    async def check_sync_staleness(
+        self, services: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """sync_stale 규칙 점검 (마지막 동기화 성공 후 경과 시간)
+
+        Args:
+            services: 서비스 이름 → 동기화 서비스 (기본: sheets, hands)
+        """
+        if not settings.ALERTS_ENABLED:
+            return []
+        if services is None:
+            from app.services.hand_analysis_sync import hand_analysis_sync_service
+            from app.services.sheets_sync import sheets_sync_service
+
+            services = {
+                "sheets": sheets_sync_service,
+                "hands": hand_analysis_sync_service,
+            }
+
+        now = datetime.utcnow()
+        # 동기화 서비스는 last_success를 서버 로컬 시각(datetime.now())으로 기록
+        # → 경과 시간은 같은 시계로 계산 (기록 시각 triggered_at은 UTC)
+        local_now = datetime.now()
+        async with self._session_maker() as db:
+            rules = await self._rules(db, ("sync_stale",))
+            if not rules:
+                return []
+
+            statuses = {}
+            for name, service in services.items():
+                status = await service.get_shared_status()
+                if status.get("enabled"):
+                    statuses[name] = status
+
+            candidates: List[Candidate] = []
+            for rule in rules:
+                names = [rule.target] if rule.target else list(statuses)
+                for name in names:
+                    status = statuses.get(name)
+                    if status is None:
+                        continue
+                    last = status.get("last_success")
+                    if last:
+                        since = datetime.fromisoformat(last)
+                        if since.tzinfo is not None:
+                            since = since.astimezone().replace(tzinfo=None)
+                        elapsed = local_now - since
+                    else:
+                        # 기동 후 한 번도 성공하지 않음 → 기동 시각부터
+                        elapsed = now - self.started_at
+                    hours = elapsed.total_seconds() / 3600
+                    if hours >= rule.threshold:
+                        candidates.append((rule, name, hours))
+
+            return await self._fire(db, candidates, now)
+
+    # ==================== 발생 처리 ====================
+
+    async def _rules(
+        self, db: AsyncSession, rule_types: Sequence[str]
+    ) -> List[AlertRule]:
+        result = await db.execute(
+            select(AlertRule).where(
+                AlertRule.enabled.is_(True), AlertRule.rule_type.in_(rule_types)
+            )
+        )
+        return list(result.scalars().all())
+
+    async def _fire(
+        self, db: AsyncSession, candidates: List[Candidate], now: datetime
+    ) -> List[Dict[str, Any]]:
+        """cooldown 지난 후보만 기록 + 메일 대기열"""
+        if not candidates:
+            return []
+
+        result = await db.execute(
+            select(
+                AlertEvent.rule_id,
+                AlertEvent.target,
+                func.max(AlertEvent.triggered_at),
+            )
+            .where(AlertEvent.rule_id.in_([rule.id for rule, _, _ in candidates]))
+            .group_by(AlertEvent.rule_id, AlertEvent.target)
+        )
+        last_fired = {(rule_id, target): at for rule_id, target, at in result.all()}
+
+        events = []
+        recipients = []
+        for rule, target, value in candidates:
+            cooldown = timedelta(
+                minutes=(
+                    rule.cooldown_minutes
+                    if rule.cooldown_minutes is not None
+                    else settings.ALERT_COOLDOWN_MINUTES
+                )
+            )
+            last = last_fired.get((rule.id, target))
+            if last is not None and now - last < cooldown:
+                continue
+            events.append(
+                {
+                    "rule_id": rule.id,
+                    "rule_type": rule.rule_type,
+                    "target": target,
+                    "value": value,
+                    "threshold": rule.threshold,
+                    "message": self._message(rule, target, value),
+                    "triggered_at": now,
+                }
+            )
+            recipients.append(self._recipients(rule))
+        if not events:
+            return []
+
+        async def write(db: AsyncSession):
+            await bulk_insert(db, AlertEvent, events)
+
+        await self.writer.run(write)
+        for event, to in zip(events, recipients):
+            logger.warning(f"Alert: {event['message']}")
+            self.notifier.enqueue(to, event["message"])
+        return events
+
+    @staticmethod
+    def _recipients(rule: AlertRule) -> List[str]:
+        value = rule.recipients or settings.ALERT_EMAIL_TO
+        return [r.strip() for r in value.split(",") if r.strip()]
+
+    @staticmethod
+    def _message(rule: AlertRule, target: Optional[str], value: float) -> str:
+        label = target or "archive"
+        if rule.rule_type == "size":
+            detail = (
+                f"size {format_size(int(value))} crossed "
+                f"{format_size(int(rule.threshold))}"
+            )
+        elif rule.rule_type == "growth":
+            detail = (
+                f"grew {format_size(int(value))} in {rule.window_days or 1} day(s) "
+                f"(threshold {format_size(int(rule.threshold))})"
+            )
+        elif rule.rule_type == "missing_duration":
+            detail = (
+                f"{value:.1%} of media files have no duration "
+                f"(threshold {rule.threshold:.1%})"
+            )
+        else:
+            detail = (
+                f"sync last succeeded {value:.1f}h ago "
+                f"(threshold {rule.threshold:g}h)"
+            )
+        return f"{rule.name}: {label} {detail}"
+
+
+# Singleton instance
+alert_service = AlertService()
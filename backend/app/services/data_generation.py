@@ -0,0 +1,75 @@
+"""
+데이터 generation vector
+
+대시보드 데이터는 스캔/시트 동기화/수동 편집이 반영될 때만 바뀐다.
+구성 요소별 버전을 공유 상태에 두고, 바뀔 때마다 새 값으로 갱신(bump)한다.
+HTTP 캐시(ETag)는 이 vector만 보고 304를 판단하므로 DB를 조회하지 않는다.
+
+- scan: 스캔 시작/진행(in-place)/완료·swap
+- work_status: Work Status 시트 동기화, 수동 편집/CSV import, 폴더 매핑
+- hands: Archive Metadata(핸드 분석) 시트 동기화
+- history: 용량 히스토리 snapshot 기록
+
+구성 요소마다 별도 키에 고유 값(time_ns)을 기록 → 워커 간 read-modify-write
+경합으로 bump가 유실되지 않음. 조회는 워커별로 DATA_GENERATION_REFRESH_SECONDS
+동안 캐시 (다른 워커의 bump는 최대 그 시간만큼 늦게 반영).
+
+Block: core.data_generation
+"""
+
+import logging
+import time
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.services.shared_state import shared_state
+
+logger = logging.getLogger(__name__)
+
+COMPONENTS = ("scan", "work_status", "hands", "history")
+KEY_PREFIX = "data:generation:"
+
+
+class DataGeneration:
+    """워커 단위 generation vector 캐시"""
+
+    def __init__(self):
+        self._vector: Optional[Dict[str, int]] = None
+        self._loaded_at = 0.0
+
+    async def current(self) -> Dict[str, int]:
+        """현재 generation vector (구성 요소 → 버전)"""
+        if (
+            self._vector is not None
+            and time.monotonic() - self._loaded_at
+            < settings.DATA_GENERATION_REFRESH_SECONDS
+        ):
+            return self._vector
+
+        vector = {}
+        try:
+            for component in COMPONENTS:
+                vector[component] = int(
+                    await shared_state.get(KEY_PREFIX + component) or 0
+                )
+        except Exception as e:
+            logger.warning(f"Failed to load data generation: {e}")
+            return self._vector or dict.fromkeys(COMPONENTS, 0)
+
+        self._vector = vector
+        self._loaded_at = time.monotonic()
+        return vector
+
+    async def bump(self, component: str) -> None:
+        """구성 요소 데이터가 바뀌었음을 기록"""
+        version = time.time_ns()
+        try:
+            await shared_state.set(KEY_PREFIX + component, version)
+        except Exception as e:
+            logger.warning(f"Failed to bump data generation ({component}): {e}")
+        if self._vector is not None:
+            self._vector = {**self._vector, component: version}
+
+
+# Singleton instance
+data_generation = DataGeneration()
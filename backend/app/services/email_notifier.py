@@ -0,0 +1,159 @@
+"""
+알림 메일 발송
+
+알림을 수신자별로 모아 ALERT_BATCH_SECONDS 뒤 1통으로 발송.
+시간당 발송 수(ALERT_EMAIL_MAX_PER_HOUR)를 넘으면 남은 알림은 다음 묶음으로 이월
+→ 알림이 몰려도 메일 수는 일정 (한 통에 여러 건).
+smtplib은 blocking이라 스레드에서 실행 (이벤트 루프를 막지 않음).
+
+Block: alerts.email
+"""
+
+import asyncio
+import logging
+import smtplib
+import time
+from collections import deque
+from email.message import EmailMessage
+from typing import Deque, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 발송 수 제한 구간 (초)
+RATE_WINDOW = 3600
+
+
+class EmailNotifier:
+    """배치 + 속도 제한 알림 메일 발송기"""
+
+    def __init__(self):
+        self._pending: Dict[str, List[str]] = {}  # 수신자 → 알림 줄
+        self._overflow: Dict[str, int] = {}  # ALERT_EMAIL_MAX_LINES 초과로 생략된 수
+        self._sent_at: Deque[float] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self.sent_count = 0
+
+    @property
+    def is_configured(self) -> bool:
+        return bool(settings.SMTP_HOST and settings.EMAIL_FROM)
+
+    @property
+    def pending(self) -> Dict[str, int]:
+        """수신자별 대기 중인 알림 수"""
+        return {
+            recipient: len(lines) + self._overflow.get(recipient, 0)
+            for recipient, lines in self._pending.items()
+        }
+
+    def enqueue(self, recipients: Iterable[str], line: str):
+        """알림 1건 추가 (묶음 발송 예약)"""
+        if not self.is_configured:
+            logger.info(f"SMTP not configured, alert not mailed: {line}")
+            return
+        for recipient in recipients:
+            lines = self._pending.setdefault(recipient, [])
+            if len(lines) < settings.ALERT_EMAIL_MAX_LINES:
+                lines.append(line)
+            else:
+                self._overflow[recipient] = self._overflow.get(recipient, 0) + 1
+        if self._pending:
+            self._schedule(settings.ALERT_BATCH_SECONDS)
+
+    def _schedule(self, delay: float):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_after(delay))
+
+    async def _flush_after(self, delay: float):
+        await asyncio.sleep(delay)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Alert email failed, retrying next batch: {e}")
+        if self._pending:
+            # 속도 제한/실패로 남은 알림 - 발송 가능해지는 시점에 다시 묶어서
+            self._task = None
+            self._schedule(max(settings.ALERT_BATCH_SECONDS, self._rate_wait()))
+
+    def _available(self, now: float) -> int:
+        """지금 보낼 수 있는 메일 수"""
+        while self._sent_at and now - self._sent_at[0] >= RATE_WINDOW:
+            self._sent_at.popleft()
+        return max(0, settings.ALERT_EMAIL_MAX_PER_HOUR - len(self._sent_at))
+
+    def _rate_wait(self) -> float:
+        """다음 발송 가능 시점까지 남은 초"""
+        now = time.monotonic()
+        if self._available(now) or not self._sent_at:
+            return 0.0
+        return RATE_WINDOW - (now - self._sent_at[0])
+
+    async def flush(self) -> int:
+        """대기 중인 알림 발송 (속도 제한 범위 내) → 발송한 메일 수"""
+        now = time.monotonic()
+        recipients = list(self._pending)[: self._available(now)]
+        if not recipients:
+            return 0
+
+        batch = {
+            recipient: (self._pending.pop(recipient), self._overflow.pop(recipient, 0))
+            for recipient in recipients
+        }
+        messages = [
+            self._build(recipient, lines, overflow)
+            for recipient, (lines, overflow) in batch.items()
+        ]
+        # 실패한 시도도 발송 수에 포함 (SMTP 장애 시 재시도 폭주 방지)
+        self._sent_at.extend([now] * len(messages))
+        try:
+            await asyncio.to_thread(self._send, messages)
+        except Exception:
+            # 다음 묶음에서 재시도 (그사이 쌓인 알림 앞에)
+            for recipient, (lines, overflow) in batch.items():
+                self._pending[recipient] = lines + self._pending.get(recipient, [])
+                if overflow:
+                    self._overflow[recipient] = (
+                        self._overflow.get(recipient, 0) + overflow
+                    )
+            raise
+        self.sent_count += len(messages)
+        return len(messages)
+
+    def _build(self, recipient: str, lines: List[str], overflow: int) -> EmailMessage:
+        message = EmailMessage()
+        count = len(lines) + overflow
+        message["Subject"] = f"[{settings.APP_NAME}] {count} alert(s)"
+        message["From"] = settings.EMAIL_FROM
+        message["To"] = recipient
+        body = "\n".join(lines)
+        if overflow:
+            body += f"\n... and {overflow} more"
+        message.set_content(body)
+        return message
+
+    def _send(self, messages: List[EmailMessage]):
+        """SMTP 연결 1회로 묶음 발송 (스레드에서 실행)"""
+        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30) as smtp:
+            smtp.ehlo()
+            if smtp.has_extn("starttls"):
+                smtp.starttls()
+                smtp.ehlo()
+            if settings.SMTP_USER:
+                smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD or "")
+            for message in messages:
+                smtp.send_message(message)
+
+    async def stop(self):
+        """예약된 묶음 발송 취소 (남은 알림은 버림)"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+# Singleton instance
+email_notifier = EmailNotifier()
@@ -7,23 +7,39 @@ Target: hand_analyses 테이블
 Block: sync.hands
 """
 
+import asyncio
+import importlib
 import json
 import logging
+import random
 import re
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-import gspread
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from google.oauth2.service_account import Credentials
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
 from app.core.config import settings
-from app.core.database import async_session_maker
+from app.core.database import db_writer
 from app.models.hand_analysis import HandAnalysis
+from app.models.sync_state import SyncFingerprint
+from app.services.data_generation import data_generation
+from app.services.hand_tags import hand_tag_service
+from app.services.shared_state import WORKER_ID, shared_state
+from app.services.sheets_fetch import fetch_worksheet_values
+from app.services.sync_fingerprint import (
+    compute_fingerprint,
+    load_fingerprints,
+    save_fingerprint,
+)
+
+if TYPE_CHECKING:
+    import gspread
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +54,18 @@ class HandSyncResult:
     synced_count: int
     created_count: int = 0
     updated_count: int = 0
+    deleted_count: int = 0
+    unchanged_count: int = 0
     worksheets_processed: int = 0
+    worksheets_skipped: int = 0  # fingerprint 동일로 skip된 워크시트 수
     error: Optional[str] = None
     details: List[str] = field(default_factory=list)
+    # 워크시트별 diff 카운트 {ws_title: {"created": n, "updated": n, ...}}
+    worksheet_diffs: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+# 워크시트 내 핸드 식별 키: (file_name, source_worksheet, file_no)
+HandKey = Tuple[str, str, Optional[int]]
 
 
 class HandAnalysisSyncService:
@@ -72,19 +97,58 @@ class HandAnalysisSyncService:
         "hand": "hands",
     }
 
+    # 동기화 대상 컬럼 (_parse_row 결과 키와 동일)
+    SYNC_COLUMNS = (
+        "file_name",
+        "nas_path",
+        "timecode_in",
+        "timecode_out",
+        "timecode_in_sec",
+        "timecode_out_sec",
+        "file_no",
+        "hand_grade",
+        "winner",
+        "hands",
+        "player_tags",
+        "poker_play_tags",
+        "source_worksheet",
+        "source_row",
+    )
+
+    # 변경 감지에서 제외하는 위치 메타데이터
+    # 시트 상단에 행 하나만 끼워 넣어도 아래 모든 행의 source_row가 밀리므로
+    # 이를 변경으로 보지 않는다. 트레이드오프: 내용이 같은 행의 source_row는
+    # 해당 행 내용이 다음에 바뀔 때까지 이전 값으로 남는다.
+    POSITIONAL_COLUMNS = ("source_row",)
+
+    # 대량 DELETE 시 IN 절 청크 크기 (SQLite 바인드 변수 제한 대응)
+    DELETE_CHUNK_SIZE = 500
+
+    # sync_fingerprints.source 값
+    FINGERPRINT_SOURCE = "hand_analysis"
+
+    # 스케줄러 job ID = leader lock 이름, 공유 상태 키
+    JOB_ID = "hand_analysis_sync"
+    STATUS_KEY = "sync_status:hand_analysis_sync"
+
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
-        self._client: Optional[gspread.Client] = None
+        # apscheduler/gspread는 무거우므로 start()/첫 동기화 시 lazy import
+        self.scheduler: Optional["AsyncIOScheduler"] = None
+        self._client: Optional["gspread.Client"] = None
         self.last_sync_time: Optional[datetime] = None
         self.last_sync_result: Optional[HandSyncResult] = None
         self.last_error: Optional[str] = None
+        # 마지막 성공 동기화 시각 (readiness "data warm" 판단용)
+        self.last_success_time: Optional[datetime] = None
         self.status: str = "idle"
         self._is_started: bool = False
 
     @property
     def next_sync_time(self) -> Optional[datetime]:
         """다음 동기화 예정 시간"""
-        job = self.scheduler.get_job("hand_analysis_sync")
+        if self.scheduler is None:
+            return None
+        job = self.scheduler.get_job(self.JOB_ID)
         return job.next_run_time if job else None
 
     @property
@@ -105,11 +169,18 @@ class HandAnalysisSyncService:
             return
 
         try:
+            from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+            self.scheduler = AsyncIOScheduler()
             self.scheduler.add_job(
                 self._sync_wrapper,
                 "interval",
                 minutes=settings.SHEETS_SYNC_INTERVAL_MINUTES,
-                id="hand_analysis_sync",
+                jitter=settings.SYNC_JITTER_SECONDS,
+                # 첫 동기화는 기동 직후가 아니라 지연 + jitter 후 백그라운드 실행
+                # (기동 시 트래픽 수용 지연 방지, 여러 인스턴스 동시 fetch 분산)
+                next_run_time=self._first_run_time(),
+                id=self.JOB_ID,
                 replace_existing=True,
             )
             self.scheduler.start()
@@ -119,9 +190,6 @@ class HandAnalysisSyncService:
                 f"(interval: {settings.SHEETS_SYNC_INTERVAL_MINUTES}m)"
             )
 
-            # 시작 시 즉시 1회 동기화
-            await self._sync_wrapper()
-
         except Exception as e:
             logger.exception(f"Failed to start hand analysis sync service: {e}")
             self.status = "error"
@@ -129,14 +197,30 @@ class HandAnalysisSyncService:
 
     async def stop(self):
         """동기화 서비스 중지"""
-        if self.scheduler.running:
+        if self.scheduler is not None and self.scheduler.running:
             self.scheduler.shutdown()
             self._is_started = False
             logger.info("Hand analysis sync scheduler stopped")
 
-    def _get_client(self) -> gspread.Client:
+        # 재시작한 워커가 lock 만료를 기다리지 않도록 leader 권한 반납
+        try:
+            await shared_state.release_lock(self.JOB_ID, WORKER_ID)
+        except Exception as e:
+            logger.warning(f"Failed to release leader lock: {e}")
+
+    def _first_run_time(self) -> datetime:
+        """첫 동기화 예정 시각 (SYNC_STARTUP_DELAY_SECONDS + 0~SYNC_JITTER_SECONDS)"""
+        return datetime.now() + timedelta(
+            seconds=settings.SYNC_STARTUP_DELAY_SECONDS
+            + random.uniform(0, settings.SYNC_JITTER_SECONDS)
+        )
+
+    def _get_client(self) -> "gspread.Client":
         """Google Sheets 클라이언트 획득 (lazy initialization)"""
         if self._client is None:
+            import gspread
+            from google.oauth2.service_account import Credentials
+
             possible_paths = [
                 Path(settings.GOOGLE_SERVICE_ACCOUNT_FILE),
                 Path("..") / settings.GOOGLE_SERVICE_ACCOUNT_FILE,
@@ -165,8 +249,22 @@ class HandAnalysisSyncService:
             logger.info(f"Google Sheets client initialized (using: {sa_path})")
         return self._client
 
+    def _open_sheet(self) -> Tuple["gspread.Spreadsheet", List[str]]:
+        """스프레드시트 열기 + 워크시트 제목 목록 (블로킹, 스레드 풀에서 호출)"""
+        client = self._get_client()
+        sheet = client.open_by_url(settings.HAND_ANALYSIS_SHEET_URL)
+        return sheet, [ws.title for ws in sheet.worksheets()]
+
     async def _sync_wrapper(self):
-        """비동기 래퍼 (스케줄러 호환)"""
+        """비동기 래퍼 (스케줄러 호환)
+
+        스케줄 실행은 leader lock을 가진 워커 1개만 수행 (--workers N 중복 방지).
+        """
+        if not await self._acquire_leader():
+            logger.info(
+                "Hand analysis sync skipped - another worker holds the leader lock"
+            )
+            return
         try:
             await self.sync()
         except Exception as e:
@@ -174,35 +272,126 @@ class HandAnalysisSyncService:
             self.last_error = str(e)
             self.status = "error"
 
-    async def sync(self) -> HandSyncResult:
-        """Google Sheets에서 핸드 데이터 동기화"""
+    async def _acquire_leader(self) -> bool:
+        """스케줄 job leader lock 획득/갱신
+
+        TTL은 주기보다 짧게 → leader가 죽으면 (프로세스 종료 등) 잠금이
+        그 주기 안에 만료되어 다음 주기에 다른 워커가 인계받음.
+        (동기화 1회는 주기의 90%보다 짧다고 가정)
+        """
+        ttl = settings.SHEETS_SYNC_INTERVAL_MINUTES * 60 * 0.9
+        try:
+            return await shared_state.acquire_lock(self.JOB_ID, WORKER_ID, ttl)
+        except Exception as e:
+            # 공유 상태 백엔드 장애 시 단일 워커처럼 동작
+            logger.warning(f"Leader lock unavailable, running locally: {e}")
+            return True
+
+    async def _publish_status(self):
+        """현재 상태를 공유 상태에 게시 (다른 워커의 /status 응답용)"""
+        try:
+            await shared_state.set(
+                self.STATUS_KEY,
+                {**self.get_status_dict(), "published_at": time.time()},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish sync status: {e}")
+
+    async def get_shared_status(self) -> Dict[str, Any]:
+        """워커 공유 상태 조회 (게시된 상태가 없으면 이 프로세스의 상태)"""
+        try:
+            shared = await shared_state.get(self.STATUS_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to read shared sync status: {e}")
+            shared = None
+        if not shared:
+            return self.get_status_dict()
+        # 동기화 도중 워커가 죽어 "syncing"이 남은 경우
+        stale_after = settings.SHEETS_SYNC_INTERVAL_MINUTES * 60 * 1.5
+        if shared["status"] == "syncing" and (
+            time.time() - shared.pop("published_at", 0) > stale_after
+        ):
+            shared["status"] = "idle"
+        shared.pop("published_at", None)
+        # 활성화 여부는 프로세스 설정 기준
+        return {**shared, "enabled": self.is_enabled}
+
+    async def sync(self, force: bool = False) -> HandSyncResult:
+        """Google Sheets에서 핸드 데이터 동기화
+
+        Args:
+            force: True면 fingerprint가 같은 워크시트도 재동기화
+        """
+        start = time.perf_counter()
+        result = None
+        try:
+            result = await self._run_sync(force)
+            return result
+        finally:
+            metrics.record_sync("hands", result, time.perf_counter() - start)
+            await self._publish_status()
+
+    async def _run_sync(self, force: bool) -> HandSyncResult:
+        """sync() 본체"""
+        # gspread는 첫 동기화 시점에 로드 (앱 기동 시 import 비용 제거)
+        gspread = await asyncio.to_thread(importlib.import_module, "gspread")
+
         self.status = "syncing"
         logger.info("Starting hand analysis sync...")
+        await self._publish_status()
 
         try:
-            client = self._get_client()
-            sheet = client.open_by_url(settings.HAND_ANALYSIS_SHEET_URL)
-            worksheets = sheet.worksheets()
-
-            logger.info(f"Found {len(worksheets)} worksheets")
+            # 1. Fetch (gspread 동기 I/O → 스레드 풀, 워크시트는 batch 조회)
+            with metrics.sync_phase_duration.time(("hands", "fetch")):
+                sheet, titles = await asyncio.to_thread(self._open_sheet)
+                logger.info(f"Found {len(titles)} worksheets")
+                values_by_title = await fetch_worksheet_values(sheet, titles)
 
             total_records = 0
             synced_count = 0
             created_count = 0
             updated_count = 0
+            deleted_count = 0
+            unchanged_count = 0
+            skipped_worksheets = 0
             details = []
+            worksheet_diffs: Dict[str, Dict[str, int]] = {}
+
+            # 2. DB 반영 (파싱된 값만 사용, 네트워크 I/O 없음)
+            # writer 슬롯은 워크시트 단위로 잡고 워크시트마다 commit
+            # → 스캐너 flush / snapshot 등 다른 쓰기가 워크시트 사이에 끼어들 수 있음
+            apply_start = time.perf_counter()
+            for ws_title, all_values in values_by_title.items():
+                async with db_writer.session() as db:
+                    # fingerprint는 해당 워크시트 행과 같은 트랜잭션에 저장
+                    stored = await load_fingerprints(db, self.FINGERPRINT_SOURCE)
+                    ws_result = await self._sync_worksheet(
+                        db, ws_title, all_values, stored, force
+                    )
+                    await db.commit()
+                total_records += ws_result["total"]
+                synced_count += ws_result["synced"]
+                created_count += ws_result["created"]
+                updated_count += ws_result["updated"]
+                deleted_count += ws_result["deleted"]
+                unchanged_count += ws_result["unchanged"]
+                skipped_worksheets += ws_result["skipped"]
+                worksheet_diffs[ws_title] = ws_result
+                if ws_result["synced"] > 0 and not ws_result["skipped"]:
+                    details.append(
+                        f"{ws_title}: {ws_result['synced']} records "
+                        f"(+{ws_result['created']} ~{ws_result['updated']} "
+                        f"-{ws_result['deleted']})"
+                    )
 
-            async with async_session_maker() as db:
-                for ws in worksheets:
-                    ws_result = await self._sync_worksheet(db, ws)
-                    total_records += ws_result["total"]
-                    synced_count += ws_result["synced"]
-                    created_count += ws_result["created"]
-                    updated_count += ws_result["updated"]
-                    if ws_result["synced"] > 0:
-                        details.append(f"{ws.title}: {ws_result['synced']} records")
+            if deleted_count or updated_count:
+                await db_writer.run(hand_tag_service.prune_tags)
+            metrics.sync_phase_duration.observe(
+                time.perf_counter() - apply_start, ("hands", "apply")
+            )
 
-                await db.commit()
+            if created_count or updated_count or deleted_count:
+                await data_generation.bump("hands")
 
             result = HandSyncResult(
                 success=True,
@@ -211,19 +400,26 @@ class HandAnalysisSyncService:
                 synced_count=synced_count,
                 created_count=created_count,
                 updated_count=updated_count,
-                worksheets_processed=len(worksheets),
+                deleted_count=deleted_count,
+                unchanged_count=unchanged_count,
+                worksheets_processed=len(titles),
+                worksheets_skipped=skipped_worksheets,
                 details=details,
+                worksheet_diffs=worksheet_diffs,
             )
 
             self.last_sync_time = result.synced_at
             self.last_sync_result = result
             self.last_error = None
+            self.last_success_time = result.synced_at
             self.status = "idle"
 
             logger.info(
                 f"Hand analysis sync completed: {synced_count}/{total_records} records "
-                f"from {len(worksheets)} worksheets "
-                f"(created: {created_count}, updated: {updated_count})"
+                f"from {len(titles)} worksheets "
+                f"(created: {created_count}, updated: {updated_count}, "
+                f"deleted: {deleted_count}, unchanged: {unchanged_count}, "
+                f"skipped worksheets: {skipped_worksheets})"
             )
             return result
 
@@ -256,77 +452,246 @@ class HandAnalysisSyncService:
     async def _sync_worksheet(
         self,
         db: AsyncSession,
-        worksheet: gspread.Worksheet,
+        ws_title: str,
+        all_values: List[List[str]],
+        stored: Dict[str, SyncFingerprint],
+        force: bool = False,
     ) -> Dict[str, int]:
-        """개별 워크시트 동기화"""
-        ws_title = worksheet.title
+        """개별 워크시트 동기화
+
+        Set 기반 파이프라인:
+        0. 값 행렬 fingerprint가 이전과 같으면 전체 skip
+        1. 시트 행 파싱 → 키별 레코드 (file_name + source_worksheet + file_no)
+        2. 기존 행을 워크시트 단위 1회 쿼리로 로드
+        3. 메모리에서 diff → 변경된 행만 bulk INSERT/UPDATE
+        4. 시트에서 사라진 행은 bulk DELETE
+        5. 변경이 있으면 워크시트 태그 연결 재계산
+        """
         logger.info(f"Processing worksheet: {ws_title}")
 
         try:
-            all_values = worksheet.get_all_values()
-
-            if len(all_values) < 2:
-                logger.warning(f"Worksheet {ws_title} has insufficient rows")
-                return {"total": 0, "synced": 0, "created": 0, "updated": 0}
-
-            # 헤더 찾기 (Row 1 또는 Row 3)
-            header_idx, headers = self._find_headers(all_values)
-            if header_idx is None:
-                logger.warning(f"No valid headers found in {ws_title}")
-                return {"total": 0, "synced": 0, "created": 0, "updated": 0}
-
-            data_rows = all_values[header_idx + 1 :]
-            logger.info(f"  Headers at row {header_idx + 1}: {headers[:8]}")
-            logger.info(f"  Data rows: {len(data_rows)}")
-
-            synced = 0
-            created = 0
-            updated = 0
-
-            for row_idx, row in enumerate(data_rows):
-                try:
-                    record = self._parse_row(
-                        headers, row, ws_title, header_idx + row_idx + 2
-                    )
-                    if record is None:
-                        continue
-
-                    # Upsert (file_name + source_worksheet + file_no로 unique 판단)
-                    result = await db.execute(
-                        select(HandAnalysis).where(
-                            HandAnalysis.file_name == record["file_name"],
-                            HandAnalysis.source_worksheet == ws_title,
-                            HandAnalysis.file_no == record.get("file_no"),
-                        )
-                    )
-                    existing = result.scalar_one_or_none()
-
-                    if existing:
-                        # 업데이트
-                        for key, value in record.items():
-                            setattr(existing, key, value)
-                        updated += 1
-                    else:
-                        # 신규 추가
-                        new_hand = HandAnalysis(**record)
-                        db.add(new_hand)
-                        created += 1
-
-                    synced += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to sync row {row_idx} in {ws_title}: {e}")
-
-            return {
-                "total": len(data_rows),
-                "synced": synced,
-                "created": created,
-                "updated": updated,
-            }
+            fingerprint = compute_fingerprint(all_values)
+            previous = stored.get(ws_title)
+            if (
+                not force
+                and previous is not None
+                and previous.fingerprint == fingerprint
+            ):
+                logger.info(f"  Unchanged {ws_title} ({fingerprint[:8]}) - skipped")
+                counts = self._empty_counts()
+                counts.update(
+                    total=previous.row_count,
+                    synced=previous.record_count,
+                    unchanged=previous.record_count,
+                    skipped=1,
+                )
+                return counts
+
+            parsed = self._parse_worksheet(ws_title, all_values)
+            if parsed is None:
+                counts = self._empty_counts()
+            else:
+                total, records, failed_keys = parsed
+                counts = await self._apply_worksheet_diff(
+                    db, ws_title, records, failed_keys
+                )
+                counts["total"] = total
+
+            save_fingerprint(
+                db,
+                stored,
+                self.FINGERPRINT_SOURCE,
+                ws_title,
+                fingerprint,
+                row_count=counts["total"],
+                record_count=counts["synced"],
+            )
+            return counts
 
         except Exception as e:
             logger.error(f"Error processing worksheet {ws_title}: {e}")
-            return {"total": 0, "synced": 0, "created": 0, "updated": 0}
+            # 실패한 워크시트의 일부 쓰기가 commit되지 않도록
+            await db.rollback()
+            return self._empty_counts()
+
+    def _empty_counts(self) -> Dict[str, int]:
+        """빈 워크시트 결과"""
+        return {
+            "total": 0,
+            "synced": 0,
+            "created": 0,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": 0,
+            "skipped": 0,
+        }
+
+    def _parse_worksheet(
+        self, ws_title: str, all_values: List[List[str]]
+    ) -> Optional[Tuple[int, Dict[HandKey, Dict[str, Any]], Set[HandKey]]]:
+        """워크시트 raw 값 → (데이터 행 수, 키별 레코드, 파싱 실패 키)
+
+        헤더를 찾을 수 없으면 None (해당 워크시트는 DB 변경 없이 스킵).
+        같은 키가 여러 행에 있으면 마지막 행이 우선 (기존 upsert 동작과 동일).
+        파싱에 실패한 행의 키는 기존 DB 행이 삭제되지 않도록 따로 모은다.
+        """
+        if len(all_values) < 2:
+            logger.warning(f"Worksheet {ws_title} has insufficient rows")
+            return None
+
+        # 헤더 찾기 (Row 1 또는 Row 3)
+        header_idx, headers = self._find_headers(all_values)
+        if header_idx is None:
+            logger.warning(f"No valid headers found in {ws_title}")
+            return None
+
+        data_rows = all_values[header_idx + 1 :]
+        logger.info(f"  Headers at row {header_idx + 1}: {headers[:8]}")
+        logger.info(f"  Data rows: {len(data_rows)}")
+
+        records: Dict[HandKey, Dict[str, Any]] = {}
+        failed_keys: Set[HandKey] = set()
+        for row_idx, row in enumerate(data_rows):
+            try:
+                record = self._parse_row(
+                    headers, row, ws_title, header_idx + row_idx + 2
+                )
+                if record is None:
+                    continue
+                records[self._record_key(record)] = record
+            except Exception as e:
+                logger.warning(f"Failed to parse row {row_idx} in {ws_title}: {e}")
+                key = self._raw_row_key(headers, row, ws_title)
+                if key is not None:
+                    failed_keys.add(key)
+
+        return len(data_rows), records, failed_keys
+
+    def _record_key(self, record: Dict[str, Any]) -> HandKey:
+        """레코드 식별 키 (file_name + source_worksheet + file_no)"""
+        return (
+            record["file_name"],
+            record["source_worksheet"],
+            record.get("file_no"),
+        )
+
+    def _raw_row_key(
+        self, headers: List[str], row: List[str], ws_title: str
+    ) -> Optional[HandKey]:
+        """파싱 실패 행의 키 추정 (file_name이 없으면 None)"""
+        try:
+            record = {headers[i]: row[i] for i in range(min(len(headers), len(row)))}
+            file_name = str(record.get("file_name", "")).strip()
+            if not file_name:
+                return None
+            return (file_name, ws_title, self._parse_int(record.get("file_no")))
+        except Exception:
+            return None
+
+    def _plan_worksheet_diff(
+        self,
+        existing_rows: List[Dict[str, Any]],
+        records: Dict[HandKey, Dict[str, Any]],
+        keep_keys: Optional[Set[HandKey]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[int], int]:
+        """기존 행과 시트 레코드를 메모리에서 비교
+
+        Args:
+            existing_rows: DB 행 목록 (id + SYNC_COLUMNS)
+            records: 시트에서 파싱한 키별 레코드
+            keep_keys: 시트에 있지만 파싱에 실패한 키 (삭제하지 않음)
+
+        Returns:
+            (inserts, updates, delete_ids, unchanged_count)
+            - updates: {"id": ..., 변경 컬럼 전체} (bulk UPDATE by PK)
+            - delete_ids: 시트에서 사라진 행 + 중복 키 행
+              (유효 레코드가 하나도 없으면 시트 이상으로 보고 삭제 전파 안 함)
+        """
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        delete_ids: List[int] = []
+        unchanged = 0
+
+        existing_by_key: Dict[HandKey, Dict[str, Any]] = {}
+        for row in existing_rows:
+            key = self._record_key(row)
+            if key in existing_by_key:
+                # 과거 동기화로 생긴 중복 키 행 정리 (첫 행만 유지)
+                delete_ids.append(row["id"])
+            else:
+                existing_by_key[key] = row
+
+        for key, record in records.items():
+            existing = existing_by_key.pop(key, None)
+            if existing is None:
+                inserts.append(record)
+            elif any(
+                existing.get(col) != record.get(col)
+                for col in self.SYNC_COLUMNS
+                if col not in self.POSITIONAL_COLUMNS
+            ):
+                updates.append({"id": existing["id"], **record})
+            else:
+                unchanged += 1
+
+        # 시트에 더 이상 없는 행 (파싱 실패 행은 유지)
+        if records:
+            keep_keys = keep_keys or set()
+            delete_ids.extend(
+                row["id"]
+                for key, row in existing_by_key.items()
+                if key not in keep_keys
+            )
+
+        return inserts, updates, delete_ids, unchanged
+
+    async def _apply_worksheet_diff(
+        self,
+        db: AsyncSession,
+        ws_title: str,
+        records: Dict[HandKey, Dict[str, Any]],
+        keep_keys: Optional[Set[HandKey]] = None,
+    ) -> Dict[str, int]:
+        """워크시트 단위 diff 계산 및 bulk 적용"""
+        columns = [HandAnalysis.id] + [
+            getattr(HandAnalysis, col) for col in self.SYNC_COLUMNS
+        ]
+        result = await db.execute(
+            select(*columns)
+            .where(HandAnalysis.source_worksheet == ws_title)
+            .order_by(HandAnalysis.id)
+        )
+        existing_rows = [dict(row._mapping) for row in result]
+
+        inserts, updates, delete_ids, unchanged = self._plan_worksheet_diff(
+            existing_rows, records, keep_keys
+        )
+
+        if inserts:
+            await db.execute(insert(HandAnalysis), inserts)
+        if updates:
+            await db.execute(update(HandAnalysis), updates)
+        for i in range(0, len(delete_ids), self.DELETE_CHUNK_SIZE):
+            chunk = delete_ids[i : i + self.DELETE_CHUNK_SIZE]
+            await db.execute(delete(HandAnalysis).where(HandAnalysis.id.in_(chunk)))
+        if inserts or updates or delete_ids:
+            # 태그 연결은 바뀐 워크시트만 다시 계산
+            await hand_tag_service.sync_worksheet(db, ws_title)
+
+        logger.info(
+            f"  Diff {ws_title}: +{len(inserts)} ~{len(updates)} "
+            f"-{len(delete_ids)} ={unchanged}"
+        )
+
+        return {
+            "total": len(records),
+            "synced": len(records),
+            "created": len(inserts),
+            "updated": len(updates),
+            "deleted": len(delete_ids),
+            "unchanged": unchanged,
+            "skipped": 0,
+        }
 
     def _find_headers(self, all_values: List[List[str]]) -> tuple:
         """헤더 행 찾기 (Row 1 또는 Row 3)"""
@@ -476,6 +841,9 @@ class HandAnalysisSyncService:
             "next_sync": (
                 self.next_sync_time.isoformat() if self.next_sync_time else None
             ),
+            "last_success": (
+                self.last_success_time.isoformat() if self.last_success_time else None
+            ),
             "error": self.last_error,
             "interval_minutes": settings.SHEETS_SYNC_INTERVAL_MINUTES,
             "last_result": (
@@ -484,7 +852,11 @@ class HandAnalysisSyncService:
                     "synced_count": self.last_sync_result.synced_count,
                     "created_count": self.last_sync_result.created_count,
                     "updated_count": self.last_sync_result.updated_count,
+                    "deleted_count": self.last_sync_result.deleted_count,
+                    "unchanged_count": self.last_sync_result.unchanged_count,
                     "worksheets_processed": self.last_sync_result.worksheets_processed,
+                    "worksheets_skipped": self.last_sync_result.worksheets_skipped,
+                    "worksheet_diffs": self.last_sync_result.worksheet_diffs,
                 }
                 if self.last_sync_result
                 else None
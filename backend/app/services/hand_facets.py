@@ -0,0 +1,93 @@
+"""
+핸드 목록 facet 캐시
+
+/hands의 워크시트/등급별 개수를 hands 데이터 generation마다 한 번만 집계
+(GROUP BY 1회) → 페이지 요청마다 count(*) / SELECT DISTINCT를 다시 돌리지 않음.
+워크시트·등급 필터 목록의 전체 개수도 이 집계에서 바로 계산.
+
+generation은 시트 동기화가 반영될 때 bump → 다음 요청에서 다시 집계.
+워커(프로세스) 단위 캐시.
+
+Block: api.hands
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.hand_analysis import HandAnalysis
+from app.services.data_generation import data_generation
+
+
+class HandFacets:
+    """hands generation 단위 워크시트/등급 개수"""
+
+    def __init__(self):
+        self._generation: Optional[int] = None
+        self._facets: Optional[Dict[str, Any]] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self, db: AsyncSession) -> Dict[str, Any]:
+        """현재 generation의 facet (없으면 집계)
+
+        Returns:
+            cells: (워크시트, 등급) → 개수
+            worksheets / grades: 이름 → 개수 (NULL 제외)
+            total: 전체 개수
+        """
+        generation = (await data_generation.current())["hands"]
+        if self._facets is not None and self._generation == generation:
+            return self._facets
+
+        # 동시 요청은 집계 1회만
+        async with self._lock:
+            if self._facets is not None and self._generation == generation:
+                return self._facets
+            result = await db.execute(
+                select(
+                    HandAnalysis.source_worksheet,
+                    HandAnalysis.hand_grade,
+                    func.count(HandAnalysis.id),
+                ).group_by(HandAnalysis.source_worksheet, HandAnalysis.hand_grade)
+            )
+            cells: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+            worksheets: Dict[str, int] = {}
+            grades: Dict[str, int] = {}
+            for worksheet, grade, count in result.all():
+                cells[(worksheet, grade)] = count
+                if worksheet:
+                    worksheets[worksheet] = worksheets.get(worksheet, 0) + count
+                if grade:
+                    grades[grade] = grades.get(grade, 0) + count
+
+            self._facets = {
+                "cells": cells,
+                "worksheets": dict(sorted(worksheets.items())),
+                "grades": dict(sorted(grades.items())),
+                "total": sum(cells.values()),
+            }
+            self._generation = generation
+            return self._facets
+
+    @staticmethod
+    def count(
+        facets: Dict[str, Any],
+        worksheet: Optional[str] = None,
+        grade: Optional[str] = None,
+    ) -> int:
+        """워크시트/등급 필터 결과 개수 (facet에서 계산)"""
+        return sum(
+            count
+            for (cell_worksheet, cell_grade), count in facets["cells"].items()
+            if (worksheet is None or cell_worksheet == worksheet)
+            and (grade is None or cell_grade == grade)
+        )
+
+    def invalidate(self):
+        self._facets = None
+
+
+# Singleton instance
+hand_facets = HandFacets()
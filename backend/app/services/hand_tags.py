@@ -0,0 +1,260 @@
+"""
+핸드 태그 정규화 / 태그 조회
+
+hand_analyses의 JSON 태그 컬럼(player_tags, poker_play_tags)을 태그 사전
+(hand_tags) + 핸드↔태그 연결(hand_tag_links)로 유지하고, 태그 필터/facet은
+연결 테이블 인덱스 위의 집합 연산으로 조회한다 (핸드 행 JSON 파싱 없음).
+
+- 동기화: 핸드 시트 동기화가 워크시트에 변경을 반영할 때 그 워크시트의 연결만
+  다시 계산 → 기존 연결과 diff해서 추가/삭제분만 쓰기
+- 교집합(all): 태그 연결을 hand_id로 GROUP BY, HAVING count = 태그 수
+- 합집합(any): 태그 중 하나라도 연결된 hand_id
+- facet: 범위(워크시트/폴더/태그 필터) 안 핸드의 태그별 핸드 수
+
+Block: sync.hands
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import and_, delete, exists, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bulk import bulk_insert, upsert
+from app.models.file_stats import FileStats
+from app.models.hand_analysis import HandAnalysis, HandTag, HandTagLink
+
+logger = logging.getLogger(__name__)
+
+# 태그 종류 → hand_analyses JSON 컬럼
+TAG_COLUMNS = {"player": "player_tags", "play": "poker_play_tags"}
+
+# (종류, 정규화 이름)
+TagRef = Tuple[str, str]
+
+
+def normalize_tag(value: str) -> str:
+    """태그 조회 키 (공백 정리 + casefold: "Phil  Ivey" → "phil ivey")"""
+    return " ".join(str(value).split()).casefold()
+
+
+def parse_tags(raw: Optional[str]) -> List[str]:
+    """JSON 태그 컬럼 → 원본 태그 목록 (형식이 깨진 값은 빈 목록)"""
+    if not raw:
+        return []
+    try:
+        values = json.loads(raw)
+    except ValueError:
+        return []
+    if not isinstance(values, list):
+        return []
+    return [str(v).strip() for v in values if v is not None and str(v).strip()]
+
+
+def parse_tag_filter(
+    player_tags: Optional[str] = None, play_tags: Optional[str] = None
+) -> List[TagRef]:
+    """쉼표 구분 쿼리 파라미터 → (종류, 정규화 이름) 목록 (중복 제거)"""
+    refs: List[TagRef] = []
+    for kind, value in (("player", player_tags), ("play", play_tags)):
+        for name in (value or "").split(","):
+            ref = (kind, normalize_tag(name))
+            if ref[1] and ref not in refs:
+                refs.append(ref)
+    return refs
+
+
+def folder_hands(folder: str):
+    """폴더 하위 파일의 hand_id (file_name 매칭 - 진행률 API와 같은 기준)"""
+    return select(HandAnalysis.id).where(
+        HandAnalysis.file_name.in_(
+            select(FileStats.name).where(FileStats.folder_path.like(f"{folder}%"))
+        )
+    )
+
+
+class HandTagService:
+    """태그 사전/연결 유지 및 태그 집합 조회"""
+
+    # (hand_id, tag_id) 쌍 DELETE 청크 크기
+    DELETE_CHUNK_SIZE = 500
+
+    async def sync_worksheet(self, db: AsyncSession, ws_title: str) -> Dict[str, int]:
+        """워크시트 핸드의 JSON 태그 → 연결 테이블 (commit은 호출자)
+
+        Returns:
+            added / removed: 추가/삭제된 연결 수
+        """
+        result = await db.execute(
+            select(
+                HandAnalysis.id,
+                *(getattr(HandAnalysis, column) for column in TAG_COLUMNS.values()),
+            ).where(HandAnalysis.source_worksheet == ws_title)
+        )
+        labels: Dict[TagRef, str] = {}
+        pairs: Set[Tuple[int, TagRef]] = set()
+        for hand_id, *columns in result:
+            for kind, raw in zip(TAG_COLUMNS, columns):
+                for label in parse_tags(raw):
+                    ref = (kind, normalize_tag(label))
+                    labels.setdefault(ref, label)
+                    pairs.add((hand_id, ref))
+
+        tag_ids = await self._ensure_tags(db, labels)
+        wanted = {(hand_id, tag_ids[ref]) for hand_id, ref in pairs}
+
+        result = await db.execute(
+            select(HandTagLink.hand_id, HandTagLink.tag_id).where(
+                HandTagLink.source_worksheet == ws_title
+            )
+        )
+        existing = {tuple(row) for row in result}
+
+        added = sorted(wanted - existing)
+        removed = sorted(existing - wanted)
+        await bulk_insert(
+            db,
+            HandTagLink,
+            [
+                {"hand_id": hand_id, "tag_id": tag_id, "source_worksheet": ws_title}
+                for hand_id, tag_id in added
+            ],
+        )
+        for i in range(0, len(removed), self.DELETE_CHUNK_SIZE):
+            chunk = removed[i : i + self.DELETE_CHUNK_SIZE]
+            await db.execute(
+                delete(HandTagLink).where(
+                    tuple_(HandTagLink.hand_id, HandTagLink.tag_id).in_(chunk)
+                )
+            )
+
+        if added or removed:
+            logger.info(f"  Tags {ws_title}: +{len(added)} -{len(removed)} links")
+        return {"added": len(added), "removed": len(removed)}
+
+    async def _ensure_tags(
+        self, db: AsyncSession, labels: Dict[TagRef, str]
+    ) -> Dict[TagRef, int]:
+        """태그 사전에 없는 태그 추가 후 (종류, 이름) → id"""
+        if not labels:
+            return {}
+        await upsert(
+            db,
+            HandTag,
+            [
+                {"kind": kind, "name": name, "label": label}
+                for (kind, name), label in labels.items()
+            ],
+            ["kind", "name"],
+        )
+        # 사전은 작음 (수백~수천 행) → 종류 단위 1회 조회
+        result = await db.execute(
+            select(HandTag.kind, HandTag.name, HandTag.id).where(
+                HandTag.kind.in_({kind for kind, _ in labels})
+            )
+        )
+        return {(kind, name): tag_id for kind, name, tag_id in result}
+
+    async def prune_tags(self, db: AsyncSession) -> int:
+        """연결이 하나도 없는 태그 사전 행 삭제 (commit은 호출자)"""
+        result = await db.execute(
+            delete(HandTag).where(~exists().where(HandTagLink.tag_id == HandTag.id))
+        )
+        return result.rowcount or 0
+
+    def matching_hands(
+        self,
+        tags: Sequence[TagRef],
+        match: str = "all",
+        worksheet: Optional[str] = None,
+    ):
+        """태그 필터에 맞는 hand_id subquery
+
+        Args:
+            tags: (종류, 정규화 이름) 목록
+            match: all = 모든 태그가 붙은 핸드 (교집합), any = 하나라도 (합집합)
+            worksheet: 워크시트 범위 (idx_hand_tag_link_tag 범위 검색)
+        """
+        by_kind: Dict[str, List[str]] = {}
+        for kind, name in dict.fromkeys(tags):
+            by_kind.setdefault(kind, []).append(name)
+
+        query = (
+            select(HandTagLink.hand_id)
+            .join(HandTag, HandTag.id == HandTagLink.tag_id)
+            .where(
+                or_(
+                    *(
+                        and_(HandTag.kind == kind, HandTag.name.in_(names))
+                        for kind, names in by_kind.items()
+                    )
+                )
+            )
+        )
+        if worksheet is not None:
+            query = query.where(HandTagLink.source_worksheet == worksheet)
+        if match == "all":
+            # (hand_id, tag_id)는 PK → 연결 수 = 서로 다른 태그 수
+            return query.group_by(HandTagLink.hand_id).having(
+                func.count() == sum(len(names) for names in by_kind.values())
+            )
+        return query.distinct()
+
+    async def facets(
+        self,
+        db: AsyncSession,
+        kind: Optional[str] = None,
+        worksheet: Optional[str] = None,
+        folder: Optional[str] = None,
+        tags: Sequence[TagRef] = (),
+        match: str = "all",
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """범위 안 핸드의 태그별 핸드 수 (많은 순)
+
+        Args:
+            kind: 태그 종류 (없으면 전체)
+            worksheet / folder: 핸드 범위
+            tags / match: 태그 필터 (필터 결과 핸드의 다른 태그 facet)
+
+        Returns:
+            total_hands: 범위 + 태그 필터에 맞는 핸드 수
+            tags: [{kind, name, label, count}]
+        """
+        link_scope = []
+        hand_scope = []
+        if worksheet is not None:
+            link_scope.append(HandTagLink.source_worksheet == worksheet)
+            hand_scope.append(HandAnalysis.source_worksheet == worksheet)
+        if folder:
+            link_scope.append(HandTagLink.hand_id.in_(folder_hands(folder)))
+            hand_scope.append(HandAnalysis.id.in_(folder_hands(folder)))
+        if tags:
+            matching = self.matching_hands(tags, match, worksheet)
+            link_scope.append(HandTagLink.hand_id.in_(matching))
+            hand_scope.append(HandAnalysis.id.in_(matching))
+        if kind:
+            link_scope.append(HandTag.kind == kind)
+
+        count = func.count().label("count")
+        result = await db.execute(
+            select(HandTag.kind, HandTag.name, HandTag.label, count)
+            .select_from(HandTagLink)
+            .join(HandTag, HandTag.id == HandTagLink.tag_id)
+            .where(*link_scope)
+            .group_by(HandTag.id, HandTag.kind, HandTag.name, HandTag.label)
+            .order_by(count.desc(), HandTag.kind, HandTag.name)
+            .limit(limit)
+        )
+        total_hands = await db.scalar(
+            select(func.count(HandAnalysis.id)).where(*hand_scope)
+        )
+        return {
+            "total_hands": total_hands or 0,
+            "tags": [dict(row._mapping) for row in result],
+        }
+
+
+# Singleton instance
+hand_tag_service = HandTagService()
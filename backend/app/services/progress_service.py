@@ -25,9 +25,20 @@ Progress Service - 통합 진행률 계산
 ===================
 """
 
+import asyncio
 import logging
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -82,6 +93,9 @@ def calculate_similarity(name1: str, name2: str) -> float:
 
 # ==================== Main Service ====================
 
+# NDJSON 스트리밍 콜백: (완성된 노드 dict, 부모 폴더 ID) → None
+NodeEmitter = Callable[[Dict[str, Any], Optional[int]], Awaitable[None]]
+
 
 class ProgressService:
     """
@@ -92,6 +106,7 @@ class ProgressService:
     """
 
     SIMILARITY_THRESHOLD = 0.5
+    STREAM_QUEUE_SIZE = 64  # NDJSON 스트리밍 시 버퍼링할 최대 노드 수
 
     async def get_folder_with_progress(
         self,
@@ -102,6 +117,8 @@ class ProgressService:
         extensions: Optional[List[str]] = None,
         include_codecs: bool = False,
         include_hidden: bool = False,
+        emit: Optional[NodeEmitter] = None,
+        compact_stats: bool = False,
     ) -> Dict[str, Any]:
         """
         폴더 트리와 진행률 정보를 함께 반환
@@ -114,9 +131,14 @@ class ProgressService:
             extensions: 확장자 필터 목록 (예: ['.mp4', '.mkv'])
             include_codecs: 코덱 정보 포함 여부
             include_hidden: 숨김 파일/폴더 포함 여부 (v1.29.0)
+            emit: 노드 스트리밍 콜백 (NDJSON 모드). 지정 시 완성된 노드를
+                  (node, parent_id)로 즉시 전달하고 tree/children에는 쌓지 않음
+            compact_stats: Compact 스키마. 노드별 root_stats/archive_stats 복사본
+                           대신 ratios(비율)만 포함 (전역 통계는 최상위 1회)
 
         Returns:
             Dict with 'tree' (폴더 목록) and 'root_stats' (전체 통계)
+            emit 지정 시 'tree'는 빈 목록
         """
         # Step 1: Work Status 전체 로드 (archive db)
         work_statuses = await self._load_work_statuses(db)
@@ -182,8 +204,11 @@ class ProgressService:
                 root_stats=root_stats,  # 루트 통계 전달 (deprecated)
                 archive_stats=archive_stats,  # Issue #49: 일관된 통계 전달
                 include_hidden=include_hidden,  # v1.29.0: 숨김 필터 전달
+                emit=emit,
+                compact_stats=compact_stats,
             )
-            tree.append(folder_data)
+            if emit is None:
+                tree.append(folder_data)
             # 이 폴더와 하위에서 사용된 ID를 다음 형제에게 전파
             root_sibling_used_ids.update(folder_used_ids)
 
@@ -193,6 +218,87 @@ class ProgressService:
             "archive_stats": archive_stats,  # Issue #49: 항상 일관된 통계
         }
 
+    async def iter_folder_progress(
+        self,
+        db: AsyncSession,
+        path: Optional[str] = None,
+        depth: int = 2,
+        include_files: bool = False,
+        extensions: Optional[List[str]] = None,
+        include_codecs: bool = False,
+        include_hidden: bool = False,
+        compact_stats: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """폴더 트리를 노드 단위 레코드로 스트리밍 (NDJSON 모드)
+
+        get_folder_with_progress()와 동일한 매칭/집계 로직을 사용하되,
+        노드가 완성되는 즉시 레코드로 내보낸다. 자식 합산이 끝나야 부모가
+        완성되므로 노드는 자식 → 부모 순서(post-order)로 나온다.
+        클라이언트는 parent_id로 트리를 재구성한다.
+
+        레코드 형식:
+            {"type": "node", "parent_id": int | None, "node": {...}}  # children=[]
+            {"type": "summary", "node_count": int, "root_stats": {...},
+             "archive_stats": {...}}
+
+        Bounded queue로 생산자/소비자를 연결하므로 서버 메모리는
+        트리 크기가 아닌 깊이에 비례한다.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.STREAM_QUEUE_SIZE)
+        done = object()
+        node_count = 0
+
+        async def emit(node: Dict[str, Any], parent_id: Optional[int]) -> None:
+            nonlocal node_count
+            node_count += 1
+            await queue.put({"type": "node", "parent_id": parent_id, "node": node})
+
+        async def produce() -> Dict[str, Any]:
+            cancelled = False
+            try:
+                return await self.get_folder_with_progress(
+                    db,
+                    path,
+                    depth,
+                    include_files,
+                    extensions,
+                    include_codecs,
+                    include_hidden,
+                    emit=emit,
+                    compact_stats=compact_stats,
+                )
+            except asyncio.CancelledError:
+                # 소비자가 떠난 경우: 큐가 가득 차 있을 수 있으므로 종료 신호 생략
+                cancelled = True
+                raise
+            finally:
+                if not cancelled:
+                    await queue.put(done)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                record = await queue.get()
+                if record is done:
+                    break
+                yield record
+
+            result = await producer
+            yield {
+                "type": "summary",
+                "node_count": node_count,
+                "root_stats": result["root_stats"],
+                "archive_stats": result["archive_stats"],
+            }
+        finally:
+            # 클라이언트 연결 종료 시 생산자 정리 (세션이 닫히기 전에 완료 대기)
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+
     # === BLOCK: progress.root_stats ===
     # Description: 루트 전체 통계 계산 (Issue #29: NAS/Sheets 데이터 분리 표시용)
     # Dependencies: FolderStats, FileStats, WorkStatus
@@ -758,6 +864,41 @@ class ProgressService:
     # AI Context: 진행률 계산/합산 문제, 코덱 집계 문제 시
     # Warning: 300줄 이상의 대형 함수 - 분할 고려 필요
 
+    def _folder_ratios(
+        self,
+        folder: FolderStats,
+        root_stats: Optional[Dict[str, Any]],
+        archive_stats: Optional[Dict[str, Any]],
+    ) -> Dict[str, float]:
+        """폴더의 전체 대비 비율 (full 스키마의 root_stats/archive_stats와
+        compact 스키마의 ratios가 공유)
+
+        - file_ratio/size_ratio: archive_stats 기준 (Issue #49, 소수점 2자리)
+        - root_file_ratio/root_size_ratio: root_stats 기준 (Issue #29, 소수점 1자리)
+        """
+        archive_files = (archive_stats or {}).get("total_files", 0)
+        archive_size = (archive_stats or {}).get("total_size", 0)
+        root_files = (root_stats or {}).get("total_files", 0)
+        root_size = (root_stats or {}).get("total_size", 0)
+        return {
+            "file_ratio": (
+                round(folder.file_count / archive_files * 100, 2)
+                if archive_files > 0
+                else 0
+            ),
+            "size_ratio": (
+                round(folder.total_size / archive_size * 100, 2)
+                if archive_size > 0
+                else 0
+            ),
+            "root_file_ratio": (
+                round(folder.file_count / root_files * 100, 1) if root_files > 0 else 0
+            ),
+            "root_size_ratio": (
+                round(folder.total_size / root_size * 100, 1) if root_size > 0 else 0
+            ),
+        }
+
     async def _build_folder_progress(
         self,
         db: AsyncSession,
@@ -779,6 +920,9 @@ class ProgressService:
             Dict[str, Any]
         ] = None,  # Issue #49: 일관된 아카이브 통계
         include_hidden: bool = False,  # v1.29.0: 숨김 파일/폴더 포함
+        emit: Optional[NodeEmitter] = None,  # NDJSON 스트리밍 콜백
+        parent_id: Optional[int] = None,  # 스트리밍 레코드의 부모 폴더 ID
+        compact_stats: bool = False,  # Compact 스키마 (노드별 비율만)
     ) -> Tuple[Dict[str, Any], Set[int]]:
         """폴더 데이터 구축 (archive db + metadata db + codecs 통합)
 
@@ -786,6 +930,9 @@ class ProgressService:
             parent_work_status_ids: 상위 폴더에서 이미 매칭된 work_status ID 집합.
                                     Cascading Match 방지: 동일 work_status가 부모-자식에 중복 매칭되지 않도록 함.
             include_hidden: 숨김 파일/폴더 포함 여부 (v1.29.0)
+            emit: 지정 시 자식 합산이 끝난 노드를 (node, parent_id)로 전달.
+                  자식은 부모의 children에 쌓지 않음 (메모리 = 트리 깊이 비례)
+            parent_id: emit에 전달할 부모 폴더 ID
 
         Returns:
             Tuple[폴더 데이터 dict, 이 폴더와 하위 폴더에서 사용된 work_status_id 집합]
@@ -847,37 +994,32 @@ class ProgressService:
                 folder.total_duration
             )
 
+        # 전체 대비 비율 (full/compact 스키마 공통 계산)
+        ratios = self._folder_ratios(folder, root_stats, archive_stats)
+
+        # Compact 스키마: 전역 통계는 응답 최상위에 1회만, 노드는 비율만 보유
+        if compact_stats:
+            folder_dict["ratios"] = ratios
+
         # Issue #29: 루트 전체 대비 비율 정보 (NAS/Sheets 데이터 분리 표시용)
         # deprecated: archive_stats 사용 권장
-        if root_stats:
-            root_total_files = root_stats.get("total_files", 0)
-            root_total_size = root_stats.get("total_size", 0)
+        if root_stats and not compact_stats:
             folder_dict["root_stats"] = {
-                "total_files": root_total_files,
-                "total_size": root_total_size,
+                "total_files": root_stats.get("total_files", 0),
+                "total_size": root_stats.get("total_size", 0),
                 "total_size_formatted": root_stats.get("total_size_formatted", "0 B"),
-                # 현재 폴더의 비율 계산
-                "file_ratio": (
-                    round(folder.file_count / root_total_files * 100, 1)
-                    if root_total_files > 0
-                    else 0
-                ),
-                "size_ratio": (
-                    round(folder.total_size / root_total_size * 100, 1)
-                    if root_total_size > 0
-                    else 0
-                ),
+                # 현재 폴더의 비율
+                "file_ratio": ratios["root_file_ratio"],
+                "size_ratio": ratios["root_size_ratio"],
             }
         else:
             folder_dict["root_stats"] = None
 
         # Issue #49: archive_stats (항상 일관된 전체 통계)
-        if archive_stats:
-            archive_total_files = archive_stats.get("total_files", 0)
-            archive_total_size = archive_stats.get("total_size", 0)
+        if archive_stats and not compact_stats:
             folder_dict["archive_stats"] = {
-                "total_files": archive_total_files,
-                "total_size": archive_total_size,
+                "total_files": archive_stats.get("total_files", 0),
+                "total_size": archive_stats.get("total_size", 0),
                 "total_size_formatted": archive_stats.get(
                     "total_size_formatted", "0 B"
                 ),
@@ -888,16 +1030,8 @@ class ProgressService:
                 "sheets_total_videos": archive_stats.get("sheets_total_videos", 0),
                 "sheets_total_done": archive_stats.get("sheets_total_done", 0),
                 # 현재 폴더의 전체 대비 비율
-                "file_ratio": (
-                    round(folder.file_count / archive_total_files * 100, 2)
-                    if archive_total_files > 0
-                    else 0
-                ),
-                "size_ratio": (
-                    round(folder.total_size / archive_total_size * 100, 2)
-                    if archive_total_size > 0
-                    else 0
-                ),
+                "file_ratio": ratios["file_ratio"],
+                "size_ratio": ratios["size_ratio"],
             }
         else:
             folder_dict["archive_stats"] = None
@@ -1135,8 +1269,12 @@ class ProgressService:
                     root_stats=root_stats,  # Issue #29: 루트 통계 전달 (deprecated)
                     archive_stats=archive_stats,  # Issue #49: 일관된 통계 전달
                     include_hidden=include_hidden,  # v1.29.0: 숨김 필터 전달
+                    emit=emit,
+                    parent_id=folder.id,
+                    compact_stats=compact_stats,
                 )
-                children.append(child_data)
+                if emit is None:
+                    children.append(child_data)
 
                 # ⚠️ 핵심 수정: 이 자식과 그 하위 폴더에서 사용된 모든 ID를 형제에게 전파
                 # 이렇게 하면 사촌 폴더(다른 부모의 자식)도 중복 사용 방지됨
@@ -1298,6 +1436,10 @@ class ProgressService:
         # sibling_used_ids는 자식들과 그 하위 폴더에서 사용한 모든 ID
         all_used_ids.update(sibling_used_ids)
 
+        # NDJSON 스트리밍: 완성된 노드를 즉시 전달
+        if emit is not None:
+            await emit(folder_dict, parent_id)
+
         return folder_dict, all_used_ids
 
     # === END BLOCK: progress.aggregator ===
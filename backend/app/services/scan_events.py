@@ -0,0 +1,161 @@
+"""
+스캔 진행 상황 SSE 브로드캐스트
+
+/scan/status 폴링은 뷰어 수만큼 상태 모델 생성/뷰어 정리/로그 복사를 반복한다.
+워커당 1개의 브로드캐스터가 SCAN_STREAM_INTERVAL_SECONDS마다 공유 상태를
+한 번만 읽고, 이전 스냅샷과의 차이(delta)를 모든 구독자에게 전달한다.
+
+- 변경된 필드와 새 로그 줄(log_seq 기준)만 전송
+- 느린 구독자에게는 대기 중인 delta를 병합(coalesce)해 1건으로 전달
+- 활성 뷰어 = 열린 스트림 연결 수 (연결별 TTL 키를 주기적으로 갱신)
+
+Block: scanner.events
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.services.shared_state import shared_state
+
+logger = logging.getLogger(__name__)
+
+# 열린 스트림 연결의 뷰어 키 prefix (폴링 뷰어 "viewer:<client_id>"와 함께 집계)
+STREAM_VIEWER_PREFIX = "viewer:stream:"
+VIEWER_TTL_SECONDS = 30
+
+
+def diff_scan_state(prev: Dict[str, Any], cur: Dict[str, Any]) -> Dict[str, Any]:
+    """두 상태 스냅샷의 차이
+
+    logs/log_seq를 제외한 필드는 값이 바뀐 것만, 로그는 log_seq 이후의
+    새 줄만 포함. log_seq가 줄었으면(새 스캔) 현재 버퍼 전체를 보냄.
+    """
+    delta = {
+        key: value
+        for key, value in cur.items()
+        if key not in ("logs", "log_seq") and prev.get(key) != value
+    }
+    prev_seq, cur_seq = prev.get("log_seq", 0), cur.get("log_seq", 0)
+    if cur_seq != prev_seq:
+        logs = cur.get("logs", [])
+        new_count = cur_seq - prev_seq
+        delta["logs"] = logs[-new_count:] if 0 < new_count < len(logs) else logs
+        delta["log_seq"] = cur_seq
+    return delta
+
+
+def merge_delta(pending: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """아직 전송하지 못한 delta에 새 delta 병합 (필드는 최신값, 로그는 이어붙임)"""
+    merged = {**pending, **delta}
+    if "logs" in pending and "logs" in delta:
+        merged["logs"] = (pending["logs"] + delta["logs"])[
+            -settings.SCAN_LOG_BUFFER_SIZE :
+        ]
+    return merged
+
+
+class ScanSubscriber:
+    """스트림 연결 1개 (전송 대기 delta를 1건으로 유지)"""
+
+    def __init__(self):
+        self.viewer_key = STREAM_VIEWER_PREFIX + uuid.uuid4().hex
+        self._pending: Optional[Dict[str, Any]] = None
+        self._ready = asyncio.Event()
+
+    def push(self, delta: Dict[str, Any]):
+        self._pending = merge_delta(self._pending or {}, delta)
+        self._ready.set()
+
+    async def next(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """다음 delta (timeout 동안 없으면 None → keepalive)"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._ready.clear()
+        delta, self._pending = self._pending, None
+        return delta
+
+
+class ScanEventBroadcaster:
+    """워커 단위 스캔 상태 브로드캐스터
+
+    구독자가 있을 때만 폴링 태스크가 돌고, 마지막 구독자가 나가면 멈춘다.
+
+    Args:
+        load_state: 현재 스캔 상태 dict를 반환 (logs 전체 버퍼 + log_seq 포함)
+    """
+
+    def __init__(self, load_state: Callable[[], Awaitable[Dict[str, Any]]]):
+        self._load_state = load_state
+        self._subscribers: Set[ScanSubscriber] = set()
+        self._last: Dict[str, Any] = {}
+        self._viewers = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """현재 전체 상태 (연결 직후 1회 전송)"""
+        self._viewers = await shared_state.count_prefix("viewer:")
+        state = await self._load_state()
+        state["active_viewers"] = self._viewers
+        return state
+
+    @asynccontextmanager
+    async def subscribe(self):
+        """구독 등록/해제 (연결이 열려 있는 동안 뷰어로 집계)"""
+        subscriber = ScanSubscriber()
+        await self._touch_viewers([subscriber])
+        self._subscribers.add(subscriber)
+        if self._task is None or self._task.done():
+            self._last = await self.snapshot()
+            self._task = asyncio.create_task(self._run())
+        try:
+            yield subscriber
+        finally:
+            self._subscribers.discard(subscriber)
+            try:
+                await shared_state.delete(subscriber.viewer_key)
+            except Exception as e:
+                logger.warning(f"Failed to remove stream viewer: {e}")
+            if not self._subscribers and self._task is not None:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+                self._task = None
+
+    async def _run(self):
+        """상태 폴링 → delta 계산 → 구독자에게 전달"""
+        last_touch = time.monotonic()
+        while self._subscribers:
+            await asyncio.sleep(settings.SCAN_STREAM_INTERVAL_SECONDS)
+            try:
+                # 뷰어 TTL 키 갱신은 TTL의 1/3 주기로만
+                if time.monotonic() - last_touch > VIEWER_TTL_SECONDS / 3:
+                    await self._touch_viewers(list(self._subscribers))
+                    self._viewers = await shared_state.count_prefix("viewer:")
+                    last_touch = time.monotonic()
+                state = await self._load_state()
+                state["active_viewers"] = self._viewers
+            except Exception as e:
+                logger.warning(f"Scan event poll failed: {e}")
+                continue
+            delta = diff_scan_state(self._last, state)
+            self._last = state
+            if delta:
+                for subscriber in list(self._subscribers):
+                    subscriber.push(delta)
+
+    async def _touch_viewers(self, subscribers: List[ScanSubscriber]):
+        for subscriber in subscribers:
+            await shared_state.set(subscriber.viewer_key, 1, ttl=VIEWER_TTL_SECONDS)
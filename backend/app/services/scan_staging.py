@@ -0,0 +1,196 @@
+"""
+Blue/green 스캔 DB
+
+전체 스캔 중에는 FolderStats가 하위 폴더부터 기록되므로, 같은 DB를 읽는
+대시보드는 일부만 합산된 상위 폴더 통계를 보게 되고 writer 잠금도 경합한다.
+staged 스캔은 라이브 DB의 스냅샷 복사본(staging 파일)에 기록하고, 스캔이
+끝나면 스캔 테이블을 한 트랜잭션으로 라이브 DB에 교체 반영한다.
+
+1. create(): SQLite backup API로 라이브 DB 전체(인덱스, 동기화 테이블 포함)를
+   <DB 파일>.staging 으로 복사 → 증분 스캔 비교 기준도 그대로 유지
+2. 스캐너는 staging 엔진(읽기 풀 + 전용 DatabaseWriter)으로만 읽고 씀
+3. swap(): 라이브 writer 슬롯에서 staging을 ATTACH 하고
+   file_stats / folder_stats를 DELETE + INSERT ... SELECT,
+   folder_stats_deltas는 새로 기록된 행만 INSERT 후 COMMIT
+   - 파일/폴더 검색 색인은 행 단위 trigger 대신 교체 후 한 번에 재구성
+     (staging 복사본은 색인 trigger를 떼고 스캔)
+   - WAL 읽기 연결은 COMMIT 전까지 이전 스냅샷, 이후 새 스냅샷을 봄
+   - 동기화 테이블은 라이브 DB 것을 그대로 유지 (스캔 중 동기화 결과 보존)
+   - folder_stats.work_status_id는 라이브 값 우선 (스캔 중 연결 변경 보존)
+4. discard(): staging 파일 삭제 (중단/실패 시 라이브 DB는 변경 없음)
+
+파일 SQLite에서만 지원 (그 외 엔진은 기존 in-place 스캔).
+
+Block: scanner.staging
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import (
+    DatabaseWriter,
+    _is_sqlite_file,
+    create_sqlite_engine,
+    db_writer,
+)
+from app.models.file_stats import FileStats, FolderStats, FolderStatsDelta
+from app.models.search import (
+    sqlite_drop_trigger_ddl,
+    sqlite_rebuild_ddl,
+    sqlite_trigger_ddl,
+)
+
+logger = logging.getLogger(__name__)
+
+# 스캔이 다시 쓰는 테이블 (교체 대상)
+SWAP_TABLES = [FileStats.__table__, FolderStats.__table__]
+# 스캔이 행을 추가만 하는 테이블 (새 행만 반영)
+APPEND_TABLES = [FolderStatsDelta.__table__]
+# 교체 테이블의 검색 색인 종류 (swap 후 1회 재구성)
+SWAP_SEARCH_KINDS = ["file", "folder"]
+STAGING_SUFFIX = ".staging"
+
+
+def staging_supported(url: Optional[str] = None) -> bool:
+    return _is_sqlite_file(url or settings.DATABASE_URL)
+
+
+class StagingDatabase:
+    """스캔 1회분 staging DB
+
+    Args:
+        url: 라이브 DB URL (기본 settings.DATABASE_URL)
+        live_writer: 라이브 DB 단일 writer (swap 시 사용)
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        live_writer: Optional[DatabaseWriter] = None,
+    ):
+        self.url = url or settings.DATABASE_URL
+        self.live_path = make_url(self.url).database
+        self.path = self.live_path + STAGING_SUFFIX
+        self.live_writer = live_writer or db_writer
+        self._engine: Optional[AsyncEngine] = None
+        self._read_engine: Optional[AsyncEngine] = None
+        self.read_session_maker: Optional[async_sessionmaker] = None
+        self.writer: Optional[DatabaseWriter] = None
+
+    async def create(self):
+        """라이브 DB 스냅샷을 staging 파일로 복사하고 엔진 준비"""
+        self._remove_files()
+        await asyncio.to_thread(self._backup)
+
+        staging_url = make_url(self.url).set(database=self.path)
+        staging_url = staging_url.render_as_string(hide_password=False)
+        self._engine = create_sqlite_engine(staging_url)
+        # writer 연결을 먼저 열어 -wal/-shm 생성 (읽기 전용 연결은 만들 수 없음)
+        async with self._engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        self._read_engine = create_sqlite_engine(staging_url, readonly=True)
+        self.writer = DatabaseWriter(
+            async_sessionmaker(
+                self._engine, class_=AsyncSession, expire_on_commit=False
+            )
+        )
+        self.read_session_maker = async_sessionmaker(
+            self._read_engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+    def _backup(self):
+        # backup()은 읽기 트랜잭션 1개로 전체 페이지를 복사 → 일관된 스냅샷
+        source = sqlite3.connect(self.live_path)
+        target = sqlite3.connect(self.path)
+        try:
+            source.backup(target)
+            # staging에서는 검색 색인을 갱신하지 않음 (swap에서 라이브 색인 재구성)
+            for kind in SWAP_SEARCH_KINDS:
+                for statement in sqlite_drop_trigger_ddl(kind):
+                    target.execute(statement)
+            target.commit()
+        finally:
+            target.close()
+            source.close()
+
+    async def swap(self):
+        """staging 스캔 결과를 라이브 DB에 원자적으로 반영"""
+        # staging 연결을 모두 닫아 WAL을 본 파일에 체크포인트
+        await self._dispose()
+
+        async with self.live_writer.connection() as connection:
+            await connection.execute(
+                text("ATTACH DATABASE :path AS staging"), {"path": self.path}
+            )
+            try:
+                await connection.execute(
+                    text(
+                        "UPDATE staging.folder_stats SET work_status_id = ("
+                        "SELECT live.work_status_id FROM main.folder_stats AS live "
+                        "WHERE live.path = staging.folder_stats.path)"
+                    )
+                )
+                # 행 단위 색인 trigger 대신 교체 후 한 번에 재구성
+                for kind in SWAP_SEARCH_KINDS:
+                    for statement in sqlite_drop_trigger_ddl(kind, "main"):
+                        await connection.execute(text(statement))
+                for table in SWAP_TABLES:
+                    columns = ", ".join(column.name for column in table.columns)
+                    await connection.execute(text(f"DELETE FROM main.{table.name}"))
+                    await connection.execute(
+                        text(
+                            f"INSERT INTO main.{table.name} ({columns}) "
+                            f"SELECT {columns} FROM staging.{table.name}"
+                        )
+                    )
+                for table in APPEND_TABLES:
+                    # staging은 라이브 복사본에서 시작 → 라이브에 없는 새 행만 추가
+                    columns = ", ".join(column.name for column in table.columns)
+                    await connection.execute(
+                        text(
+                            f"INSERT INTO main.{table.name} ({columns}) "
+                            f"SELECT {columns} FROM staging.{table.name} "
+                            f"WHERE id > (SELECT COALESCE(MAX(id), 0) "
+                            f"FROM main.{table.name})"
+                        )
+                    )
+                for kind in SWAP_SEARCH_KINDS:
+                    await connection.execute(text(sqlite_rebuild_ddl(kind, "main")))
+                    for statement in sqlite_trigger_ddl(kind, "main"):
+                        await connection.execute(text(statement))
+                await connection.commit()
+            except Exception:
+                await connection.rollback()
+                raise
+            finally:
+                await connection.execute(text("DETACH DATABASE staging"))
+                await connection.commit()
+
+        self._remove_files()
+        logger.info(f"Swapped staged scan into {self.live_path}")
+
+    async def discard(self):
+        """staging 폐기 (라이브 DB는 변경 없음)"""
+        await self._dispose()
+        self._remove_files()
+
+    async def _dispose(self):
+        for staging_engine in (self._read_engine, self._engine):
+            if staging_engine is not None:
+                await staging_engine.dispose()
+        self._engine = self._read_engine = None
+
+    def _remove_files(self):
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except FileNotFoundError:
+                pass
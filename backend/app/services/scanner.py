@@ -4,15 +4,19 @@ import asyncio
 import json
 import os
 import subprocess
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
+from app.core.bulk import bulk_insert, upsert
 from app.core.config import settings
-from app.models.file_stats import FileStats, FolderStats
+from app.core.database import DatabaseWriter, db_writer
+from app.models.file_stats import FileStats, FolderStats, FolderStatsDelta
 from app.services.utils import get_mime_type
 
 # Media extensions (for duration extraction via ffprobe)
@@ -55,9 +59,20 @@ class ArchiveScanner:
     """Scanner for archive directory"""
 
     def __init__(
-        self, db: AsyncSession, state: Dict[str, Any], scan_type: str = "full"
+        self,
+        db: AsyncSession,
+        state: Dict[str, Any],
+        scan_type: str = "full",
+        writer: Optional[DatabaseWriter] = None,
+        scan_id: Optional[int] = None,
     ):
+        # db is used for reads only; all writes go through the single writer
+        # in short transactions so dashboard reads and syncs never wait on a
+        # scan-long write transaction
         self.db = db
+        self.writer = writer or db_writer
+        self._pending_new: List[Dict[str, Any]] = []
+        self._pending_updates: List[Dict[str, Any]] = []
         self.state = state
         self.scan_type = scan_type  # "full" or "incremental"
         self.files_processed = 0
@@ -66,6 +81,12 @@ class ArchiveScanner:
         self.files_updated = 0
         self.folders_processed = 0
         self.last_scan_time: Optional[datetime] = None
+        # Folder deltas of this scan share one generation (scan id + start time)
+        self.scan_id = scan_id
+        self.started_at = datetime.utcnow()
+        # Per-extension totals of every file seen (skipped ones included),
+        # used for the daily snapshot breakdown without re-reading file_stats
+        self.type_stats: Dict[str, Dict[str, float]] = {}
 
     async def _get_last_scan_time(self) -> Optional[datetime]:
         """Get the last successful scan completion time"""
@@ -109,6 +130,7 @@ class ArchiveScanner:
 
         try:
             await self._scan_directory(base_path, depth=0)
+            await self._flush()
 
             # Log final statistics
             if self.scan_type == "incremental":
@@ -134,6 +156,8 @@ class ArchiveScanner:
             "file_count": 0,
             "folder_count": 0,
             "total_duration": 0.0,
+            "media_count": 0,
+            "missing_duration_count": 0,
         }
 
         try:
@@ -161,6 +185,10 @@ class ArchiveScanner:
                     folder_stats["total_size"] += file_info["size"]
                     folder_stats["file_count"] += 1
                     folder_stats["total_duration"] += file_info.get("duration", 0)
+                    if ext in MEDIA_EXTENSIONS:
+                        folder_stats["media_count"] += 1
+                        if not file_info.get("duration"):
+                            folder_stats["missing_duration_count"] += 1
 
                     self.files_processed += 1
                     self.state["files_scanned"] = self.files_processed
@@ -177,6 +205,10 @@ class ArchiveScanner:
                         folder_stats["file_count"] += sub_folder.file_count
                         folder_stats["folder_count"] += sub_folder.folder_count
                         folder_stats["total_duration"] += sub_folder.total_duration
+                        folder_stats["media_count"] += sub_folder.media_count or 0
+                        folder_stats["missing_duration_count"] += (
+                            sub_folder.missing_duration_count or 0
+                        )
 
             except Exception as e:
                 print(f"Error processing {entry.path}: {e}")
@@ -203,6 +235,8 @@ class ArchiveScanner:
             dict with keys: duration, video_codec, audio_codec
         """
         result_info = {"duration": 0.0, "video_codec": None, "audio_codec": None}
+        outcome = "ok"
+        start = time.perf_counter()
 
         try:
             # Use faster options: read format and stream info, limit probe size
@@ -226,7 +260,9 @@ class ArchiveScanner:
                 timeout=10,  # Reduced timeout to 10 seconds
             )
 
-            if result.returncode == 0:
+            if result.returncode != 0:
+                outcome = "failed"
+            else:
                 data = json.loads(result.stdout)
 
                 # Extract duration
@@ -244,12 +280,16 @@ class ArchiveScanner:
                         result_info["audio_codec"] = codec_name
 
         except subprocess.TimeoutExpired:
+            outcome = "timeout"
             self._add_log(f"⏱️ Timeout: {os.path.basename(file_path)}")
         except json.JSONDecodeError:
-            pass
+            outcome = "failed"
         except Exception as e:
+            outcome = "error"
             self._add_log(f"❌ Error: {os.path.basename(file_path)} - {str(e)[:50]}")
 
+        metrics.scan_probes.inc(labels=(outcome,))
+        metrics.scan_probe_duration.observe(time.perf_counter() - start)
         return result_info
 
     def _get_media_duration(self, file_path: str) -> float:
@@ -257,7 +297,12 @@ class ArchiveScanner:
         return self._get_media_info(file_path)["duration"]
 
     def _add_log(self, message: str):
-        """Add log message to shared state"""
+        """Add log message to shared state
+
+        logs is a ring buffer of the last SCAN_LOG_BUFFER_SIZE lines and
+        log_seq counts every line ever added, so stream consumers can tell
+        which lines are new since their last look.
+        """
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}"
 
@@ -265,9 +310,23 @@ class ArchiveScanner:
             self.state["logs"] = []
 
         self.state["logs"].append(log_entry)
-        # Keep only last 100 logs
-        if len(self.state["logs"]) > 100:
-            self.state["logs"] = self.state["logs"][-100:]
+        self.state["log_seq"] = self.state.get("log_seq", 0) + 1
+        # Keep only the last SCAN_LOG_BUFFER_SIZE logs
+        if len(self.state["logs"]) > settings.SCAN_LOG_BUFFER_SIZE:
+            del self.state["logs"][: -settings.SCAN_LOG_BUFFER_SIZE]
+
+    def _count_type(self, ext: str, size: int, duration: float):
+        """Add one file to the per-extension totals"""
+        stats = self.type_stats.get(ext or "unknown")
+        if stats is None:
+            stats = self.type_stats[ext or "unknown"] = {
+                "file_count": 0,
+                "total_size": 0,
+                "total_duration": 0.0,
+            }
+        stats["file_count"] += 1
+        stats["total_size"] += size
+        stats["total_duration"] += duration
 
     async def _process_file(
         self, entry: os.DirEntry, folder_path: str
@@ -280,6 +339,8 @@ class ArchiveScanner:
             stat = entry.stat()
             ext = Path(entry.name).suffix.lower()
             file_mtime = datetime.fromtimestamp(stat.st_mtime)
+            metrics.scan_files.inc()
+            metrics.scan_bytes.inc(stat.st_size)
 
             # Check if file exists in DB first
             result = await self.db.execute(
@@ -292,6 +353,8 @@ class ArchiveScanner:
                 # File hasn't been modified since last scan - skip it
                 if file_mtime <= self.last_scan_time:
                     self.files_skipped += 1
+                    metrics.scan_files_skipped.inc()
+                    self._count_type(ext, existing.size, existing.duration or 0.0)
                     # Return existing data for folder stats calculation
                     return {
                         "size": existing.size,
@@ -351,6 +414,7 @@ class ArchiveScanner:
                 "video_codec": video_codec,
                 "audio_codec": audio_codec,
             }
+            self._count_type(ext, stat.st_size, duration)
 
             if existing:
                 # Update existing (if size changed, duration is 0, or codec info missing)
@@ -361,25 +425,49 @@ class ArchiveScanner:
                 )
                 if needs_update:
                     self.files_updated += 1
-                    for key, value in file_info.items():
-                        if key != "path":
-                            setattr(existing, key, value)
+                    self._pending_updates.append(
+                        {
+                            "id": existing.id,
+                            **{k: v for k, v in file_info.items() if k != "path"},
+                        }
+                    )
             else:
                 # Create new
                 self.files_new += 1
-                db_file = FileStats(**file_info)
-                self.db.add(db_file)
+                self._pending_new.append(file_info)
 
             # Commit periodically
             if self.files_processed % 500 == 0:
-                await self.db.commit()
+                await self._flush()
 
             return file_info
 
         except Exception as e:
             print(f"Error processing file {entry.path}: {e}")
+            metrics.scan_errors.inc(labels=("file",))
             return {"size": 0, "duration": 0}
 
+    async def _flush(
+        self, extra: Optional[Callable[[AsyncSession], Awaitable[None]]] = None
+    ):
+        """Write pending files (and extra work) in one short writer transaction"""
+        new, updates = self._pending_new, self._pending_updates
+        if not (new or updates or extra):
+            return
+        self._pending_new, self._pending_updates = [], []
+
+        async def write(db: AsyncSession):
+            if new:
+                await bulk_insert(db, FileStats, new)
+            if updates:
+                await db.execute(update(FileStats), updates)
+            if extra:
+                await extra(db)
+
+        await self.writer.run(write)
+        # End the read snapshot so the next read sees what was just committed
+        await self.db.rollback()
+
     async def _save_folder_stats(
         self,
         path: str,
@@ -387,35 +475,80 @@ class ArchiveScanner:
         depth: int,
         parent_path: Optional[str],
     ):
-        """Save folder statistics"""
-        name = os.path.basename(path) or path
-
-        result = await self.db.execute(
-            select(FolderStats).where(FolderStats.path == path)
-        )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            existing.total_size = stats["total_size"]
-            existing.file_count = stats["file_count"]
-            existing.folder_count = stats["folder_count"]
-            existing.total_duration = stats["total_duration"]
-            existing.last_scanned_at = datetime.utcnow()
-        else:
-            folder = FolderStats(
-                path=path,
-                name=name,
-                parent_path=parent_path,
-                depth=depth,
-                total_size=stats["total_size"],
-                file_count=stats["file_count"],
-                folder_count=stats["folder_count"],
-                total_duration=stats["total_duration"],
-                last_scanned_at=datetime.utcnow(),
+        """Save folder statistics (flushes pending files in the same transaction)"""
+
+        async def upsert_folder(db: AsyncSession):
+            now = datetime.utcnow()
+            previous = (
+                await db.execute(
+                    select(
+                        FolderStats.total_size,
+                        FolderStats.file_count,
+                        FolderStats.total_duration,
+                    ).where(FolderStats.path == path)
+                )
+            ).first()
+            await upsert(
+                db,
+                FolderStats,
+                [
+                    {
+                        "path": path,
+                        "name": os.path.basename(path) or path,
+                        "parent_path": parent_path,
+                        "depth": depth,
+                        "total_size": stats["total_size"],
+                        "file_count": stats["file_count"],
+                        "folder_count": stats["folder_count"],
+                        "total_duration": stats["total_duration"],
+                        "media_count": stats.get("media_count", 0),
+                        "missing_duration_count": stats.get(
+                            "missing_duration_count", 0
+                        ),
+                        "last_scanned_at": now,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                ],
+                conflict_columns=["path"],
+                update_columns=[
+                    "total_size",
+                    "file_count",
+                    "folder_count",
+                    "total_duration",
+                    "media_count",
+                    "missing_duration_count",
+                    "last_scanned_at",
+                    "updated_at",
+                ],
             )
-            self.db.add(folder)
-
-        await self.db.commit()
+            delta = self._folder_delta(path, depth, stats, previous)
+            if delta:
+                await bulk_insert(db, FolderStatsDelta, [delta])
+
+        await self._flush(upsert_folder)
+
+    def _folder_delta(
+        self, path: str, depth: int, stats: Dict[str, Any], previous
+    ) -> Optional[Dict[str, Any]]:
+        """Growth row for folder history, or None if the totals did not change"""
+        old_size, old_files, old_duration = previous or (0, 0, 0.0)
+        size_delta = stats["total_size"] - (old_size or 0)
+        file_count_delta = stats["file_count"] - (old_files or 0)
+        duration_delta = stats["total_duration"] - (old_duration or 0.0)
+        if not (size_delta or file_count_delta or abs(duration_delta) >= 0.5):
+            return None
+        return {
+            "scan_id": self.scan_id,
+            "folder_path": path,
+            "depth": depth,
+            "scanned_at": self.started_at,
+            "size_delta": size_delta,
+            "file_count_delta": file_count_delta,
+            "duration_delta": duration_delta,
+            "total_size": stats["total_size"],
+            "file_count": stats["file_count"],
+        }
 
     async def _get_folder_stats(self, path: str) -> Optional[FolderStats]:
         """Get folder stats from DB"""
@@ -0,0 +1,151 @@
+"""
+이름 검색 서비스
+
+파일/폴더/핸드 파일명/작업 카테고리 부분 문자열 검색 (색인: app.models.search)
+
+- SQLite: FTS5 trigram MATCH + bm25 순위 (3자 이상)
+  trigram은 3자 미만을 색인하지 않으므로 짧은 검색어는 LIKE (원본 테이블 스캔)
+- PostgreSQL: ILIKE '%...%' (pg_trgm GIN 인덱스) + similarity() 순위
+- 전체 개수 대신 limit + 1 조회로 다음 페이지 여부만 판단 (흔한 검색어도 일정 비용)
+
+Block: search.query
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.file_stats import FileStats, FolderStats
+from app.models.hand_analysis import HandAnalysis
+from app.models.search import SEARCH_SOURCES, SEARCH_TABLES
+from app.models.work_status import WorkStatus
+
+# trigram 색인이 쓰이는 최소 검색어 길이
+MIN_TRIGRAM_LENGTH = 3
+
+# 검색 종류 → (모델, 색인 컬럼, 경로 컬럼)
+SEARCH_MODELS = {
+    "file": (FileStats, FileStats.name, FileStats.path),
+    "folder": (FolderStats, FolderStats.name, FolderStats.path),
+    "hand": (HandAnalysis, HandAnalysis.file_name, HandAnalysis.nas_path),
+    "category": (WorkStatus, WorkStatus.category, None),
+}
+
+
+def _like_pattern(value: str) -> str:
+    """ILIKE 부분 문자열 패턴 (%, _, \\ 는 문자 그대로 - FTS5 phrase와 같은 의미)"""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _phrase(value: str) -> str:
+    """FTS5 phrase 쿼리 (연산자/특수문자를 문자 그대로)"""
+    return '"' + value.replace('"', '""') + '"'
+
+
+class SearchService:
+    """이름 부분 문자열 검색"""
+
+    KINDS = tuple(SEARCH_SOURCES)
+
+    @staticmethod
+    def _dialect(db: AsyncSession) -> str:
+        return db.get_bind().dialect.name
+
+    def contains(self, db: AsyncSession, kind: str, value: str):
+        """`column ILIKE '%value%'`와 같은 조건 (가능하면 검색 색인 사용)"""
+        model, column, _ = SEARCH_MODELS[kind]
+        if self._dialect(db) == "sqlite" and len(value) >= MIN_TRIGRAM_LENGTH:
+            fts = SEARCH_TABLES[kind]
+            return model.id.in_(
+                select(fts.c.rowid).where(fts.c[column.key].op("MATCH")(_phrase(value)))
+            )
+        return column.ilike(_like_pattern(value), escape="\\")
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query: str,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """순위순 검색 결과 1페이지
+
+        여러 종류를 검색하면 종류별 상위 offset + limit + 1개를 점수로 병합.
+        """
+        started = time.perf_counter()
+        kinds = list(kinds or self.KINDS)
+        wanted = offset + limit + 1
+
+        hits: List[Dict[str, Any]] = []
+        for kind in kinds:
+            rows = await db.execute(self._select(db, kind, query).limit(wanted))
+            hits.extend(
+                {
+                    "kind": kind,
+                    "id": row.id,
+                    "name": row.name,
+                    "path": row.path,
+                    "score": float(row.score or 0.0),
+                }
+                for row in rows
+            )
+        if len(kinds) > 1:
+            hits.sort(key=lambda hit: -hit["score"])
+
+        page = hits[offset : offset + limit]
+        return {
+            "query": query,
+            "kinds": kinds,
+            "items": page,
+            "offset": offset,
+            "limit": limit,
+            "has_more": len(hits) > offset + limit,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _select(self, db: AsyncSession, kind: str, query: str):
+        """종류 1개의 순위 쿼리 (score: 클수록 관련도 높음)"""
+        model, column, path = SEARCH_MODELS[kind]
+        path = path if path is not None else literal(None)
+        dialect = self._dialect(db)
+
+        if dialect == "sqlite" and len(query) >= MIN_TRIGRAM_LENGTH:
+            fts = SEARCH_TABLES[kind]
+            # bm25()는 작을수록 관련도 높음 → 부호 반전
+            score = -func.bm25(literal_column(fts.name))
+            return (
+                select(
+                    model.id,
+                    column.label("name"),
+                    path.label("path"),
+                    score.label("score"),
+                )
+                .select_from(fts)
+                .join(model, model.id == fts.c.rowid)
+                .where(fts.c[column.key].op("MATCH")(_phrase(query)))
+                .order_by(literal_column("rank"), model.id)
+            )
+
+        if dialect == "postgresql":
+            # 컬럼 그대로 ILIKE → gin_trgm_ops 인덱스 사용 (lower() 식은 인덱스 불가)
+            score = func.similarity(column, query)
+            condition = column.ilike(_like_pattern(query), escape="\\")
+        else:
+            # 짧은 검색어: 이름이 짧을수록 (검색어 비중이 클수록) 앞에
+            score = literal(len(query)) / func.max(func.length(column), 1)
+            condition = func.lower(column).contains(query.lower(), autoescape=True)
+        return (
+            select(
+                model.id, column.label("name"), path.label("path"), score.label("score")
+            )
+            .where(condition)
+            .order_by(score.desc(), model.id)
+        )
+
+
+# Singleton instance
+search_service = SearchService()
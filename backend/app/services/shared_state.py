@@ -0,0 +1,328 @@
+"""
+워커 간 공유 상태 / 잠금 백엔드
+
+uvicorn --workers N 으로 띄우면 모듈 전역 변수는 프로세스마다 따로 존재한다.
+스캔 진행 상태, 활성 뷰어, 동기화 상태처럼 모든 워커가 같은 값을 봐야 하는
+상태와, 스케줄러 작업을 한 프로세스만 실행하기 위한 leader lock을 여기서 관리.
+
+- database (기본): 앱 DB의 shared_state 테이블 (SQLite/PostgreSQL)
+- redis: REDIS_URL (redis 패키지 필요, 첫 사용 시 import)
+- memory: 단일 프로세스 전용 (테스트/개발)
+
+조회(get/count_prefix)는 읽기만 한다. 만료 항목 삭제는 purge_loop()가
+SHARED_STATE_PURGE_SECONDS마다 수행 (redis는 키 TTL로 자체 만료).
+
+Block: core.shared_state
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, func, select
+
+from app.core.config import settings
+from app.models.shared_state import SharedStateEntry
+
+logger = logging.getLogger(__name__)
+
+# 이 프로세스의 식별자 (잠금 소유자). PID 재사용 대비 랜덤 suffix
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+LOCK_PREFIX = "lock:"
+
+
+class SharedStateBackend:
+    """공유 상태 백엔드 인터페이스
+
+    값은 JSON 직렬화 가능한 객체. ttl(초)이 지나면 없는 것으로 취급.
+    """
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def count_prefix(self, prefix: str) -> int:
+        """prefix로 시작하는 유효(미만료) 키 수 (읽기 전용)"""
+        raise NotImplementedError
+
+    async def purge_expired(self) -> int:
+        """만료된 항목 삭제 (주기 작업에서 호출)
+
+        Returns:
+            삭제된 항목 수
+        """
+        return 0
+
+    async def acquire_lock(self, name: str, owner: str, ttl: float) -> bool:
+        """잠금 획득 (이미 owner가 보유 중이면 만료 연장)
+
+        Returns:
+            True면 owner가 잠금 보유
+        """
+        raise NotImplementedError
+
+    async def release_lock(self, name: str, owner: str) -> None:
+        """owner가 보유 중인 잠금만 해제"""
+        raise NotImplementedError
+
+    async def lock_owner(self, name: str) -> Optional[str]:
+        """현재 잠금 소유자 (없거나 만료면 None)"""
+        raise NotImplementedError
+
+
+class MemoryStateBackend(SharedStateBackend):
+    """프로세스 내부 dict 백엔드 (단일 워커 전용)"""
+
+    def __init__(self):
+        self._data: Dict[str, tuple] = {}  # key -> (value, expires_at monotonic)
+
+    def _live(self, key: str) -> Optional[tuple]:
+        item = self._data.get(key)
+        if item and item[1] is not None and item[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return item
+
+    async def get(self, key: str) -> Optional[Any]:
+        item = self._live(key)
+        return item[0] if item else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires = time.monotonic() + ttl if ttl else None
+        self._data[key] = (value, expires)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def count_prefix(self, prefix: str) -> int:
+        return sum(
+            1 for k in list(self._data) if k.startswith(prefix) and self._live(k)
+        )
+
+    async def purge_expired(self) -> int:
+        expired = [k for k in list(self._data) if self._live(k) is None]
+        return len(expired)
+
+    async def acquire_lock(self, name: str, owner: str, ttl: float) -> bool:
+        current = await self.get(LOCK_PREFIX + name)
+        if current not in (None, owner):
+            return False
+        await self.set(LOCK_PREFIX + name, owner, ttl)
+        return True
+
+    async def release_lock(self, name: str, owner: str) -> None:
+        if await self.get(LOCK_PREFIX + name) == owner:
+            await self.delete(LOCK_PREFIX + name)
+
+    async def lock_owner(self, name: str) -> Optional[str]:
+        return await self.get(LOCK_PREFIX + name)
+
+
+class DatabaseStateBackend(SharedStateBackend):
+    """앱 DB shared_state 테이블 백엔드
+
+    잠금 획득은 INSERT ... ON CONFLICT DO UPDATE WHERE (만료 또는 본인 소유)
+    단일 문장으로 처리 → SQLite/PostgreSQL 모두 원자적.
+    """
+
+    def __init__(self, session_maker=None):
+        self._session_maker = session_maker
+
+    def _session(self):
+        if self._session_maker is None:
+            from app.core.database import async_session_maker
+
+            self._session_maker = async_session_maker
+        return self._session_maker()
+
+    @staticmethod
+    def _expires(ttl: Optional[float]) -> Optional[datetime]:
+        return datetime.utcnow() + timedelta(seconds=ttl) if ttl else None
+
+    @staticmethod
+    def _alive():
+        return (SharedStateEntry.expires_at.is_(None)) | (
+            SharedStateEntry.expires_at > datetime.utcnow()
+        )
+
+    @staticmethod
+    def _insert(dialect: str):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        return insert(SharedStateEntry)
+
+    async def _upsert(self, db, key: str, value: str, ttl: Optional[float], where=None):
+        stmt = self._insert(db.bind.dialect.name).values(
+            key=key,
+            value=value,
+            expires_at=self._expires(ttl),
+            updated_at=datetime.utcnow(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SharedStateEntry.key],
+            set_={
+                "value": stmt.excluded.value,
+                "expires_at": stmt.excluded.expires_at,
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=where,
+        )
+        await db.execute(stmt)
+
+    async def _get_raw(self, db, key: str) -> Optional[str]:
+        return await db.scalar(
+            select(SharedStateEntry.value).where(
+                SharedStateEntry.key == key, self._alive()
+            )
+        )
+
+    async def get(self, key: str) -> Optional[Any]:
+        async with self._session() as db:
+            raw = await self._get_raw(db, key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        async with self._session() as db:
+            await self._upsert(db, key, json.dumps(value, default=str), ttl)
+            await db.commit()
+
+    async def delete(self, key: str) -> None:
+        async with self._session() as db:
+            await db.execute(
+                delete(SharedStateEntry).where(SharedStateEntry.key == key)
+            )
+            await db.commit()
+
+    async def count_prefix(self, prefix: str) -> int:
+        async with self._session() as db:
+            count = await db.scalar(
+                select(func.count())
+                .select_from(SharedStateEntry)
+                .where(SharedStateEntry.key.startswith(prefix), self._alive())
+            )
+        return count or 0
+
+    async def purge_expired(self) -> int:
+        # 만료된 heartbeat/잠금 행 정리 (키가 무한히 쌓이지 않도록)
+        async with self._session() as db:
+            result = await db.execute(
+                delete(SharedStateEntry).where(
+                    SharedStateEntry.expires_at <= datetime.utcnow()
+                )
+            )
+            await db.commit()
+        return result.rowcount or 0
+
+    async def acquire_lock(self, name: str, owner: str, ttl: float) -> bool:
+        key = LOCK_PREFIX + name
+        async with self._session() as db:
+            await self._upsert(
+                db,
+                key,
+                owner,
+                ttl,
+                where=(SharedStateEntry.expires_at <= datetime.utcnow())
+                | (SharedStateEntry.value == owner),
+            )
+            await db.commit()
+            return await self._get_raw(db, key) == owner
+
+    async def release_lock(self, name: str, owner: str) -> None:
+        async with self._session() as db:
+            await db.execute(
+                delete(SharedStateEntry).where(
+                    SharedStateEntry.key == LOCK_PREFIX + name,
+                    SharedStateEntry.value == owner,
+                )
+            )
+            await db.commit()
+
+    async def lock_owner(self, name: str) -> Optional[str]:
+        async with self._session() as db:
+            return await self._get_raw(db, LOCK_PREFIX + name)
+
+
+class RedisStateBackend(SharedStateBackend):
+    """Redis 백엔드 (SET NX PX 기반 잠금)"""
+
+    # 본인 소유일 때만 만료 연장 / 삭제 (GET 후 명령 사이 경쟁 방지)
+    _RENEW = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+    )
+    _RELEASE = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._redis.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        px = int(ttl * 1000) if ttl else None
+        await self._redis.set(key, json.dumps(value, default=str), px=px)
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def count_prefix(self, prefix: str) -> int:
+        return len([k async for k in self._redis.scan_iter(match=f"{prefix}*")])
+
+    async def acquire_lock(self, name: str, owner: str, ttl: float) -> bool:
+        key, px = LOCK_PREFIX + name, int(ttl * 1000)
+        if await self._redis.set(key, owner, nx=True, px=px):
+            return True
+        return bool(await self._redis.eval(self._RENEW, 1, key, owner, px))
+
+    async def release_lock(self, name: str, owner: str) -> None:
+        await self._redis.eval(self._RELEASE, 1, LOCK_PREFIX + name, owner)
+
+    async def lock_owner(self, name: str) -> Optional[str]:
+        return await self._redis.get(LOCK_PREFIX + name)
+
+
+def create_backend(kind: Optional[str] = None) -> SharedStateBackend:
+    """설정(SHARED_STATE_BACKEND)에 맞는 백엔드 생성"""
+    kind = kind or settings.SHARED_STATE_BACKEND
+    if kind == "redis":
+        return RedisStateBackend(settings.REDIS_URL)
+    if kind == "memory":
+        return MemoryStateBackend()
+    return DatabaseStateBackend()
+
+
+async def purge_loop(interval: Optional[float] = None):
+    """만료 항목 주기 정리 (lifespan에서 태스크로 실행)"""
+    interval = interval or settings.SHARED_STATE_PURGE_SECONDS
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            purged = await shared_state.purge_expired()
+            if purged:
+                logger.debug(f"Purged {purged} expired shared state entries")
+        except Exception as e:
+            logger.warning(f"Shared state purge failed: {e}")
+
+
+# Singleton instance
+shared_state: SharedStateBackend = create_backend()
@@ -0,0 +1,81 @@
+"""
+Google Sheets 비동기 fetch 유틸리티
+
+gspread는 동기 HTTP 클라이언트이므로 async 함수 안에서 직접 호출하면
+요청 왕복 동안 이벤트 루프 전체(모든 API 요청)가 멈춘다.
+- 블로킹 호출은 스레드 풀에서 실행 (asyncio.to_thread)
+- 여러 워크시트는 values_batch_get 한 번에 묶어서 조회
+  (워크시트가 많으면 청크 단위로 나누고 동시 호출 수 제한)
+
+Block: sync.fetch
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    import gspread
+
+logger = logging.getLogger(__name__)
+
+
+def _batch_get_values(
+    spreadsheet: "gspread.Spreadsheet",
+    titles: Sequence[str],
+) -> Dict[str, List[List[str]]]:
+    """워크시트 전체 값을 1회 요청으로 조회 (스레드 풀에서 실행)
+
+    get_all_values()와 동일하게 빈 셀을 ""로 채워 직사각형 행렬로 반환.
+    """
+    from gspread.utils import absolute_range_name, fill_gaps
+
+    response = spreadsheet.values_batch_get(
+        [absolute_range_name(title) for title in titles]
+    )
+    value_ranges = response.get("valueRanges", [])
+    # valueRanges는 요청 순서와 동일
+    return {
+        title: fill_gaps(value_range.get("values", []))
+        for title, value_range in zip(titles, value_ranges)
+    }
+
+
+async def fetch_worksheet_values(
+    spreadsheet: "gspread.Spreadsheet",
+    titles: Sequence[str],
+    batch_size: int = 0,
+    concurrency: int = 0,
+) -> Dict[str, List[List[str]]]:
+    """여러 워크시트 값을 이벤트 루프를 막지 않고 조회
+
+    Args:
+        spreadsheet: 열린 gspread Spreadsheet
+        titles: 조회할 워크시트 제목 (결과도 이 순서)
+        batch_size: values_batch_get 1회당 워크시트 수 (0이면 설정값)
+        concurrency: 동시 batch 요청 수 (0이면 설정값)
+
+    Returns:
+        워크시트 제목 → get_all_values() 형식 행렬
+    """
+    batch_size = batch_size or settings.SHEETS_FETCH_BATCH_SIZE
+    concurrency = concurrency or settings.SHEETS_FETCH_CONCURRENCY
+
+    chunks = [
+        list(titles[i : i + batch_size]) for i in range(0, len(titles), batch_size)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_chunk(chunk: List[str]) -> Dict[str, List[List[str]]]:
+        async with semaphore:
+            return await asyncio.to_thread(_batch_get_values, spreadsheet, chunk)
+
+    results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    logger.info(f"Fetched {len(titles)} worksheets in {len(chunks)} batch request(s)")
+
+    values: Dict[str, List[List[str]]] = {}
+    for result in results:
+        values.update(result)
+    return values
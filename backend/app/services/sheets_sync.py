@@ -7,24 +7,44 @@ Target: work_status 테이블
 Block: sync.sheets
 """
 
+import asyncio
+import importlib
 import logging
+import random
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-import gspread
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from google.oauth2.service_account import Credentials
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
+from app.core.bulk import upsert
 from app.core.config import settings
-from app.core.database import async_session_maker
+from app.core.database import db_writer
+from app.models.file_stats import FolderStats
 from app.models.work_status import Archive, WorkStatus
+from app.services.data_generation import data_generation
+from app.services.progress_service import progress_service
+from app.services.shared_state import WORKER_ID, shared_state
+from app.services.sync_fingerprint import (
+    compute_fingerprint,
+    load_fingerprints,
+    load_synced_ids,
+    save_fingerprint,
+)
+
+if TYPE_CHECKING:
+    import gspread
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 logger = logging.getLogger(__name__)
 
+# (archive 이름, category)
+WorkStatusKey = Tuple[str, str]
+
 
 @dataclass
 class SyncResult:
@@ -36,6 +56,10 @@ class SyncResult:
     synced_count: int
     created_count: int = 0
     updated_count: int = 0
+    deleted_count: int = 0
+    unchanged_count: int = 0
+    skipped_unchanged: bool = False  # fingerprint 동일로 skip
+    synced_ids: List[int] = field(default_factory=list)  # 시트가 소유한 행 ID
     error: Optional[str] = None
     details: List[str] = field(default_factory=list)
 
@@ -51,19 +75,37 @@ class SheetsSyncService:
 
     SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 
+    # 시트 → work_statuses 동기화 대상 컬럼 (변경 감지 기준)
+    SYNC_COLUMNS = ("pic", "status", "total_videos", "excel_done", "notes1", "notes2")
+
+    # DELETE ... WHERE id IN (...) 청크 크기
+    DELETE_CHUNK_SIZE = 500
+
+    # sync_fingerprints.source 값
+    FINGERPRINT_SOURCE = "work_status"
+
+    # 스케줄러 job ID = leader lock 이름, 공유 상태 키
+    JOB_ID = "sheets_sync"
+    STATUS_KEY = "sync_status:sheets_sync"
+
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
-        self._client: Optional[gspread.Client] = None
+        # apscheduler/gspread는 무거우므로 start()/첫 동기화 시 lazy import
+        self.scheduler: Optional["AsyncIOScheduler"] = None
+        self._client: Optional["gspread.Client"] = None
         self.last_sync_time: Optional[datetime] = None
         self.last_sync_result: Optional[SyncResult] = None
         self.last_error: Optional[str] = None
+        # 마지막 성공 동기화 시각 (readiness "data warm" 판단용)
+        self.last_success_time: Optional[datetime] = None
         self.status: str = "idle"
         self._is_started: bool = False
 
     @property
     def next_sync_time(self) -> Optional[datetime]:
         """다음 동기화 예정 시간"""
-        job = self.scheduler.get_job("sheets_sync")
+        if self.scheduler is None:
+            return None
+        job = self.scheduler.get_job(self.JOB_ID)
         return job.next_run_time if job else None
 
     @property
@@ -95,11 +137,18 @@ class SheetsSyncService:
                 return
 
         try:
+            from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+            self.scheduler = AsyncIOScheduler()
             self.scheduler.add_job(
                 self._sync_wrapper,
                 "interval",
                 minutes=settings.SHEETS_SYNC_INTERVAL_MINUTES,
-                id="sheets_sync",
+                jitter=settings.SYNC_JITTER_SECONDS,
+                # 첫 동기화는 기동 직후가 아니라 지연 + jitter 후 백그라운드 실행
+                # (기동 시 트래픽 수용 지연 방지, 여러 인스턴스 동시 fetch 분산)
+                next_run_time=self._first_run_time(),
+                id=self.JOB_ID,
                 replace_existing=True,
             )
             self.scheduler.start()
@@ -109,9 +158,6 @@ class SheetsSyncService:
                 f"(interval: {settings.SHEETS_SYNC_INTERVAL_MINUTES}m)"
             )
 
-            # 시작 시 즉시 1회 동기화
-            await self._sync_wrapper()
-
         except Exception as e:
             logger.exception(f"Failed to start sheets sync service: {e}")
             self.status = "error"
@@ -119,14 +165,30 @@ class SheetsSyncService:
 
     async def stop(self):
         """동기화 서비스 중지"""
-        if self.scheduler.running:
+        if self.scheduler is not None and self.scheduler.running:
             self.scheduler.shutdown()
             self._is_started = False
             logger.info("Sheets sync scheduler stopped")
 
-    def _get_client(self) -> gspread.Client:
+        # 재시작한 워커가 lock 만료를 기다리지 않도록 leader 권한 반납
+        try:
+            await shared_state.release_lock(self.JOB_ID, WORKER_ID)
+        except Exception as e:
+            logger.warning(f"Failed to release leader lock: {e}")
+
+    def _first_run_time(self) -> datetime:
+        """첫 동기화 예정 시각 (SYNC_STARTUP_DELAY_SECONDS + 0~SYNC_JITTER_SECONDS)"""
+        return datetime.now() + timedelta(
+            seconds=settings.SYNC_STARTUP_DELAY_SECONDS
+            + random.uniform(0, settings.SYNC_JITTER_SECONDS)
+        )
+
+    def _get_client(self) -> "gspread.Client":
         """Google Sheets 클라이언트 획득 (lazy initialization)"""
         if self._client is None:
+            import gspread
+            from google.oauth2.service_account import Credentials
+
             # Service Account 파일 경로 확인 (여러 위치 시도)
             possible_paths = [
                 Path(
@@ -160,8 +222,21 @@ class SheetsSyncService:
             logger.info(f"Google Sheets client initialized (using: {sa_path})")
         return self._client
 
+    def _fetch_values(self) -> Tuple[str, List[List[str]]]:
+        """첫 워크시트 제목 + 전체 값 (블로킹, 스레드 풀에서 호출)"""
+        client = self._get_client()
+        sheet = client.open_by_url(settings.WORK_STATUS_SHEET_URL)
+        worksheet = sheet.get_worksheet(0)
+        return worksheet.title, worksheet.get_all_values()
+
     async def _sync_wrapper(self):
-        """비동기 래퍼 (스케줄러 호환)"""
+        """비동기 래퍼 (스케줄러 호환)
+
+        스케줄 실행은 leader lock을 가진 워커 1개만 수행 (--workers N 중복 방지).
+        """
+        if not await self._acquire_leader():
+            logger.info("Sheets sync skipped - another worker holds the leader lock")
+            return
         try:
             await self.sync()
         except Exception as e:
@@ -169,20 +244,80 @@ class SheetsSyncService:
             self.last_error = str(e)
             self.status = "error"
 
-    async def sync(self) -> SyncResult:
-        """Google Sheets에서 데이터 동기화"""
+    async def _acquire_leader(self) -> bool:
+        """스케줄 job leader lock 획득/갱신
+
+        TTL은 주기보다 짧게 → leader가 죽으면 (프로세스 종료 등) 잠금이
+        그 주기 안에 만료되어 다음 주기에 다른 워커가 인계받음.
+        (동기화 1회는 주기의 90%보다 짧다고 가정)
+        """
+        ttl = settings.SHEETS_SYNC_INTERVAL_MINUTES * 60 * 0.9
+        try:
+            return await shared_state.acquire_lock(self.JOB_ID, WORKER_ID, ttl)
+        except Exception as e:
+            # 공유 상태 백엔드 장애 시 단일 워커처럼 동작
+            logger.warning(f"Leader lock unavailable, running locally: {e}")
+            return True
+
+    async def _publish_status(self):
+        """현재 상태를 공유 상태에 게시 (다른 워커의 /status 응답용)"""
+        try:
+            await shared_state.set(
+                self.STATUS_KEY,
+                {**self.get_status_dict(), "published_at": time.time()},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish sync status: {e}")
+
+    async def get_shared_status(self) -> Dict[str, Any]:
+        """워커 공유 상태 조회 (게시된 상태가 없으면 이 프로세스의 상태)"""
+        try:
+            shared = await shared_state.get(self.STATUS_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to read shared sync status: {e}")
+            shared = None
+        if not shared:
+            return self.get_status_dict()
+        # 동기화 도중 워커가 죽어 "syncing"이 남은 경우
+        stale_after = settings.SHEETS_SYNC_INTERVAL_MINUTES * 60 * 1.5
+        if shared["status"] == "syncing" and (
+            time.time() - shared.pop("published_at", 0) > stale_after
+        ):
+            shared["status"] = "idle"
+        shared.pop("published_at", None)
+        # 활성화 여부는 프로세스 설정 기준
+        return {**shared, "enabled": self.is_enabled}
+
+    async def sync(self, force: bool = False) -> SyncResult:
+        """Google Sheets에서 데이터 동기화
+
+        Args:
+            force: True면 fingerprint가 같아도 전체 재동기화
+        """
+        start = time.perf_counter()
+        result = None
+        try:
+            result = await self._run_sync(force)
+            return result
+        finally:
+            metrics.record_sync("sheets", result, time.perf_counter() - start)
+            await self._publish_status()
+
+    async def _run_sync(self, force: bool) -> SyncResult:
+        """sync() 본체"""
+        # gspread는 첫 동기화 시점에 로드 (앱 기동 시 import 비용 제거)
+        gspread = await asyncio.to_thread(importlib.import_module, "gspread")
+
         self.status = "syncing"
         logger.info("Starting sheets sync...")
+        await self._publish_status()
 
         try:
-            # 1. Sheets 데이터 fetch
-            client = self._get_client()
-            sheet = client.open_by_url(settings.WORK_STATUS_SHEET_URL)
-            worksheet = sheet.get_worksheet(0)
-
+            # 1. Sheets 데이터 fetch (gspread 동기 I/O → 스레드 풀)
             # 시트 구조: Row 1 = 제목, Row 2 = 헤더, Row 3+ = 데이터
             # get_all_values()로 raw 데이터를 가져와서 직접 파싱
-            all_values = worksheet.get_all_values()
+            with metrics.sync_phase_duration.time(("sheets", "fetch")):
+                ws_title, all_values = await asyncio.to_thread(self._fetch_values)
 
             if len(all_values) < 3:
                 logger.warning("Sheet has insufficient rows")
@@ -196,48 +331,75 @@ class SheetsSyncService:
                 # 상태 업데이트 (early return 케이스)
                 self.last_sync_time = result.synced_at
                 self.last_sync_result = result
+                self.last_success_time = result.synced_at
                 self.status = "idle"
                 return result
 
-            # Row 2를 헤더로 사용 (index 1)
-            headers = [self._normalize_header(h) for h in all_values[1]]
-            data_rows = all_values[2:]  # Row 3부터 데이터
-
-            # 딕셔너리 리스트로 변환 (병합 셀 처리)
-            records = []
-            last_archive = ""  # 병합 셀: 빈 Archive는 이전 값 상속
-
-            for row in data_rows:
-                if len(row) >= len(headers):
-                    record = {headers[i]: row[i] for i in range(len(headers))}
-
-                    # 병합 셀 처리: Archive가 비어있으면 이전 값 사용
-                    current_archive = str(record.get("Archive", "")).strip()
-                    if current_archive:
-                        last_archive = current_archive
-                    else:
-                        record["Archive"] = last_archive
+            # 2. 변경 감지 → DB 동기화
+            fingerprint = compute_fingerprint(all_values)
+
+            # 쓰기는 단일 writer 슬롯에서 (스캐너 등 다른 쓰기와 직렬화)
+            # Work Status는 워크시트 1개 → fingerprint와 행을 한 트랜잭션으로 commit
+            apply_start = time.perf_counter()
+            async with db_writer.session() as db:
+                stored = await load_fingerprints(db, self.FINGERPRINT_SOURCE)
+                previous = stored.get(ws_title)
+
+                if (
+                    not force
+                    and previous is not None
+                    and previous.fingerprint == fingerprint
+                ):
+                    # 시트 내용 동일 → 파싱/DB diff/캐시 무효화 모두 skip
+                    logger.info(
+                        f"Worksheet unchanged ({fingerprint[:8]}) - skipping sync"
+                    )
+                    result = SyncResult(
+                        success=True,
+                        synced_at=datetime.now(),
+                        total_records=previous.row_count,
+                        synced_count=previous.record_count,
+                        unchanged_count=previous.record_count,
+                        skipped_unchanged=True,
+                    )
+                else:
+                    records = self._parse_records(all_values)
+                    result = await self._sync_to_db(
+                        db, records, load_synced_ids(previous)
+                    )
+                    save_fingerprint(
+                        db,
+                        stored,
+                        self.FINGERPRINT_SOURCE,
+                        ws_title,
+                        fingerprint,
+                        row_count=result.total_records,
+                        record_count=result.synced_count,
+                        synced_ids=result.synced_ids,
+                    )
+                    await db.commit()
 
-                    records.append(record)
+            # 캐시 무효화 / generation 갱신은 writer 슬롯을 놓은 뒤
+            if result.created_count or result.updated_count or result.deleted_count:
+                # sheets_total_videos 등 Work Status 기반 캐시 재계산
+                progress_service.invalidate_archive_stats_cache()
+                await data_generation.bump("work_status")
 
-            logger.info(
-                f"Fetched {len(records)} records from sheets (headers: {headers})"
+            metrics.sync_phase_duration.observe(
+                time.perf_counter() - apply_start, ("sheets", "apply")
             )
 
-            # 2. DB 동기화
-            async with async_session_maker() as db:
-                result = await self._sync_to_db(db, records)
-                await db.commit()
-
             # 3. 결과 기록
             self.last_sync_time = result.synced_at
             self.last_sync_result = result
             self.last_error = None
+            self.last_success_time = result.synced_at
             self.status = "idle"
 
             logger.info(
                 f"Sync completed: {result.synced_count}/{result.total_records} records "
-                f"(created: {result.created_count}, updated: {result.updated_count})"
+                f"(created: {result.created_count}, updated: {result.updated_count}, "
+                f"deleted: {result.deleted_count}, unchanged: {result.unchanged_count})"
             )
             return result
 
@@ -275,19 +437,52 @@ class SheetsSyncService:
             self.status = "error"
             return result
 
+    def _parse_records(self, all_values: List[List[str]]) -> List[Dict[str, Any]]:
+        """raw 값 → 레코드 딕셔너리 리스트 (Row 2 = 헤더, Row 3+ = 데이터)"""
+        # Row 2를 헤더로 사용 (index 1)
+        headers = [self._normalize_header(h) for h in all_values[1]]
+        data_rows = all_values[2:]  # Row 3부터 데이터
+
+        # 딕셔너리 리스트로 변환 (병합 셀 처리)
+        records = []
+        last_archive = ""  # 병합 셀: 빈 Archive는 이전 값 상속
+
+        for row in data_rows:
+            if len(row) >= len(headers):
+                record = {headers[i]: row[i] for i in range(len(headers))}
+
+                # 병합 셀 처리: Archive가 비어있으면 이전 값 사용
+                current_archive = str(record.get("Archive", "")).strip()
+                if current_archive:
+                    last_archive = current_archive
+                else:
+                    record["Archive"] = last_archive
+
+                records.append(record)
+
+        logger.info(f"Fetched {len(records)} records from sheets (headers: {headers})")
+        return records
+
     async def _sync_to_db(
         self,
         db: AsyncSession,
         records: List[Dict[str, Any]],
+        owned_ids: Optional[Set[int]] = None,
     ) -> SyncResult:
-        """DB에 데이터 동기화 (Upsert 방식)"""
-        synced_count = 0
-        created_count = 0
-        updated_count = 0
-        details: List[str] = []
+        """DB에 데이터 동기화 (bulk upsert + 삭제 전파)
 
-        # 아카이브 캐시 (이름 → ID 매핑)
-        archive_cache: Dict[str, int] = {}
+        1. 시트 레코드를 (archive, category) 키로 파싱 (중복 키는 마지막 행 우선)
+        2. archives / work_statuses 전체를 각각 1회 조회
+        3. 메모리에서 INSERT/UPDATE/DELETE 계산 후 bulk 적용
+           - 값이 같은 행은 쓰지 않음 (updated_at 유지)
+           - 삭제는 이전 동기화가 소유한 행(owned_ids)에 한정
+             (POST /work-status, CSV import로 만든 행은 삭제하지 않음)
+
+        Args:
+            owned_ids: 이전 시트 동기화가 소유한 work_statuses.id
+        """
+        details: List[str] = []
+        parsed: Dict[WorkStatusKey, Dict[str, Any]] = {}
 
         for record in records:
             try:
@@ -297,91 +492,163 @@ class SheetsSyncService:
                 if not archive_name or not category:
                     continue
 
-                # Archive 처리
-                if archive_name not in archive_cache:
-                    archive = await self._get_or_create_archive(db, archive_name)
-                    archive_cache[archive_name] = archive.id
-
-                archive_id = archive_cache[archive_name]
-                # category는 이미 위에서 추출됨
-
-                # 기존 레코드 조회 (archive_id + category로 unique 판단)
-                result = await db.execute(
-                    select(WorkStatus).where(
-                        WorkStatus.archive_id == archive_id,
-                        WorkStatus.category == category,
-                    )
-                )
-                existing = result.scalar_one_or_none()
-
-                # 데이터 파싱 (정규화된 헤더 이름 사용)
-                # PIC에 줄바꿈이 있을 수 있으므로 정리
-                pic_raw = str(record.get("PIC", "")).strip()
-                pic = " ".join(pic_raw.split()) if pic_raw else None
-
-                status = self._normalize_status(str(record.get("Status", "대기")))
-                total_videos = self._parse_int(record.get("Total", 0))
-                excel_done = self._parse_int(record.get("Excel Done", 0))
-                notes1 = str(record.get("Notes 1", "")).strip() or None
-                notes2 = str(record.get("Notes 2", "")).strip() or None
-
-                if existing:
-                    # 업데이트
-                    existing.pic = pic
-                    existing.status = status
-                    existing.total_videos = total_videos
-                    existing.excel_done = excel_done
-                    existing.notes1 = notes1
-                    existing.notes2 = notes2
-                    updated_count += 1
-                else:
-                    # 신규 추가
-                    new_work_status = WorkStatus(
-                        archive_id=archive_id,
-                        category=category,
-                        pic=pic,
-                        status=status,
-                        total_videos=total_videos,
-                        excel_done=excel_done,
-                        notes1=notes1,
-                        notes2=notes2,
-                    )
-                    db.add(new_work_status)
-                    created_count += 1
-                    details.append(f"Created: {archive_name}/{category}")
-
-                synced_count += 1
+                parsed[(archive_name, category)] = self._parse_record(record)
 
             except Exception as e:
                 logger.warning(f"Failed to sync record: {record}, error: {e}")
                 details.append(f"Error: {record.get('Archive', 'Unknown')} - {e}")
 
+        archive_ids = await self._ensure_archives(
+            db, {archive_name for archive_name, _ in parsed}
+        )
+
+        columns = [WorkStatus.id, WorkStatus.archive_id, WorkStatus.category] + [
+            getattr(WorkStatus, col) for col in self.SYNC_COLUMNS
+        ]
+        result = await db.execute(select(*columns).order_by(WorkStatus.id))
+        existing_rows = [dict(row._mapping) for row in result]
+
+        (
+            inserts,
+            updates,
+            delete_ids,
+            unchanged,
+            matched_ids,
+        ) = self._plan_work_status_diff(
+            existing_rows, parsed, archive_ids, owned_ids or set()
+        )
+
+        if inserts:
+            inserted = await db.execute(
+                insert(WorkStatus).returning(WorkStatus.id), inserts
+            )
+            matched_ids.extend(inserted.scalars())
+        if updates:
+            await db.execute(update(WorkStatus), updates)
+        for i in range(0, len(delete_ids), self.DELETE_CHUNK_SIZE):
+            chunk = delete_ids[i : i + self.DELETE_CHUNK_SIZE]
+            # 삭제되는 Work Status를 참조하는 폴더 연결 해제
+            await db.execute(
+                update(FolderStats)
+                .where(FolderStats.work_status_id.in_(chunk))
+                .values(work_status_id=None)
+            )
+            await db.execute(delete(WorkStatus).where(WorkStatus.id.in_(chunk)))
+
+        archive_names = {v: k for k, v in archive_ids.items()}
+        for row in inserts:
+            details.append(
+                f"Created: {archive_names[row['archive_id']]}/{row['category']}"
+            )
+        if delete_ids:
+            details.append(f"Deleted: {len(delete_ids)} categories removed from sheet")
+
         return SyncResult(
             success=True,
             synced_at=datetime.now(),
             total_records=len(records),
-            synced_count=synced_count,
-            created_count=created_count,
-            updated_count=updated_count,
+            synced_count=len(parsed),
+            created_count=len(inserts),
+            updated_count=len(updates),
+            deleted_count=len(delete_ids),
+            unchanged_count=unchanged,
+            synced_ids=matched_ids,
             details=details,
         )
 
-    async def _get_or_create_archive(
+    def _parse_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """시트 레코드 → SYNC_COLUMNS 값 (정규화된 헤더 이름 사용)"""
+        # PIC에 줄바꿈이 있을 수 있으므로 정리
+        pic_raw = str(record.get("PIC", "")).strip()
+
+        return {
+            "pic": " ".join(pic_raw.split()) if pic_raw else None,
+            "status": self._normalize_status(str(record.get("Status", "대기"))),
+            "total_videos": self._parse_int(record.get("Total", 0)),
+            "excel_done": self._parse_int(record.get("Excel Done", 0)),
+            "notes1": str(record.get("Notes 1", "")).strip() or None,
+            "notes2": str(record.get("Notes 2", "")).strip() or None,
+        }
+
+    def _plan_work_status_diff(
         self,
-        db: AsyncSession,
-        name: str,
-    ) -> Archive:
-        """Archive 조회 또는 생성"""
-        result = await db.execute(select(Archive).where(Archive.name == name))
-        archive = result.scalar_one_or_none()
+        existing_rows: List[Dict[str, Any]],
+        parsed: Dict[WorkStatusKey, Dict[str, Any]],
+        archive_ids: Dict[str, int],
+        owned_ids: Set[int],
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[int], int, List[int]]:
+        """기존 행과 시트 레코드를 메모리에서 비교
+
+        Args:
+            existing_rows: DB 행 목록 (id, archive_id, category + SYNC_COLUMNS)
+            parsed: (archive 이름, category) 키별 시트 값
+            archive_ids: archive 이름 → ID
+            owned_ids: 이전 시트 동기화가 소유한 행 ID (삭제 후보 범위)
+
+        Returns:
+            (inserts, updates, delete_ids, unchanged_count, matched_ids)
+            - updates: {"id": ..., 변경 컬럼 전체} (bulk UPDATE by PK)
+            - delete_ids: 시트에서 사라진 행 + 중복 키 행 (owned_ids 내에서만,
+              유효 레코드가 하나도 없으면 시트 이상으로 보고 삭제 전파 안 함)
+            - matched_ids: 시트 키와 매칭된 기존 행 ID (INSERT ID는 호출 측에서 추가)
+        """
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        stale_ids: List[int] = []
+        matched_ids: List[int] = []
+        unchanged = 0
+
+        existing_by_key: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        for row in existing_rows:
+            key = (row["archive_id"], row["category"])
+            if key in existing_by_key:
+                # 중복 (archive_id, category) 행 정리 (첫 행만 유지)
+                stale_ids.append(row["id"])
+            else:
+                existing_by_key[key] = row
+
+        for (archive_name, category), values in parsed.items():
+            archive_id = archive_ids[archive_name]
+            existing = existing_by_key.pop((archive_id, category), None)
+            if existing is None:
+                inserts.append(
+                    {"archive_id": archive_id, "category": category, **values}
+                )
+                continue
+
+            matched_ids.append(existing["id"])
+            if any(existing.get(col) != values[col] for col in self.SYNC_COLUMNS):
+                updates.append({"id": existing["id"], **values})
+            else:
+                unchanged += 1
+
+        # 시트에 더 이상 없는 카테고리
+        stale_ids.extend(row["id"] for row in existing_by_key.values())
+
+        delete_ids = [i for i in stale_ids if i in owned_ids] if parsed else []
 
-        if not archive:
-            archive = Archive(name=name)
-            db.add(archive)
-            await db.flush()
-            logger.info(f"Created new archive: {name}")
+        return inserts, updates, delete_ids, unchanged, matched_ids
 
-        return archive
+    async def _ensure_archives(
+        self,
+        db: AsyncSession,
+        names: Set[str],
+    ) -> Dict[str, int]:
+        """Archive 이름 → ID 매핑 (없는 Archive는 bulk 생성)"""
+        result = await db.execute(select(Archive.id, Archive.name))
+        archive_ids = {name: archive_id for archive_id, name in result}
+
+        missing = sorted(names - archive_ids.keys())
+        if missing:
+            # 다른 경로(POST /work-status 등)가 먼저 만들었으면 무시
+            await upsert(db, Archive, [{"name": name} for name in missing], ["name"])
+            result = await db.execute(
+                select(Archive.id, Archive.name).where(Archive.name.in_(missing))
+            )
+            archive_ids.update({name: archive_id for archive_id, name in result})
+            logger.info(f"Created new archives: {', '.join(missing)}")
+
+        return archive_ids
 
     def _normalize_header(self, header: str) -> str:
         """헤더 이름 정규화 (줄바꿈 제거, 공백 정리)"""
@@ -465,6 +732,9 @@ class SheetsSyncService:
             "next_sync": (
                 self.next_sync_time.isoformat() if self.next_sync_time else None
             ),
+            "last_success": (
+                self.last_success_time.isoformat() if self.last_success_time else None
+            ),
             "error": self.last_error,
             "interval_minutes": settings.SHEETS_SYNC_INTERVAL_MINUTES,
             "last_result": (
@@ -473,6 +743,9 @@ class SheetsSyncService:
                     "synced_count": self.last_sync_result.synced_count,
                     "created_count": self.last_sync_result.created_count,
                     "updated_count": self.last_sync_result.updated_count,
+                    "deleted_count": self.last_sync_result.deleted_count,
+                    "unchanged_count": self.last_sync_result.unchanged_count,
+                    "skipped_unchanged": self.last_sync_result.skipped_unchanged,
                 }
                 if self.last_sync_result
                 else None
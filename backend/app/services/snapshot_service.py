@@ -0,0 +1,221 @@
+"""
+용량 히스토리 snapshot 서비스
+
+daily_snapshots 기록 (스캔 완료 후 + 매일 1회) 및 주/월 rollup 유지.
+
+- 합계: 최상위 폴더(depth 0)의 누적 집계만 조회 (file_stats 재조회 없음)
+- 형식별 분포: 스캐너가 순회 중 모은 확장자별 합계. 스캔 없이 도는 매일 snapshot은
+  직전 snapshot의 분포를 이어 씀 (분포가 전혀 없을 때만 file_stats GROUP BY 1회)
+- rollup: snapshot마다 해당 주/월 행을 upsert (기간 마지막 값)
+  → 수년 범위 /stats/history도 일정한 점 개수, snapshot 1회당 3행 쓰기
+
+Block: stats.snapshot
+"""
+
+import json
+import logging
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bulk import upsert
+from app.core.config import settings
+from app.core.database import db_writer
+from app.models.file_stats import DailySnapshot, FileStats, FolderStats, HistoryRollup
+from app.services.data_generation import data_generation
+from app.services.shared_state import WORKER_ID, shared_state
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+logger = logging.getLogger(__name__)
+
+# 해상도별 점 1개가 덮는 일수 (/stats/history 점 개수 계산용)
+PERIOD_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+TypeStats = Dict[str, Dict[str, float]]
+
+
+def period_start(period: str, day: date) -> datetime:
+    """day가 속한 기간의 시작 (daily: 당일, weekly: 월요일, monthly: 1일)"""
+    if period == "weekly":
+        day = day - timedelta(days=day.weekday())
+    elif period == "monthly":
+        day = day.replace(day=1)
+    return datetime(day.year, day.month, day.day)
+
+
+class SnapshotService:
+    """daily_snapshots / history_rollups 기록 (매일 스케줄 + 스캔 완료 후)"""
+
+    # 스케줄러 job ID = leader lock 이름
+    JOB_ID = "daily_snapshot"
+
+    def __init__(self):
+        # apscheduler는 start() 시 lazy import
+        self.scheduler: Optional["AsyncIOScheduler"] = None
+        self.last_snapshot: Optional[Dict[str, Any]] = None
+        self._is_started: bool = False
+
+    async def start(self):
+        """매일 snapshot 스케줄 등록"""
+        if self._is_started or not settings.SNAPSHOT_ENABLED:
+            return
+        try:
+            from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+            self.scheduler = AsyncIOScheduler()
+            self.scheduler.add_job(
+                self._snapshot_wrapper,
+                "cron",
+                hour=settings.SNAPSHOT_DAILY_HOUR,
+                jitter=settings.SYNC_JITTER_SECONDS,
+                id=self.JOB_ID,
+                replace_existing=True,
+            )
+            self.scheduler.start()
+            self._is_started = True
+            logger.info(
+                f"Daily snapshot scheduler started "
+                f"(hour: {settings.SNAPSHOT_DAILY_HOUR})"
+            )
+        except Exception as e:
+            logger.exception(f"Failed to start snapshot scheduler: {e}")
+
+    async def stop(self):
+        """스케줄 중지"""
+        if self.scheduler is not None and self.scheduler.running:
+            self.scheduler.shutdown()
+            self._is_started = False
+        try:
+            await shared_state.release_lock(self.JOB_ID, WORKER_ID)
+        except Exception as e:
+            logger.warning(f"Failed to release snapshot lock: {e}")
+
+    async def _snapshot_wrapper(self):
+        """스케줄 실행 - 워커 1개만 (같은 날짜 upsert라 중복돼도 결과는 같음)"""
+        try:
+            leader = await shared_state.acquire_lock(self.JOB_ID, WORKER_ID, 3600)
+        except Exception as e:
+            logger.warning(f"Snapshot lock unavailable, running locally: {e}")
+            leader = True
+        if not leader:
+            return
+        try:
+            await self.take_snapshot()
+        except Exception as e:
+            logger.exception(f"Daily snapshot failed: {e}")
+
+    async def take_snapshot(
+        self, type_stats: Optional[TypeStats] = None
+    ) -> Dict[str, Any]:
+        """오늘 snapshot 기록 (writer 슬롯)
+
+        Args:
+            type_stats: 방금 끝난 전체 스캔의 확장자별 합계 (없으면 직전 분포 사용)
+        """
+        snapshot: Dict[str, Any] = {}
+
+        async def write(db: AsyncSession):
+            snapshot.update(await self.write_snapshot(db, type_stats))
+
+        await db_writer.run(write)
+        await data_generation.bump("history")
+        self.last_snapshot = snapshot
+        logger.info(
+            f"Snapshot {snapshot['date']:%Y-%m-%d}: "
+            f"{snapshot['total_files']} files, {snapshot['total_size']} bytes"
+        )
+        return snapshot
+
+    async def write_snapshot(
+        self,
+        db: AsyncSession,
+        type_stats: Optional[TypeStats] = None,
+        today: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """daily snapshot + 주/월 rollup upsert (commit은 호출자)"""
+        today = today or datetime.utcnow().date()
+
+        totals = (
+            await db.execute(
+                select(
+                    func.sum(FolderStats.total_size),
+                    func.sum(FolderStats.file_count),
+                    # 루트 폴더 수 + 하위 폴더 누적 수 = 전체 폴더 수
+                    func.count(FolderStats.id) + func.sum(FolderStats.folder_count),
+                    func.sum(FolderStats.total_duration),
+                ).where(FolderStats.depth == 0)
+            )
+        ).one()
+
+        if type_stats is None:
+            type_stats = await self._previous_type_stats(db)
+
+        snapshot = {
+            "date": period_start("daily", today),
+            "total_size": totals[0] or 0,
+            "total_files": totals[1] or 0,
+            "total_folders": totals[2] or 0,
+            "total_duration": totals[3] or 0.0,
+            "file_type_stats": json.dumps(type_stats, sort_keys=True),
+        }
+        columns = [key for key in snapshot if key != "date"]
+        await upsert(db, DailySnapshot, [snapshot], ["date"], columns)
+
+        values = {key: snapshot[key] for key in columns}
+        rollups = [
+            {
+                "period": period,
+                "period_start": period_start(period, today),
+                "snapshot_date": snapshot["date"],
+                "updated_at": datetime.utcnow(),
+                **values,
+            }
+            for period in ("weekly", "monthly")
+        ]
+        await upsert(
+            db,
+            HistoryRollup,
+            rollups,
+            ["period", "period_start"],
+            ["snapshot_date", "updated_at", *columns],
+        )
+        return snapshot
+
+    async def _previous_type_stats(self, db: AsyncSession) -> TypeStats:
+        """스캔 없는 snapshot의 형식별 분포 - 가장 최근 snapshot 값"""
+        previous = (
+            await db.execute(
+                select(DailySnapshot.file_type_stats)
+                .where(DailySnapshot.file_type_stats.isnot(None))
+                .order_by(DailySnapshot.date.desc())
+                .limit(1)
+            )
+        ).scalar()
+        if previous:
+            return json.loads(previous)
+
+        # 첫 snapshot (스캔 기록이 snapshot 도입 이전) - 1회만 file_stats 집계
+        result = await db.execute(
+            select(
+                FileStats.extension,
+                func.count(FileStats.id),
+                func.sum(FileStats.size),
+                func.sum(FileStats.duration),
+            ).group_by(FileStats.extension)
+        )
+        return {
+            (ext or "unknown"): {
+                "file_count": count,
+                "total_size": size or 0,
+                "total_duration": duration or 0.0,
+            }
+            for ext, count, size, duration in result.all()
+        }
+
+
+# Singleton instance
+snapshot_service = SnapshotService()
@@ -0,0 +1,71 @@
+"""
+워크시트 콘텐츠 fingerprint 유틸리티
+
+Sheets 동기화 서비스가 공통으로 사용:
+- get_all_values() 행렬 → SHA-256
+- DB에 저장된 이전 fingerprint와 비교하여 변경 없는 워크시트 skip
+
+Block: sync.fingerprint
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.sync_state import SyncFingerprint
+
+# 파싱 로직이 바뀌어 기존 fingerprint를 무효화해야 할 때 올림
+FINGERPRINT_VERSION = 1
+
+
+def compute_fingerprint(values: List[List[str]]) -> str:
+    """워크시트 값 행렬의 fingerprint (SHA-256 hex)"""
+    payload = json.dumps(
+        [FINGERPRINT_VERSION, values], ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def load_fingerprints(
+    db: AsyncSession,
+    source: str,
+) -> Dict[str, SyncFingerprint]:
+    """출처별 저장된 fingerprint 조회 (워크시트 제목 → 행)"""
+    result = await db.execute(
+        select(SyncFingerprint).where(SyncFingerprint.source == source)
+    )
+    return {fp.worksheet: fp for fp in result.scalars()}
+
+
+def load_synced_ids(fp: Optional[SyncFingerprint]) -> Set[int]:
+    """이전 동기화가 소유한 행 ID (기록 없으면 빈 집합)"""
+    if fp is None or not fp.synced_ids:
+        return set()
+    return set(json.loads(fp.synced_ids))
+
+
+def save_fingerprint(
+    db: AsyncSession,
+    stored: Dict[str, SyncFingerprint],
+    source: str,
+    worksheet: str,
+    fingerprint: str,
+    row_count: int,
+    record_count: int,
+    synced_ids: Optional[List[int]] = None,
+) -> None:
+    """fingerprint 저장 (호출 측 트랜잭션에서 commit)"""
+    fp = stored.get(worksheet)
+    if fp is None:
+        fp = SyncFingerprint(source=source, worksheet=worksheet)
+        db.add(fp)
+        stored[worksheet] = fp
+
+    fp.fingerprint = fingerprint
+    fp.row_count = row_count
+    fp.record_count = record_count
+    if synced_ids is not None:
+        fp.synced_ids = json.dumps(sorted(synced_ids))
@@ -0,0 +1,6 @@
+"""
+Archive Statistics 벤치마크
+
+합성 아카이브 생성기(synthetic)와 end-to-end 벤치마크 러너(run).
+실행: backend 디렉터리에서 python -m benchmarks.run --help
+"""
@@ -0,0 +1,384 @@
+"""
+End-to-end 벤치마크
+
+    cd backend
+    python -m benchmarks.run --files 100000 --depth 5 --output bench.json
+
+합성 아카이브로 다음을 측정하고 결과를 JSON으로 출력한다 (릴리스 간 회귀 추적용).
+
+- seed: FileStats/FolderStats/HandAnalysis/WorkStatus 직접 적재 속도
+- scan: 실제 임시 디렉터리 트리 + 가짜 ffprobe로 전체 스캔 / 증분 재스캔
+- sync: Work Status / Archive Metadata 시트 값 → DB 반영 (최초 / 변경 없음)
+- endpoints: 주요 조회 API (첫 요청 + 반복 요청 분포)
+
+각 단계는 임시 SQLite 파일 DB를 따로 쓰고 앱 DB는 건드리지 않는다.
+조회 API는 dependency override로 벤치마크 DB를 읽는다.
+
+Block: benchmarks.run
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# SQL echo(DEBUG 기본값 True)는 측정값을 왜곡하므로 앱 설정 로드 전에 끈다
+os.environ.setdefault("DEBUG", "false")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, DatabaseWriter, create_sqlite_engine  # noqa: E402
+from benchmarks.synthetic import (  # noqa: E402
+    ArchiveSpec,
+    fake_ffprobe,
+    hand_sheets,
+    seed_database,
+    work_status_sheet,
+    write_tree,
+)
+
+# 주요 조회 API (대시보드 첫 화면 / 트리 / 목록)
+ENDPOINTS = [
+    "/api/stats/summary",
+    "/api/stats/file-types",
+    "/api/stats/codecs",
+    "/api/stats/codecs/tree?depth=2",
+    "/api/stats/history",
+    "/api/folders/tree?depth=2",
+    "/api/progress/tree?depth=2",
+    "/api/progress/tree?depth=3&stats_schema=compact",
+    "/api/progress/summary",
+    "/api/hands?limit=1000",
+    "/api/hands/summary",
+    "/api/work-status",
+]
+
+
+@asynccontextmanager
+async def benchmark_database(directory: str, name: str):
+    """임시 SQLite 파일 DB (앱과 같은 production pragma) → (writer, 읽기 세션)"""
+    url = f"sqlite+aiosqlite:///{os.path.join(directory, name)}"
+    writer = create_sqlite_engine(url)
+    reader = create_sqlite_engine(url, readonly=True)
+    try:
+        async with writer.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield (
+            DatabaseWriter(async_sessionmaker(writer, expire_on_commit=False)),
+            async_sessionmaker(reader, expire_on_commit=False),
+        )
+    finally:
+        await reader.dispose()
+        await writer.dispose()
+
+
+async def _timed(coro) -> Dict[str, Any]:
+    start = time.perf_counter()
+    extra = await coro
+    return {"seconds": round(time.perf_counter() - start, 4), **(extra or {})}
+
+
+def _distribution(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "min_ms": round(ordered[0] * 1000, 2),
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 2),
+    }
+
+
+async def bench_seed(directory: str, spec: ArchiveSpec) -> Dict[str, Any]:
+    async with benchmark_database(directory, "seed.db") as (writer, _):
+
+        async def seed():
+            async with writer.session() as db:
+                return {"rows": await seed_database(db, spec)}
+
+        return await _timed(seed())
+
+
+async def bench_scan(
+    directory: str, spec: ArchiveSpec, ffprobe_latency: float
+) -> Dict[str, Any]:
+    """실제 디렉터리 트리 스캔 (전체 → 증분)"""
+    from app.models.file_stats import ScanHistory
+    from app.services.scanner import ArchiveScanner
+
+    tree_spec = ArchiveSpec(**{**asdict(spec), "root": os.path.join(directory, "nas")})
+    write_start = time.perf_counter()
+    files = write_tree(tree_spec)
+    results: Dict[str, Any] = {
+        "files": files,
+        "ffprobe_latency": ffprobe_latency,
+        "write_tree_seconds": round(time.perf_counter() - write_start, 4),
+    }
+
+    previous_path = settings.NAS_LOCAL_PATH
+    settings.NAS_LOCAL_PATH = tree_spec.root
+    try:
+        async with benchmark_database(directory, "scan.db") as (writer, reader):
+
+            async def scan(scan_type: str):
+                async with reader() as db:
+                    scanner = ArchiveScanner(
+                        db, {"is_scanning": True, "logs": []}, scan_type, writer=writer
+                    )
+                    await scanner.scan()
+
+                async def record(db):
+                    db.add(ScanHistory(status="completed", completed_at=datetime.now()))
+
+                await writer.run(record)
+                return {
+                    "files_processed": scanner.files_processed,
+                    "files_skipped": scanner.files_skipped,
+                }
+
+            with fake_ffprobe(ffprobe_latency):
+                for scan_type in ("full", "incremental"):
+                    result = await _timed(scan(scan_type))
+                    result["files_per_second"] = round(
+                        result["files_processed"] / max(result["seconds"], 1e-9), 1
+                    )
+                    results[scan_type] = result
+    finally:
+        settings.NAS_LOCAL_PATH = previous_path
+    return results
+
+
+async def bench_sync(directory: str, spec: ArchiveSpec) -> Dict[str, Any]:
+    """시트 값 → DB 반영 (Google Sheets fetch 제외)"""
+    from app.services.hand_analysis_sync import HandAnalysisSyncService
+    from app.services.sheets_sync import SheetsSyncService
+    from app.services.sync_fingerprint import load_fingerprints
+
+    work_values = work_status_sheet(spec)
+    hand_values = hand_sheets(spec)
+    results: Dict[str, Any] = {
+        "work_status_rows": len(work_values) - 2,
+        "hand_rows": sum(len(values) - 1 for values in hand_values.values()),
+        "worksheets": len(hand_values),
+    }
+
+    async with benchmark_database(directory, "sync.db") as (writer, _):
+        sheets = SheetsSyncService()
+        hands = HandAnalysisSyncService()
+
+        async def work_status():
+            async with writer.session() as db:
+                result = await sheets._sync_to_db(
+                    db, sheets._parse_records(work_values)
+                )
+                await db.commit()
+            return {"created": result.created_count, "updated": result.updated_count}
+
+        async def hand_analysis():
+            counts = {"created": 0, "updated": 0}
+            async with writer.session() as db:
+                stored = await load_fingerprints(db, hands.FINGERPRINT_SOURCE)
+                for title, values in hand_values.items():
+                    # force: fingerprint skip 없이 diff 경로 측정
+                    result = await hands._sync_worksheet(
+                        db, title, values, stored, force=True
+                    )
+                    counts["created"] += result["created"]
+                    counts["updated"] += result["updated"]
+                await db.commit()
+            return counts
+
+        results["work_status_initial"] = await _timed(work_status())
+        results["work_status_unchanged"] = await _timed(work_status())
+        results["hands_initial"] = await _timed(hand_analysis())
+        results["hands_unchanged"] = await _timed(hand_analysis())
+    return results
+
+
+async def bench_endpoints(
+    directory: str,
+    spec: ArchiveSpec,
+    endpoints: List[str],
+    iterations: int,
+    http_cache: bool,
+) -> Dict[str, Any]:
+    """조회 API 응답 시간 (첫 요청 + 반복 요청 분포)"""
+    from app.core.database import get_db, get_read_db
+    from app.main import app
+    from app.services import data_generation as generation_module
+    from app.services.shared_state import MemoryStateBackend
+
+    results: Dict[str, Any] = {"iterations": iterations, "http_cache": http_cache}
+    previous_cache = settings.HTTP_CACHE_ENABLED
+    settings.HTTP_CACHE_ENABLED = http_cache
+    # generation vector(HTTP 캐시, /hands facet)도 앱 DB 대신 프로세스 메모리에서 읽음
+    previous_state = generation_module.shared_state
+    generation_module.shared_state = MemoryStateBackend()
+
+    async with benchmark_database(directory, "read.db") as (writer, reader):
+        async with writer.session() as db:
+            results["rows"] = await seed_database(db, spec)
+
+        async def override_read_db():
+            async with reader() as db:
+                yield db
+
+        async def override_db():
+            async with writer.session() as db:
+                yield db
+
+        app.dependency_overrides[get_read_db] = override_read_db
+        app.dependency_overrides[get_db] = override_db
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://bench", timeout=None
+            ) as client:
+                for url in endpoints:
+                    start = time.perf_counter()
+                    first = await client.get(url)
+                    entry = {
+                        "status": first.status_code,
+                        "bytes": len(first.content),
+                        "first_ms": round((time.perf_counter() - start) * 1000, 2),
+                    }
+                    samples = []
+                    for _ in range(iterations):
+                        start = time.perf_counter()
+                        await client.get(url)
+                        samples.append(time.perf_counter() - start)
+                    if samples:
+                        entry.update(_distribution(samples))
+                    results[url] = entry
+        finally:
+            app.dependency_overrides.pop(get_read_db, None)
+            app.dependency_overrides.pop(get_db, None)
+            settings.HTTP_CACHE_ENABLED = previous_cache
+            generation_module.shared_state = previous_state
+    return results
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+async def run_benchmarks(
+    spec: ArchiveSpec,
+    suites: List[str],
+    scan_files: Optional[int] = None,
+    ffprobe_latency: float = 0.0,
+    endpoints: Optional[List[str]] = None,
+    iterations: int = 5,
+    http_cache: bool = False,
+) -> Dict[str, Any]:
+    """선택한 스위트를 순서대로 실행하고 결과 dict 반환"""
+    report: Dict[str, Any] = {
+        "meta": {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "app_version": settings.APP_VERSION,
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "spec": asdict(spec),
+        },
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="archive-bench-") as directory:
+        if "seed" in suites:
+            report["results"]["seed"] = await bench_seed(directory, spec)
+        if "scan" in suites:
+            # 실제 파일을 만드는 스캔은 별도 규모로 제한 가능
+            scan_spec = ArchiveSpec(
+                **{**asdict(spec), "files": min(spec.files, scan_files or spec.files)}
+            )
+            report["results"]["scan"] = await bench_scan(
+                directory, scan_spec, ffprobe_latency
+            )
+        if "sync" in suites:
+            report["results"]["sync"] = await bench_sync(directory, spec)
+        if "endpoints" in suites:
+            report["results"]["endpoints"] = await bench_endpoints(
+                directory, spec, endpoints or ENDPOINTS, iterations, http_cache
+            )
+    return report
+
+
+SUITES = ["seed", "scan", "sync", "endpoints"]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Archive Statistics benchmarks")
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--depth", type=int, default=4, choices=range(2, 9))
+    parser.add_argument("--files-per-folder", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--suites", nargs="+", default=SUITES, choices=SUITES)
+    parser.add_argument(
+        "--scan-files",
+        type=int,
+        default=20_000,
+        help="스캔 벤치마크용 실제 파일 수 상한",
+    )
+    parser.add_argument(
+        "--ffprobe-latency",
+        type=float,
+        default=0.0,
+        help="가짜 ffprobe 호출당 추가 지연 (초, 프로세스 기동 비용 별도)",
+    )
+    parser.add_argument("--endpoint", action="append", dest="endpoints")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--http-cache", action="store_true")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: stdout)")
+    args = parser.parse_args(argv)
+
+    spec = ArchiveSpec(
+        files=args.files,
+        depth=args.depth,
+        files_per_folder=args.files_per_folder,
+        seed=args.seed,
+    )
+    # 서비스의 디버그 print가 stdout JSON에 섞이지 않도록 stderr로
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(
+            run_benchmarks(
+                spec,
+                args.suites,
+                scan_files=args.scan_files,
+                ffprobe_latency=args.ffprobe_latency,
+                endpoints=args.endpoints,
+                iterations=args.iterations,
+                http_cache=args.http_cache,
+            )
+        )
+    output = json.dumps(report, indent=2, ensure_ascii=False, default=str)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
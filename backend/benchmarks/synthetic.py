@@ -0,0 +1,400 @@
+"""
+합성 아카이브 생성기
+
+실제 NAS 아카이브와 비슷한 구조(WSOP/HCL 등 시리즈 → 연도/이벤트 → Day/Table ...)를
+원하는 규모(1만 ~ 500만 파일, 깊이 2~8)로 결정적(seed)으로 만든다.
+
+- iter_archive: FolderStats / FileStats 행 dict를 post-order로 스트리밍
+  (스캐너와 같은 순서/집계, 재귀 스택 외에는 메모리에 쌓지 않음)
+- write_tree: 같은 구조를 실제 디렉터리 트리로 (크기는 sparse 파일)
+- seed_database: FileStats / FolderStats / HandAnalysis / WorkStatus 행 직접 적재
+- work_status_sheet / hand_sheets: 동기화 서비스 입력과 같은 시트 값 행렬
+- fake_ffprobe: 지연 시간을 조절할 수 있는 ffprobe 대체 실행 파일
+
+Block: benchmarks.synthetic
+"""
+
+import json
+import os
+import random
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bulk import bulk_insert
+from app.models.file_stats import FileStats, FolderStats
+from app.models.hand_analysis import HandAnalysis
+from app.models.work_status import Archive, WorkStatus
+
+SERIES = ["WSOP", "HCL", "GGMillions", "WPT", "EPT", "PAD", "MPP", "Triton"]
+EVENTS = ["Main Event", "Paradise", "Europe", "Circuit LA", "Bracelet", "High Roller"]
+GAMES = ["NLH", "PLO", "Mixed", "Short Deck"]
+LEVEL_NAMES = ["Day {n}", "Table {n}", "Camera {n}", "Part {n}", "Clip {n}"]
+
+# (확장자, 비율) - 대부분 영상, 일부 오디오/자막/문서
+EXTENSIONS = [
+    (".mp4", 0.70),
+    (".mov", 0.08),
+    (".mxf", 0.05),
+    (".mkv", 0.04),
+    (".wav", 0.03),
+    (".srt", 0.05),
+    (".xml", 0.03),
+    (".txt", 0.02),
+]
+MEDIA = {".mp4", ".mov", ".mxf", ".mkv", ".wav"}
+VIDEO_CODECS = ["h264", "hevc", "prores", "dnxhd"]
+AUDIO_CODECS = ["aac", "pcm_s16le", "mp3"]
+
+Row = Dict[str, Any]
+
+
+@dataclass
+class ArchiveSpec:
+    """합성 아카이브 규모/형태"""
+
+    files: int = 10_000
+    depth: int = 4  # 루트(0) 아래 폴더 단계 수 (파일은 가장 깊은 폴더에)
+    files_per_folder: int = 50
+    seed: int = 42
+    root: str = "/archive"
+    hand_file_every: int = 10  # 미디어 파일 N개 중 1개에 핸드 기록
+    hands_per_file: int = 10
+
+    @property
+    def branching(self) -> int:
+        """단계별 하위 폴더 수 (리프 폴더 수 ≈ files / files_per_folder)"""
+        leaves = max(1, self.files // max(1, self.files_per_folder))
+        return max(2, round(leaves ** (1 / self.depth)))
+
+
+def _folder_name(level: int, index: int, series: str, year: int) -> str:
+    if level == 1:
+        return series
+    if level == 2:
+        return f"{year} {series} {EVENTS[index % len(EVENTS)]}"
+    if level == 3:
+        return f"Event #{index + 1} {GAMES[index % len(GAMES)]}"
+    return LEVEL_NAMES[(level - 4) % len(LEVEL_NAMES)].format(n=index + 1)
+
+
+def _file_row(rng: random.Random, folder: str, stem: str, index: int) -> Row:
+    r = rng.random()
+    for extension, share in EXTENSIONS:
+        r -= share
+        if r <= 0:
+            break
+    name = f"{stem}_{index + 1:04d}{extension}"
+    media = extension in MEDIA
+    size = int(rng.lognormvariate(21, 1)) if media else rng.randint(1_000, 200_000)
+    modified = datetime(2024, 1, 1) - timedelta(minutes=rng.randint(0, 2_000_000))
+    return {
+        "path": f"{folder}/{name}",
+        "name": name,
+        "folder_path": folder,
+        "extension": extension,
+        "size": size,
+        "duration": round(rng.uniform(600, 14_400), 2) if media else 0.0,
+        "video_codec": (
+            rng.choice(VIDEO_CODECS) if extension != ".wav" and media else None
+        ),
+        "audio_codec": rng.choice(AUDIO_CODECS) if media else None,
+        "file_created_at": modified,
+        "file_modified_at": modified,
+    }
+
+
+def iter_archive(spec: ArchiveSpec) -> Iterator[Tuple[str, Row]]:
+    """("file" | "folder", 행) post-order 스트림 (폴더 행에 하위 합계 포함)"""
+    rng = random.Random(spec.seed)
+    branching = spec.branching
+    leaves = branching**spec.depth
+    base, extra = divmod(spec.files, leaves)
+    leaf_index = 0
+
+    def walk(path: str, parent, level: int, series: str, year: int, stem: str):
+        nonlocal leaf_index
+        totals = {
+            "total_size": 0,
+            "file_count": 0,
+            "folder_count": 0,
+            "total_duration": 0.0,
+        }
+        if level == spec.depth:
+            count = base + (1 if leaf_index < extra else 0)
+            leaf_index += 1
+            for i in range(count):
+                row = _file_row(rng, path, stem, i)
+                totals["total_size"] += row["size"]
+                totals["file_count"] += 1
+                totals["total_duration"] += row["duration"]
+                yield "file", row
+        else:
+            for i in range(branching):
+                child_series = SERIES[i % len(SERIES)] if level == 0 else series
+                if level == 0 and i >= len(SERIES):
+                    child_series += f" {i // len(SERIES) + 1}"
+                child_year = 2008 + i % 17 if level == 1 else year
+                name = _folder_name(level + 1, i, child_series, child_year)
+                child_stem = (
+                    f"{stem}_{i + 1}" if stem else child_series.replace(" ", "")
+                )
+                child = yield from walk(
+                    f"{path}/{name}",
+                    path,
+                    level + 1,
+                    child_series,
+                    child_year,
+                    child_stem,
+                )
+                totals["folder_count"] += 1 + child["folder_count"]
+                for key in ("total_size", "file_count", "total_duration"):
+                    totals[key] += child[key]
+
+        yield "folder", {
+            "path": path,
+            "name": os.path.basename(path) or path,
+            "parent_path": parent,
+            "depth": level,
+            **totals,
+        }
+        return totals
+
+    yield from walk(spec.root, None, 0, "", 2008, "")
+
+
+def write_tree(spec: ArchiveSpec) -> int:
+    """spec.root 아래에 실제 디렉터리/파일 생성 (파일 크기는 sparse), 파일 수 반환"""
+    count = 0
+    for kind, row in iter_archive(spec):
+        if kind != "file":
+            continue
+        os.makedirs(row["folder_path"], exist_ok=True)
+        with open(row["path"], "wb") as f:
+            f.truncate(row["size"])
+        mtime = row["file_modified_at"].timestamp()
+        os.utime(row["path"], (mtime, mtime))
+        count += 1
+    return count
+
+
+def _timecode(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def iter_hand_rows(spec: ArchiveSpec) -> Iterator[Row]:
+    """핸드 분석 레코드 (hand_analysis_sync._parse_row 결과와 같은 키)"""
+    rng = random.Random(spec.seed + 1)
+    media_index = 0
+    for kind, row in iter_archive(spec):
+        if kind != "file" or not row["video_codec"]:
+            continue
+        media_index += 1
+        if media_index % spec.hand_file_every:
+            continue
+        worksheet = row["path"][len(spec.root) + 1 :].split("/", 1)[0] + " Hands"
+        step = row["duration"] / (spec.hands_per_file + 1)
+        for n in range(spec.hands_per_file):
+            start = step * n + rng.uniform(0, step / 2)
+            end = start + rng.uniform(30, step / 2 + 30)
+            yield {
+                "file_name": row["name"],
+                "nas_path": row["path"],
+                "timecode_in": _timecode(start),
+                "timecode_out": _timecode(end),
+                "timecode_in_sec": float(int(start)),
+                "timecode_out_sec": float(int(end)),
+                "file_no": n + 1,
+                "hand_grade": rng.choice(["★", "★★", "★★★"]),
+                "winner": None,
+                "hands": f"{rng.choice('AKQJT98')}{rng.choice('AKQJT98')} vs "
+                f"{rng.choice('AKQJT98')}{rng.choice('AKQJT98')}",
+                "player_tags": json.dumps(
+                    [rng.choice(["ivey", "negreanu", "hellmuth"])]
+                ),
+                "poker_play_tags": json.dumps(
+                    [rng.choice(["bluff", "hero call", "fold"])]
+                ),
+                "source_worksheet": worksheet,
+                "source_row": n + 2,
+            }
+
+
+def iter_work_status_rows(spec: ArchiveSpec) -> Iterator[Tuple[str, Row]]:
+    """(archive 이름, WorkStatus 값) - 2단계 폴더(연도/이벤트) 하나당 1행"""
+    rng = random.Random(spec.seed + 2)
+    for kind, row in iter_archive(spec):
+        if kind != "folder" or row["depth"] != min(2, spec.depth):
+            continue
+        archive = row["path"][len(spec.root) + 1 :].split("/", 1)[0]
+        total = max(1, row["file_count"])
+        done = rng.randint(0, total)
+        yield archive, {
+            "category": row["name"],
+            "pic": rng.choice(["Kim", "Lee", "Park", None]),
+            "status": "completed" if done == total else "in_progress",
+            "total_videos": total,
+            "excel_done": done,
+            "progress_percent": round(done / total * 100, 2),
+            "notes1": None,
+            "notes2": None,
+        }
+
+
+def work_status_sheet(spec: ArchiveSpec) -> List[List[str]]:
+    """Work Status 시트 값 (Row 1 = 제목, Row 2 = 헤더, Row 3+ = 데이터)"""
+    values = [
+        ["Archive Work Status"],
+        [
+            "Archive",
+            "Category",
+            "PIC",
+            "Status",
+            "Total (# of videos)",
+            "Excel Done",
+            "Notes 1",
+            "Notes 2",
+        ],
+    ]
+    for archive, row in iter_work_status_rows(spec):
+        values.append(
+            [
+                archive,
+                row["category"],
+                row["pic"] or "",
+                "완료" if row["status"] == "completed" else "작업 중",
+                str(row["total_videos"]),
+                str(row["excel_done"]),
+                "",
+                "",
+            ]
+        )
+    return values
+
+
+def hand_sheets(spec: ArchiveSpec) -> Dict[str, List[List[str]]]:
+    """Archive Metadata 시트 값 (워크시트별, Row 1 = 헤더)"""
+    header = [
+        "File No.",
+        "File Name",
+        "In",
+        "Out",
+        "Hand Grade",
+        "Hands",
+        "Tag (Player)",
+        "Tag (Poker Play)",
+    ]
+    sheets: Dict[str, List[List[str]]] = {}
+    for row in iter_hand_rows(spec):
+        sheets.setdefault(row["source_worksheet"], [header]).append(
+            [
+                str(row["file_no"]),
+                row["file_name"],
+                row["timecode_in"],
+                row["timecode_out"],
+                row["hand_grade"],
+                row["hands"],
+                json.loads(row["player_tags"])[0],
+                json.loads(row["poker_play_tags"])[0],
+            ]
+        )
+    return sheets
+
+
+async def _insert_batches(db: AsyncSession, model, rows, batch_size: int) -> int:
+    batch, count = [], 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            await bulk_insert(db, model, batch)
+            count += len(batch)
+            batch = []
+    await bulk_insert(db, model, batch)
+    return count + len(batch)
+
+
+async def seed_database(
+    db: AsyncSession, spec: ArchiveSpec, batch_size: int = 10_000
+) -> Dict[str, int]:
+    """합성 데이터를 DB 행으로 직접 적재 (commit 포함), 테이블별 행 수 반환"""
+    now = datetime.utcnow()
+    counts = {"file_stats": 0, "folder_stats": 0}
+    files: List[Row] = []
+    folders: List[Row] = []
+    for kind, row in iter_archive(spec):
+        target = files if kind == "file" else folders
+        target.append({**row, "created_at": now, "updated_at": now})
+        if len(target) >= batch_size:
+            model = FileStats if kind == "file" else FolderStats
+            await bulk_insert(db, model, target)
+            counts[model.__tablename__] += len(target)
+            target.clear()
+    await bulk_insert(db, FileStats, files)
+    await bulk_insert(db, FolderStats, folders)
+    counts["file_stats"] += len(files)
+    counts["folder_stats"] += len(folders)
+
+    archive_ids: Dict[str, int] = {}
+    work_statuses = []
+    for archive, row in iter_work_status_rows(spec):
+        if archive not in archive_ids:
+            record = Archive(name=archive)
+            db.add(record)
+            await db.flush()
+            archive_ids[archive] = record.id
+        work_statuses.append({**row, "archive_id": archive_ids[archive]})
+    counts["work_statuses"] = await _insert_batches(
+        db, WorkStatus, work_statuses, batch_size
+    )
+    counts["hand_analyses"] = await _insert_batches(
+        db, HandAnalysis, iter_hand_rows(spec), batch_size
+    )
+    await db.commit()
+    return counts
+
+
+FAKE_FFPROBE = """#!{python}
+import json, sys, time, zlib
+
+time.sleep({latency!r})
+h = zlib.crc32(sys.argv[-1].encode())
+print(json.dumps({{
+    "format": {{"duration": str(600 + h % 14000)}},
+    "streams": [
+        {{"codec_type": "video", "codec_name": {video!r}[h % {nvideo}]}},
+        {{"codec_type": "audio", "codec_name": {audio!r}[h % {naudio}]}},
+    ],
+}}))
+"""
+
+
+@contextmanager
+def fake_ffprobe(latency: float = 0.0):
+    """PATH 앞에 가짜 ffprobe를 둔다 (호출마다 latency초 대기 후 JSON 출력)"""
+    with tempfile.TemporaryDirectory(prefix="fake-ffprobe-") as directory:
+        path = os.path.join(directory, "ffprobe")
+        with open(path, "w") as f:
+            f.write(
+                FAKE_FFPROBE.format(
+                    python=sys.executable,
+                    latency=latency,
+                    video=VIDEO_CODECS,
+                    nvideo=len(VIDEO_CODECS),
+                    audio=AUDIO_CODECS,
+                    naudio=len(AUDIO_CODECS),
+                )
+            )
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        previous = os.environ.get("PATH", "")
+        os.environ["PATH"] = directory + os.pathsep + previous
+        try:
+            yield path
+        finally:
+            os.environ["PATH"] = previous
@@ -0,0 +1,88 @@
+"""
+Alembic 마이그레이션 환경
+
+- CLI (alembic upgrade head): settings.DATABASE_URL로 async 엔진 생성
+- 앱 기동 (app.core.database.run_migrations): 전달받은 연결 재사용
+
+Block: core.migrations
+"""
+
+import asyncio
+
+from alembic import context
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.models  # noqa: F401 - 모든 모델을 metadata에 등록
+from app.core.config import settings
+from app.core.database import Base
+from app.models.search import is_search_table
+
+config = context.config
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """dialect 전용 인덱스(Index.ddl_if)는 해당 DB에서만 비교
+
+    검색 색인(FTS5 가상 테이블, pg_trgm 인덱스)은 metadata 밖에서 관리
+    """
+    if type_ == "table" and reflected and is_search_table(name):
+        return False
+    if type_ == "index" and reflected and name and name.endswith("_trgm"):
+        return False
+    ddl_if = getattr(obj, "_ddl_if", None)
+    if type_ == "index" and not reflected and ddl_if is not None and ddl_if.dialect:
+        return context.get_context().dialect.name == ddl_if.dialect
+    return True
+
+
+def _configure(**kwargs):
+    context.configure(
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # SQLite는 ALTER 지원이 제한적 → batch 모드 (테이블 재생성)
+        render_as_batch=True,
+        compare_type=True,
+        **kwargs,
+    )
+
+
+def run_migrations_offline() -> None:
+    """SQL 스크립트 출력 (alembic upgrade head --sql)"""
+    _configure(
+        url=settings.DATABASE_URL,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    _configure(connection=connection)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        async with engine.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+            await connection.commit()
+    finally:
+        await engine.dispose()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
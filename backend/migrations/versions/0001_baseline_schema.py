@@ -0,0 +1,273 @@
+"""baseline schema
+
+Alembic 도입 전 create_all()로 만들던 스키마.
+기존 DB(테이블은 있고 alembic_version이 없는 경우)는 기동 시 이 리비전으로
+stamp된 뒤 이후 리비전만 적용됨 (app.core.database.run_migrations).
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 08:03:19.935960
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archives",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    with op.batch_alter_table("archives", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_archives_id"), ["id"], unique=False)
+
+    op.create_table(
+        "daily_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.DateTime(), nullable=False),
+        sa.Column("total_size", sa.BigInteger(), nullable=True),
+        sa.Column("total_files", sa.Integer(), nullable=True),
+        sa.Column("total_folders", sa.Integer(), nullable=True),
+        sa.Column("total_duration", sa.Float(), nullable=True),
+        sa.Column("file_type_stats", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("daily_snapshots", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_daily_snapshots_date"), ["date"], unique=True
+        )
+        batch_op.create_index(batch_op.f("ix_daily_snapshots_id"), ["id"], unique=False)
+
+    op.create_table(
+        "file_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("folder_path", sa.String(), nullable=False),
+        sa.Column("extension", sa.String(), nullable=True),
+        sa.Column("mime_type", sa.String(), nullable=True),
+        sa.Column("size", sa.BigInteger(), nullable=True),
+        sa.Column("duration", sa.Float(), nullable=True),
+        sa.Column("video_codec", sa.String(), nullable=True),
+        sa.Column("audio_codec", sa.String(), nullable=True),
+        sa.Column("file_created_at", sa.DateTime(), nullable=True),
+        sa.Column("file_modified_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("file_stats", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_file_stats_extension"), ["extension"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_file_stats_folder_path"), ["folder_path"], unique=False
+        )
+        batch_op.create_index(batch_op.f("ix_file_stats_id"), ["id"], unique=False)
+        batch_op.create_index(batch_op.f("ix_file_stats_path"), ["path"], unique=True)
+
+    op.create_table(
+        "hand_analyses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("file_name", sa.String(), nullable=False),
+        sa.Column("nas_path", sa.String(), nullable=True),
+        sa.Column("timecode_in", sa.String(), nullable=True),
+        sa.Column("timecode_out", sa.String(), nullable=True),
+        sa.Column("timecode_in_sec", sa.Float(), nullable=True),
+        sa.Column("timecode_out_sec", sa.Float(), nullable=True),
+        sa.Column("file_no", sa.Integer(), nullable=True),
+        sa.Column("hand_grade", sa.String(), nullable=True),
+        sa.Column("winner", sa.String(), nullable=True),
+        sa.Column("hands", sa.String(), nullable=True),
+        sa.Column("player_tags", sa.Text(), nullable=True),
+        sa.Column("poker_play_tags", sa.Text(), nullable=True),
+        sa.Column("source_worksheet", sa.String(), nullable=True),
+        sa.Column("source_row", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("hand_analyses", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_hand_file_worksheet", ["file_name", "source_worksheet"], unique=False
+        )
+        batch_op.create_index(
+            "idx_hand_timecode_out", ["timecode_out_sec"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_hand_analyses_file_name"), ["file_name"], unique=False
+        )
+        batch_op.create_index(batch_op.f("ix_hand_analyses_id"), ["id"], unique=False)
+
+    op.create_table(
+        "scan_history",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("scan_type", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("total_size", sa.BigInteger(), nullable=True),
+        sa.Column("total_files", sa.Integer(), nullable=True),
+        sa.Column("total_folders", sa.Integer(), nullable=True),
+        sa.Column("total_duration", sa.Float(), nullable=True),
+        sa.Column("new_files", sa.Integer(), nullable=True),
+        sa.Column("deleted_files", sa.Integer(), nullable=True),
+        sa.Column("size_change", sa.BigInteger(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("error_message", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("scan_history", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_scan_history_id"), ["id"], unique=False)
+
+    op.create_table(
+        "shared_state",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("value", sa.Text(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    with op.batch_alter_table("shared_state", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_shared_state_expires_at"), ["expires_at"], unique=False
+        )
+
+    op.create_table(
+        "sync_fingerprints",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("worksheet", sa.String(), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=True),
+        sa.Column("record_count", sa.Integer(), nullable=True),
+        sa.Column("synced_ids", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("source", "worksheet", name="uq_sync_fingerprint_ws"),
+    )
+    with op.batch_alter_table("sync_fingerprints", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_sync_fingerprints_id"), ["id"], unique=False
+        )
+
+    op.create_table(
+        "work_statuses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("archive_id", sa.Integer(), nullable=False),
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("pic", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("total_videos", sa.Integer(), nullable=True),
+        sa.Column("excel_done", sa.Integer(), nullable=True),
+        sa.Column("progress_percent", sa.Float(), nullable=True),
+        sa.Column("notes1", sa.Text(), nullable=True),
+        sa.Column("notes2", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["archive_id"],
+            ["archives.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("work_statuses", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_work_statuses_id"), ["id"], unique=False)
+
+    op.create_table(
+        "folder_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("parent_path", sa.String(), nullable=True),
+        sa.Column("depth", sa.Integer(), nullable=True),
+        sa.Column("total_size", sa.BigInteger(), nullable=True),
+        sa.Column("file_count", sa.Integer(), nullable=True),
+        sa.Column("folder_count", sa.Integer(), nullable=True),
+        sa.Column("total_duration", sa.Float(), nullable=True),
+        sa.Column("work_status_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("last_scanned_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["work_status_id"],
+            ["work_statuses.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("folder_stats", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_folder_stats_id"), ["id"], unique=False)
+        batch_op.create_index(
+            batch_op.f("ix_folder_stats_parent_path"), ["parent_path"], unique=False
+        )
+        batch_op.create_index(batch_op.f("ix_folder_stats_path"), ["path"], unique=True)
+        batch_op.create_index(
+            batch_op.f("ix_folder_stats_work_status_id"),
+            ["work_status_id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("folder_stats", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_folder_stats_work_status_id"))
+        batch_op.drop_index(batch_op.f("ix_folder_stats_path"))
+        batch_op.drop_index(batch_op.f("ix_folder_stats_parent_path"))
+        batch_op.drop_index(batch_op.f("ix_folder_stats_id"))
+
+    op.drop_table("folder_stats")
+    with op.batch_alter_table("work_statuses", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_work_statuses_id"))
+
+    op.drop_table("work_statuses")
+    with op.batch_alter_table("sync_fingerprints", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_sync_fingerprints_id"))
+
+    op.drop_table("sync_fingerprints")
+    with op.batch_alter_table("shared_state", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_shared_state_expires_at"))
+
+    op.drop_table("shared_state")
+    with op.batch_alter_table("scan_history", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_scan_history_id"))
+
+    op.drop_table("scan_history")
+    with op.batch_alter_table("hand_analyses", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_hand_analyses_id"))
+        batch_op.drop_index(batch_op.f("ix_hand_analyses_file_name"))
+        batch_op.drop_index("idx_hand_timecode_out")
+        batch_op.drop_index("idx_hand_file_worksheet")
+
+    op.drop_table("hand_analyses")
+    with op.batch_alter_table("file_stats", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_file_stats_path"))
+        batch_op.drop_index(batch_op.f("ix_file_stats_id"))
+        batch_op.drop_index(batch_op.f("ix_file_stats_folder_path"))
+        batch_op.drop_index(batch_op.f("ix_file_stats_extension"))
+
+    op.drop_table("file_stats")
+    with op.batch_alter_table("daily_snapshots", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_daily_snapshots_id"))
+        batch_op.drop_index(batch_op.f("ix_daily_snapshots_date"))
+
+    op.drop_table("daily_snapshots")
+    with op.batch_alter_table("archives", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_archives_id"))
+
+    op.drop_table("archives")
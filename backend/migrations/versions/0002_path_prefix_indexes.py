@@ -0,0 +1,43 @@
+"""path prefix indexes (PostgreSQL)
+
+LIKE 'prefix%' 하위 경로 조회(file_stats.folder_path, folder_stats.path/parent_path)용
+text_pattern_ops 인덱스. 기본 btree 인덱스는 C 이외 collation에서 LIKE prefix
+검색에 사용되지 않음. SQLite는 기존 인덱스로 충분하므로 건너뜀.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 08:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREFIX_INDEXES = [
+    ("ix_file_stats_folder_path_prefix", "file_stats", "folder_path"),
+    ("ix_folder_stats_path_prefix", "folder_stats", "path"),
+    ("ix_folder_stats_parent_path_prefix", "folder_stats", "parent_path"),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name, table, column in PREFIX_INDEXES:
+        op.create_index(
+            name, table, [column], postgresql_ops={column: "text_pattern_ops"}
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name, table, _ in PREFIX_INDEXES:
+        op.drop_index(name, table_name=table)
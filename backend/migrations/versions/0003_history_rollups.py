@@ -0,0 +1,50 @@
+"""history rollups
+
+daily_snapshots의 주/월 단위 rollup (기간별 마지막 snapshot 값).
+수년 범위 /stats/history 조회를 일정한 점 개수로 제한.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Alembic 도입 전 create_all()로 만든 DB(baseline stamp)에는 이미 있을 수 있음
+    if "history_rollups" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "history_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("period", sa.String(), nullable=False),
+        sa.Column("period_start", sa.DateTime(), nullable=False),
+        sa.Column("snapshot_date", sa.DateTime(), nullable=False),
+        sa.Column("total_size", sa.BigInteger(), nullable=True),
+        sa.Column("total_files", sa.Integer(), nullable=True),
+        sa.Column("total_folders", sa.Integer(), nullable=True),
+        sa.Column("total_duration", sa.Float(), nullable=True),
+        sa.Column("file_type_stats", sa.String(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("period", "period_start", name="uq_history_rollup_period"),
+    )
+    with op.batch_alter_table("history_rollups", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_history_rollups_id"), ["id"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("history_rollups", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_history_rollups_id"))
+    op.drop_table("history_rollups")
@@ -0,0 +1,61 @@
+"""folder stats deltas
+
+스캔마다 합계가 바뀐 폴더만 기록하는 변화량 테이블
+(폴더별 시계열 / 기간별 top growing 조회용 인덱스 포함).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Alembic 도입 전 create_all()로 만든 DB(baseline stamp)에는 이미 있을 수 있음
+    if "folder_stats_deltas" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "folder_stats_deltas",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("scan_id", sa.Integer(), nullable=True),
+        sa.Column("folder_path", sa.String(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=True),
+        sa.Column("scanned_at", sa.DateTime(), nullable=False),
+        sa.Column("size_delta", sa.BigInteger(), nullable=True),
+        sa.Column("file_count_delta", sa.Integer(), nullable=True),
+        sa.Column("duration_delta", sa.Float(), nullable=True),
+        sa.Column("total_size", sa.BigInteger(), nullable=True),
+        sa.Column("file_count", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("folder_stats_deltas", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_folder_stats_deltas_id"), ["id"], unique=False
+        )
+        batch_op.create_index(
+            "ix_folder_stats_deltas_path_time",
+            ["folder_path", "scanned_at"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_folder_stats_deltas_time_depth", ["scanned_at", "depth"], unique=False
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("folder_stats_deltas", schema=None) as batch_op:
+        batch_op.drop_index("ix_folder_stats_deltas_time_depth")
+        batch_op.drop_index("ix_folder_stats_deltas_path_time")
+        batch_op.drop_index(batch_op.f("ix_folder_stats_deltas_id"))
+    op.drop_table("folder_stats_deltas")
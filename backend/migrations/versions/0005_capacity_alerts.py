@@ -0,0 +1,86 @@
+"""capacity alerts
+
+알림 규칙/발생 기록 테이블, folder_stats 미디어 파일 수 컬럼
+(재생시간 누락 비율 알림을 변경된 폴더 행만 읽고 판단).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Alembic 도입 전 create_all()로 만든 DB(baseline stamp)에는 이미 있을 수 있음
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+
+    folder_columns = {c["name"] for c in inspector.get_columns("folder_stats")}
+    with op.batch_alter_table("folder_stats", schema=None) as batch_op:
+        for name in ("media_count", "missing_duration_count"):
+            if name not in folder_columns:
+                batch_op.add_column(sa.Column(name, sa.Integer(), nullable=True))
+
+    if "alert_rules" not in tables:
+        op.create_table(
+            "alert_rules",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("rule_type", sa.String(), nullable=False),
+            sa.Column("target", sa.String(), nullable=True),
+            sa.Column("threshold", sa.Float(), nullable=False),
+            sa.Column("window_days", sa.Integer(), nullable=True),
+            sa.Column("recipients", sa.Text(), nullable=True),
+            sa.Column("cooldown_minutes", sa.Integer(), nullable=True),
+            sa.Column("enabled", sa.Boolean(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        with op.batch_alter_table("alert_rules", schema=None) as batch_op:
+            batch_op.create_index(batch_op.f("ix_alert_rules_id"), ["id"], unique=False)
+
+    if "alert_events" not in tables:
+        op.create_table(
+            "alert_events",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("rule_id", sa.Integer(), nullable=False),
+            sa.Column("rule_type", sa.String(), nullable=False),
+            sa.Column("target", sa.String(), nullable=True),
+            sa.Column("value", sa.Float(), nullable=False),
+            sa.Column("threshold", sa.Float(), nullable=False),
+            sa.Column("message", sa.Text(), nullable=False),
+            sa.Column("triggered_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        with op.batch_alter_table("alert_events", schema=None) as batch_op:
+            batch_op.create_index(
+                batch_op.f("ix_alert_events_id"), ["id"], unique=False
+            )
+            batch_op.create_index(
+                "ix_alert_events_rule_time", ["rule_id", "triggered_at"], unique=False
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("alert_events", schema=None) as batch_op:
+        batch_op.drop_index("ix_alert_events_rule_time")
+        batch_op.drop_index(batch_op.f("ix_alert_events_id"))
+    op.drop_table("alert_events")
+    with op.batch_alter_table("alert_rules", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_alert_rules_id"))
+    op.drop_table("alert_rules")
+    with op.batch_alter_table("folder_stats", schema=None) as batch_op:
+        batch_op.drop_column("missing_duration_count")
+        batch_op.drop_column("media_count")
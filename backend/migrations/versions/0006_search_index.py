@@ -0,0 +1,31 @@
+"""search index
+
+이름 부분 문자열 검색 색인 - SQLite FTS5 trigram 가상 테이블 + 동기화 trigger,
+PostgreSQL pg_trgm GIN 인덱스. 기존 행은 생성 시 한 번 색인.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.models.search import create_search_index, drop_search_index
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS - create_all()로 만든 DB(baseline stamp)에는 이미 있음
+    create_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_search_index(op.get_bind())
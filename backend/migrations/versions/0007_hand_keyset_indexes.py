@@ -0,0 +1,46 @@
+"""hand keyset indexes
+
+/hands keyset 페이지 정렬 키 (source_worksheet, file_name, timecode_in_sec, id)
+인덱스 - 전체 / 등급 필터 각각. 행 값 비교는 NULL을 건너뛰므로 기존 NULL은
+빈 값으로 채움 (동기화는 항상 값을 씀).
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+KEYSET = ["source_worksheet", "file_name", "timecode_in_sec", "id"]
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE hand_analyses SET source_worksheet = '' "
+        "WHERE source_worksheet IS NULL"
+    )
+    op.execute(
+        "UPDATE hand_analyses SET timecode_in_sec = 0 WHERE timecode_in_sec IS NULL"
+    )
+    # if_not_exists - create_all()로 만든 DB(baseline stamp)에는 이미 있음
+    op.create_index("idx_hand_keyset", "hand_analyses", KEYSET, if_not_exists=True)
+    op.create_index(
+        "idx_hand_grade_keyset",
+        "hand_analyses",
+        ["hand_grade", *KEYSET],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_hand_grade_keyset", table_name="hand_analyses")
+    op.drop_index("idx_hand_keyset", table_name="hand_analyses")
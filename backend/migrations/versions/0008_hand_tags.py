@@ -0,0 +1,127 @@
+"""hand tags
+
+정규화 태그 사전(hand_tags) + 핸드↔태그 연결(hand_tag_links).
+기존 핸드의 JSON 태그 컬럼에서 한 번 채움 (이후는 핸드 동기화가 유지).
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.services.hand_tags import TAG_COLUMNS, normalize_tag, parse_tags
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Alembic 도입 전 create_all()로 만든 DB(baseline stamp)에는 이미 있을 수 있음
+    bind = op.get_bind()
+    tables = sa.inspect(bind).get_table_names()
+
+    if "hand_tags" not in tables:
+        op.create_table(
+            "hand_tags",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("kind", sa.String(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("label", sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("kind", "name", name="uq_hand_tag_kind_name"),
+        )
+
+    if "hand_tag_links" not in tables:
+        op.create_table(
+            "hand_tag_links",
+            sa.Column("hand_id", sa.Integer(), nullable=False),
+            sa.Column("tag_id", sa.Integer(), nullable=False),
+            sa.Column("source_worksheet", sa.String(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["hand_id"], ["hand_analyses.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(["tag_id"], ["hand_tags.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("hand_id", "tag_id"),
+        )
+        with op.batch_alter_table("hand_tag_links", schema=None) as batch_op:
+            batch_op.create_index(
+                "idx_hand_tag_link_tag",
+                ["tag_id", "source_worksheet", "hand_id"],
+                unique=False,
+            )
+            batch_op.create_index(
+                "idx_hand_tag_link_worksheet",
+                ["source_worksheet", "tag_id"],
+                unique=False,
+            )
+
+    if bind.scalar(sa.text("SELECT COUNT(*) FROM hand_tag_links")):
+        return
+    _backfill(bind)
+
+
+def _backfill(bind) -> None:
+    """기존 hand_analyses JSON 태그 → 사전 + 연결"""
+    rows = bind.execute(
+        sa.text(
+            "SELECT id, source_worksheet, player_tags, poker_play_tags "
+            "FROM hand_analyses "
+            "WHERE player_tags IS NOT NULL OR poker_play_tags IS NOT NULL"
+        )
+    ).all()
+
+    labels = {}
+    pairs = set()
+    for hand_id, worksheet, *columns in rows:
+        for kind, raw in zip(TAG_COLUMNS, columns):
+            for label in parse_tags(raw):
+                ref = (kind, normalize_tag(label))
+                labels.setdefault(ref, label)
+                pairs.add((hand_id, worksheet or "", ref))
+    if not labels:
+        return
+
+    def load_tag_ids():
+        result = bind.execute(sa.text("SELECT id, kind, name FROM hand_tags"))
+        return {(kind, name): tag_id for tag_id, kind, name in result}
+
+    tag_ids = load_tag_ids()
+    missing = [ref for ref in labels if ref not in tag_ids]
+    if missing:
+        bind.execute(
+            sa.text(
+                "INSERT INTO hand_tags (kind, name, label) "
+                "VALUES (:kind, :name, :label)"
+            ),
+            [
+                {"kind": kind, "name": name, "label": labels[(kind, name)]}
+                for kind, name in missing
+            ],
+        )
+        tag_ids = load_tag_ids()
+    bind.execute(
+        sa.text(
+            "INSERT INTO hand_tag_links (hand_id, tag_id, source_worksheet) "
+            "VALUES (:hand_id, :tag_id, :source_worksheet)"
+        ),
+        [
+            {"hand_id": hand_id, "tag_id": tag_ids[ref], "source_worksheet": worksheet}
+            for hand_id, worksheet, ref in sorted(pairs)
+        ],
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("hand_tag_links", schema=None) as batch_op:
+        batch_op.drop_index("idx_hand_tag_link_worksheet")
+        batch_op.drop_index("idx_hand_tag_link_tag")
+    op.drop_table("hand_tag_links")
+    op.drop_table("hand_tags")
@@ -0,0 +1,31 @@
+"""
+공통 pytest fixture
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.database import Base
+from app.services.progress_service import progress_service
+
+
+@pytest.fixture(autouse=True)
+def clear_archive_stats_cache():
+    """진행률 트리의 archive_stats 캐시는 프로세스 전역 → 테스트 간 격리"""
+    progress_service.invalidate_archive_stats_cache()
+    yield
+    progress_service.invalidate_archive_stats_cache()
+
+
+@pytest_asyncio.fixture
+async def db():
+    """테이블(검색 색인 포함)이 생성된 in-memory SQLite 세션"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+    finally:
+        await engine.dispose()
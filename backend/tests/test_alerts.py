@@ -0,0 +1,322 @@
+"""
+용량 알림 테스트
+
+테스트 케이스:
+- 스캔 후 바뀐 폴더만 평가: size(넘어서는 순간), growth, missing_duration
+- 같은 규칙은 cooldown 동안 다시 울리지 않음
+- sync_stale: 마지막 동기화 성공 후 경과 시간 (서버 로컬 시각 기록, UTC 아닌 서버)
+- 메일: 수신자별 묶음 발송, 시간당 제한 초과분 이월 (로컬 SMTP 대역)
+"""
+
+import asyncio
+import email
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base, DatabaseWriter, create_sqlite_engine
+from app.models.alert import AlertEvent, AlertRule
+from app.models.file_stats import FolderStats, FolderStatsDelta
+from app.services.alert_service import AlertService
+from app.services.email_notifier import EmailNotifier
+from app.services.hand_analysis_sync import HandAnalysisSyncService
+from app.services.scanner import ArchiveScanner
+from app.services.sheets_sync import SheetsSyncService
+
+GB = 1024**3
+
+
+class RecordingNotifier:
+    """enqueue된 알림 기록 (메일 발송 없음)"""
+
+    def __init__(self):
+        self.sent = []
+
+    def enqueue(self, recipients, line):
+        self.sent.append((list(recipients), line))
+
+    async def stop(self):
+        pass
+
+
+class StatusOf:
+    """실제 동기화 서비스의 get_status_dict() 그대로 공유 상태로 노출"""
+
+    def __init__(self, service, enabled=True):
+        self.service = service
+        self.enabled = enabled
+
+    async def get_shared_status(self):
+        return {**self.service.get_status_dict(), "enabled": self.enabled}
+
+
+@asynccontextmanager
+async def alert_database(tmp_path):
+    """파일 SQLite DB + 알림 서비스 (기록용 notifier)"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'alerts.db'}"
+    engine = create_sqlite_engine(url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        service = AlertService(
+            session_maker=session_maker,
+            writer=DatabaseWriter(session_maker),
+            notifier=RecordingNotifier(),
+        )
+        yield session_maker, service
+    finally:
+        await engine.dispose()
+
+
+def delta(path, scanned_at, size_delta, total_size, depth=1):
+    return FolderStatsDelta(
+        folder_path=path,
+        depth=depth,
+        scanned_at=scanned_at,
+        size_delta=size_delta,
+        file_count_delta=1,
+        duration_delta=0.0,
+        total_size=total_size,
+        file_count=1,
+    )
+
+
+@asynccontextmanager
+async def smtp_server():
+    """로컬 SMTP 대역 - 받은 메일을 messages에 기록"""
+    messages = []
+
+    async def handle(reader, writer):
+        writer.write(b"220 localhost ESMTP\r\n")
+        data, lines = False, []
+        while line := await reader.readline():
+            if data:
+                if line == b".\r\n":
+                    messages.append(email.message_from_bytes(b"".join(lines)))
+                    data, lines = False, []
+                    writer.write(b"250 OK\r\n")
+                else:
+                    lines.append(line[1:] if line.startswith(b"..") else line)
+                continue
+            command = line[:4].upper()
+            if command == b"EHLO":
+                writer.write(b"250-localhost\r\n250 8BITMIME\r\n")
+            elif command == b"DATA":
+                data = True
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    try:
+        yield server.sockets[0].getsockname()[1], messages
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+class TestScanRules:
+    """AlertService.evaluate_scan() 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_targets(self, tmp_path):
+        generation = datetime.utcnow()
+        async with alert_database(tmp_path) as (session_maker, service):
+            async with session_maker() as db:
+                db.add_all(
+                    [
+                        FolderStats(path="/a", name="a", depth=0, total_size=12 * GB),
+                        FolderStats(path="/a/WSOP", name="WSOP", depth=1),
+                        delta("/a/WSOP", generation - timedelta(days=3), GB, 2 * GB),
+                        delta("/a/WSOP", generation, 3 * GB, 5 * GB),
+                        delta("/a", generation, 3 * GB, 12 * GB, depth=0),
+                        AlertRule(
+                            name="WSOP full",
+                            rule_type="size",
+                            target="/a/WSOP",
+                            threshold=4 * GB,
+                            recipients="ops@example.com",
+                        ),
+                        AlertRule(
+                            name="Archive full", rule_type="size", threshold=20 * GB
+                        ),
+                        AlertRule(
+                            name="WSOP growth",
+                            rule_type="growth",
+                            target="/a/WSOP",
+                            threshold=4 * GB,
+                            window_days=7,
+                        ),
+                        # 이번 스캔에서 바뀌지 않은 폴더 → 평가 안 함
+                        AlertRule(
+                            name="HCL full",
+                            rule_type="size",
+                            target="/a/HCL",
+                            threshold=1,
+                        ),
+                    ]
+                )
+                await db.commit()
+
+            events = await service.evaluate_scan(generation)
+            # cooldown 안의 재평가 → 새 알림 없음
+            again = await service.evaluate_scan(generation)
+
+            async with session_maker() as db:
+                stored = (await db.execute(select(AlertEvent))).scalars().all()
+
+        assert sorted((e["rule_type"], e["value"]) for e in events) == [
+            ("growth", 4.0 * GB),
+            ("size", 5.0 * GB),
+        ]
+        assert again == []
+        assert len(stored) == 2
+        recipients, line = next(s for s in service.notifier.sent if "full" in s[1])
+        assert recipients == ["ops@example.com"]
+        assert line == "WSOP full: /a/WSOP size 5.00 GB crossed 4.00 GB"
+
+    @pytest.mark.asyncio
+    async def test_scan_missing_duration(self, tmp_path, monkeypatch):
+        root = tmp_path / "archive"
+        (root / "WSOP").mkdir(parents=True)
+        (root / "WSOP" / "a.mp4").write_bytes(b"x" * 10)
+        (root / "WSOP" / "b.mp4").write_bytes(b"x" * 10)
+        (root / "notes.txt").write_text("n")
+        monkeypatch.setattr(settings, "NAS_LOCAL_PATH", str(root))
+
+        durations = iter([120.0, 0.0])
+        monkeypatch.setattr(
+            ArchiveScanner,
+            "_get_media_info",
+            lambda self, path: {
+                "duration": next(durations),
+                "video_codec": "h264",
+                "audio_codec": None,
+            },
+        )
+
+        async with alert_database(tmp_path) as (session_maker, service):
+            async with session_maker() as db:
+                db.add(
+                    AlertRule(
+                        name="Missing", rule_type="missing_duration", threshold=0.5
+                    )
+                )
+                await db.commit()
+
+                scanner = ArchiveScanner(
+                    db, {"is_scanning": True, "logs": []}, writer=service.writer
+                )
+                await scanner.scan()
+                top = await db.scalar(
+                    select(FolderStats).where(FolderStats.path == str(root))
+                )
+
+            events = await service.evaluate_scan(scanner.started_at)
+
+        assert (top.media_count, top.missing_duration_count) == (2, 1)
+        assert [(e["target"], e["value"]) for e in events] == [(None, 0.5)]
+        assert service.notifier.sent[0][1] == (
+            "Missing: archive 50.0% of media files have no duration "
+            "(threshold 50.0%)"
+        )
+
+
+class TestSyncStale:
+    """AlertService.check_sync_staleness() 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stale_services(self, tmp_path, monkeypatch):
+        # UTC가 아닌 서버 (동기화 서비스는 로컬 시각으로 기록)
+        monkeypatch.setenv("TZ", "Asia/Seoul")
+        time.tzset()
+        try:
+            sheets = SheetsSyncService()
+            sheets.last_success_time = datetime.now() - timedelta(hours=5)
+            hands = HandAnalysisSyncService()
+            hands.last_success_time = datetime.now() - timedelta(minutes=5)
+            services = {
+                "sheets": StatusOf(sheets),
+                "hands": StatusOf(hands),
+                "off": StatusOf(SheetsSyncService(), enabled=False),
+            }
+            async with alert_database(tmp_path) as (session_maker, service):
+                async with session_maker() as db:
+                    db.add(AlertRule(name="Stale", rule_type="sync_stale", threshold=2))
+                    await db.commit()
+                events = await service.check_sync_staleness(services)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert [e["target"] for e in events] == ["sheets"]
+        assert 4.9 < events[0]["value"] < 5.1
+
+
+class TestEmailNotifier:
+    """EmailNotifier 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batched_and_rate_limited(self, monkeypatch):
+        async with smtp_server() as (port, messages):
+            monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+            monkeypatch.setattr(settings, "SMTP_PORT", port)
+            monkeypatch.setattr(settings, "SMTP_USER", None)
+            monkeypatch.setattr(settings, "EMAIL_FROM", "archive@example.com")
+            monkeypatch.setattr(settings, "ALERT_BATCH_SECONDS", 0.01)
+            monkeypatch.setattr(settings, "ALERT_EMAIL_MAX_PER_HOUR", 2)
+            monkeypatch.setattr(settings, "ALERT_EMAIL_MAX_LINES", 2)
+
+            notifier = EmailNotifier()
+            for i in range(3):
+                notifier.enqueue(["a@example.com"], f"alert {i}")
+            notifier.enqueue(["b@example.com", "c@example.com"], "shared")
+
+            for _ in range(100):
+                if notifier.sent_count:
+                    break
+                await asyncio.sleep(0.01)
+            await notifier.stop()
+
+        assert notifier.sent_count == 2
+        # 제한 초과 수신자는 다음 묶음으로 이월
+        assert notifier.pending == {"c@example.com": 1}
+        first = messages[0]
+        assert first["To"] == "a@example.com"
+        assert first["Subject"].endswith("3 alert(s)")
+        assert first.get_payload().splitlines() == [
+            "alert 0",
+            "alert 1",
+            "... and 1 more",
+        ]
+        assert messages[1]["To"] == "b@example.com"
+
+    @pytest.mark.asyncio
+    async def test_failed_send_keeps_alerts(self, monkeypatch):
+        async with smtp_server() as (port, _):
+            pass  # 닫힌 포트
+        monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+        monkeypatch.setattr(settings, "SMTP_PORT", port)
+        monkeypatch.setattr(settings, "EMAIL_FROM", "archive@example.com")
+        monkeypatch.setattr(settings, "ALERT_BATCH_SECONDS", 60)
+
+        notifier = EmailNotifier()
+        notifier.enqueue(["a@example.com"], "alert")
+        with pytest.raises(OSError):
+            await notifier.flush()
+        await notifier.stop()
+
+        assert notifier.pending == {"a@example.com": 1}
+        assert notifier.sent_count == 0
@@ -0,0 +1,119 @@
+"""
+합성 아카이브 생성기 / 벤치마크 러너 테스트
+
+테스트 케이스:
+- 같은 seed → 같은 아카이브, 폴더 합계가 하위 파일 합과 일치
+- 실제 트리 + 가짜 ffprobe로 스캐너가 미디어 정보 추출
+- 시트 값이 동기화 서비스 파서로 그대로 읽힘
+- 소규모 end-to-end 실행 결과 JSON 구조
+"""
+
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.services.hand_analysis_sync import HandAnalysisSyncService
+from app.services.scanner import ArchiveScanner
+from app.services.sheets_sync import SheetsSyncService
+from benchmarks.run import run_benchmarks
+from benchmarks.synthetic import (
+    ArchiveSpec,
+    fake_ffprobe,
+    hand_sheets,
+    iter_archive,
+    work_status_sheet,
+    write_tree,
+)
+
+
+class TestGenerator:
+    """iter_archive() 테스트"""
+
+    @pytest.mark.parametrize("depth", [2, 5, 8])
+    def test_deterministic_with_consistent_totals(self, depth):
+        spec = ArchiveSpec(files=3000, depth=depth, files_per_folder=20)
+        rows = list(iter_archive(spec))
+        assert rows == list(iter_archive(spec))
+
+        files = [row for kind, row in rows if kind == "file"]
+        folders = {row["path"]: row for kind, row in rows if kind == "folder"}
+        assert len(files) == 3000
+        assert len({f["path"] for f in files}) == 3000
+
+        root = folders[spec.root]
+        assert root["depth"] == 0 and root["parent_path"] is None
+        assert root["file_count"] == 3000
+        assert root["total_size"] == sum(f["size"] for f in files)
+        assert root["folder_count"] == len(folders) - 1
+        assert max(f["depth"] for f in folders.values()) == depth
+        # post-order: 루트가 마지막
+        assert rows[-1] == ("folder", root)
+
+    def test_realistic_names(self):
+        spec = ArchiveSpec(files=500, depth=3)
+        paths = [row["path"] for kind, row in iter_archive(spec) if kind == "folder"]
+        assert "/archive/WSOP" in paths
+        assert any(p.startswith("/archive/HCL/") for p in paths)
+
+
+class TestFakeInputs:
+    """실제 트리 / 가짜 ffprobe / 시트 값 테스트"""
+
+    def test_scanner_reads_fake_ffprobe(self, tmp_path):
+        spec = ArchiveSpec(files=20, depth=2, root=str(tmp_path / "nas"))
+        assert write_tree(spec) == 20
+        media = next(
+            row
+            for kind, row in iter_archive(spec)
+            if kind == "file" and row["video_codec"]
+        )
+
+        scanner = ArchiveScanner(db=None, state={}, writer=object())
+        with fake_ffprobe(latency=0.01):
+            info = scanner._get_media_info(media["path"])
+        assert info["duration"] >= 600
+        assert info["video_codec"] and info["audio_codec"]
+
+    def test_sheet_values_parse(self):
+        spec = ArchiveSpec(files=2000, depth=3)
+
+        work_records = SheetsSyncService()._parse_records(work_status_sheet(spec))
+        assert work_records and {"Archive", "Category", "Total"} <= set(work_records[0])
+
+        service = HandAnalysisSyncService()
+        title, values = next(iter(hand_sheets(spec).items()))
+        total, records, failed = service._parse_worksheet(title, values)
+        assert total == len(records) == len(values) - 1
+        assert not failed
+        record = next(iter(records.values()))
+        assert record["timecode_out_sec"] > record["timecode_in_sec"]
+        assert json.loads(record["player_tags"])
+
+
+class TestRunner:
+    """run_benchmarks() 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_small_run_reports_json(self, monkeypatch):
+        monkeypatch.setattr(settings, "HTTP_CACHE_ENABLED", True)
+        report = await run_benchmarks(
+            ArchiveSpec(files=200, depth=2),
+            ["seed", "sync", "endpoints"],
+            endpoints=["/api/stats/summary", "/api/hands?limit=1000"],
+            iterations=2,
+        )
+
+        results = report["results"]
+        assert report["meta"]["spec"]["files"] == 200
+        assert results["seed"]["rows"]["file_stats"] == 200
+        assert results["sync"]["hands_initial"]["created"] == (
+            results["sync"]["hand_rows"]
+        )
+        assert results["sync"]["hands_unchanged"]["created"] == 0
+        summary = results["endpoints"]["/api/stats/summary"]
+        assert summary["status"] == 200
+        assert summary["min_ms"] <= summary["p50_ms"] <= summary["max_ms"]
+        # 벤치마크 중에만 HTTP 캐시 비활성
+        assert settings.HTTP_CACHE_ENABLED
+        json.dumps(report, default=str)
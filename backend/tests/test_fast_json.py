@@ -0,0 +1,152 @@
+"""
+대용량 응답 직렬화 fast path / 압축 테스트
+
+테스트 케이스:
+- /progress/tree, /hands: fast path 응답이 기존 경로와 동일한 스키마/값
+- 큰 응답만 gzip, 작은 응답/스트리밍 응답은 그대로
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.core.database import Base, get_read_db
+from app.core.fast_json import CompressionMiddleware, FastJSONResponse
+from app.models.file_stats import FolderStats
+from app.models.hand_analysis import HandAnalysis
+from app.services.shared_state import MemoryStateBackend
+
+
+@asynccontextmanager
+async def app_client():
+    """폴더/핸드가 시드된 in-memory DB로 앱 클라이언트 (HTTP 캐시 비활성)"""
+    from app.main import app
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        db.add_all(
+            [
+                FolderStats(path="/a", name="a", depth=0, file_count=2, total_size=300),
+                FolderStats(
+                    path="/a/WSOP",
+                    name="WSOP",
+                    parent_path="/a",
+                    depth=1,
+                    file_count=2,
+                    total_size=300,
+                ),
+            ]
+        )
+        db.add_all(
+            HandAnalysis(
+                file_name=f"WSOP_{i}.mp4",
+                timecode_in=f"00:0{i}:00",
+                timecode_in_sec=i * 60.0,
+                timecode_out_sec=i * 60.0 + 30,
+                file_no=i,
+                hand_grade="★★",
+                player_tags='["ivey"]',
+                source_worksheet="2024 WSOPC LA",
+            )
+            for i in range(5)
+        )
+        await db.commit()
+
+    async def override_get_db():
+        async with AsyncSession(engine) as db:
+            yield db
+
+    app.dependency_overrides[get_read_db] = override_get_db
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_read_db, None)
+        await engine.dispose()
+
+
+class TestFastPath:
+    """FAST_JSON_ENABLED 응답 스키마 동일성"""
+
+    @pytest.fixture(autouse=True)
+    def no_http_cache(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.services.data_generation.shared_state", MemoryStateBackend()
+        )
+        monkeypatch.setattr(settings, "HTTP_CACHE_ENABLED", False)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/progress/tree?depth=3",
+            "/api/progress/tree?depth=3&stats_schema=compact",
+            "/api/hands?limit=3&offset=1",
+            "/api/hands?grade=★★&file_name=WSOP_4",
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_same_body_as_standard_path(self, url, monkeypatch):
+        async with app_client() as client:
+            standard = await client.get(url)
+            monkeypatch.setattr(settings, "FAST_JSON_ENABLED", True)
+            fast = await client.get(url)
+
+        assert fast.status_code == standard.status_code == 200
+        assert fast.json() == standard.json()
+        assert fast.headers.get("vary") == standard.headers.get("vary")
+
+
+def make_app():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/big")
+    async def big():
+        return FastJSONResponse({"items": ["x" * 100] * 1000})
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                yield "y" * 50000 + "\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return app
+
+
+class TestCompression:
+    """CompressionMiddleware 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_only_large_complete_responses(self, monkeypatch):
+        monkeypatch.setattr(settings, "RESPONSE_COMPRESSION_ENABLED", True)
+        monkeypatch.setattr(settings, "RESPONSE_COMPRESSION_MIN_BYTES", 1024)
+        transport = ASGITransport(app=make_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            big = await client.get("/big", headers={"Accept-Encoding": "gzip"})
+            small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+            stream = await client.get("/stream", headers={"Accept-Encoding": "gzip"})
+            plain = await client.get("/big", headers={"Accept-Encoding": "identity"})
+
+        assert big.headers["content-encoding"] == "gzip"
+        assert big.headers["vary"] == "Accept-Encoding"
+        assert int(big.headers["content-length"]) < len(plain.content)
+        assert big.json() == plain.json()
+
+        for res in (small, stream, plain):
+            assert "content-encoding" not in res.headers
+        assert len(stream.content) == 150003
@@ -0,0 +1,98 @@
+"""
+폴더별 증가 히스토리 테스트
+
+테스트 케이스:
+- 스캔 전후 합계가 바뀐 폴더만 delta 기록 (변경 없으면 None)
+- /folders/growth: 기간 내 delta 합계 → 증가한 폴더만 내림차순
+- /folders/growth/series: 폴더별 스캔 시점 합계
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.folders import get_folder_growth_series, get_top_growing_folders
+from app.models.file_stats import FolderStats, FolderStatsDelta
+from app.services.scanner import ArchiveScanner
+
+
+def delta(path, days_ago, size_delta, total_size, depth=1, files=1):
+    return FolderStatsDelta(
+        folder_path=path,
+        depth=depth,
+        scanned_at=datetime.utcnow() - timedelta(days=days_ago),
+        size_delta=size_delta,
+        file_count_delta=files,
+        duration_delta=0.0,
+        total_size=total_size,
+        file_count=files,
+    )
+
+
+class TestFolderDelta:
+    """ArchiveScanner._folder_delta() 테스트"""
+
+    def test_changed_and_unchanged(self):
+        scanner = ArchiveScanner(db=None, state={}, scan_id=7)
+        stats = {"total_size": 1500, "file_count": 3, "total_duration": 30.2}
+
+        row = scanner._folder_delta("/archive/WSOP", 1, stats, (1000, 2, 30.0))
+        assert row["scan_id"] == 7
+        assert row["scanned_at"] == scanner.started_at
+        assert (row["size_delta"], row["file_count_delta"]) == (500, 1)
+        assert (row["total_size"], row["file_count"]) == (1500, 3)
+
+        # 새 폴더 → 전체가 증가분
+        new = scanner._folder_delta("/archive/New", 1, stats, None)
+        assert new["size_delta"] == 1500
+
+        # 합계 동일 (duration 미세 차이 포함) → 기록 없음
+        assert scanner._folder_delta("/archive/WSOP", 1, stats, (1500, 3, 30.0)) is None
+
+
+class TestGrowthEndpoints:
+    """GET /folders/growth, /folders/growth/series 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_top_growing(self, db):
+        db.add_all(
+            [
+                FolderStats(path="/archive/WSOP", name="WSOP", total_size=900),
+                delta("/archive/WSOP", 20, 300, 600),
+                delta("/archive/WSOP", 5, 300, 900),
+                delta("/archive/HCL", 5, 500, 500),
+                delta("/archive/HCL", 100, 10_000, 10_000),
+                delta("/archive/Old", 3, -200, 100),
+                delta("/archive", 5, 800, 1400, depth=0),
+            ]
+        )
+        await db.commit()
+
+        growth = await get_top_growing_folders(days=30, depth=1, limit=20, db=db)
+        top = await get_top_growing_folders(days=30, depth=None, limit=1, db=db)
+
+        assert [(g.path, g.size_delta, g.changes) for g in growth] == [
+            ("/archive/WSOP", 600, 2),
+            ("/archive/HCL", 500, 1),
+        ]
+        assert growth[0].name == "WSOP"
+        assert growth[0].current_size == 900
+        assert growth[1].current_size is None
+        assert [g.path for g in top] == ["/archive"]
+
+    @pytest.mark.asyncio
+    async def test_series(self, db):
+        db.add_all(
+            [
+                delta("/archive/WSOP", 5, 300, 900),
+                delta("/archive/WSOP", 20, 300, 600),
+                delta("/archive/WSOP", 400, 600, 600),
+                delta("/archive/HCL", 5, 500, 500),
+            ]
+        )
+        await db.commit()
+        series = await get_folder_growth_series(path="/archive/WSOP", days=365, db=db)
+
+        assert series.path == "/archive/WSOP"
+        assert [p.total_size for p in series.points] == [600, 900]
+        assert series.points[0].scanned_at < series.points[1].scanned_at
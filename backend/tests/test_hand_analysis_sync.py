@@ -0,0 +1,339 @@
+"""
+Hand Analysis 동기화 diff 파이프라인 테스트
+
+테스트 케이스:
+- 신규/변경/미변경/삭제 행 분류
+- 중복 키 행 정리
+- bulk INSERT/UPDATE/DELETE 적용 (in-memory SQLite)
+- fingerprint 동일 워크시트 skip
+- 파싱 실패/빈 시트 삭제 방지, source_row 변경 무시
+- 워크시트 batch fetch
+- writer 슬롯은 워크시트 단위 (워크시트마다 commit)
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.database import Base, DatabaseWriter
+from app.models.hand_analysis import HandAnalysis
+from app.services.hand_analysis_sync import HandAnalysisSyncService
+from app.services.shared_state import MemoryStateBackend
+from app.services.sheets_fetch import fetch_worksheet_values
+from app.services.sync_fingerprint import load_fingerprints
+
+WS = "2024 WSOPC LA"
+
+
+def make_record(file_name: str, file_no: int, out: str = "0:10:00", row: int = 2):
+    """_parse_row() 결과와 동일한 형태의 레코드"""
+    service = HandAnalysisSyncService()
+    return {
+        "file_name": file_name,
+        "nas_path": None,
+        "timecode_in": "0:00:00",
+        "timecode_out": out,
+        "timecode_in_sec": 0.0,
+        "timecode_out_sec": service._parse_timecode(out),
+        "file_no": file_no,
+        "hand_grade": None,
+        "winner": None,
+        "hands": None,
+        "player_tags": None,
+        "poker_play_tags": None,
+        "source_worksheet": WS,
+        "source_row": row,
+    }
+
+
+class TestWorksheetDiffPlan:
+    """메모리 diff 계산 테스트"""
+
+    def setup_method(self):
+        self.service = HandAnalysisSyncService()
+
+    def _keyed(self, *records):
+        return {self.service._record_key(r): r for r in records}
+
+    def test_classifies_insert_update_unchanged_delete(self):
+        """신규/변경/미변경/삭제 분류"""
+        existing = [
+            {"id": 1, **make_record("a.mp4", 1)},
+            {"id": 2, **make_record("a.mp4", 2)},
+            {"id": 3, **make_record("gone.mp4", 1)},
+        ]
+        records = self._keyed(
+            make_record("a.mp4", 1),  # unchanged
+            make_record("a.mp4", 2, out="0:20:00"),  # updated
+            make_record("b.mp4", 1),  # new
+        )
+
+        inserts, updates, delete_ids, unchanged = self.service._plan_worksheet_diff(
+            existing, records
+        )
+
+        assert [r["file_name"] for r in inserts] == ["b.mp4"]
+        assert [u["id"] for u in updates] == [2]
+        assert updates[0]["timecode_out_sec"] == 1200.0
+        assert delete_ids == [3]
+        assert unchanged == 1
+
+    def test_duplicate_existing_keys_are_deleted(self):
+        """과거 중복 키 행은 첫 행만 남기고 삭제"""
+        existing = [
+            {"id": 10, **make_record("a.mp4", 1)},
+            {"id": 11, **make_record("a.mp4", 1)},
+        ]
+        records = self._keyed(make_record("a.mp4", 1))
+
+        inserts, updates, delete_ids, unchanged = self.service._plan_worksheet_diff(
+            existing, records
+        )
+
+        assert inserts == []
+        assert updates == []
+        assert delete_ids == [11]
+        assert unchanged == 1
+
+    def test_null_file_no_is_a_valid_key(self):
+        """file_no가 없는 행도 키로 매칭"""
+        existing = [{"id": 1, **make_record("a.mp4", None)}]
+        records = self._keyed(make_record("a.mp4", None))
+
+        _, _, delete_ids, unchanged = self.service._plan_worksheet_diff(
+            existing, records
+        )
+
+        assert delete_ids == []
+        assert unchanged == 1
+
+
+class TestApplyWorksheetDiff:
+    """bulk 적용 테스트 (in-memory SQLite)"""
+
+    @pytest.mark.asyncio
+    async def test_apply_twice_is_idempotent(self, db):
+        service = HandAnalysisSyncService()
+        first = {
+            service._record_key(r): r
+            for r in [make_record("a.mp4", 1), make_record("a.mp4", 2)]
+        }
+        second = {
+            service._record_key(r): r
+            for r in [make_record("a.mp4", 1, out="0:30:00"), make_record("c.mp4", 1)]
+        }
+
+        counts = await service._apply_worksheet_diff(db, WS, first)
+        assert counts["created"] == 2
+
+        counts = await service._apply_worksheet_diff(db, WS, first)
+        assert counts["unchanged"] == 2
+        assert counts["created"] == counts["updated"] == counts["deleted"] == 0
+
+        counts = await service._apply_worksheet_diff(db, WS, second)
+        assert (counts["created"], counts["updated"], counts["deleted"]) == (1, 1, 1)
+        await db.commit()
+
+        total = await db.scalar(select(func.count(HandAnalysis.id)))
+        assert total == 2
+        max_out = await db.scalar(
+            select(HandAnalysis.timecode_out_sec).where(
+                HandAnalysis.file_name == "a.mp4"
+            )
+        )
+        assert max_out == 1800.0
+
+
+class TestWorksheetFingerprint:
+    """fingerprint 기반 워크시트 skip 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_worksheet_is_skipped(self, db):
+        service = HandAnalysisSyncService()
+        values = [
+            ["File Name", "In", "Out", "File No"],
+            ["a.mp4", "0:00:00", "0:10:00", "1"],
+            ["a.mp4", "0:10:00", "0:20:00", "2"],
+        ]
+
+        stored = await load_fingerprints(db, service.FINGERPRINT_SOURCE)
+        counts = await service._sync_worksheet(db, WS, values, stored)
+        await db.commit()
+        assert (counts["created"], counts["skipped"]) == (2, 0)
+
+        stored = await load_fingerprints(db, service.FINGERPRINT_SOURCE)
+        counts = await service._sync_worksheet(db, WS, values, stored)
+        assert counts["skipped"] == 1
+        assert counts["synced"] == counts["unchanged"] == 2
+
+        # force=True면 fingerprint 무시
+        counts = await service._sync_worksheet(db, WS, values, stored, force=True)
+        assert (counts["skipped"], counts["unchanged"]) == (0, 2)
+
+        # 내용이 바뀌면 재동기화
+        values = values[:2]
+        counts = await service._sync_worksheet(db, WS, values, stored)
+        await db.commit()
+        assert (counts["skipped"], counts["deleted"]) == (0, 1)
+        assert stored[WS].record_count == 1
+
+
+class TestDeleteSafety:
+    """삭제 전파 안전장치 테스트"""
+
+    def setup_method(self):
+        self.service = HandAnalysisSyncService()
+
+    def test_failed_row_keys_are_not_deleted(self):
+        """파싱 실패 행의 기존 DB 행은 유지"""
+        existing = [
+            {"id": 1, **make_record("a.mp4", 1)},
+            {"id": 2, **make_record("broken.mp4", 1)},
+        ]
+        records = {self.service._record_key(r): r for r in [make_record("a.mp4", 1)]}
+
+        _, _, delete_ids, _ = self.service._plan_worksheet_diff(
+            existing, records, keep_keys={("broken.mp4", WS, 1)}
+        )
+
+        assert delete_ids == []
+
+    def test_no_valid_rows_keeps_existing(self):
+        """유효 레코드가 하나도 없으면 삭제 전파 안 함"""
+        existing = [{"id": 1, **make_record("a.mp4", 1)}]
+
+        _, _, delete_ids, _ = self.service._plan_worksheet_diff(existing, {})
+
+        assert delete_ids == []
+
+    def test_shifted_source_row_is_not_an_update(self):
+        """행 삽입으로 source_row만 밀린 경우 변경으로 보지 않음"""
+        existing = [{"id": 1, **make_record("a.mp4", 1, row=2)}]
+        records = {
+            self.service._record_key(r): r for r in [make_record("a.mp4", 1, row=3)]
+        }
+
+        _, updates, _, unchanged = self.service._plan_worksheet_diff(existing, records)
+
+        assert updates == []
+        assert unchanged == 1
+
+    def test_parse_failure_key_is_tracked(self):
+        """_parse_row 예외 시 원본 행에서 키를 추정"""
+        service = self.service
+        original = service._parse_row
+
+        def flaky(headers, row, ws, row_number):
+            if row[0] == "broken.mp4":
+                raise ValueError("bad row")
+            return original(headers, row, ws, row_number)
+
+        service._parse_row = flaky
+        parsed = service._parse_worksheet(
+            WS,
+            [
+                ["File Name", "In", "Out", "File No"],
+                ["a.mp4", "0:00:00", "0:10:00", "1"],
+                ["broken.mp4", "0:00:00", "0:10:00", "3"],
+            ],
+        )
+
+        total, records, failed_keys = parsed
+        assert total == 2
+        assert list(records) == [("a.mp4", WS, 1)]
+        assert failed_keys == {("broken.mp4", WS, 3)}
+
+
+class FakeSpreadsheet:
+    """gspread.Spreadsheet 대역 (values_batch_get 호출 기록)"""
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.calls = []
+
+    def values_batch_get(self, ranges):
+        self.calls.append(ranges)
+        return {
+            "valueRanges": [
+                {"range": r, "values": self.sheets[r.strip("'")]} for r in ranges
+            ]
+        }
+
+
+class TestBatchFetch:
+    """fetch_worksheet_values() 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_pads_like_get_all_values(self):
+        sheets = {
+            f"WS{i}": [["File Name", "In", "Out"], [f"{i}.mp4", "0:00:01"]]
+            for i in range(5)
+        }
+        spreadsheet = FakeSpreadsheet(sheets)
+
+        values = await fetch_worksheet_values(
+            spreadsheet, list(sheets), batch_size=2, concurrency=2
+        )
+
+        assert list(values) == list(sheets)
+        assert len(spreadsheet.calls) == 3
+        # 짧은 행은 ""로 채움 (get_all_values와 동일)
+        assert values["WS3"][1] == ["3.mp4", "0:00:01", ""]
+
+
+class RecordingWriter(DatabaseWriter):
+    """writer 슬롯 진입 횟수 기록"""
+
+    def __init__(self, session_maker):
+        super().__init__(session_maker)
+        self.sessions = 0
+
+    @asynccontextmanager
+    async def session(self):
+        self.sessions += 1
+        async with super().session() as db:
+            yield db
+
+
+class TestWriterSlot:
+    """sync()의 writer 슬롯 범위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_writer_is_taken_per_worksheet(self, monkeypatch):
+        sheets = {
+            title: [
+                ["File Name", "In", "Out", "File No"],
+                [f"{title}.mp4", "0:00:00", "0:10:00", "1"],
+            ]
+            for title in ("WS1", "WS2")
+        }
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            writer = RecordingWriter(async_sessionmaker(engine, expire_on_commit=False))
+            state = MemoryStateBackend()
+            monkeypatch.setattr("app.services.hand_analysis_sync.db_writer", writer)
+            monkeypatch.setattr("app.services.hand_analysis_sync.shared_state", state)
+            monkeypatch.setattr("app.services.data_generation.shared_state", state)
+
+            service = HandAnalysisSyncService()
+            monkeypatch.setattr(
+                service, "_open_sheet", lambda: (FakeSpreadsheet(sheets), list(sheets))
+            )
+            result = await service.sync()
+
+            async with AsyncSession(engine) as db:
+                total = await db.scalar(select(func.count(HandAnalysis.id)))
+                stored = await load_fingerprints(db, service.FINGERPRINT_SOURCE)
+        finally:
+            await engine.dispose()
+
+        assert result.success and result.created_count == 2
+        # 워크시트마다 슬롯을 잡고 놓음 (전체 동기화 동안 독점하지 않음)
+        assert writer.sessions == 2
+        assert not writer._lock.locked()
+        assert total == 2
+        assert set(stored) == {"WS1", "WS2"}
@@ -0,0 +1,301 @@
+"""
+핸드 태그 정규화 / 태그 조회 테스트
+
+테스트 케이스:
+- 동기화가 태그 사전/연결 유지 (추가/변경/삭제, 표기만 다른 태그는 한 태그)
+- 태그 교집합(all) / 합집합(any) 필터, 워크시트 범위, GET /hands 태그 필터
+- 태그 facet: 워크시트/폴더 범위, 태그 필터 결과의 다른 태그 분포
+- migration 0008 backfill
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from app.api.hands import get_hand_tags, get_hands
+from app.core.config import settings
+from app.models.file_stats import FileStats
+from app.models.hand_analysis import HandAnalysis, HandTag, HandTagLink
+from app.services.hand_analysis_sync import HandAnalysisSyncService
+from app.services.hand_facets import hand_facets
+from app.services.hand_tags import hand_tag_service, normalize_tag, parse_tag_filter
+from app.services.shared_state import MemoryStateBackend
+
+WS = "2024 WSOPC LA"
+OTHER_WS = "HCL 2023"
+
+
+def make_record(file_name, file_no, players=(), plays=(), worksheet=WS):
+    """_parse_row() 결과와 동일한 형태의 레코드"""
+    return {
+        "file_name": file_name,
+        "nas_path": None,
+        "timecode_in": "0:00:00",
+        "timecode_out": "0:10:00",
+        "timecode_in_sec": 0.0,
+        "timecode_out_sec": 600.0,
+        "file_no": file_no,
+        "hand_grade": None,
+        "winner": None,
+        "hands": None,
+        "player_tags": json.dumps(list(players)) if players else None,
+        "poker_play_tags": json.dumps(list(plays)) if plays else None,
+        "source_worksheet": worksheet,
+        "source_row": file_no + 1,
+    }
+
+
+async def apply(db, worksheet, *records):
+    service = HandAnalysisSyncService()
+    counts = await service._apply_worksheet_diff(
+        db, worksheet, {service._record_key(r): r for r in records}
+    )
+    await db.commit()
+    return counts
+
+
+async def seed(db):
+    await apply(
+        db,
+        WS,
+        make_record("a.mp4", 1, ["Ivey", "Negreanu"], ["bluff"]),
+        make_record("a.mp4", 2, ["ivey"], ["fold"]),
+        make_record("b.mp4", 1, ["Negreanu"], ["bluff", "hero call"]),
+        make_record("b.mp4", 2),
+    )
+    await apply(
+        db,
+        OTHER_WS,
+        make_record("c.mp4", 1, [" IVEY "], ["bluff"], worksheet=OTHER_WS),
+    )
+    db.add_all(
+        [
+            FileStats(path="/WSOP/a.mp4", name="a.mp4", folder_path="/WSOP", size=1),
+            FileStats(path="/HCL/c.mp4", name="c.mp4", folder_path="/HCL", size=1),
+        ]
+    )
+    await db.commit()
+
+
+async def matching_files(db, tags, match="all", worksheet=None):
+    result = await db.execute(
+        select(HandAnalysis.file_name, HandAnalysis.file_no)
+        .where(
+            HandAnalysis.id.in_(hand_tag_service.matching_hands(tags, match, worksheet))
+        )
+        .order_by(HandAnalysis.file_name, HandAnalysis.file_no)
+    )
+    return [tuple(row) for row in result]
+
+
+async def tag_facets(db, **params):
+    params = {
+        "kind": None,
+        "worksheet": None,
+        "folder": None,
+        "player_tags": None,
+        "play_tags": None,
+        "tag_match": "all",
+        "limit": 50,
+        **params,
+    }
+    response = await get_hand_tags(db=db, **params)
+    return response.total_hands, {
+        (tag.kind, tag.name): tag.count for tag in response.tags
+    }
+
+
+class TestTagParsing:
+    """정규화 / 필터 파라미터 테스트"""
+
+    def test_normalize_and_filter(self):
+        assert normalize_tag("  Phil   IVEY ") == "phil ivey"
+        assert parse_tag_filter("Ivey, ivey ,,negreanu", "Bluff") == [
+            ("player", "ivey"),
+            ("player", "negreanu"),
+            ("play", "bluff"),
+        ]
+        assert parse_tag_filter(None, " , ") == []
+
+
+class TestTagSync:
+    """동기화 → 태그 사전/연결 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_links_follow_sheet_changes(self, db):
+        await seed(db)
+        tags = (await db.execute(select(HandTag))).scalars().all()
+        # 표기만 다른 "Ivey" / "ivey" / " IVEY "는 한 태그 (label은 처음 본 표기)
+        assert {(t.kind, t.name, t.label) for t in tags} == {
+            ("player", "ivey", "Ivey"),
+            ("player", "negreanu", "Negreanu"),
+            ("play", "bluff", "bluff"),
+            ("play", "fold", "fold"),
+            ("play", "hero call", "hero call"),
+        }
+        assert await db.scalar(select(HandTagLink).limit(1)) is not None
+
+        # 태그 변경 + 행 삭제 → 해당 워크시트 연결만 다시 계산, 고아 태그 정리
+        await apply(
+            db,
+            WS,
+            make_record("a.mp4", 1, ["Ivey"], ["bluff"]),
+            make_record("a.mp4", 2, ["ivey"], ["fold"]),
+        )
+        await hand_tag_service.prune_tags(db)
+        await db.commit()
+
+        total, counts = await tag_facets(db)
+        assert total == 3
+        assert counts == {
+            ("player", "ivey"): 3,
+            ("play", "bluff"): 2,
+            ("play", "fold"): 1,
+        }
+        names = (await db.execute(select(HandTag.name))).scalars().all()
+        assert sorted(names) == ["bluff", "fold", "ivey"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sheet_keeps_links(self, db):
+        await seed(db)
+        before = (await db.execute(select(HandTagLink.hand_id))).all()
+        counts = await apply(
+            db,
+            OTHER_WS,
+            make_record("c.mp4", 1, [" IVEY "], ["bluff"], worksheet=OTHER_WS),
+        )
+        after = (await db.execute(select(HandTagLink.hand_id))).all()
+
+        assert counts["unchanged"] == 1
+        assert sorted(before) == sorted(after)
+
+
+class TestTagFilter:
+    """교집합 / 합집합 필터 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_intersection_union_and_worksheet(self, db):
+        await seed(db)
+        ivey_bluff = [("player", "ivey"), ("play", "bluff")]
+
+        assert await matching_files(db, ivey_bluff) == [
+            ("a.mp4", 1),
+            ("c.mp4", 1),
+        ]
+        assert await matching_files(db, ivey_bluff, worksheet=WS) == [("a.mp4", 1)]
+        assert await matching_files(
+            db, [("play", "fold"), ("play", "hero call")], "any"
+        ) == [("a.mp4", 2), ("b.mp4", 1)]
+        # 없는 태그: all은 결과 없음, any는 나머지 태그로
+        unknown = [("player", "ivey"), ("player", "nobody")]
+        assert await matching_files(db, unknown) == []
+        assert len(await matching_files(db, unknown, "any")) == 3
+
+    @pytest.mark.asyncio
+    async def test_hands_endpoint_filter(self, monkeypatch, db):
+        monkeypatch.setattr(settings, "FAST_JSON_ENABLED", False)
+        monkeypatch.setattr(
+            "app.services.data_generation.shared_state", MemoryStateBackend()
+        )
+        params = {
+            "worksheet": None,
+            "file_name": None,
+            "grade": None,
+            "player_tags": "ivey",
+            "play_tags": "bluff",
+            "tag_match": "all",
+            "limit": 1,
+            "offset": 0,
+            "cursor": None,
+            "count": False,
+        }
+        await seed(db)
+        hand_facets.invalidate()
+        first = await get_hands(db=db, **params)
+        second = await get_hands(
+            db=db, **{**params, "cursor": first.next_cursor, "count": True}
+        )
+
+        # 태그 필터 개수는 count=true일 때만
+        assert first.total_count is None
+        assert second.total_count == 2
+        assert [h.file_name for h in first.items + second.items] == [
+            "a.mp4",
+            "c.mp4",
+        ]
+        assert second.next_cursor is None
+
+
+class TestTagFacets:
+    """GET /hands/tags 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_scopes(self, db):
+        await seed(db)
+
+        total, counts = await tag_facets(db, kind="player", worksheet=WS)
+        assert total == 4  # 태그 없는 핸드 포함
+        assert counts == {("player", "ivey"): 2, ("player", "negreanu"): 2}
+
+        total, counts = await tag_facets(db, folder="/HCL")
+        assert total == 1
+        assert counts == {("player", "ivey"): 1, ("play", "bluff"): 1}
+
+        # ivey + bluff 핸드에 함께 붙은 태그
+        total, counts = await tag_facets(db, player_tags="IVEY", play_tags="bluff")
+        assert total == 2
+        assert counts == {
+            ("player", "ivey"): 2,
+            ("play", "bluff"): 2,
+            ("player", "negreanu"): 1,
+        }
+
+
+class TestBackfillMigration:
+    """migration 0008 backfill 테스트"""
+
+    def test_backfill_existing_hands(self, tmp_path):
+        from alembic import command
+        from alembic.config import Config
+
+        from app.core.database import ALEMBIC_INI
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'tags.db'}")
+
+        def upgrade(conn, revision):
+            config = Config(str(ALEMBIC_INI))
+            config.set_main_option(
+                "script_location", str(ALEMBIC_INI.parent / "migrations")
+            )
+            config.attributes["connection"] = conn
+            command.upgrade(config, revision)
+
+        try:
+            with engine.begin() as conn:
+                upgrade(conn, "0007")
+                conn.execute(
+                    text(
+                        "INSERT INTO hand_analyses "
+                        "(file_name, source_worksheet, timecode_in_sec, "
+                        "player_tags, poker_play_tags) VALUES "
+                        "('a.mp4', :ws, 0, :players, :plays), "
+                        "('b.mp4', :ws, 0, NULL, 'not json')"
+                    ),
+                    {"ws": WS, "players": '["Ivey", "ivey"]', "plays": '["bluff"]'},
+                )
+                upgrade(conn, "0008")
+                tags = conn.execute(
+                    text("SELECT kind, name, label FROM hand_tags ORDER BY kind")
+                ).all()
+                links = conn.execute(
+                    text("SELECT source_worksheet FROM hand_tag_links")
+                ).all()
+        finally:
+            engine.dispose()
+
+        assert [tuple(t) for t in tags] == [
+            ("play", "bluff", "bluff"),
+            ("player", "ivey", "Ivey"),
+        ]
+        assert [tuple(link) for link in links] == [(WS,), (WS,)]
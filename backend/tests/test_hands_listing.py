@@ -0,0 +1,150 @@
+"""
+핸드 목록 keyset 페이지 / facet 테스트
+
+테스트 케이스:
+- cursor로 끝까지 넘기면 offset 순서와 같은 전체 목록 (중복/누락 없음)
+- 워크시트/등급 필터 + cursor, 전체 개수는 facet에서
+- facet은 hands generation이 바뀔 때만 다시 집계
+- file_name 검색 개수는 count=true일 때만
+"""
+
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.hands import get_hands
+from app.core.config import settings
+from app.models.hand_analysis import HandAnalysis
+from app.services.data_generation import data_generation
+from app.services.hand_facets import hand_facets
+from app.services.shared_state import MemoryStateBackend
+
+
+async def seed(db):
+    """워크시트 2개 × 핸드 10개"""
+    db.add_all(
+        HandAnalysis(
+            file_name=f"{worksheet[:4]}_{i % 3}.mp4",
+            timecode_in_sec=float(i % 2) * 60,
+            hand_grade="★★" if i % 4 == 0 else "★",
+            source_worksheet=worksheet,
+        )
+        for worksheet in ("2024 WSOPC LA", "HCL 2023")
+        for i in range(10)
+    )
+    await db.commit()
+    hand_facets.invalidate()
+
+
+async def list_hands(db, **params):
+    params = {
+        "worksheet": None,
+        "file_name": None,
+        "grade": None,
+        "player_tags": None,
+        "play_tags": None,
+        "tag_match": "all",
+        "limit": 100,
+        "offset": 0,
+        "cursor": None,
+        "count": False,
+        **params,
+    }
+    response = await get_hands(db=db, **params)
+    if settings.FAST_JSON_ENABLED:
+        return json.loads(response.body)
+    return response.model_dump()
+
+
+async def walk(db, limit, **params):
+    """cursor로 마지막 페이지까지 → (id 목록, 페이지 수)"""
+    ids, pages, cursor = [], 0, None
+    while True:
+        page = await list_hands(db, limit=limit, cursor=cursor, **params)
+        ids += [item["id"] for item in page["items"]]
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+
+@pytest.fixture(autouse=True)
+def memory_generation(monkeypatch):
+    monkeypatch.setattr(
+        "app.services.data_generation.shared_state", MemoryStateBackend()
+    )
+
+
+class TestKeyset:
+    """GET /hands cursor 페이지 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fast_json", [False, True])
+    async def test_cursor_walk_matches_offset_order(self, monkeypatch, fast_json, db):
+        monkeypatch.setattr(settings, "FAST_JSON_ENABLED", fast_json)
+        await seed(db)
+        everything = await list_hands(db)
+        ids, pages = await walk(db, limit=3)
+        offset_page = await list_hands(db, limit=3, offset=3)
+
+        assert everything["next_cursor"] is None
+        assert everything["total_count"] == 20
+        assert ids == [item["id"] for item in everything["items"]]
+        assert pages == 7
+        assert [item["id"] for item in offset_page["items"]] == ids[3:6]
+
+    @pytest.mark.asyncio
+    async def test_filters(self, db):
+        await seed(db)
+        expected = [
+            item["id"]
+            for item in (await list_hands(db))["items"]
+            if item["source_worksheet"] == "HCL 2023" and item["hand_grade"] == "★"
+        ]
+        page = await list_hands(db, worksheet="HCL 2023", grade="★", limit=2)
+        ids, _ = await walk(db, limit=2, worksheet="HCL 2023", grade="★")
+        grade_ids, _ = await walk(db, limit=4, grade="★★")
+
+        assert ids == expected
+        assert page["total_count"] == 7
+        assert len(grade_ids) == 6
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, db):
+        await seed(db)
+        with pytest.raises(HTTPException) as error:
+            await list_hands(db, cursor="not-a-cursor")
+        assert error.value.status_code == 400
+
+
+class TestFacets:
+    """facet 캐시 / 개수 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_recomputed_per_generation(self, db):
+        await seed(db)
+        first = await list_hands(db, limit=1)
+        db.add(HandAnalysis(file_name="new.mp4", source_worksheet="New"))
+        await db.commit()
+        cached = await list_hands(db, limit=1)
+        await data_generation.bump("hands")
+        fresh = await list_hands(db, limit=1)
+
+        assert first["facets"] == {
+            "worksheets": {"2024 WSOPC LA": 10, "HCL 2023": 10},
+            "grades": {"★": 14, "★★": 6},
+        }
+        assert first["worksheets"] == ["2024 WSOPC LA", "HCL 2023"]
+        assert cached["total_count"] == 20
+        assert fresh["total_count"] == 21
+        assert fresh["facets"]["worksheets"]["New"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_count_is_optional(self, db):
+        await seed(db)
+        plain = await list_hands(db, file_name="HCL _1")
+        counted = await list_hands(db, file_name="HCL _1", count=True)
+
+        assert plain["total_count"] is None
+        assert counted["total_count"] == len(counted["items"]) == 3
@@ -0,0 +1,124 @@
+"""
+generation 기반 HTTP 캐시 테스트
+
+테스트 케이스:
+- 읽기 응답에 ETag / Cache-Control, If-None-Match 일치 시 라우트 없이 304
+- generation bump 후 새 ETag / 새 응답
+- 같은 generation 응답 memo (라우트 재실행 없음), ETag에 없는 Vary면 memo 안 함
+- 대상 외 경로 / 동기화 상태 경로는 그대로 통과
+- 다른 워커의 bump는 refresh 주기 후 반영
+"""
+
+import pytest
+from fastapi import FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import settings
+from app.core.http_cache import GenerationCacheMiddleware
+from app.services import data_generation as data_generation_module
+from app.services.data_generation import DataGeneration
+from app.services.shared_state import MemoryStateBackend
+
+
+@pytest.fixture
+def generation(monkeypatch):
+    monkeypatch.setattr(data_generation_module, "shared_state", MemoryStateBackend())
+    service = DataGeneration()
+    monkeypatch.setattr("app.core.http_cache.data_generation", service)
+    return service
+
+
+def make_app(calls):
+    app = FastAPI()
+    app.add_middleware(GenerationCacheMiddleware)
+
+    @app.get("/api/stats/summary")
+    async def summary():
+        calls.append("summary")
+        return {"total": len(calls)}
+
+    @app.get("/api/stats/random")
+    async def random_vary(response: Response):
+        calls.append("random")
+        response.headers["Vary"] = "X-Unknown"
+        return {"n": len(calls)}
+
+    @app.get("/api/hands/sync/status")
+    async def sync_status():
+        calls.append("sync")
+        return {"status": "idle"}
+
+    return app
+
+
+def client_for(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestEtag:
+    """ETag / 304 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_skips_route(self, generation):
+        calls = []
+        async with client_for(make_app(calls)) as client:
+            first = await client.get("/api/stats/summary")
+            etag = first.headers["etag"]
+            assert first.headers["cache-control"] == settings.HTTP_CACHE_CONTROL
+
+            again = await client.get(
+                "/api/stats/summary", headers={"If-None-Match": etag}
+            )
+            assert again.status_code == 304
+            assert again.headers["etag"] == etag
+            assert calls == ["summary"]
+
+            # 데이터 변경 → 새 ETag, 라우트 재실행
+            await generation.bump("scan")
+            changed = await client.get(
+                "/api/stats/summary", headers={"If-None-Match": etag}
+            )
+            assert changed.status_code == 200
+            assert changed.headers["etag"] != etag
+            assert changed.json() == {"total": 2}
+
+    @pytest.mark.asyncio
+    async def test_memo_and_unknown_vary(self, generation):
+        calls = []
+        async with client_for(make_app(calls)) as client:
+            first = await client.get("/api/stats/summary")
+            memo = await client.get("/api/stats/summary")
+            assert memo.json() == first.json()
+            assert calls == ["summary"]
+
+            # ETag에 반영되지 않은 헤더로 달라지는 응답은 memo 안 함
+            await client.get("/api/stats/random")
+            await client.get("/api/stats/random")
+            assert calls.count("random") == 2
+
+    @pytest.mark.asyncio
+    async def test_excluded_paths_pass_through(self, generation):
+        calls = []
+        async with client_for(make_app(calls)) as client:
+            res = await client.get("/api/hands/sync/status")
+            await client.get("/api/hands/sync/status")
+        assert "etag" not in res.headers
+        assert calls == ["sync", "sync"]
+
+
+class TestDataGeneration:
+    """DataGeneration 워커 간 반영 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_other_worker_bump_after_refresh(self, generation, monkeypatch):
+        other_worker = DataGeneration()
+        before = await generation.current()
+
+        await other_worker.bump("work_status")
+        # refresh 주기 안에서는 캐시된 vector
+        assert await generation.current() == before
+
+        monkeypatch.setattr(settings, "DATA_GENERATION_REFRESH_SECONDS", 0)
+        after = await generation.current()
+        assert after["work_status"] != before["work_status"]
+        assert after["scan"] == before["scan"]
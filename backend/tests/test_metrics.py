@@ -0,0 +1,145 @@
+"""
+Prometheus 지표 테스트
+
+테스트 케이스:
+- text exposition 형식 (누적 버킷, 라벨 이스케이프)
+- 라우트 템플릿 기준 요청 수 / 지연 기록
+- GET /metrics 응답 (DB 풀 / single-flight Gauge 포함)
+- ffprobe 호출 결과, 동기화 결과 분류
+"""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core import metrics
+from app.core.metrics import MetricsMiddleware, MetricsRegistry
+from app.services.scanner import ArchiveScanner
+from app.services.sheets_sync import SyncResult
+from benchmarks.synthetic import ArchiveSpec, fake_ffprobe, iter_archive, write_tree
+
+
+class TestRegistry:
+    """MetricsRegistry.render() 테스트"""
+
+    def test_exposition_format(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("t_total", "Test counter", ("path",))
+        histogram = registry.histogram("t_seconds", "Test latency", buckets=(0.1, 1))
+        registry.gauge("t_gauge", "Test gauge", lambda: [((), 3)])
+
+        counter.inc(labels=('a"b',))
+        counter.inc(2, labels=('a"b',))
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value)
+
+        lines = registry.render().splitlines()
+        assert "# TYPE t_total counter" in lines
+        assert 't_total{path="a\\"b"} 3' in lines
+        assert 't_seconds_bucket{le="0.1"} 1' in lines
+        assert 't_seconds_bucket{le="1"} 2' in lines
+        assert 't_seconds_bucket{le="+Inf"} 3' in lines
+        assert "t_seconds_count 3" in lines
+        assert "t_seconds_sum 5.55" in lines
+        assert "t_gauge 3" in lines
+
+    def test_failing_gauge_skipped(self):
+        registry = MetricsRegistry()
+        registry.gauge("broken", "Broken gauge", lambda: 1 / 0)
+        registry.counter("ok_total", "Counter").inc()
+        text = registry.render()
+        assert "broken" not in text
+        assert "ok_total 1" in text
+
+
+class TestMiddleware:
+    """MetricsMiddleware / GET /metrics 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_records_route_template(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/folders/{folder_id}")
+        async def folder(folder_id: int):
+            return {"id": folder_id}
+
+        labels = ("GET", "/folders/{folder_id}", "200")
+        before = metrics.http_requests.value(labels)
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/folders/1")
+            await client.get("/folders/2")
+            await client.get("/missing")
+
+        assert metrics.http_requests.value(labels) == before + 2
+        assert metrics.http_requests.value(("GET", "(not routed)", "404")) >= 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self):
+        from app.main import app
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE archive_http_requests_total counter" in response.text
+        assert 'archive_single_flight_requests{kind="leaders"}' in response.text
+
+
+class TestInstrumentation:
+    """스캐너 / 동기화 계측 테스트"""
+
+    def test_probe_outcomes(self, tmp_path):
+        spec = ArchiveSpec(files=20, depth=2, root=str(tmp_path / "nas"))
+        write_tree(spec)
+        media = next(
+            row
+            for kind, row in iter_archive(spec)
+            if kind == "file" and row["video_codec"]
+        )
+        scanner = ArchiveScanner(db=None, state={}, writer=object())
+
+        before = metrics.scan_probes.value(("ok",))
+        probes = metrics.scan_probe_duration.count()
+        with fake_ffprobe(latency=0.01):
+            scanner._get_media_info(media["path"])
+
+        assert metrics.scan_probes.value(("ok",)) == before + 1
+        assert metrics.scan_probe_duration.count() == probes + 1
+
+    @pytest.mark.parametrize(
+        "result, outcome",
+        [
+            (None, "error"),
+            (
+                SyncResult(
+                    success=False, synced_at=None, total_records=0, synced_count=0
+                ),
+                "failed",
+            ),
+            (
+                SyncResult(
+                    success=True,
+                    synced_at=None,
+                    total_records=0,
+                    synced_count=0,
+                    skipped_unchanged=True,
+                ),
+                "unchanged",
+            ),
+            (
+                SyncResult(
+                    success=True, synced_at=None, total_records=0, synced_count=0
+                ),
+                "ok",
+            ),
+        ],
+    )
+    def test_sync_outcomes(self, result, outcome):
+        before = metrics.sync_runs.value(("test", outcome))
+        metrics.record_sync("test", result, 0.2)
+        assert metrics.sync_runs.value(("test", outcome)) == before + 1
+        assert metrics.sync_phase_duration.count(("test", "total")) >= 1
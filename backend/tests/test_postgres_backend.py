@@ -0,0 +1,195 @@
+"""
+PostgreSQL 모드 / Alembic 마이그레이션 / bulk 쓰기 경로 테스트
+
+PostgreSQL 서버 없이 실행 가능한 범위:
+- Alembic upgrade head (신규 DB, create_all로 만든 기존 DB stamp 후 업그레이드)
+- 모델 ↔ 마이그레이션 일치 (autogenerate diff 없음)
+- postgresql+asyncpg 엔진 풀 설정, PostgreSQL 전용 DDL/ON CONFLICT 컴파일
+- COPY 경로 (asyncpg 연결 stand-in으로 copy_records_to_table 호출 확인)
+- SQLite ON CONFLICT upsert
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import func, inspect, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.schema import CreateIndex
+
+from app.core.bulk import bulk_insert, dialect_insert, upsert
+from app.core.config import settings
+from app.core.database import Base, _pool_kwargs, _upgrade
+from app.models.file_stats import FileStats, FolderStats
+from app.models.search import is_search_table
+from app.models.work_status import Archive
+
+
+def _version_and_tables(connection):
+    context = MigrationContext.configure(connection)
+    return context.get_current_revision(), set(inspect(connection).get_table_names())
+
+
+class TestMigrations:
+    """Alembic 마이그레이션 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fresh_database_matches_models(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'new.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(_upgrade)
+            async with engine.connect() as conn:
+                version, tables = await conn.run_sync(_version_and_tables)
+                diff = await conn.run_sync(
+                    lambda c: compare_metadata(
+                        MigrationContext.configure(c), Base.metadata
+                    )
+                )
+        finally:
+            await engine.dispose()
+
+        assert version == "0008"
+        assert {"file_stats", "folder_stats", "work_statuses"} <= tables
+        # compare_metadata는 env.py include_object를 거치지 않음 → PostgreSQL 전용
+        # prefix 인덱스(ddl_if)와 metadata 밖의 검색 색인 테이블은 제외하고 비교
+        assert [
+            d
+            for d in diff
+            if "prefix" not in str(d)
+            and not (d[0] == "remove_table" and is_search_table(d[1].name))
+        ] == []
+        assert "file_stats_search" in tables
+
+    @pytest.mark.asyncio
+    async def test_existing_create_all_database_is_stamped(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.execute(
+                    FolderStats.__table__.insert().values(path="/a", name="a")
+                )
+            async with engine.begin() as conn:
+                await conn.run_sync(_upgrade)
+            async with engine.connect() as conn:
+                version, _ = await conn.run_sync(_version_and_tables)
+                count = await conn.scalar(select(func.count(FolderStats.id)))
+        finally:
+            await engine.dispose()
+
+        assert version == "0008"
+        assert count == 1
+
+
+class TestPostgresConfig:
+    """PostgreSQL 엔진 설정 / DDL 테스트"""
+
+    def test_pool_settings(self):
+        kwargs = _pool_kwargs("postgresql+asyncpg://u:p@db/archive")
+        assert kwargs["pool_size"] == settings.DB_POOL_SIZE
+        assert kwargs["max_overflow"] == settings.DB_MAX_OVERFLOW
+        assert kwargs["pool_pre_ping"] is settings.DB_POOL_PRE_PING
+
+        engine = create_async_engine("postgresql+asyncpg://u:p@db/archive", **kwargs)
+        assert engine.pool.size() == settings.DB_POOL_SIZE
+        assert _pool_kwargs("sqlite+aiosqlite:///:memory:") == {}
+
+    def test_prefix_index_only_on_postgres(self):
+        index = next(
+            i
+            for i in FileStats.__table__.indexes
+            if i.name == "ix_file_stats_folder_path_prefix"
+        )
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        assert "folder_path text_pattern_ops" in ddl
+        assert index._ddl_if.dialect == "postgresql"
+
+    def test_on_conflict_compiles_for_postgres(self):
+        stmt = dialect_insert("postgresql", Archive).on_conflict_do_nothing(
+            index_elements=["name"]
+        )
+        assert "ON CONFLICT (name) DO NOTHING" in str(
+            stmt.compile(dialect=postgresql.dialect())
+        )
+
+
+class FakeCopyConnection:
+    """asyncpg Connection stand-in (copy_records_to_table 기록)"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.calls.append((table, records, columns))
+
+
+class FakePostgresSession:
+    """COPY 경로가 사용하는 AsyncSession 표면만 흉내"""
+
+    def __init__(self):
+        self.bind = SimpleNamespace(
+            dialect=SimpleNamespace(name="postgresql", driver="asyncpg")
+        )
+        self.copy = FakeCopyConnection()
+
+    async def connection(self):
+        async def get_raw_connection():
+            return SimpleNamespace(driver_connection=self.copy)
+
+        return SimpleNamespace(get_raw_connection=get_raw_connection)
+
+
+class TestBulkPaths:
+    """bulk_insert / upsert 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_copy_path_fills_python_defaults(self):
+        db = FakePostgresSession()
+        await bulk_insert(
+            db,
+            FileStats,
+            [
+                {"path": "/a/1.mp4", "name": "1.mp4", "folder_path": "/a", "size": 1},
+                {"path": "/a/2.mp4", "name": "2.mp4", "folder_path": "/a", "size": 2},
+            ],
+        )
+
+        ((table, records, columns),) = db.copy.calls
+        assert table == "file_stats"
+        assert "id" not in columns
+        assert {"created_at", "updated_at"} <= set(columns)
+        row = dict(zip(columns, records[0]))
+        assert row["path"] == "/a/1.mp4"
+        assert row["created_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_sqlite_upsert_and_insert(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with async_sessionmaker(engine)() as db:
+                await bulk_insert(
+                    db, FileStats, [{"path": "/a/x", "name": "x", "folder_path": "/a"}]
+                )
+                row = {"path": "/a", "name": "a", "file_count": 1}
+                await upsert(db, FolderStats, [row], ["path"], ["file_count"])
+                await upsert(
+                    db,
+                    FolderStats,
+                    [{**row, "file_count": 5}],
+                    ["path"],
+                    ["file_count"],
+                )
+                # update_columns 없으면 DO NOTHING
+                await upsert(db, FolderStats, [{**row, "file_count": 9}], ["path"])
+                await db.commit()
+
+                folders = (await db.execute(select(FolderStats))).scalars().all()
+                assert [(f.path, f.file_count) for f in folders] == [("/a", 5)]
+                assert await db.scalar(select(func.count(FileStats.id))) == 1
+        finally:
+            await engine.dispose()
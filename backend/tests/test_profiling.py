@@ -0,0 +1,155 @@
+"""
+온디맨드 프로파일링 테스트
+
+테스트 케이스:
+- 토큰 미설정 / 불일치 → ?__profile 무시 (일반 응답)
+- ?__profile=1 → 요청 핸들러 stack (실행 중 + await 대기) collapsed 형식
+- ?__profile=pstats → cProfile 결과
+- 실행 중인 작업에 샘플러 부착 → 디스크 보고서
+- /debug/profile, /debug/requests 접근 제어
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import settings
+from app.core.profiling import JobProfiles, ProfilingMiddleware, find_task
+
+TOKEN = "secret"
+
+
+def busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def make_app(seen):
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware)
+
+    @app.get("/tree")
+    async def tree(request: Request):
+        seen.append(dict(request.query_params))
+        busy(0.05)
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    return app
+
+
+async def get(app, url, token):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(url, headers={"x-profile-token": token})
+
+
+class TestRequestProfile:
+    """ProfilingMiddleware 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("token, header", [("", TOKEN), (TOKEN, "wrong")])
+    async def test_flag_ignored_without_valid_token(self, monkeypatch, token, header):
+        monkeypatch.setattr(settings, "PROFILING_TOKEN", token)
+        seen = []
+        response = await get(make_app(seen), "/tree?depth=2&__profile=1", header)
+        assert response.json() == {"ok": True}
+        assert "x-profile-status" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_sampled_stacks(self, monkeypatch):
+        monkeypatch.setattr(settings, "PROFILING_TOKEN", TOKEN)
+        monkeypatch.setattr(settings, "PROFILING_INTERVAL_MS", 2.0)
+        seen = []
+        response = await get(make_app(seen), "/tree?depth=2&__profile=1", TOKEN)
+
+        assert response.status_code == 200
+        assert response.headers["x-profile-status"] == "200"
+        assert response.headers["cache-control"] == "no-store"
+        assert int(response.headers["x-profile-samples"]) > 0
+        # 라우트에는 플래그 없이 전달
+        assert seen == [{"depth": "2"}]
+
+        stacks = response.text.splitlines()
+        assert all(line.startswith("_profiled (profiling.py") for line in stacks)
+        assert any(";busy (test_profiling.py" in line for line in stacks)
+        assert any(line.split(" ")[-2].endswith("<waiting>") for line in stacks)
+
+    @pytest.mark.asyncio
+    async def test_pstats(self, monkeypatch):
+        monkeypatch.setattr(settings, "PROFILING_TOKEN", TOKEN)
+        response = await get(make_app([]), "/tree?__profile=pstats", TOKEN)
+        assert response.headers["x-profile-status"] == "200"
+        assert "function calls" in response.text
+        assert "(busy)" in response.text
+
+
+class TestJobProfile:
+    """JobProfiles / /debug/profile 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_attach_writes_report(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "PROFILING_INTERVAL_MS", 2.0)
+
+        async def job():
+            for _ in range(5):
+                busy(0.01)
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(job())
+        await asyncio.sleep(0)
+        assert find_task(job.__code__) is task
+
+        profiles = JobProfiles()
+        name = profiles.attach("scan", task, job.__code__, [], seconds=30)
+        with pytest.raises(RuntimeError):
+            profiles.attach("scan", task, job.__code__, [], seconds=30)
+        await task
+
+        # 작업 종료 → 샘플러가 다음 주기에 보고서 저장
+        for _ in range(100):
+            if not profiles.active:
+                break
+            await asyncio.sleep(0.01)
+        assert [r["name"] for r in profiles.reports()] == [name]
+        with open(profiles.report_path(name)) as f:
+            lines = f.read().splitlines()
+        assert lines and all(
+            line.startswith("job (test_profiling.py") for line in lines
+        )
+        assert profiles.report_path("../" + name) is None
+
+    @pytest.mark.asyncio
+    async def test_endpoint_access(self, monkeypatch):
+        from app.main import app
+
+        monkeypatch.setattr(settings, "PROFILING_TOKEN", "")
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            disabled = await client.post("/debug/profile/scan")
+            requests_disabled = await client.get("/debug/requests")
+            monkeypatch.setattr(settings, "PROFILING_TOKEN", TOKEN)
+            forbidden = await client.post("/debug/profile/scan")
+            requests_forbidden = await client.get("/debug/requests")
+            requests = await client.get(
+                "/debug/requests", headers={"x-profile-token": TOKEN}
+            )
+            idle = await client.post(
+                "/debug/profile/scan", headers={"x-profile-token": TOKEN}
+            )
+            unknown = await client.post(
+                "/debug/profile/nope", headers={"x-profile-token": TOKEN}
+            )
+
+        assert disabled.status_code == 404
+        assert requests_disabled.status_code == 404
+        assert forbidden.status_code == 403
+        assert requests_forbidden.status_code == 403
+        assert requests.status_code == 200
+        assert idle.status_code == 409
+        assert unknown.status_code == 404
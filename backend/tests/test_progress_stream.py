@@ -0,0 +1,178 @@
+"""
+Progress 트리 스트리밍 / Compact 스키마 테스트
+
+테스트 케이스:
+- NDJSON 레코드 순서 (post-order) 및 parent_id
+- summary 레코드
+- 소비자 조기 종료 시 생산자 정리
+- compact 스키마 응답 및 Vary 헤더
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.database import Base, get_read_db
+from app.models.file_stats import FolderStats
+from app.services.progress_service import ProgressService
+from app.services.shared_state import MemoryStateBackend
+
+FOLDERS = [
+    # (path, parent_path, depth, file_count, total_size)
+    ("/a", None, 0, 3, 300),
+    ("/a/WSOP", "/a", 1, 2, 200),
+    ("/a/WSOP/WSOP Europe", "/a/WSOP", 2, 1, 100),
+    ("/a/HCL", "/a", 1, 1, 100),
+]
+
+
+@asynccontextmanager
+async def seeded_engine():
+    """폴더 트리가 시드된 in-memory SQLite 엔진"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as db:
+            db.add_all(
+                FolderStats(
+                    path=path,
+                    name=path.rsplit("/", 1)[-1],
+                    parent_path=parent,
+                    depth=depth,
+                    file_count=files,
+                    total_size=size,
+                    folder_count=0,
+                    total_duration=0,
+                )
+                for path, parent, depth, files, size in FOLDERS
+            )
+            await db.commit()
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+class TestNdjsonStream:
+    """iter_folder_progress() 레코드 스트림 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_post_order_with_parent_ids_and_summary(self):
+        service = ProgressService()
+        async with seeded_engine() as engine, AsyncSession(engine) as db:
+            records = [r async for r in service.iter_folder_progress(db, depth=3)]
+
+        nodes = [r for r in records if r["type"] == "node"]
+        ids = {r["node"]["path"]: r["node"]["id"] for r in nodes}
+        order = [r["node"]["path"] for r in nodes]
+
+        # 자식이 부모보다 먼저 나옴
+        assert order.index("/a/WSOP/WSOP Europe") < order.index("/a/WSOP")
+        assert order.index("/a/WSOP") < order.index("/a")
+        assert order[-1] == "/a"
+
+        parents = {r["node"]["path"]: r["parent_id"] for r in nodes}
+        assert parents["/a"] is None
+        assert parents["/a/WSOP"] == ids["/a"]
+        assert parents["/a/WSOP/WSOP Europe"] == ids["/a/WSOP"]
+        assert all(r["node"]["children"] == [] for r in nodes)
+
+        summary = records[-1]
+        assert summary["type"] == "summary"
+        assert summary["node_count"] == len(nodes) == len(FOLDERS)
+        assert summary["archive_stats"]["total_files"] == 3
+
+    @pytest.mark.asyncio
+    async def test_early_close_cleans_up_producer(self):
+        """소비자가 떠나도 가득 찬 큐에서 생산자가 멈춰 있지 않아야 함"""
+        service = ProgressService()
+        service.STREAM_QUEUE_SIZE = 1
+        async with seeded_engine() as engine, AsyncSession(engine) as db:
+            stream = service.iter_folder_progress(db, depth=3)
+            first = await stream.__anext__()
+            assert first["type"] == "node"
+            await asyncio.sleep(0.05)  # 생산자가 큐를 채우고 대기하도록
+            await stream.aclose()
+
+            pending = [
+                t
+                for t in asyncio.all_tasks()
+                if t is not asyncio.current_task() and not t.done()
+            ]
+            assert pending == []
+
+
+class TestCompactSchema:
+    """/progress/tree compact 스키마 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def memory_state(self, monkeypatch):
+        # ETag 미들웨어의 generation 조회를 앱 DB 대신 메모리 백엔드로
+        monkeypatch.setattr(
+            "app.services.data_generation.shared_state", MemoryStateBackend()
+        )
+
+    @asynccontextmanager
+    async def client(self):
+        from app.main import app
+
+        async with seeded_engine() as engine:
+
+            async def override_get_db():
+                async with AsyncSession(engine) as db:
+                    yield db
+
+            app.dependency_overrides[get_read_db] = override_get_db
+            try:
+                async with AsyncClient(
+                    transport=ASGITransport(app=app), base_url="http://test"
+                ) as client:
+                    yield client
+            finally:
+                app.dependency_overrides.pop(get_read_db, None)
+
+    @pytest.mark.asyncio
+    async def test_compact_nodes_carry_ratios_only(self):
+        async with self.client() as client:
+            res = await client.get("/api/progress/tree?depth=3&stats_schema=compact")
+
+        body = res.json()
+        assert res.status_code == 200
+        assert body["schema_version"] == "compact"
+        assert body["archive_stats"]["total_files"] == 3
+        node = body["tree"][0]
+        assert "root_stats" not in node and "archive_stats" not in node
+        assert node["ratios"]["file_ratio"] == 100.0
+        assert node["children"][0]["ratios"]["size_ratio"] > 0
+        assert "vary" not in res.headers
+
+    @pytest.mark.asyncio
+    async def test_header_negotiation_sets_vary(self):
+        async with self.client() as client:
+            compact = await client.get(
+                "/api/progress/tree?depth=3", headers={"X-Response-Schema": "compact"}
+            )
+            full = await client.get("/api/progress/tree?depth=3")
+
+        assert compact.json()["schema_version"] == "compact"
+        assert compact.headers["vary"] == "X-Response-Schema"
+        assert full.headers["vary"] == "X-Response-Schema"
+
+        full_node = full.json()["tree"][0]
+        assert "schema_version" not in full.json()
+        assert full_node["archive_stats"]["file_ratio"] == (
+            compact.json()["tree"][0]["ratios"]["file_ratio"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_openapi_documents_both_schemas(self):
+        async with self.client() as client:
+            spec = (await client.get("/openapi.json")).json()
+
+        schema = spec["paths"]["/api/progress/tree"]["get"]["responses"]["200"]
+        refs = str(schema["content"]["application/json"]["schema"])
+        assert "TreeWithRootStats" in refs
+        assert "CompactTreeWithRootStats" in refs
@@ -0,0 +1,107 @@
+"""
+요청별 SQL 계측 테스트
+
+테스트 케이스:
+- 요청별 쿼리 수 / 반환 행 수 → Server-Timing 헤더, 라우트별 누적
+- 가장 느린 문장 N개만 유지
+- 응답 후 BackgroundTasks / 요청 밖 쿼리는 집계하지 않음
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import BackgroundTasks, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import query_stats
+from app.core.config import settings
+from app.core.query_stats import QueryStatsMiddleware, RequestLog, RequestQueryStats
+
+
+@asynccontextmanager
+async def memory_engine():
+    """행 2개짜리 테이블이 있는 in-memory SQLite 엔진"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (id INTEGER)"))
+            await conn.execute(text("INSERT INTO t VALUES (1), (2)"))
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def log(monkeypatch):
+    log = RequestLog()
+    monkeypatch.setattr(query_stats, "request_log", log)
+    return log
+
+
+def make_app(engine, after_response):
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/folders/{folder_id}")
+    async def folder(folder_id: int, background: BackgroundTasks):
+        async with engine.connect() as conn:
+            for _ in range(3):
+                await conn.execute(text("SELECT id FROM t"))
+
+        async def later():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            after_response.append(True)
+
+        background.add_task(later)
+        return {"id": folder_id}
+
+    return app
+
+
+class TestQueryStats:
+    """QueryStatsMiddleware 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_counts_per_request_and_route(self, log):
+        after_response = []
+        async with memory_engine() as engine:
+            transport = ASGITransport(app=make_app(engine, after_response))
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                first = await client.get("/folders/1")
+                await client.get("/folders/2")
+
+        assert after_response == [True, True]
+        assert 'desc="3 queries"' in first.headers["server-timing"]
+        assert "app;dur=" in first.headers["server-timing"]
+
+        recent = log.snapshot()["recent"]
+        assert [r["path"] for r in recent] == ["/folders/2", "/folders/1"]
+        # 응답 후 BackgroundTasks 쿼리는 제외
+        assert recent[0]["queries"] == 3
+        assert recent[0]["rows"] == 6
+
+        [route] = log.snapshot()["routes"]
+        assert route["route"] == "GET /folders/{folder_id}"
+        assert route["requests"] == 2
+        assert route["avg_queries"] == 3
+        assert route["slowest"][0]["statement"] == "SELECT id FROM t"
+
+    @pytest.mark.asyncio
+    async def test_queries_outside_requests_ignored(self, log):
+        async with memory_engine() as engine, engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        assert log.snapshot() == {"recent": [], "routes": []}
+
+    def test_keeps_only_slowest(self, monkeypatch):
+        monkeypatch.setattr(settings, "QUERY_STATS_SLOWEST", 2)
+        stats = RequestQueryStats()
+        for ms in (5, 1, 9, 3):
+            stats.record(f"SELECT {ms}", ms / 1000, 1)
+
+        assert stats.queries == 4
+        assert [s["statement"] for s in stats.slowest] == ["SELECT 9", "SELECT 5"]
@@ -0,0 +1,153 @@
+"""
+스캔 진행 SSE 스트림 테스트
+
+테스트 케이스:
+- 상태 diff (변경 필드 / 새 로그 줄 / 새 스캔 시 로그 초기화)
+- 느린 구독자 delta 병합
+- 브로드캐스터: 구독자 공유 폴링, 열린 연결 = 활성 뷰어, 마지막 구독 해제 시 정지
+- /scan/events 응답 형식 (snapshot → progress)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.services import scan_events as scan_events_module
+from app.services.scan_events import (
+    ScanEventBroadcaster,
+    ScanSubscriber,
+    diff_scan_state,
+)
+from app.services.shared_state import MemoryStateBackend
+
+
+class TestDiff:
+    """diff_scan_state() 테스트"""
+
+    def test_changed_fields_and_new_log_lines(self):
+        prev = {"progress": 10.0, "files_scanned": 5, "logs": ["a", "b"], "log_seq": 2}
+        cur = {
+            "progress": 20.0,
+            "files_scanned": 5,
+            "logs": ["a", "b", "c", "d"],
+            "log_seq": 4,
+        }
+
+        assert diff_scan_state(prev, cur) == {
+            "progress": 20.0,
+            "logs": ["c", "d"],
+            "log_seq": 4,
+        }
+        assert diff_scan_state(cur, cur) == {}
+
+    def test_ring_buffer_overflow_and_reset(self):
+        # 버퍼(3줄)보다 많은 줄이 쌓이면 버퍼 전체
+        assert diff_scan_state({"log_seq": 1}, {"logs": ["x", "y", "z"], "log_seq": 9})[
+            "logs"
+        ] == ["x", "y", "z"]
+        # 새 스캔으로 sequence가 줄면 버퍼 전체
+        assert diff_scan_state({"log_seq": 50}, {"logs": ["new"], "log_seq": 1})[
+            "logs"
+        ] == ["new"]
+
+
+class TestSubscriber:
+    """ScanSubscriber 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_pending_deltas_are_coalesced(self):
+        subscriber = ScanSubscriber()
+        subscriber.push({"progress": 10.0, "logs": ["a"], "log_seq": 1})
+        subscriber.push({"progress": 20.0, "logs": ["b"], "log_seq": 2})
+
+        delta = await subscriber.next(timeout=0.1)
+        assert delta == {"progress": 20.0, "logs": ["a", "b"], "log_seq": 2}
+        assert await subscriber.next(timeout=0.05) is None
+
+
+class TestBroadcaster:
+    """ScanEventBroadcaster 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_shared_poll_viewers_and_shutdown(self, monkeypatch):
+        monkeypatch.setattr(scan_events_module, "shared_state", MemoryStateBackend())
+        monkeypatch.setattr(settings, "SCAN_STREAM_INTERVAL_SECONDS", 0.01)
+
+        state = {"progress": 0.0, "logs": [], "log_seq": 0}
+        loads = []
+
+        async def load_state():
+            loads.append(1)
+            return dict(state)
+
+        broadcaster = ScanEventBroadcaster(load_state)
+        async with broadcaster.subscribe() as first:
+            async with broadcaster.subscribe() as second:
+                assert (await broadcaster.snapshot())["active_viewers"] == 2
+
+                state.update(progress=50.0, logs=["hello"], log_seq=1)
+                delta_a = await first.next(timeout=1)
+                delta_b = await second.next(timeout=1)
+
+            assert delta_a == delta_b
+            assert delta_a["progress"] == 50.0
+            assert delta_a["logs"] == ["hello"]
+            # 닫힌 연결은 뷰어에서 빠짐
+            assert (await broadcaster.snapshot())["active_viewers"] == 1
+
+        assert broadcaster.subscriber_count == 0
+        assert broadcaster._task is None
+        polled = len(loads)
+        await asyncio.sleep(0.05)
+        assert len(loads) == polled
+
+
+class FakeRequest:
+    """request.is_disconnected()만 흉내 (n번째 확인 후 연결 종료)"""
+
+    def __init__(self, checks: int):
+        self.checks = checks
+
+    async def is_disconnected(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+class TestEventsEndpoint:
+    """/scan/events 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_then_progress(self, monkeypatch):
+        from app.api import scan
+
+        backend = MemoryStateBackend()
+        monkeypatch.setattr(scan_events_module, "shared_state", backend)
+        monkeypatch.setattr(scan, "shared_state", backend)
+        monkeypatch.setattr(settings, "SCAN_STREAM_INTERVAL_SECONDS", 0.01)
+        monkeypatch.setattr(
+            scan, "scan_events", ScanEventBroadcaster(scan._stream_state)
+        )
+
+        response = await scan.stream_scan_events(FakeRequest(checks=1))
+        assert response.media_type == "text/event-stream"
+
+        chunks = response.body_iterator
+        snapshot = await chunks.__anext__()
+        assert snapshot.startswith("event: snapshot\n")
+        assert json.loads(snapshot.split("data: ", 1)[1])["is_scanning"] is False
+
+        await backend.acquire_lock("scan", "worker-1", ttl=30)
+        await backend.set(
+            "scan:state", {"is_scanning": True, "progress": 5.0, "log_seq": 0}
+        )
+        progress = await chunks.__anext__()
+        assert progress.startswith("event: progress\n")
+        delta = json.loads(progress.split("data: ", 1)[1])
+        assert delta["is_scanning"] is True
+        assert delta["progress"] == 5.0
+
+        with pytest.raises(StopAsyncIteration):
+            await chunks.__anext__()
+        assert scan.scan_events.subscriber_count == 0
@@ -0,0 +1,125 @@
+"""
+Blue/green 스캔 DB 테스트
+
+테스트 케이스:
+- staged 스캔 중 라이브 DB는 이전 스냅샷 그대로
+- swap 후 새 스냅샷 반영 (검색 색인 포함), 스캔 중 라이브 DB 쓰기(동기화 테이블, 폴더 연결) 보존
+- discard 시 라이브 DB 변경 없음 + staging 파일 정리
+"""
+
+import os
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base, DatabaseWriter, create_sqlite_engine
+from app.models.file_stats import FileStats, FolderStats
+from app.models.work_status import Archive
+from app.services.scan_staging import StagingDatabase
+from app.services.scanner import ArchiveScanner
+from app.services.search_service import search_service
+
+
+@asynccontextmanager
+async def live_database(tmp_path):
+    """파일 SQLite 라이브 DB (writer + 읽기 전용 엔진)"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'live.db'}"
+    writer = create_sqlite_engine(url)
+    reader = create_sqlite_engine(url, readonly=True)
+    try:
+        async with writer.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                FolderStats.__table__.insert().values(
+                    path="/old", name="old", file_count=1, work_status_id=7
+                )
+            )
+        yield url, DatabaseWriter(async_sessionmaker(writer)), async_sessionmaker(
+            reader
+        )
+    finally:
+        await reader.dispose()
+        await writer.dispose()
+
+
+def make_archive(tmp_path, monkeypatch):
+    root = tmp_path / "archive"
+    (root / "WSOP").mkdir(parents=True)
+    (root / "WSOP" / "a.txt").write_text("aaaa")
+    (root / "b.txt").write_text("bb")
+    monkeypatch.setattr(settings, "NAS_LOCAL_PATH", str(root))
+    return root
+
+
+async def run_staged_scan(staging: StagingDatabase):
+    async with staging.read_session_maker() as db:
+        scanner = ArchiveScanner(
+            db, {"is_scanning": True, "logs": []}, writer=staging.writer
+        )
+        await scanner.scan()
+
+
+class TestStagedScan:
+    """StagingDatabase 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_swap_publishes_complete_snapshot(self, tmp_path, monkeypatch):
+        root = make_archive(tmp_path, monkeypatch)
+
+        async with live_database(tmp_path) as (url, live_writer, live_reader):
+            staging = StagingDatabase(url, live_writer)
+            await staging.create()
+            await run_staged_scan(staging)
+
+            # 스캔 완료 전: 라이브 DB는 이전 스냅샷
+            async with live_reader() as db:
+                assert await db.scalar(select(func.count(FileStats.id))) == 0
+
+            # 스캔 중 라이브 DB 쓰기 (동기화 테이블 / 폴더 연결 변경)
+            async def live_writes(db):
+                db.add(Archive(name="WSOP"))
+                folder = await db.scalar(
+                    select(FolderStats).where(FolderStats.path == "/old")
+                )
+                folder.work_status_id = 9
+
+            await live_writer.run(live_writes)
+
+            await staging.swap()
+
+            async with live_reader() as db:
+                assert await db.scalar(select(func.count(FileStats.id))) == 2
+                top = await db.scalar(
+                    select(FolderStats).where(FolderStats.path == str(root))
+                )
+                assert (top.file_count, top.total_size) == (2, 6)
+                old = await db.scalar(
+                    select(FolderStats).where(FolderStats.path == "/old")
+                )
+                assert old.work_status_id == 9
+                assert await db.scalar(select(Archive.name)) == "WSOP"
+                # 검색 색인은 교체 후 재구성
+                found = await search_service.search(db, "a.txt", ["file"])
+                assert [hit["name"] for hit in found["items"]] == ["a.txt"]
+
+        assert not os.path.exists(staging.path)
+
+    @pytest.mark.asyncio
+    async def test_discard_leaves_live_untouched(self, tmp_path, monkeypatch):
+        make_archive(tmp_path, monkeypatch)
+
+        async with live_database(tmp_path) as (url, live_writer, live_reader):
+            staging = StagingDatabase(url, live_writer)
+            await staging.create()
+            await run_staged_scan(staging)
+            await staging.discard()
+
+            async with live_reader() as db:
+                assert await db.scalar(select(func.count(FileStats.id))) == 0
+                assert await db.scalar(select(func.count(FolderStats.id))) == 1
+
+        for suffix in ("", "-wal", "-shm"):
+            assert not os.path.exists(staging.path + suffix)
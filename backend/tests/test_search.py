@@ -0,0 +1,158 @@
+"""
+이름 검색 테스트
+
+테스트 케이스:
+- 원본 테이블 쓰기(추가/이름 변경/삭제)가 trigger로 색인에 반영
+- /search: 종류별 순위, 페이지 (has_more), 짧은 검색어 LIKE 경로
+- contains(): ILIKE '%...%'와 같은 결과 (/hands?file_name=, 카테고리 매칭)
+- PostgreSQL: 컬럼 그대로 ILIKE (pg_trgm GIN 인덱스 사용 가능한 식)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql
+
+from app.api.search import search
+from app.models.file_stats import FileStats, FolderStats
+from app.models.hand_analysis import HandAnalysis
+from app.models.work_status import Archive, WorkStatus
+from app.services.search_service import search_service
+
+
+def file(name, folder="/archive/WSOP"):
+    return FileStats(
+        path=f"{folder}/{name}", name=name, folder_path=folder, size=1, duration=0.0
+    )
+
+
+async def seed(db):
+    archive = Archive(name="WSOP")
+    db.add(archive)
+    await db.flush()
+    db.add_all(
+        [
+            file("WSOP_2024_Main_Event.mp4"),
+            file("wsop_paradise_day1.mp4"),
+            file("HCL_episode_01.mp4"),
+            FolderStats(path="/archive/WSOP", name="WSOP", depth=1),
+            FolderStats(path="/archive/HCL", name="HCL", depth=1),
+            HandAnalysis(file_name="WSOP_2024_Main_Event.mp4", source_worksheet="ws"),
+            HandAnalysis(file_name="HCL_episode_01.mp4", source_worksheet="ws"),
+            WorkStatus(archive_id=archive.id, category="WSOP Paradise"),
+            WorkStatus(archive_id=archive.id, category="HCL 2024"),
+        ]
+    )
+    await db.commit()
+
+
+async def names(db, q, kind=None, **kwargs):
+    response = await search(q=q, kind=kind, limit=20, offset=0, db=db, **kwargs)
+    return [(hit["kind"], hit["name"]) for hit in response["items"]]
+
+
+class TestIndexMaintenance:
+    """trigger 기반 색인 유지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_writes_update_index(self, db):
+        await seed(db)
+        assert await names(db, "paradise", ["file"]) == [
+            ("file", "wsop_paradise_day1.mp4")
+        ]
+
+        await db.execute(
+            update(FileStats)
+            .where(FileStats.name == "wsop_paradise_day1.mp4")
+            .values(name="wsop_europe_day1.mp4")
+        )
+        await db.execute(delete(FileStats).where(FileStats.name.like("HCL%")))
+        db.add(file("HCL_episode_02.mp4", "/archive/HCL"))
+        await db.commit()
+
+        assert await names(db, "paradise", ["file"]) == []
+        assert await names(db, "europe", ["file"]) == [("file", "wsop_europe_day1.mp4")]
+        assert await names(db, "episode", ["file"]) == [("file", "HCL_episode_02.mp4")]
+
+
+class TestSearch:
+    """GET /search 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_all_kinds_case_insensitive(self, db):
+        await seed(db)
+        hits = await names(db, "wsop")
+
+        assert sorted(hits) == [
+            ("category", "WSOP Paradise"),
+            ("file", "WSOP_2024_Main_Event.mp4"),
+            ("file", "wsop_paradise_day1.mp4"),
+            ("folder", "WSOP"),
+            ("hand", "WSOP_2024_Main_Event.mp4"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pagination(self, db):
+        await seed(db)
+        first = await search(q="mp4", kind=["file"], limit=2, offset=0, db=db)
+        second = await search(q="mp4", kind=["file"], limit=2, offset=2, db=db)
+
+        assert first["has_more"] is True
+        assert second["has_more"] is False
+        ids = [hit["id"] for hit in first["items"] + second["items"]]
+        assert sorted(ids) == [1, 2, 3]
+        assert first["took_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_short_query_and_special_characters(self, db):
+        await seed(db)
+        short = await names(db, "01", ["file"])
+        # FTS 연산자/LIKE 와일드카드는 문자 그대로
+        quoted = await names(db, 'main" OR "hcl', ["file"])
+        wildcard = await names(db, "_2", ["file"])
+
+        assert short == [("file", "HCL_episode_01.mp4")]
+        assert quoted == []
+        assert wildcard == [("file", "WSOP_2024_Main_Event.mp4")]
+
+
+class TestContains:
+    """SearchService.contains() 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("value", ["main_event", "HCL", "24", "nothing"])
+    async def test_same_as_ilike(self, value, db):
+        await seed(db)
+        indexed = await db.scalars(
+            select(HandAnalysis.id).where(search_service.contains(db, "hand", value))
+        )
+        scanned = await db.scalars(
+            select(HandAnalysis.id).where(HandAnalysis.file_name.ilike(f"%{value}%"))
+        )
+        assert sorted(indexed) == sorted(scanned)
+
+
+class TestPostgresQuery:
+    """PostgreSQL 검색 조건 테스트 (SQL 컴파일만)"""
+
+    class Session:
+        def get_bind(self):
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+    @pytest.mark.parametrize("kind", ["file", "folder", "hand", "category"])
+    def test_ilike_on_indexed_column(self, kind):
+        db = self.Session()
+        compiled = search_service._select(db, kind, "50%_off").compile(
+            dialect=postgresql.dialect()
+        )
+        sql = str(compiled)
+        # lower(column) LIKE는 gin_trgm_ops 인덱스를 쓰지 못함
+        assert "lower(" not in sql
+        assert " ILIKE " in sql.upper()
+        assert "%50\\%\\_off%" in compiled.params.values()
+
+        condition = search_service.contains(db, kind, "a_b")
+        compiled = condition.compile(dialect=postgresql.dialect())
+        assert "lower(" not in str(compiled)
+        assert list(compiled.params.values()) == ["%a\\_b%"]
@@ -0,0 +1,181 @@
+"""
+워커 간 공유 상태 / leader lock 테스트
+
+테스트 케이스:
+- DB 백엔드 값 저장/만료, prefix 카운트 (읽기 전용), 만료 항목 정리
+- 잠금 획득/갱신/경합/만료 후 인계/해제
+- 스캔 시작 중복 방지 (다른 워커가 lock 보유 시 409)
+- /scan/status 반복 폴링은 뷰어 heartbeat를 다시 쓰지 않음
+- 스케줄 동기화는 leader 워커만 실행
+- 동기화 상태 공유 (다른 워커의 결과 조회)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.shared_state import SharedStateEntry
+from app.services.sheets_sync import SheetsSyncService
+from app.services.shared_state import DatabaseStateBackend, MemoryStateBackend
+
+
+@asynccontextmanager
+async def database_backend():
+    """in-memory SQLite 위의 DatabaseStateBackend"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield DatabaseStateBackend(async_sessionmaker(engine, expire_on_commit=False))
+    finally:
+        await engine.dispose()
+
+
+class TestDatabaseBackend:
+    """DatabaseStateBackend 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_values_and_expiry(self):
+        async with database_backend() as backend:
+            await backend.set("scan:state", {"progress": 12.5})
+            assert await backend.get("scan:state") == {"progress": 12.5}
+
+            await backend.set("viewer:a", 1, ttl=30)
+            await backend.set("viewer:b", 1, ttl=0.05)
+            assert await backend.count_prefix("viewer:") == 2
+
+            await asyncio.sleep(0.1)
+            assert await backend.get("viewer:b") is None
+            assert await backend.count_prefix("viewer:") == 1
+
+            # 조회는 읽기만 → 만료 행은 purge_expired()가 삭제
+            async with backend._session() as db:
+                rows = select(func.count()).select_from(SharedStateEntry)
+                assert await db.scalar(rows) == 3
+            assert await backend.purge_expired() == 1
+            async with backend._session() as db:
+                assert await db.scalar(rows) == 2
+
+            await backend.delete("scan:state")
+            assert await backend.get("scan:state") is None
+
+    @pytest.mark.asyncio
+    async def test_lock_contention_renewal_and_takeover(self):
+        async with database_backend() as backend:
+            assert await backend.acquire_lock("job", "w1", ttl=0.2)
+            # 보유자는 갱신 가능, 다른 워커는 실패
+            assert await backend.acquire_lock("job", "w1", ttl=0.2)
+            assert not await backend.acquire_lock("job", "w2", ttl=0.2)
+            assert await backend.lock_owner("job") == "w1"
+
+            # 다른 워커의 해제 요청은 무시
+            await backend.release_lock("job", "w2")
+            assert await backend.lock_owner("job") == "w1"
+
+            # 만료되면 다른 워커가 인계
+            await asyncio.sleep(0.3)
+            assert await backend.lock_owner("job") is None
+            assert await backend.acquire_lock("job", "w2", ttl=30)
+
+            await backend.release_lock("job", "w2")
+            assert await backend.acquire_lock("job", "w1", ttl=30)
+
+
+class TestScanLock:
+    """/scan/start 중복 방지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_start_rejected_while_other_worker_scans(self, monkeypatch):
+        from app.main import app
+
+        backend = MemoryStateBackend()
+        monkeypatch.setattr("app.api.scan.shared_state", backend)
+        monkeypatch.setattr("app.api.scan._viewer_touched", {})
+        await backend.acquire_lock("scan", "other-worker", ttl=30)
+        await backend.set("scan:state", {"is_scanning": True, "progress": 40.0})
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            res = await client.post("/api/scan/start", json={"scan_type": "full"})
+            assert res.status_code == 409
+
+            status = (await client.get("/api/scan/status?client_id=c1")).json()
+            assert status["is_scanning"] is True
+            assert status["progress"] == 40.0
+            assert status["active_viewers"] == 1
+
+            # 소유 워커가 죽어 lock이 사라지면 스캔 중으로 보지 않음
+            await backend.release_lock("scan", "other-worker")
+            status = (await client.get("/api/scan/status")).json()
+            assert status["is_scanning"] is False
+
+    @pytest.mark.asyncio
+    async def test_repeat_polls_reuse_viewer_heartbeat(self, monkeypatch):
+        from app.main import app
+
+        backend = MemoryStateBackend()
+        writes = []
+        original_set = backend.set
+
+        async def recording_set(key, value, ttl=None):
+            writes.append(key)
+            await original_set(key, value, ttl)
+
+        backend.set = recording_set
+        monkeypatch.setattr("app.api.scan.shared_state", backend)
+        monkeypatch.setattr("app.api.scan._viewer_touched", {})
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            for client_id in ("c1", "c1", "c1", "c2"):
+                status = (
+                    await client.get(f"/api/scan/status?client_id={client_id}")
+                ).json()
+
+        assert writes == ["viewer:c1", "viewer:c2"]
+        assert status["active_viewers"] == 2
+
+
+class TestSyncLeader:
+    """스케줄 동기화 leader 선출 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_only_leader_runs_scheduled_sync(self, monkeypatch):
+        backend = MemoryStateBackend()
+        monkeypatch.setattr("app.services.sheets_sync.shared_state", backend)
+        await backend.acquire_lock("sheets_sync", "other-worker", ttl=30)
+
+        service = SheetsSyncService()
+        calls = []
+
+        async def fake_sync(force=False):
+            calls.append(force)
+
+        service.sync = fake_sync
+        await service._sync_wrapper()
+        assert calls == []
+
+        await backend.release_lock("sheets_sync", "other-worker")
+        await service._sync_wrapper()
+        assert calls == [False]
+
+    @pytest.mark.asyncio
+    async def test_status_published_for_other_workers(self, monkeypatch):
+        backend = MemoryStateBackend()
+        monkeypatch.setattr("app.services.sheets_sync.shared_state", backend)
+
+        leader, follower = SheetsSyncService(), SheetsSyncService()
+        leader.status = "error"
+        leader.last_error = "boom"
+        await leader._publish_status()
+
+        status = await follower.get_shared_status()
+        assert (status["status"], status["error"]) == ("error", "boom")
+        assert "published_at" not in status
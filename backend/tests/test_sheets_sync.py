@@ -0,0 +1,147 @@
+"""
+Work Status 시트 동기화 diff 파이프라인 테스트
+
+테스트 케이스:
+- 신규/변경/미변경/삭제 분류
+- 삭제 전파는 시트가 소유한 행에 한정 (수동 입력 행 보호)
+- 빈 시트 삭제 방지
+- 미변경 행 updated_at 유지 (in-memory SQLite)
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.models.file_stats import FolderStats
+from app.models.work_status import Archive, WorkStatus
+from app.services.sheets_sync import SheetsSyncService
+
+
+def sheet_row(archive: str, category: str, total: str = "10", pic: str = "Kim"):
+    """_parse_records() 결과와 동일한 형태의 시트 레코드"""
+    return {
+        "Archive": archive,
+        "Category": category,
+        "PIC": pic,
+        "Status": "작업 중",
+        "Total": total,
+        "Excel Done": "1",
+        "Notes 1": "",
+        "Notes 2": "",
+    }
+
+
+class TestWorkStatusDiffPlan:
+    """메모리 diff 계산 테스트"""
+
+    def setup_method(self):
+        self.service = SheetsSyncService()
+        self.values = self.service._parse_record(sheet_row("WSOP", "A"))
+
+    def _row(self, id, category, **overrides):
+        return {
+            "id": id,
+            "archive_id": 1,
+            "category": category,
+            **self.values,
+            **overrides,
+        }
+
+    def test_classifies_and_limits_deletes_to_owned_rows(self):
+        existing = [
+            self._row(1, "A"),  # unchanged
+            self._row(2, "B", total_videos=99),  # updated
+            self._row(3, "gone"),  # 시트 소유 → 삭제
+            self._row(4, "manual"),  # 수동 입력 → 유지
+        ]
+        parsed = {("WSOP", "A"): self.values, ("WSOP", "B"): self.values}
+        parsed[("WSOP", "C")] = self.values
+
+        inserts, updates, delete_ids, unchanged, matched = (
+            self.service._plan_work_status_diff(
+                existing, parsed, {"WSOP": 1}, owned_ids={1, 2, 3}
+            )
+        )
+
+        assert [r["category"] for r in inserts] == ["C"]
+        assert [u["id"] for u in updates] == [2]
+        assert delete_ids == [3]
+        assert unchanged == 1
+        assert matched == [1, 2]
+
+    def test_empty_sheet_deletes_nothing(self):
+        existing = [self._row(1, "A")]
+
+        *_, delete_ids, _, _ = self.service._plan_work_status_diff(
+            existing, {}, {}, owned_ids={1}
+        )
+
+        assert delete_ids == []
+
+
+class TestSyncToDb:
+    """bulk 적용 테스트 (in-memory SQLite)"""
+
+    @pytest.mark.asyncio
+    async def test_delete_propagation_and_updated_at(self, db):
+        service = SheetsSyncService()
+        # 수동 입력 행 (POST /work-status 등)
+        archive = Archive(name="WSOP")
+        db.add(archive)
+        await db.flush()
+        db.add(WorkStatus(archive_id=archive.id, category="manual"))
+        await db.commit()
+
+        first = await service._sync_to_db(
+            db, [sheet_row("WSOP", "A"), sheet_row("WSOP", "B")]
+        )
+        await db.commit()
+        assert (first.created_count, first.deleted_count) == (2, 0)
+
+        ids = {w.category: w.id for w in (await db.scalars(select(WorkStatus))).all()}
+        assert sorted(first.synced_ids) == sorted([ids["A"], ids["B"]])
+        db.add(FolderStats(path="/b", name="b", depth=0, work_status_id=ids["B"]))
+        await db.commit()
+        before = {
+            w.category: w.updated_at
+            for w in (await db.scalars(select(WorkStatus))).all()
+        }
+
+        await asyncio.sleep(0.01)
+        second = await service._sync_to_db(
+            db,
+            [sheet_row("WSOP", "A"), sheet_row("HCL", "C", total="5")],
+            set(first.synced_ids),
+        )
+        await db.commit()
+        assert (
+            second.created_count,
+            second.updated_count,
+            second.deleted_count,
+            second.unchanged_count,
+        ) == (1, 0, 1, 1)
+
+        db.expire_all()
+        rows = {w.category: w for w in (await db.scalars(select(WorkStatus))).all()}
+        assert set(rows) == {"A", "C", "manual"}
+        # 미변경 행은 다시 쓰지 않음
+        assert rows["A"].updated_at == before["A"]
+        folder = (await db.scalars(select(FolderStats))).one()
+        assert folder.work_status_id is None
+
+    @pytest.mark.asyncio
+    async def test_first_sync_without_history_deletes_nothing(self, db):
+        service = SheetsSyncService()
+        archive = Archive(name="WSOP")
+        db.add(archive)
+        await db.flush()
+        db.add(WorkStatus(archive_id=archive.id, category="imported"))
+        await db.commit()
+
+        result = await service._sync_to_db(db, [sheet_row("WSOP", "A")])
+        await db.commit()
+
+        assert result.deleted_count == 0
+        total = len((await db.scalars(select(WorkStatus))).all())
+        assert total == 2
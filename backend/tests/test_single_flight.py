@@ -0,0 +1,120 @@
+"""
+Single-flight 요청 병합 테스트
+
+테스트 케이스:
+- 동시 동일 요청은 1회만 실행, follower는 같은 결과 공유 + collapse_ratio
+- leader 실패 시 follower는 직접 실행 (fallback)
+- 미들웨어: 동시 동일 조회는 라우트 1회, 쿼리 순서가 달라도 같은 키
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.http_cache import GenerationCacheMiddleware
+from app.core.single_flight import SingleFlight
+from app.services import data_generation as data_generation_module
+from app.services.data_generation import DataGeneration
+from app.services.shared_state import MemoryStateBackend
+
+
+@pytest.fixture
+def flight(monkeypatch):
+    monkeypatch.setattr(data_generation_module, "shared_state", MemoryStateBackend())
+    monkeypatch.setattr("app.core.http_cache.data_generation", DataGeneration())
+    service = SingleFlight()
+    monkeypatch.setattr("app.core.http_cache.single_flight", service)
+    return service
+
+
+class TestSingleFlight:
+    """SingleFlight 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        calls = []
+        release = asyncio.Event()
+
+        async def work():
+            calls.append(1)
+            await release.wait()
+            return "tree"
+
+        tasks = [
+            asyncio.create_task(flight.do("k", work, label="/tree")) for _ in range(4)
+        ]
+        await asyncio.sleep(0)
+        assert flight.inflight == 1
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == [1]
+        assert [r for r, _ in results] == ["tree"] * 4
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+
+        stats = flight.stats()
+        assert stats["leaders"] == 1
+        assert stats["followers"] == 3
+        assert stats["collapse_ratio"] == 0.75
+        assert stats["paths"]["/tree"]["followers"] == 3
+        assert stats["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_leader_failure_falls_back(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise RuntimeError("db error")
+
+        leader = asyncio.create_task(flight.do("k", failing))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", failing))
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(RuntimeError):
+            await leader
+        assert await follower == (None, True)
+        assert flight.stats()["fallbacks"] == 1
+
+
+class TestMiddlewareCoalescing:
+    """GenerationCacheMiddleware 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_run_route_once(self, flight):
+        calls = []
+        release = asyncio.Event()
+        app = FastAPI()
+        app.add_middleware(GenerationCacheMiddleware)
+
+        @app.get("/api/progress/tree")
+        async def tree(depth: int = 1, include_files: bool = False):
+            calls.append(depth)
+            await release.wait()
+            return {"depth": depth, "calls": len(calls)}
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [
+                asyncio.create_task(client.get(url))
+                for url in (
+                    "/api/progress/tree?depth=2&include_files=false",
+                    "/api/progress/tree?include_files=false&depth=2",
+                    "/api/progress/tree?depth=2&include_files=false",
+                )
+            ]
+            while flight.inflight == 0 or flight.stats()["followers"] < 2:
+                await asyncio.sleep(0.01)
+            release.set()
+            responses = await asyncio.gather(*requests)
+
+        assert calls == [2]
+        assert all(r.json() == {"depth": 2, "calls": 1} for r in responses)
+        assert len({r.headers["etag"] for r in responses}) == 1
+        assert flight.stats()["paths"]["/api/progress/tree"]["followers"] == 2
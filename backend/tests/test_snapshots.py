@@ -0,0 +1,160 @@
+"""
+용량 히스토리 snapshot / rollup 테스트
+
+테스트 케이스:
+- 최상위 폴더 집계로 합계 기록, 같은 날짜는 덮어쓰기
+- 주/월 rollup은 기간 마지막 snapshot 값
+- 스캔 없는 snapshot은 직전 형식별 분포 사용 (없으면 file_stats 집계)
+- /stats/history 점 개수 제한 → 주/월 rollup으로 전환
+"""
+
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.api.stats import get_history
+from app.models.file_stats import DailySnapshot, FileStats, FolderStats, HistoryRollup
+from app.services.snapshot_service import SnapshotService, period_start
+
+MONDAY = date(2026, 10, 19)
+
+
+def folder(path, depth, size, files, folders=0, parent=None):
+    return FolderStats(
+        path=path,
+        name=path.rsplit("/", 1)[-1],
+        parent_path=parent,
+        depth=depth,
+        total_size=size,
+        file_count=files,
+        folder_count=folders,
+        total_duration=files * 10.0,
+    )
+
+
+async def seed(db, size=1000):
+    db.add_all(
+        [
+            folder("/archive", 0, size, 3, folders=2),
+            folder("/archive/WSOP", 1, size - 100, 2, parent="/archive"),
+            folder("/archive/HCL", 1, 100, 1, parent="/archive"),
+        ]
+    )
+    await db.commit()
+
+
+class TestPeriodStart:
+    """period_start() 테스트"""
+
+    def test_boundaries(self):
+        sunday = date(2026, 10, 25)
+        assert period_start("daily", sunday) == datetime(2026, 10, 25)
+        assert period_start("weekly", sunday) == datetime(2026, 10, 19)
+        assert period_start("monthly", sunday) == datetime(2026, 10, 1)
+
+
+class TestWriteSnapshot:
+    """SnapshotService.write_snapshot() 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_totals_and_rollups(self, db):
+        service = SnapshotService()
+        types = {".mp4": {"file_count": 3, "total_size": 1000, "total_duration": 30}}
+        await seed(db)
+        snapshot = await service.write_snapshot(db, types, today=MONDAY)
+        # 같은 날 재실행 → 덮어쓰기, 다음 날 → 같은 주/월 rollup 갱신
+        root = await db.scalar(select(FolderStats).where(FolderStats.depth == 0))
+        root.total_size = 1500
+        await service.write_snapshot(db, today=MONDAY)
+        await service.write_snapshot(db, today=MONDAY + timedelta(days=1))
+        await db.commit()
+
+        snapshots = (
+            (await db.execute(select(DailySnapshot).order_by(DailySnapshot.date)))
+            .scalars()
+            .all()
+        )
+        rollups = (await db.execute(select(HistoryRollup))).scalars().all()
+
+        assert snapshot["total_files"] == 3
+        assert snapshot["total_folders"] == 3
+        assert snapshot["total_duration"] == 30.0
+        assert [s.date for s in snapshots] == [
+            datetime(2026, 10, 19),
+            datetime(2026, 10, 20),
+        ]
+        assert [s.total_size for s in snapshots] == [1500, 1500]
+        # 분포는 직전 snapshot 값 유지
+        assert json.loads(snapshots[-1].file_type_stats) == types
+
+        assert {(r.period, r.period_start) for r in rollups} == {
+            ("weekly", datetime(2026, 10, 19)),
+            ("monthly", datetime(2026, 10, 1)),
+        }
+        assert all(r.snapshot_date == datetime(2026, 10, 20) for r in rollups)
+
+    @pytest.mark.asyncio
+    async def test_first_snapshot_aggregates_file_stats(self, db):
+        await seed(db)
+        db.add_all(
+            [
+                FileStats(
+                    path="/a.mp4",
+                    name="a.mp4",
+                    folder_path="/",
+                    extension=".mp4",
+                    size=10,
+                    duration=5.0,
+                ),
+                FileStats(
+                    path="/b.mp4",
+                    name="b.mp4",
+                    folder_path="/",
+                    extension=".mp4",
+                    size=20,
+                    duration=None,
+                ),
+                FileStats(path="/c", name="c", folder_path="/", extension=None, size=1),
+            ]
+        )
+        await db.commit()
+        snapshot = await SnapshotService().write_snapshot(db, today=MONDAY)
+
+        assert json.loads(snapshot["file_type_stats"]) == {
+            ".mp4": {"file_count": 2, "total_size": 30, "total_duration": 5.0},
+            "unknown": {"file_count": 1, "total_size": 1, "total_duration": 0.0},
+        }
+
+
+class TestHistory:
+    """GET /stats/history 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "period, days, expected",
+        [
+            ("daily", 30, "daily"),
+            ("daily", 2000, "weekly"),
+            ("weekly", 3650, "monthly"),
+            ("monthly", 30, "monthly"),
+        ],
+    )
+    async def test_resolution(self, period, days, expected, db):
+        service = SnapshotService()
+        today = datetime.utcnow().date()
+        await seed(db)
+        for offset in (14, 7, 0):
+            await service.write_snapshot(db, {}, today=today - timedelta(days=offset))
+        await db.commit()
+        response = await get_history(period=period, days=days, db=db)
+
+        assert response.period == expected
+        points = {"daily": 3, "weekly": 3}.get(expected)
+        if points:
+            assert len(response.data) == points
+        else:
+            assert 1 <= len(response.data) <= 2
+        assert response.data[0].size_change is None
+        assert all(p.total_size == 1000 for p in response.data)
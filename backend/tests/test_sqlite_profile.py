@@ -0,0 +1,140 @@
+"""
+SQLite production profile / 단일 writer 테스트
+
+테스트 케이스:
+- connect 이벤트 pragma (WAL, busy_timeout, 읽기 전용 연결)
+- 쓰기 트랜잭션이 열려 있어도 읽기 풀은 대기하지 않음
+- DatabaseWriter 작업 직렬화
+- 스캐너: 읽기 세션 + writer 짧은 트랜잭션으로 파일/폴더 통계 저장
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import event, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.core.database import (
+    Base,
+    DatabaseWriter,
+    _read_only_url,
+    _set_sqlite_pragmas,
+)
+from app.models.file_stats import FileStats, FolderStats
+from app.services.scanner import ArchiveScanner
+
+
+@asynccontextmanager
+async def sqlite_profile(tmp_path):
+    """파일 SQLite 위의 writer 엔진 + 읽기 전용 엔진"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'archive.db'}"
+    writer = create_async_engine(url)
+    event.listen(writer.sync_engine, "connect", lambda c, _: _set_sqlite_pragmas(c))
+    reader = create_async_engine(_read_only_url(url))
+    event.listen(
+        reader.sync_engine,
+        "connect",
+        lambda c, _: _set_sqlite_pragmas(c, readonly=True),
+    )
+    try:
+        async with writer.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield writer, reader
+    finally:
+        await reader.dispose()
+        await writer.dispose()
+
+
+class TestPragmas:
+    """connect 이벤트 pragma 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_wal_and_read_only(self, tmp_path):
+        async with sqlite_profile(tmp_path) as (writer, reader):
+            async with writer.connect() as conn:
+                assert (await conn.scalar(text("PRAGMA journal_mode"))) == "wal"
+                assert (await conn.scalar(text("PRAGMA synchronous"))) == 1  # NORMAL
+                assert (
+                    await conn.scalar(text("PRAGMA busy_timeout"))
+                ) == settings.SQLITE_BUSY_TIMEOUT_MS
+
+            async with reader.connect() as conn:
+                with pytest.raises(Exception):
+                    await conn.execute(text("CREATE TABLE nope (a)"))
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_open_write(self, tmp_path):
+        async with sqlite_profile(tmp_path) as (writer, reader):
+            async with writer.connect() as wconn:
+                await wconn.execute(
+                    text(
+                        "INSERT INTO folder_stats (path, name, depth) "
+                        "VALUES ('/a', 'a', 0)"
+                    )
+                )
+                # 커밋 전 쓰기 트랜잭션이 열린 상태에서 읽기
+                async with reader.connect() as rconn:
+                    count = await asyncio.wait_for(
+                        rconn.scalar(text("SELECT count(*) FROM folder_stats")), 1
+                    )
+                assert count == 0
+                await wconn.commit()
+
+
+class TestDatabaseWriter:
+    """DatabaseWriter 직렬화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_jobs_never_overlap(self, tmp_path):
+        async with sqlite_profile(tmp_path) as (writer, _):
+            db_writer = DatabaseWriter(async_sessionmaker(writer))
+            active, overlaps = [], []
+
+            async def job(db):
+                active.append(1)
+                overlaps.append(len(active))
+                await asyncio.sleep(0.01)
+                active.pop()
+
+            await asyncio.gather(*(db_writer.run(job) for _ in range(5)))
+            assert max(overlaps) == 1
+
+
+class TestScannerWrites:
+    """스캐너 writer 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_scan_persists_files_and_folders(self, tmp_path, monkeypatch):
+        root = tmp_path / "archive"
+        (root / "WSOP").mkdir(parents=True)
+        (root / "WSOP" / "a.txt").write_text("aaaa")
+        (root / "WSOP" / "b.txt").write_text("bb")
+        (root / "c.txt").write_text("c")
+        monkeypatch.setattr(settings, "NAS_LOCAL_PATH", str(root))
+
+        async with sqlite_profile(tmp_path) as (writer, reader):
+            state = {"is_scanning": True, "logs": []}
+            async with async_sessionmaker(reader)() as db:
+                scanner = ArchiveScanner(
+                    db, state, writer=DatabaseWriter(async_sessionmaker(writer))
+                )
+                await scanner.scan()
+
+            async with async_sessionmaker(reader)() as db:
+                assert await db.scalar(select(func.count(FileStats.id))) == 3
+                top = await db.scalar(
+                    select(FolderStats).where(FolderStats.path == str(root))
+                )
+                # 하위 폴더 통계는 writer 커밋 후 읽기 세션에서 다시 읽어 합산
+                assert (top.file_count, top.total_size) == (3, 7)
+
+            # 재스캔: 기존 행은 id 기준 bulk UPDATE (중복 INSERT 없음)
+            async with async_sessionmaker(reader)() as db:
+                rescan = ArchiveScanner(
+                    db, state, writer=DatabaseWriter(async_sessionmaker(writer))
+                )
+                await rescan.scan()
+                assert rescan.files_new == 0
+                assert await db.scalar(select(func.count(FileStats.id))) == 3
@@ -0,0 +1,104 @@
+"""
+앱 기동 / readiness 테스트
+
+테스트 케이스:
+- app.main import 시 gspread/apscheduler 미로드
+- 첫 동기화는 지연 + jitter 후 예약 (start()가 동기화를 기다리지 않음)
+- /ready: serving vs data_warm 구분, require_warm 시 503
+"""
+
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import settings
+from app.services.shared_state import MemoryStateBackend
+from app.services.sheets_sync import SheetsSyncService
+
+
+class TestLazyImports:
+    """무거운 의존성 지연 로드 테스트"""
+
+    def test_app_import_skips_heavy_modules(self):
+        code = (
+            "import sys, app.main; "
+            "print(sorted(m for m in ('gspread', 'apscheduler', 'google.oauth2') "
+            "if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
+
+
+class TestDeferredSync:
+    """첫 동기화 예약 테스트"""
+
+    def test_first_run_is_delayed_with_jitter(self, monkeypatch):
+        monkeypatch.setattr(settings, "SYNC_STARTUP_DELAY_SECONDS", 5)
+        monkeypatch.setattr(settings, "SYNC_JITTER_SECONDS", 30)
+        service = SheetsSyncService()
+
+        before = datetime.now()
+        delays = [
+            (service._first_run_time() - before).total_seconds() for _ in range(20)
+        ]
+
+        assert all(5 <= d <= 36 for d in delays)
+        assert service.scheduler is None
+        assert service.next_sync_time is None
+
+
+class TestReadiness:
+    """/ready 엔드포인트 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def memory_state(self, monkeypatch):
+        backend = MemoryStateBackend()
+        monkeypatch.setattr("app.services.sheets_sync.shared_state", backend)
+        monkeypatch.setattr("app.services.hand_analysis_sync.shared_state", backend)
+        return backend
+
+    async def get(self, path: str):
+        from app.main import app
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.get(path)
+
+    @pytest.mark.asyncio
+    async def test_serving_before_data_warm(self, monkeypatch):
+        from app.main import hand_analysis_sync_service, sheets_sync_service
+
+        monkeypatch.setattr(sheets_sync_service, "last_success_time", None)
+        monkeypatch.setattr(hand_analysis_sync_service, "last_success_time", None)
+        monkeypatch.setattr(settings, "SHEETS_SYNC_ENABLED", True)
+        monkeypatch.setattr(settings, "WORK_STATUS_SHEET_URL", "https://sheet")
+
+        res = await self.get("/ready")
+        assert res.status_code == 200
+        body = res.json()
+        assert body["serving"] is True
+        assert body["data_warm"] is False
+        assert body["checks"]["sheets_sync"]["warm"] is False
+        # 비활성 서비스는 warm 판단에서 제외
+        assert body["checks"]["hand_analysis_sync"]["warm"] is True
+
+        res = await self.get("/ready?require_warm=true")
+        assert res.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_warm_after_successful_sync(self, monkeypatch):
+        from app.main import hand_analysis_sync_service, sheets_sync_service
+
+        now = datetime.now()
+        monkeypatch.setattr(sheets_sync_service, "last_success_time", now)
+        monkeypatch.setattr(hand_analysis_sync_service, "last_success_time", now)
+
+        res = await self.get("/ready?require_warm=true")
+        assert res.status_code == 200
+        assert res.json()["data_warm"] is True
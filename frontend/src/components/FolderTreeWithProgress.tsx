@@ -592,7 +592,10 @@ export default function FolderTreeWithProgress({
 
   const isCodecMode = displayMode === 'codec';
 
+  const treeQueryKey = ['folder-tree-progress', initialPath, initialDepth, showFiles, selectedExtensions, displayMode];
+
   // include_codecs 파라미터 추가 (codec 모드일 때)
+  // NDJSON 스트리밍: 최상위 폴더가 완성될 때마다 캐시에 반영 → 전체 트리 완성 전 렌더링
   const {
     data: folders,
     isLoading,
@@ -600,14 +603,24 @@ export default function FolderTreeWithProgress({
     refetch,
     isFetching,
   } = useQuery({
-    queryKey: ['folder-tree-progress', initialPath, initialDepth, showFiles, selectedExtensions, displayMode],
-    queryFn: () => progressApi.getTreeWithProgress(
-      initialPath,
-      initialDepth,
-      showFiles,
-      selectedExtensions,
-      isCodecMode  // include_codecs
-    ),
+    queryKey: treeQueryKey,
+    queryFn: async () => {
+      const partial: FolderWithProgress[] = [];
+      const result = await progressApi.streamTree(
+        (record) => {
+          if (record.type === 'node' && record.parent_id === null) {
+            partial.push(record.node);
+            queryClient.setQueryData(treeQueryKey, [...partial]);
+          }
+        },
+        initialPath,
+        initialDepth,
+        showFiles,
+        selectedExtensions,
+        isCodecMode  // include_codecs
+      );
+      return result.tree;
+    },
     refetchInterval: 60000, // 60초마다 자동 갱신
     staleTime: 30000,
   });
@@ -21,6 +21,7 @@ import {
 } from 'lucide-react';
 import clsx from 'clsx';
 import { scanApi } from '../services/api';
+import type { ScanStatus, ScanStatusDelta } from '../types';
 
 function formatDuration(seconds: number): string {
   const hours = Math.floor(seconds / 3600);
@@ -31,6 +32,24 @@ function formatDuration(seconds: number): string {
   return `${minutes}m`;
 }
 
+// SSE delta 적용: 필드는 덮어쓰고, 로그는 이미 받은 줄(log_seq 이하)을 제외하고 이어붙임
+function applyScanDelta(prev: ScanStatus, delta: ScanStatusDelta): ScanStatus {
+  const { logs, log_seq, ...fields } = delta;
+  const next = { ...prev, ...fields };
+  if (logs && log_seq !== undefined) {
+    if (log_seq < prev.log_seq) {
+      // 새 스캔 시작 (sequence 초기화)
+      next.logs = logs;
+    } else {
+      const firstSeq = log_seq - logs.length + 1;
+      next.logs = [...prev.logs, ...logs.filter((_, i) => firstSeq + i > prev.log_seq)];
+    }
+    next.logs = next.logs.slice(-100);
+    next.log_seq = log_seq;
+  }
+  return next;
+}
+
 interface LayoutProps {
   children: ReactNode;
 }
@@ -66,13 +85,29 @@ export default function Layout({ children }: LayoutProps) {
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, []);
 
-  // Poll scan status - always poll to show status from other clients
+  // Scan status - pushed over SSE (shared across clients); poll only if the stream fails
+  const [streamFailed, setStreamFailed] = useState(false);
   const { data: scanStatus } = useQuery({
     queryKey: ['scan-status'],
     queryFn: scanApi.getStatus,
-    refetchInterval: (query) => query.state.data?.is_scanning ? 1000 : 5000,
+    refetchInterval: (query) =>
+      streamFailed ? (query.state.data?.is_scanning ? 1000 : 5000) : false,
   });
 
+  useEffect(() => {
+    return scanApi.streamStatus(
+      (status) => {
+        setStreamFailed(false);
+        queryClient.setQueryData(['scan-status'], status);
+      },
+      (delta) =>
+        queryClient.setQueryData<ScanStatus>(['scan-status'], (prev) =>
+          prev ? applyScanDelta(prev, delta) : prev
+        ),
+      () => setStreamFailed(true)
+    );
+  }, [queryClient]);
+
   // Start scan mutation
   const startScanMutation = useMutation({
     mutationFn: (scanType: ScanType) => scanApi.start(scanType),
@@ -10,6 +10,7 @@ import type {
   WorkStatusUpdate,
   Archive,
   ScanStatus,
+  ScanStatusDelta,
   ScanHistory,
   WorkerStatsListResponse,
   WorkerStatsSummary,
@@ -28,6 +29,8 @@ import type {
   BulkConnectResult,
   CodecTreeNode,
   TreeWithRootStats,
+  ProgressTreeStreamRecord,
+  RootStats,
 } from '../types';
 
 const api = axios.create({
@@ -234,6 +237,24 @@ export const scanApi = {
     return data;
   },
 
+  // SSE 스트림 구독: 연결 시 snapshot 1회, 이후 변경분(delta)만 수신
+  // 반환값: 구독 해제 함수
+  streamStatus: (
+    onSnapshot: (status: ScanStatus) => void,
+    onDelta: (delta: ScanStatusDelta) => void,
+    onError?: () => void
+  ): (() => void) => {
+    const source = new EventSource('/api/scan/events');
+    source.addEventListener('snapshot', (e) =>
+      onSnapshot(JSON.parse((e as MessageEvent).data))
+    );
+    source.addEventListener('progress', (e) =>
+      onDelta(JSON.parse((e as MessageEvent).data))
+    );
+    if (onError) source.onerror = onError;
+    return () => source.close();
+  },
+
   start: async (scanType = 'manual', path?: string): Promise<{
     scan_id: number;
     message: string;
@@ -379,6 +400,80 @@ export const progressApi = {
     return data;
   },
 
+  /**
+   * 폴더 트리 NDJSON 스트리밍 조회
+   * 노드가 완성되는 즉시 onRecord 호출 → 전체 트리 완성 전에 렌더링 시작 가능
+   * @returns 재구성된 TreeWithRootStats (summary 수신 후)
+   */
+  streamTree: async (
+    onRecord: (record: ProgressTreeStreamRecord) => void,
+    path?: string,
+    depth = 2,
+    includeFiles = false,
+    extensions?: string[],
+    includeCodecs = false,
+    includeHidden = false
+  ): Promise<TreeWithRootStats> => {
+    const params = new URLSearchParams();
+    if (path) params.append('path', path);
+    params.append('depth', depth.toString());
+    params.append('include_files', includeFiles.toString());
+    params.append('include_codecs', includeCodecs.toString());
+    params.append('include_hidden', includeHidden.toString());
+    params.append('format', 'ndjson');
+    if (extensions && extensions.length > 0) {
+      params.append('extensions', extensions.join(','));
+    }
+
+    const response = await fetch(`/api/progress/tree?${params}`);
+    if (!response.ok || !response.body) {
+      throw new Error(`Progress tree stream failed: ${response.status}`);
+    }
+
+    // 자식이 먼저 도착하므로 parent_id별로 모아두었다가 부모 도착 시 연결
+    const pending = new Map<number, FolderWithProgress[]>();
+    const tree: FolderWithProgress[] = [];
+    const summary: { rootStats?: RootStats } = {};
+
+    const handle = (record: ProgressTreeStreamRecord) => {
+      if (record.type === 'node') {
+        const node = record.node;
+        node.children = pending.get(node.id) ?? [];
+        pending.delete(node.id);
+        if (record.parent_id === null) {
+          tree.push(node);
+        } else {
+          const siblings = pending.get(record.parent_id) ?? [];
+          siblings.push(node);
+          pending.set(record.parent_id, siblings);
+        }
+      } else {
+        summary.rootStats = record.root_stats;
+      }
+      onRecord(record);
+    };
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop() ?? '';
+      for (const line of lines) {
+        if (line.trim()) handle(JSON.parse(line));
+      }
+    }
+    if (buffer.trim()) handle(JSON.parse(buffer));
+
+    if (!summary.rootStats) {
+      throw new Error('Progress tree stream ended without summary');
+    }
+    return { tree, root_stats: summary.rootStats };
+  },
+
   getFolderDetail: async (
     folderPath: string,
     includeFiles = true
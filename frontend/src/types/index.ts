@@ -145,11 +145,15 @@ export interface ScanStatus {
   elapsed_seconds: number | null;
   estimated_remaining_seconds: number | null;
   logs: string[];
+  log_seq: number;
   media_files_processed: number;
   total_duration_found: number;
   active_viewers: number;
 }
 
+// /scan/events progress delta (changed fields + new log lines)
+export type ScanStatusDelta = Partial<ScanStatus>;
+
 export interface ScanHistory {
   id: number;
   scan_type: string;
@@ -337,6 +341,16 @@ export interface FolderRootStats {
   size_ratio: number;  // 현재 폴더 용량 / 전체 용량 * 100
 }
 
+/**
+ * Compact 스키마 노드별 비율 (stats_schema=compact)
+ */
+export interface FolderRatios {
+  file_ratio: number;       // archive_stats 기준
+  size_ratio: number;
+  root_file_ratio: number;  // root_stats 기준
+  root_size_ratio: number;
+}
+
 export interface FolderWithProgress {
   id: number;
   name: string;
@@ -363,6 +377,8 @@ export interface FolderWithProgress {
   codec_summary?: FolderCodecSummary;
   // Issue #29: 루트 전체 대비 비율 (NAS/Sheets 데이터 분리 표시용)
   root_stats?: FolderRootStats;
+  // stats_schema=compact 응답: 전역 통계 대신 비율만 포함
+  ratios?: FolderRatios;
   children: FolderWithProgress[];
   files?: FileWithProgress[];
 }
@@ -380,6 +396,14 @@ export interface RootStats {
   sheets_total_done: number;
 }
 
+/**
+ * 전체 아카이브 통계 V2 (Issue #49) - path와 무관하게 항상 동일
+ */
+export interface ArchiveStats extends RootStats {
+  file_ratio?: number | null;
+  size_ratio?: number | null;
+}
+
 /**
  * 폴더 트리 + 루트 통계 응답 (Issue #29)
  */
@@ -388,6 +412,14 @@ export interface TreeWithRootStats {
   root_stats: RootStats;
 }
 
+/**
+ * /progress/tree?format=ndjson 스트림 레코드
+ * 노드는 자식 → 부모 순서로 도착하며 children은 항상 빈 배열 (parent_id로 재구성)
+ */
+export type ProgressTreeStreamRecord =
+  | { type: 'node'; parent_id: number | null; node: FolderWithProgress }
+  | { type: 'summary'; node_count: number; root_stats: RootStats; archive_stats: ArchiveStats };
+
 export interface ProgressSummary {
   nas: {
     total_folders: number;